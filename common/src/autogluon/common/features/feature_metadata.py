@@ -5,7 +5,7 @@ from typing import Any, Dict, List, Set, Tuple, Union
 
 import pandas as pd
 
-from .infer_types import get_type_group_map_special, get_type_map_raw
+from .infer_types import StreamingTypeInference, get_type_group_map_special, get_type_map_raw
 
 logger = logging.getLogger(__name__)
 
@@ -231,7 +231,8 @@ class FeatureMetadata:
             metadata = self
         else:
             metadata = copy.deepcopy(self)
-        features_invalid = [feature for feature in features if feature not in self.get_features()]
+        valid_features = set(self.get_features())
+        features_invalid = [feature for feature in features if feature not in valid_features]
         if features_invalid:
             raise KeyError(
                 f"remove_features was called with a feature that does not exist in feature metadata. Invalid Features: {features_invalid}"
@@ -242,11 +243,13 @@ class FeatureMetadata:
 
     def keep_features(self, features: list, inplace=False):
         """Removes all features from metadata except for those in features"""
-        features_invalid = [feature for feature in features if feature not in self.get_features()]
+        valid_features = set(self.get_features())
+        features_invalid = [feature for feature in features if feature not in valid_features]
         if features_invalid:
             raise KeyError(
                 f"keep_features was called with a feature that does not exist in feature metadata. Invalid Features: {features_invalid}"
             )
+        features = set(features)
         features_to_remove = [feature for feature in self.get_features() if feature not in features]
         return self.remove_features(features=features_to_remove, inplace=inplace)
 
@@ -289,6 +292,7 @@ class FeatureMetadata:
 
     @staticmethod
     def _remove_features_from_type_group_map(d, features):
+        features = set(features)
         for key, features_orig in d.items():
             d[key] = [feature for feature in features_orig if feature not in features]
 
@@ -472,7 +476,7 @@ class FeatureMetadata:
             return output_str
 
     @classmethod
-    def from_df(cls, df: pd.DataFrame):
+    def from_df(cls, df: pd.DataFrame, sample_size: int = None):
         """
         Construct FeatureMetadata based on the inferred feature types of an input :class:`pd.DataFrame`.
 
@@ -480,13 +484,22 @@ class FeatureMetadata:
         ----------
         df : :class:`pd.DataFrame`
             DataFrame used to infer FeatureMetadata.
+        sample_size : int, default None
+            If specified and `df` has more rows, the special types are inferred from a random sample of `sample_size` rows
+            plus the missing value counts of every feature, which is much faster for large data.
+            Features whose sample is ambiguous are inferred from their full values.
+            Refer to :class:`autogluon.common.features.infer_types.StreamingTypeInference` for details.
 
         Returns
         -------
         :class:`FeatureMetadata` object.
         """
         type_map_raw = get_type_map_raw(df)
-        type_group_map_special = get_type_group_map_special(df)
+        if sample_size is not None and len(df) > sample_size:
+            type_inference = StreamingTypeInference(sample_size=sample_size, precision=None).update(df)
+            type_group_map_special = type_inference.get_type_group_map_special(X=df)
+        else:
+            type_group_map_special = get_type_group_map_special(df)
         return cls(type_map_raw=type_map_raw, type_group_map_special=type_group_map_special)
 
     def verify_data(self, df: pd.DataFrame) -> bool:
@@ -1,6 +1,6 @@
 import logging
 from collections import defaultdict
-from typing import List
+from typing import Callable, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -8,6 +8,13 @@ from pandas import DataFrame, Series
 
 logger = logging.getLogger(__name__)
 
+# Thresholds of the special type checks, shared by the full and the sampled type inference
+_DATETIME_SAMPLE_SIZE = 500
+_DATETIME_MAX_NAN_RATIO = 0.8
+_NLP_SAMPLE_SIZE = 5000
+_NLP_MIN_UNIQUE_RATIO = 0.01
+_NLP_MIN_AVG_WORDS = 3
+
 
 def get_type_family_raw(dtype) -> str:
     """From dtype, gets the dtype family."""
@@ -104,10 +111,10 @@ def check_if_datetime_as_object_feature(X: Series) -> bool:
     type_family = get_type_family_raw(X.dtype)
     # TODO: Check if low numeric numbers, could be categorical encoding!
     # TODO: If low numeric, potentially it is just numeric instead of date
-    if X.isnull().all():
-        return False
     if type_family != "object":  # TODO: seconds from epoch support
         return False
+    if X.isnull().all():
+        return False
     try:
         # TODO: pd.Series(['20170204','20170205','20170206']) is incorrectly not detected as datetime_as_object
         #  But we don't want pd.Series(['184','822828','20170206']) to be detected as datetime_as_object
@@ -115,11 +122,11 @@ def check_if_datetime_as_object_feature(X: Series) -> bool:
         pd.to_numeric(X)
     except (ValueError, TypeError):
         try:
-            if len(X) > 500:
+            if len(X) > _DATETIME_SAMPLE_SIZE:
                 # Sample to speed-up type inference
-                X = X.sample(n=500, random_state=0)
+                X = X.sample(n=_DATETIME_SAMPLE_SIZE, random_state=0)
             result = pd.to_datetime(X, errors="coerce", format="mixed")
-            if result.isnull().mean() > 0.8:  # If over 80% of the rows are NaN
+            if result.isnull().mean() > _DATETIME_MAX_NAN_RATIO:  # If over 80% of the rows are NaN
                 return False
             return True
         except (ValueError, TypeError):
@@ -132,25 +139,306 @@ def check_if_nlp_feature(X: Series) -> bool:
     type_family = get_type_family_raw(X.dtype)
     if type_family != "object":
         return False
-    if len(X) > 5000:
+    if len(X) > _NLP_SAMPLE_SIZE:
         # Sample to speed-up type inference
-        X = X.sample(n=5000, random_state=0)
+        X = X.sample(n=_NLP_SAMPLE_SIZE, random_state=0)
     X_unique = X.unique()
     num_unique = len(X_unique)
     num_rows = len(X)
     unique_ratio = num_unique / num_rows
-    if unique_ratio <= 0.01:
+    if unique_ratio <= _NLP_MIN_UNIQUE_RATIO:
         return False
     try:
         avg_words = Series(X_unique.astype(str)).str.split().str.len().mean()
     except AttributeError:
         return False
-    if avg_words < 3:
+    if avg_words < _NLP_MIN_AVG_WORDS:
         return False
 
     return True
 
 
+class CardinalitySketch:
+    """
+    HyperLogLog sketch estimating the number of distinct non-null values of a feature with constant memory.
+    Sketches can be updated chunk by chunk and merged, and the estimate does not depend on the order of the values.
+
+    Parameters
+    ----------
+    precision : int, default 12
+        The sketch uses 2**precision registers of one byte. The relative standard error of the estimate is about 1.04 / sqrt(2**precision),
+        1.6% for the default precision.
+    """
+
+    def __init__(self, precision: int = 12):
+        if not 4 <= precision <= 18:
+            raise ValueError(f"precision must be between 4 and 18, but was {precision}")
+        self.precision = precision
+        self.registers = np.zeros(2**precision, dtype=np.uint8)
+
+    def update(self, values: Union[Series, np.ndarray]) -> "CardinalitySketch":
+        """Adds the values to the sketch. Null values are ignored."""
+        values = Series(values, copy=False) if not isinstance(values, Series) else values
+        values = values[values.notna()]
+        if len(values) == 0:
+            return self
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            values = values.astype(values.dtype.categories.dtype)
+        hashes = pd.util.hash_pandas_object(values, index=False).to_numpy()
+        num_bits = 64 - self.precision
+        register = (hashes >> np.uint64(num_bits)).astype(np.intp)
+        remainder = hashes & np.uint64((1 << num_bits) - 1)
+        # Position of the leftmost 1-bit of the remaining bits. frexp is exact as remainder has at most 60 bits.
+        rank = (num_bits + 1 - np.frexp(remainder.astype(np.float64))[1]).astype(np.uint8)
+        np.maximum.at(self.registers, register, rank)
+        return self
+
+    def merge(self, other: "CardinalitySketch") -> "CardinalitySketch":
+        """Merges another sketch of the same precision into this sketch, as if its values were added to this sketch."""
+        if other.precision != self.precision:
+            raise ValueError(f"Cannot merge sketches of different precision: {self.precision} and {other.precision}")
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def estimate(self) -> float:
+        """Returns the estimated number of distinct values."""
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+        num_zero = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * m and num_zero > 0:
+            # Linear counting is more accurate for small cardinalities
+            estimate = m * np.log(m / num_zero)
+        return float(estimate)
+
+    @property
+    def relative_error(self) -> float:
+        return 1.04 / np.sqrt(len(self.registers))
+
+
+class StreamingTypeInference:
+    """
+    Infers the raw and special types of features from a bounded uniformly random sample of the rows, per-feature missing value counts
+    and optional per-feature cardinality sketches, instead of scanning the full values of every feature.
+    The inference can be updated chunk by chunk, so that data larger than memory is processed with bounded memory.
+
+    Raw types are derived from the dtypes, as in `get_type_map_raw`. If chunks disagree, int and float features become float, otherwise object.
+    Special types are decided on the sample with the same checks as `get_types_special` (the fast path), unless the sample is ambiguous:
+        all sampled values are missing: ambiguous unless the missing value counts show that all values of the feature are missing.
+        datetime_as_object: ambiguous if all sampled values are numeric, as a single non-numeric value outside of the sample
+            would make the feature a datetime candidate, or if the fraction of sampled values which are not datetimes is close to its threshold.
+        text: ambiguous if the unique ratio or the average number of words of the sampled values is close to its threshold.
+            If sketched, decided without the sample if the cardinality sketch shows too few distinct values for the unique ratio threshold.
+    Ambiguous features are decided by `get_types_special` on their full values if these are provided to `get_type_map_special`.
+    If the data has at most `sample_size` rows, the sample is the full data and all features are decided by `get_types_special`.
+
+    Parameters
+    ----------
+    sample_size : int, default 10000
+        The maximum number of rows in the sample.
+    precision : int, default 12
+        The precision of the cardinality sketches of object features, refer to `CardinalitySketch`.
+        If None, no sketches are computed. Sketching hashes every value, which is worthwhile if the full values cannot be scanned later,
+        such as when the data is streamed in chunks.
+    random_state : int, default 0
+        The random state used to sample the rows.
+
+    Attributes
+    ----------
+    num_rows : int
+        The number of rows seen.
+    num_missing : dict
+        Feature name to its number of missing values in the rows seen.
+    num_unique : dict
+        Feature name to its estimated number of distinct non-null values, for features of raw type object. Empty if `precision` is None.
+    fast_path_features : list of str
+        The features whose special types were decided from the sample by the last call to `get_type_map_special`.
+    full_scan_features : list of str
+        The features whose special types were decided from their full values by the last call to `get_type_map_special`.
+    """
+
+    def __init__(self, sample_size: int = 10000, precision: Optional[int] = 12, random_state: int = 0):
+        if sample_size < 1:
+            raise ValueError(f"sample_size must be at least 1, but was {sample_size}")
+        self.sample_size = sample_size
+        self.precision = precision
+        self.num_rows = 0
+        self.fast_path_features = []
+        self.full_scan_features = []
+        self._rng = np.random.default_rng(random_state)
+        self._type_map_raw = None
+        self._sketches = {}
+        self._num_missing = {}
+        self._sample = None
+        self._sample_keys = None
+
+    def update(self, X: DataFrame) -> "StreamingTypeInference":
+        """Adds a chunk of rows. All chunks must have the same columns."""
+        type_map_raw = get_type_map_raw(X)
+        if self._type_map_raw is None:
+            self._type_map_raw = type_map_raw
+        elif list(type_map_raw) != list(self._type_map_raw):
+            raise ValueError("All chunks must have the same columns in the same order.")
+        else:
+            for feature, type_raw in type_map_raw.items():
+                type_raw_prev = self._type_map_raw[feature]
+                if type_raw != type_raw_prev:
+                    self._type_map_raw[feature] = (
+                        "float" if {type_raw, type_raw_prev} == {"int", "float"} else "object"
+                    )
+        for feature, num_missing in X.isnull().sum().items():
+            self._num_missing[feature] = self._num_missing.get(feature, 0) + int(num_missing)
+        if self.precision is not None:
+            for feature in X.columns:
+                if self._type_map_raw[feature] == "object":
+                    if feature not in self._sketches:
+                        self._sketches[feature] = CardinalitySketch(precision=self.precision)
+                    self._sketches[feature].update(X[feature])
+
+        # Keeping the rows with the smallest random keys is equivalent to uniform sampling without replacement
+        keys = self._rng.random(len(X))
+        if len(X) > self.sample_size:
+            idx_keep = np.sort(np.argpartition(keys, self.sample_size)[: self.sample_size])
+            X_candidates, keys = X.iloc[idx_keep], keys[idx_keep]
+        else:
+            X_candidates = X
+        X_candidates = X_candidates.set_axis(pd.RangeIndex(self.num_rows, self.num_rows + len(X_candidates)), axis=0)
+        self.num_rows += len(X)
+        if self._sample is None:
+            self._sample, self._sample_keys = X_candidates, keys
+        else:
+            self._sample = pd.concat([self._sample, X_candidates])
+            self._sample_keys = np.concatenate([self._sample_keys, keys])
+            if len(self._sample) > self.sample_size:
+                idx_keep = np.sort(np.argpartition(self._sample_keys, self.sample_size)[: self.sample_size])
+                self._sample, self._sample_keys = self._sample.iloc[idx_keep], self._sample_keys[idx_keep]
+        return self
+
+    @property
+    def num_missing(self) -> dict:
+        return dict(self._num_missing)
+
+    @property
+    def num_unique(self) -> dict:
+        return {feature: sketch.estimate() for feature, sketch in self._sketches.items()}
+
+    @property
+    def sample(self) -> DataFrame:
+        """The uniformly random sample of the rows, in their original order."""
+        return self._sample
+
+    def get_type_map_raw(self) -> dict:
+        self._check_is_updated()
+        return dict(self._type_map_raw)
+
+    def get_type_map_special(self, X: Optional[Union[DataFrame, Callable[[str], Series]]] = None) -> dict:
+        """
+        Returns the special types of the features, equivalent to `get_type_map_special`.
+
+        Parameters
+        ----------
+        X : DataFrame or Callable, optional
+            The full data, used to decide the special types of features whose sample is ambiguous.
+            Either a DataFrame, or a function which returns the full values of a feature as a Series given its name.
+            If None, ambiguous features are decided from the sample.
+        """
+        self._check_is_updated()
+        self.fast_path_features = []
+        self.full_scan_features = []
+        is_sample_complete = len(self._sample) == self.num_rows
+        type_map_special = {}
+        for feature in self._sample.columns:
+            values = self._sample[feature]
+            if is_sample_complete or self._type_map_raw[feature] != "object":
+                types_special = get_types_special(values)
+            else:
+                types_special, is_ambiguous = self._get_types_special_sampled(feature=feature, values=values)
+                if is_ambiguous and X is not None:
+                    values_full = X[feature] if isinstance(X, DataFrame) else X(feature)
+                    types_special = get_types_special(values_full)
+                    self.full_scan_features.append(feature)
+                else:
+                    self.fast_path_features.append(feature)
+            if types_special:
+                type_map_special[feature] = types_special
+        if not is_sample_complete:
+            logger.log(
+                15,
+                f"Inferred special types of {len(self.fast_path_features)} features from a sample of {len(self._sample)} of {self.num_rows} rows, "
+                f"{len(self.full_scan_features)} features with an ambiguous sample from their full values: {self.full_scan_features}",
+            )
+        return type_map_special
+
+    def get_type_group_map_special(self, X: Optional[Union[DataFrame, Callable[[str], Series]]] = None) -> defaultdict:
+        return get_type_group_map(self.get_type_map_special(X=X))
+
+    def _get_types_special_sampled(self, feature: str, values: Series) -> Tuple[List[str], bool]:
+        """Returns the special types of an object feature decided from its sampled values, and whether the sample is ambiguous."""
+        types_special = []
+        if isinstance(values.dtype, pd.SparseDtype):
+            types_special.append("sparse")
+        if values.isnull().all():
+            if self._num_missing[feature] < self.num_rows:
+                return types_special, True
+            # All values are missing, which are at most 2 distinct values (None and NaN) for the unique ratio of the text check
+            return types_special, 2 > _NLP_MIN_UNIQUE_RATIO * min(self.num_rows, _NLP_SAMPLE_SIZE)
+        is_datetime, is_ambiguous = _check_if_datetime_as_object_sample(values)
+        if is_datetime:
+            types_special.append("datetime_as_object")
+        elif not is_ambiguous:
+            sketch = self._sketches.get(feature)
+            if sketch is not None:
+                # The unique values of the text check include missing values
+                num_unique_max = sketch.estimate() * (1 + 3 * sketch.relative_error) + 1
+                if num_unique_max <= _NLP_MIN_UNIQUE_RATIO * min(self.num_rows, _NLP_SAMPLE_SIZE):
+                    return types_special, False
+            is_text, is_ambiguous = _check_if_nlp_feature_sample(values)
+            if is_text:
+                types_special.append("text")
+        return types_special, is_ambiguous
+
+    def _check_is_updated(self):
+        if self._sample is None:
+            raise AssertionError(f"{self.__class__.__name__} has no data, call `update` first.")
+
+
+def _check_if_datetime_as_object_sample(X: Series, margin: float = 0.05) -> Tuple[bool, bool]:
+    """
+    Sampled equivalent of `check_if_datetime_as_object_feature` for a random sample of an object feature with non-null values.
+    Returns whether the feature is datetime_as_object and whether the sample is ambiguous.
+    """
+    try:
+        pd.to_numeric(X)
+    except (ValueError, TypeError):
+        try:
+            result = pd.to_datetime(X.iloc[:_DATETIME_SAMPLE_SIZE], errors="coerce", format="mixed")
+        except (ValueError, TypeError):
+            return False, False
+        nan_ratio = result.isnull().mean()
+        return nan_ratio <= _DATETIME_MAX_NAN_RATIO, abs(nan_ratio - _DATETIME_MAX_NAN_RATIO) < margin
+    else:
+        return False, True
+
+
+def _check_if_nlp_feature_sample(X: Series, margin: float = 0.5) -> Tuple[bool, bool]:
+    """
+    Sampled equivalent of `check_if_nlp_feature` for a random sample of an object feature.
+    Returns whether the feature is text and whether the sample is ambiguous.
+    """
+    X = X.iloc[:_NLP_SAMPLE_SIZE]
+    X_unique = X.unique()
+    unique_ratio = len(X_unique) / len(X)
+    is_ambiguous = (1 - margin) * _NLP_MIN_UNIQUE_RATIO < unique_ratio <= (1 + margin) * _NLP_MIN_UNIQUE_RATIO
+    if unique_ratio <= _NLP_MIN_UNIQUE_RATIO:
+        return False, is_ambiguous
+    try:
+        avg_words = Series(X_unique.astype(str)).str.split().str.len().mean()
+    except AttributeError:
+        return False, is_ambiguous
+    is_ambiguous = is_ambiguous or abs(avg_words - _NLP_MIN_AVG_WORDS) < margin
+    return avg_words >= _NLP_MIN_AVG_WORDS, is_ambiguous
+
+
 def get_bool_true_val(uniques):
     """
     From a pandas series with `uniques = series.unique()`, get the replace_val to convert to boolean when calling:
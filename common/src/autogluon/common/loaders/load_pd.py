@@ -5,6 +5,7 @@ import multiprocessing
 from os import listdir
 from os.path import isfile, join
 from pathlib import Path
+from typing import Iterator
 
 import pandas as pd
 from pandas import DataFrame
@@ -149,6 +150,82 @@ def load(
     return df
 
 
+def load_chunks(
+    path: str | Path,
+    chunk_size: int,
+    delimiter=None,
+    encoding="utf-8",
+    columns_to_keep: list[str] | None = None,
+    dtype=None,
+    format: str | None = None,
+) -> Iterator[DataFrame]:
+    """
+    Lazily loads the CSV or Parquet data at `path` in chunks of at most `chunk_size` rows,
+    so that data larger than memory can be processed with bounded memory usage.
+
+    Parameters
+    ----------
+    path : str or Path
+        Path to a CSV file, a Parquet file or a directory of Parquet files.
+    chunk_size : int
+        The maximum number of rows per chunk.
+        Parquet chunks can be smaller than `chunk_size` as chunks do not span multiple row groups.
+    delimiter : str, optional
+        The CSV delimiter. If None, inferred from the file extension.
+    encoding : str, default = "utf-8"
+        The CSV encoding.
+    columns_to_keep : list[str], optional
+        If specified, only these columns are loaded.
+    dtype : optional
+        The CSV dtypes, passed to `pd.read_csv`.
+    format : str, optional
+        One of "csv" and "parquet". If None, inferred from `path`.
+
+    Yields
+    ------
+    DataFrame chunks in order. Chunk indices are continuous, equivalent to the index of `load(path)`.
+    """
+    if isinstance(path, Path):
+        path = str(path)
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, but was {chunk_size}")
+    if format is None:
+        if ".parquet" in path or ".pq" in path or path[-1] == "/":
+            format = "parquet"
+        else:
+            format = "csv"
+
+    if format == "parquet":
+        import pyarrow.dataset as ds
+
+        dataset = ds.dataset(path, format="parquet")
+        row_start = 0
+        for batch in dataset.to_batches(columns=columns_to_keep, batch_size=chunk_size):
+            if batch.num_rows == 0:
+                continue
+            df = batch.to_pandas()
+            df.index = pd.RangeIndex(row_start, row_start + len(df))
+            row_start += len(df)
+            yield df
+    elif format == "csv":
+        if delimiter is None:
+            delimiter = "\t" if path.endswith(".tsv") else ","
+        with pd.read_csv(
+            path,
+            delimiter=delimiter,
+            encoding=encoding,
+            dtype=dtype,
+            usecols=columns_to_keep,
+            chunksize=chunk_size,
+        ) as reader:
+            for df in reader:
+                if columns_to_keep is not None:
+                    df = df[columns_to_keep]
+                yield df
+    else:
+        raise ValueError(f"file format {format} not supported for chunked loading! Valid formats: ['csv', 'parquet']")
+
+
 def _load_multipart_child(chunk):
     (
         path,
@@ -2,6 +2,8 @@ import logging
 import math
 from functools import wraps
 
+import numpy as np
+import pandas as pd
 from pandas import DataFrame
 
 from ..features.infer_types import get_type_map_raw
@@ -58,3 +60,43 @@ def get_approximate_df_mem_usage(df: DataFrame, sample_ratio=0.2):
             )
             memory_usage = memory_usage_inexact.combine_first(memory_usage)
         return memory_usage
+
+
+def get_sparse_features(df: DataFrame) -> list:
+    """Returns the columns of `df` that have a pandas sparse dtype."""
+    return [column for column, dtype in df.dtypes.items() if isinstance(dtype, pd.SparseDtype)]
+
+
+def to_csr_matrix(df: DataFrame, dtype=np.float32):
+    """
+    Converts `df` to a scipy CSR matrix without converting the sparse columns of `df` to dense.
+    Column order is preserved. Category columns are converted to their category codes, with missing values as NaN.
+    Missing values of dense columns are stored explicitly as NaN.
+    """
+    from scipy.sparse import csr_matrix, hstack
+
+    is_sparse = [isinstance(df_dtype, pd.SparseDtype) for df_dtype in df.dtypes]
+    num_columns = len(is_sparse)
+    blocks = []
+    block_start = 0
+    # Convert contiguous runs of sparse and dense columns separately to preserve column order
+    for i in range(1, num_columns + 1):
+        if i < num_columns and is_sparse[i] == is_sparse[block_start]:
+            continue
+        df_block = df.iloc[:, block_start:i]
+        if is_sparse[block_start]:
+            blocks.append(df_block.sparse.to_coo().tocsr().astype(dtype))
+        else:
+            values = np.empty(df_block.shape, dtype=dtype)
+            for j, column in enumerate(df_block.columns):
+                series = df_block[column]
+                if isinstance(series.dtype, pd.CategoricalDtype):
+                    codes = series.cat.codes.to_numpy()
+                    values[:, j] = np.where(codes < 0, np.nan, codes)
+                else:
+                    values[:, j] = series.to_numpy(dtype=dtype, na_value=np.nan)
+            blocks.append(csr_matrix(values))
+        block_start = i
+    if not blocks:
+        return csr_matrix((len(df), 0), dtype=dtype)
+    return hstack(blocks, format="csr", dtype=dtype)
@@ -2,7 +2,14 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from autogluon.common.features.infer_types import get_bool_true_val
+from autogluon.common.features.feature_metadata import FeatureMetadata
+from autogluon.common.features.infer_types import (
+    CardinalitySketch,
+    StreamingTypeInference,
+    get_bool_true_val,
+    get_type_map_raw,
+    get_type_map_special,
+)
 
 
 @pytest.mark.parametrize(
@@ -35,3 +42,56 @@ def test_when_pandas_categorical_then_no_attribute_error(series):
     uniques = series.unique()
     result = get_bool_true_val(uniques)
     assert result in list(series.unique())
+
+
+def _generate_mixed_data(num_rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    words = np.array([f"w{i}" for i in range(200)])
+    texts = np.array([" ".join(rng.choice(words, 5)) for _ in range(2000)])
+    dates = pd.date_range("2020-01-01", periods=300).astype(str).to_numpy()
+    return pd.DataFrame(
+        {
+            "float": rng.normal(size=num_rows),
+            "cat": rng.choice(["a", "b", "c"], num_rows).astype(object),
+            "text": rng.choice(texts, num_rows),
+            "date": rng.choice(dates, num_rows),
+            "numeric_str": rng.integers(0, 1000, num_rows).astype(str).astype(object),
+            "mostly_missing": np.array([None] * (num_rows - 3) + ["x y z"] * 3, dtype=object),
+            "all_missing": np.array([None] * num_rows, dtype=object),
+        }
+    )
+
+
+def test_cardinality_sketch_estimate_and_merge():
+    values = pd.Series([f"v{i}" for i in range(20000)] + [None] * 10)
+    sketch = CardinalitySketch().update(values.iloc[:12000])
+    sketch_other = CardinalitySketch().update(values.iloc[8000:])
+    assert abs(sketch.merge(sketch_other).estimate() / 20000 - 1) < 5 * sketch.relative_error
+    assert CardinalitySketch().update(pd.Series(["a", "b", "a", None])).estimate() == pytest.approx(2, rel=0.01)
+
+
+def test_streaming_type_inference_matches_full_inference():
+    X = _generate_mixed_data(num_rows=30000)
+    type_inference = StreamingTypeInference(sample_size=5000)
+    for i in range(0, len(X), 7000):
+        type_inference.update(X.iloc[i : i + 7000])
+
+    assert type_inference.num_rows == len(X)
+    assert len(type_inference.sample) == 5000
+    assert type_inference.get_type_map_raw() == get_type_map_raw(X)
+    assert type_inference.get_type_map_special(X=X) == get_type_map_special(X)
+    # features whose values are all missing are decided via the missing value counts
+    assert type_inference.fast_path_features == ["cat", "text", "date", "all_missing"]
+    # numeric strings and mostly missing values cannot be decided from the sample
+    assert type_inference.full_scan_features == ["numeric_str", "mostly_missing"]
+    assert type_inference.num_unique["cat"] == pytest.approx(3, rel=0.01)
+    assert type_inference.num_missing == {
+        **{feature: 0 for feature in X.columns},
+        "mostly_missing": len(X) - 3,
+        "all_missing": len(X),
+    }
+
+
+def test_feature_metadata_from_df_with_sample_size():
+    X = _generate_mixed_data(num_rows=20000)
+    assert FeatureMetadata.from_df(X, sample_size=2000) == FeatureMetadata.from_df(X)
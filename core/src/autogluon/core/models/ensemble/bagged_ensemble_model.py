@@ -60,7 +60,14 @@ class BaggedEnsembleModel(AbstractModel):
         Refer to AbstractModel documentation
     """
 
+    # Only written by older versions, read as a fallback if the `.npy` files below do not exist
     _oof_filename = "oof.pkl"
+    # Normalized float32 OOF prediction probabilities, memory-mapped by readers such as `load_oof`
+    _oof_pred_proba_filename = "oof_pred_proba.npy"
+    # Exact unnormalized OOF prediction probabilities (sum over children), required to fit additional folds
+    _oof_pred_proba_sum_filename = "oof_pred_proba_sum.npy"
+    # Number of children that predicted each OOF row, required together with the unnormalized OOF to fit additional folds
+    _oof_pred_model_repeats_filename = "oof_pred_model_repeats.npy"
     seed_name = "model_random_seed"
 
     def __init__(
@@ -200,6 +207,9 @@ class BaggedEnsembleModel(AbstractModel):
 
     def predict_proba_oof(self, **kwargs) -> np.array:
         # TODO: Require is_valid == True (add option param to ignore is_valid)
+        if self._oof_pred_proba is None:
+            # OOF is not in memory after `save`, memory-map it from disk instead of loading it in full
+            return self.load_oof(path=self.path, verbose=False)
         return self._predict_proba_oof(self._oof_pred_proba, self._oof_pred_model_repeats)
 
     @staticmethod
@@ -1433,6 +1443,16 @@ class BaggedEnsembleModel(AbstractModel):
 
     @classmethod
     def load_oof(cls, path: str, verbose: bool = True) -> np.array:
+        """
+        Returns the out-of-fold prediction probabilities of the model saved at `path`.
+
+        The OOF is memory-mapped from `utils/oof_pred_proba.npy` so that rows are only read from disk when accessed.
+        The memory map is copy-on-write: in-place modifications of the returned array are never written back to disk.
+        For models saved by older versions, falls back to loading `utils/oof.pkl`, or the model itself.
+        """
+        path_oof_pred_proba = os.path.join(path, "utils", cls._oof_pred_proba_filename)
+        if os.path.exists(path_oof_pred_proba):
+            return np.load(path_oof_pred_proba, mmap_mode="c")
         try:
             oof = load_pkl.load(path=os.path.join(path, "utils", cls._oof_filename), verbose=verbose)
             oof_pred_proba = oof["_oof_pred_proba"]
@@ -1447,6 +1467,11 @@ class BaggedEnsembleModel(AbstractModel):
     def _load_oof(self):
         if self._oof_pred_proba is not None:
             pass
+        elif os.path.exists(os.path.join(self.path, "utils", self._oof_pred_proba_sum_filename)):
+            self._oof_pred_proba = np.load(os.path.join(self.path, "utils", self._oof_pred_proba_sum_filename))
+            self._oof_pred_model_repeats = np.load(
+                os.path.join(self.path, "utils", self._oof_pred_model_repeats_filename)
+            )
         else:
             oof = load_pkl.load(path=os.path.join(self.path, "utils", self._oof_filename))
             self._oof_pred_proba = oof["_oof_pred_proba"]
@@ -1486,13 +1511,7 @@ class BaggedEnsembleModel(AbstractModel):
                 self.save_child(model=child, path=path, verbose=False)
 
         if save_oof and self._oof_pred_proba is not None:
-            save_pkl.save(
-                path=os.path.join(path, "utils", self._oof_filename),
-                object={
-                    "_oof_pred_proba": self._oof_pred_proba,
-                    "_oof_pred_model_repeats": self._oof_pred_model_repeats,
-                },
-            )
+            self._save_oof_pred_proba(path=path)
             self._oof_pred_proba = None
             self._oof_pred_model_repeats = None
 
@@ -1503,6 +1522,31 @@ class BaggedEnsembleModel(AbstractModel):
         self.models = _models
         return path
 
+    def _save_oof_pred_proba(self, path: str):
+        """
+        Saves the OOF as `.npy` files: the exact unnormalized OOF prediction probabilities and the repeat counts,
+        which `_load_oof` restores so that additional folds are added onto the exact sum,
+        and the normalized float32 OOF prediction probabilities, which can be memory-mapped by `load_oof`.
+        """
+        oof_pred_proba = self._predict_proba_oof(self._oof_pred_proba, self._oof_pred_model_repeats)
+        os.makedirs(os.path.join(path, "utils"), exist_ok=True)
+        # The unnormalized OOF file is written after the repeat counts and each file is written to a temporary file
+        # first, so that readers never see a partially written file or the unnormalized OOF without its repeat counts
+        for filename, array in [
+            (self._oof_pred_model_repeats_filename, self._oof_pred_model_repeats),
+            (self._oof_pred_proba_sum_filename, self._oof_pred_proba),
+            (self._oof_pred_proba_filename, oof_pred_proba),
+        ]:
+            path_array = os.path.join(path, "utils", filename)
+            path_tmp = path_array + ".tmp.npy"
+            np.save(path_tmp, array, allow_pickle=False)
+            os.replace(path_tmp, path_array)
+        # Remove the OOF saved by older versions, so that it is not stored twice
+        try:
+            os.remove(os.path.join(path, "utils", self._oof_filename))
+        except FileNotFoundError:
+            pass
+
     # If `remove_fit_stack=True`, variables will be removed that are required to fit more folds and to fit new stacker models which use this model as a base model.
     #  This includes OOF variables.
     def reduce_memory_size(
@@ -1518,10 +1562,16 @@ class BaggedEnsembleModel(AbstractModel):
             remove_fit=remove_fit, remove_info=remove_info, requires_save=requires_save, **kwargs
         )
         if remove_fit_stack:
-            try:
-                os.remove(os.path.join(self.path, "utils", self._oof_filename))
-            except FileNotFoundError:
-                pass
+            for filename in [
+                self._oof_filename,
+                self._oof_pred_proba_filename,
+                self._oof_pred_proba_sum_filename,
+                self._oof_pred_model_repeats_filename,
+            ]:
+                try:
+                    os.remove(os.path.join(self.path, "utils", filename))
+                except FileNotFoundError:
+                    pass
             if requires_save:
                 self._oof_pred_proba = None
                 self._oof_pred_model_repeats = None
@@ -7,7 +7,6 @@ import time
 from collections import defaultdict
 from typing import Dict, List
 
-import numpy as np
 import pandas as pd
 
 from autogluon.common.features.feature_metadata import FeatureMetadata
@@ -15,6 +14,7 @@ from autogluon.common.features.types import R_FLOAT, S_STACK
 
 from ...constants import MULTICLASS, QUANTILE, SOFTCLASS
 from ...utils.exceptions import NoStackFeatures, NotValidStacker
+from ...utils.utils import concat_stack_features, convert_pred_probas_to_df
 from ..abstract.abstract_model import AbstractModel
 from .bagged_ensemble_model import BaggedEnsembleModel
 
@@ -260,7 +260,7 @@ class StackerEnsembleModel(BaggedEnsembleModel):
                     )  # TODO: This could get very large on a high class count problem. Consider capping to top N most frequent classes and merging least frequent
                 X_stacker = self.pred_probas_to_df(X_stacker, index=X.index)
                 if use_orig_features_in_stack:
-                    X = pd.concat([X_stacker, X], axis=1)
+                    X = concat_stack_features(X_stacker=X_stacker, X=X)
                 else:
                     X = X_stacker
             elif not use_orig_features_in_stack:
@@ -275,14 +275,9 @@ class StackerEnsembleModel(BaggedEnsembleModel):
         return X
 
     def pred_probas_to_df(self, pred_proba: list, index=None) -> pd.DataFrame:
-        if self.problem_type in [MULTICLASS, SOFTCLASS, QUANTILE]:
-            pred_proba = np.concatenate(pred_proba, axis=1)
-            pred_proba = pd.DataFrame(pred_proba, columns=self.stack_columns)
-        else:
-            pred_proba = pd.DataFrame(data=np.asarray(pred_proba).T, columns=self.stack_columns)
-        if index is not None:
-            pred_proba.set_index(index, inplace=True)
-        return pred_proba
+        return convert_pred_probas_to_df(
+            pred_proba_list=pred_proba, columns=self.stack_columns, problem_type=self.problem_type, index=index
+        )
 
     def _fit(self, X, y, compute_base_preds=True, time_limit=None, **kwargs):
         start_time = time.time()
@@ -0,0 +1,326 @@
+from __future__ import annotations
+
+import logging
+from typing import List, Optional, Tuple, Type
+
+import numpy as np
+import scipy.stats
+import sklearn.metrics
+
+from ...constants import BINARY, MULTICLASS, QUANTILE, REGRESSION
+from ...metrics import Scorer, customized_log_loss, quantile_metrics, rmse_func
+from ...metrics.classification_metrics import customized_binary_roc_auc_score
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on the number of float elements materialized at once when building fantasy ensembles for a chunk of candidates.
+# 2**22 float64 elements == 32 MB, small enough to keep temporaries cache-friendly.
+DEFAULT_MAX_CHUNK_ELEMENTS = 2**22
+
+
+class AbstractBatchedEnsembleScorer:
+    """
+    Scores every candidate "fantasy" ensemble of an `EnsembleSelection` iteration in a single vectorized pass.
+
+    In iteration `s` of ensemble selection, the fantasy ensemble of candidate `j` is
+    `weighted_ensemble_prediction + candidate_weight * predictions[j]`.
+    Rather than building each fantasy ensemble one at a time and calling the full scorer on it,
+    a batched scorer stacks all candidate predictions into a single `(n_models, n_rows[, n_classes])` array
+    and computes the regret (error, lower is better, optimum is 0) of all candidates at once.
+
+    Subclasses implement a metric-specific kernel in `_score_chunk`. The returned values are identical
+    (up to floating point rounding) to `compute_metric(..., as_error=True)` applied to each fantasy ensemble.
+
+    Parameters
+    ----------
+    predictions : List[np.ndarray]
+        The prediction probabilities of each candidate model, in the format used by `EnsembleSelection`.
+    labels : np.ndarray
+        The ground truth labels.
+    problem_type : str
+        The problem type.
+    sample_weight : np.ndarray, optional
+        The sample weights, only specified if the kernel supports sample weights.
+    quantile_levels : List[float], optional
+        The quantile levels, required for quantile problem types.
+    max_chunk_elements : int, default = DEFAULT_MAX_CHUNK_ELEMENTS
+        The maximum number of elements of the fantasy ensemble tensor to materialize at once.
+        Candidates are scored in chunks to bound peak memory usage.
+    """
+
+    # The names of the metrics the kernel implements
+    metric_names: Tuple[str, ...] = ()
+    # The metric score functions the kernel implements. Used to ensure a custom metric sharing the name of a built-in metric is not intercepted.
+    score_funcs: Tuple[callable, ...] = ()
+    # The problem types the kernel supports
+    problem_types: Tuple[str, ...] = ()
+    # If False, will fall back to the default scoring path when sample weights are specified
+    supports_sample_weight: bool = True
+
+    def __init__(
+        self,
+        predictions: List[np.ndarray],
+        labels: np.ndarray,
+        problem_type: str,
+        sample_weight: np.ndarray = None,
+        quantile_levels: List[float] = None,
+        max_chunk_elements: int = DEFAULT_MAX_CHUNK_ELEMENTS,
+    ):
+        self.problem_type = problem_type
+        self.labels = np.asarray(labels)
+        self.sample_weight = None if sample_weight is None else np.asarray(sample_weight)
+        self.quantile_levels = quantile_levels
+        self.predictions = self._stack_predictions(predictions)
+        self.num_models = self.predictions.shape[0]
+        elements_per_model = max(int(np.prod(self.predictions.shape[1:])), 1)
+        self.chunk_size = max(int(max_chunk_elements // elements_per_model), 1)
+
+    @classmethod
+    def is_supported(cls, metric: Scorer, problem_type: str, sample_weight: np.ndarray = None) -> bool:
+        if problem_type not in cls.problem_types:
+            return False
+        if getattr(metric, "name", None) not in cls.metric_names:
+            return False
+        if getattr(metric, "_score_func", None) not in cls.score_funcs:
+            return False
+        if getattr(metric, "_kwargs", None):
+            return False
+        if sample_weight is not None and not cls.supports_sample_weight:
+            return False
+        return True
+
+    @staticmethod
+    def _stack_predictions(predictions: List[np.ndarray]) -> np.ndarray:
+        return np.stack(predictions, axis=0)
+
+    def score(self, weighted_ensemble_prediction: np.ndarray, candidate_weight: float) -> np.ndarray:
+        """
+        Returns the regret of adding each candidate model to the current ensemble.
+
+        Parameters
+        ----------
+        weighted_ensemble_prediction : np.ndarray
+            The current ensemble prediction, already multiplied by its weight `s / (s + 1)`.
+        candidate_weight : float
+            The weight of the candidate model in the fantasy ensemble, `1 / (s + 1)`.
+
+        Returns
+        -------
+        scores : np.ndarray of shape (n_models,)
+            The regret of each fantasy ensemble.
+        """
+        scores = np.zeros(self.num_models)
+        for start in range(0, self.num_models, self.chunk_size):
+            end = min(start + self.chunk_size, self.num_models)
+            scores[start:end] = self._score_chunk(
+                weighted_ensemble_prediction=weighted_ensemble_prediction,
+                candidate_weight=candidate_weight,
+                start=start,
+                end=end,
+            )
+        return scores
+
+    def _fantasy_ensembles(
+        self, weighted_ensemble_prediction: np.ndarray, candidate_weight: float, start: int, end: int
+    ) -> np.ndarray:
+        # Identical arithmetic to the per-candidate path of `EnsembleSelection._fit`
+        return weighted_ensemble_prediction[np.newaxis] + candidate_weight * self.predictions[start:end]
+
+    def _average(self, values: np.ndarray) -> np.ndarray:
+        """Averages `values` of shape (n_candidates, n_rows) over rows, respecting sample weights"""
+        if self.sample_weight is None:
+            return values.mean(axis=1)
+        return np.average(values, axis=1, weights=self.sample_weight)
+
+    def _score_chunk(
+        self, weighted_ensemble_prediction: np.ndarray, candidate_weight: float, start: int, end: int
+    ) -> np.ndarray:
+        raise NotImplementedError
+
+
+class LogLossBatchedEnsembleScorer(AbstractBatchedEnsembleScorer):
+    """
+    Incremental log_loss kernel.
+
+    Only the probability of the true class contributes to log_loss, so the true class probability and the row sum
+    (for renormalization) of every candidate are gathered once up front.
+    Each iteration then costs O(n_models * n_rows) instead of O(n_models * n_rows * n_classes).
+
+    `customized_log_loss` does not support sample weights, so weighted fits fall back to the default path.
+    """
+
+    metric_names = ("log_loss",)
+    score_funcs = (customized_log_loss,)
+    problem_types = (BINARY, MULTICLASS)
+    supports_sample_weight = False
+
+    def __init__(self, predictions: List[np.ndarray], labels: np.ndarray, problem_type: str, **kwargs):
+        super().__init__(predictions=predictions, labels=labels, problem_type=problem_type, **kwargs)
+        if self.problem_type == MULTICLASS:
+            self._labels_int = self.labels.astype(np.int64)
+            self._rows = np.arange(len(self._labels_int))
+            self.predictions_true = self.predictions[:, self._rows, self._labels_int]
+            self.predictions_sum = self.predictions.sum(axis=2)
+            # Gathered once, the full stacked predictions are no longer needed
+            self.predictions = None
+            self.chunk_size = max(
+                int(kwargs.get("max_chunk_elements", DEFAULT_MAX_CHUNK_ELEMENTS) // max(len(self._rows), 1)), 1
+            )
+
+    def _score_chunk(
+        self, weighted_ensemble_prediction: np.ndarray, candidate_weight: float, start: int, end: int
+    ) -> np.ndarray:
+        if self.problem_type == BINARY:
+            # Probability of the true class: `p` for positive rows, `1 - p` for negative rows, computed as `offset + scale * pred`
+            eps = 1e-15
+            is_positive = self.labels == 1
+            offset = np.where(is_positive, weighted_ensemble_prediction, 1 - weighted_ensemble_prediction)
+            scale = np.where(is_positive, candidate_weight, -candidate_weight)
+            fant_true = offset[np.newaxis] + scale[np.newaxis] * self.predictions[start:end]
+        else:
+            ensemble_true = weighted_ensemble_prediction[self._rows, self._labels_int]
+            ensemble_sum = weighted_ensemble_prediction.sum(axis=1)
+            fant_true = ensemble_true[np.newaxis] + candidate_weight * self.predictions_true[start:end]
+            fant_sum = ensemble_sum[np.newaxis] + candidate_weight * self.predictions_sum[start:end]
+            fant_true /= fant_sum
+            eps = np.finfo(fant_true.dtype).eps
+        np.clip(fant_true, eps, 1 - eps, out=fant_true)
+        np.log(fant_true, out=fant_true)
+        return -fant_true.mean(axis=1)
+
+
+class AccuracyBatchedEnsembleScorer(AbstractBatchedEnsembleScorer):
+    """Accuracy kernel. Renormalization of multiclass fantasy ensembles is skipped as it does not change the argmax."""
+
+    metric_names = ("accuracy",)
+    score_funcs = (sklearn.metrics.accuracy_score,)
+    problem_types = (BINARY, MULTICLASS)
+
+    def _score_chunk(
+        self, weighted_ensemble_prediction: np.ndarray, candidate_weight: float, start: int, end: int
+    ) -> np.ndarray:
+        fant = self._fantasy_ensembles(weighted_ensemble_prediction, candidate_weight, start, end)
+        if self.problem_type == BINARY:
+            y_pred = (fant > 0.5).astype(int)
+        else:
+            y_pred = np.argmax(fant, axis=2)
+        correct = (y_pred == self.labels[np.newaxis]).astype(float)
+        return 1 - self._average(correct)
+
+
+class RocAucBatchedEnsembleScorer(AbstractBatchedEnsembleScorer):
+    """
+    Binary roc_auc kernel based on the Mann-Whitney U statistic, ranking every candidate in one call.
+    Ties receive average ranks, which is equivalent to the trapezoidal AUC computed by the scorer.
+    """
+
+    metric_names = ("roc_auc",)
+    score_funcs = (customized_binary_roc_auc_score,)
+    problem_types = (BINARY,)
+    supports_sample_weight = False
+
+    def __init__(self, predictions: List[np.ndarray], labels: np.ndarray, problem_type: str, **kwargs):
+        super().__init__(predictions=predictions, labels=labels, problem_type=problem_type, **kwargs)
+        self._is_positive = self.labels == 1
+        self._num_positive = int(self._is_positive.sum())
+        self._num_negative = len(self.labels) - self._num_positive
+
+    def _score_chunk(
+        self, weighted_ensemble_prediction: np.ndarray, candidate_weight: float, start: int, end: int
+    ) -> np.ndarray:
+        fant = self._fantasy_ensembles(weighted_ensemble_prediction, candidate_weight, start, end)
+        ranks = scipy.stats.rankdata(fant, axis=1)
+        rank_sum_positive = ranks[:, self._is_positive].sum(axis=1)
+        auc = (rank_sum_positive - self._num_positive * (self._num_positive + 1) / 2) / (
+            self._num_positive * self._num_negative
+        )
+        return 1 - auc
+
+
+class RMSEBatchedEnsembleScorer(AbstractBatchedEnsembleScorer):
+    metric_names = ("root_mean_squared_error",)
+    score_funcs = (rmse_func,)
+    problem_types = (REGRESSION,)
+
+    def _score_chunk(
+        self, weighted_ensemble_prediction: np.ndarray, candidate_weight: float, start: int, end: int
+    ) -> np.ndarray:
+        fant = self._fantasy_ensembles(weighted_ensemble_prediction, candidate_weight, start, end)
+        return np.sqrt(self._average((self.labels[np.newaxis] - fant) ** 2))
+
+
+class MAEBatchedEnsembleScorer(AbstractBatchedEnsembleScorer):
+    metric_names = ("mean_absolute_error",)
+    score_funcs = (sklearn.metrics.mean_absolute_error,)
+    problem_types = (REGRESSION,)
+
+    def _score_chunk(
+        self, weighted_ensemble_prediction: np.ndarray, candidate_weight: float, start: int, end: int
+    ) -> np.ndarray:
+        fant = self._fantasy_ensembles(weighted_ensemble_prediction, candidate_weight, start, end)
+        return self._average(np.abs(fant - self.labels[np.newaxis]))
+
+
+class PinballBatchedEnsembleScorer(AbstractBatchedEnsembleScorer):
+    metric_names = ("pinball_loss",)
+    score_funcs = (quantile_metrics.pinball_loss,)
+    problem_types = (QUANTILE,)
+
+    def __init__(self, predictions: List[np.ndarray], labels: np.ndarray, problem_type: str, **kwargs):
+        super().__init__(predictions=predictions, labels=labels, problem_type=problem_type, **kwargs)
+        if self.quantile_levels is None:
+            raise AssertionError("quantile_levels is required to score quantile metrics")
+        self._quantile_levels = np.asarray(self.quantile_levels, dtype=float).reshape(1, 1, -1)
+
+    def _score_chunk(
+        self, weighted_ensemble_prediction: np.ndarray, candidate_weight: float, start: int, end: int
+    ) -> np.ndarray:
+        fant = self._fantasy_ensembles(weighted_ensemble_prediction, candidate_weight, start, end)
+        error_values = self.labels.reshape(1, -1, 1) - fant
+        loss_values = np.maximum(self._quantile_levels * error_values, (self._quantile_levels - 1) * error_values)
+        if self.sample_weight is None:
+            loss_values = loss_values.mean(axis=1)
+        else:
+            loss_values = np.average(loss_values, axis=1, weights=self.sample_weight)
+        return loss_values.mean(axis=1)
+
+
+BATCHED_ENSEMBLE_SCORERS: List[Type[AbstractBatchedEnsembleScorer]] = [
+    LogLossBatchedEnsembleScorer,
+    AccuracyBatchedEnsembleScorer,
+    RocAucBatchedEnsembleScorer,
+    RMSEBatchedEnsembleScorer,
+    MAEBatchedEnsembleScorer,
+    PinballBatchedEnsembleScorer,
+]
+
+
+def get_batched_ensemble_scorer(
+    metric: Scorer,
+    predictions: List[np.ndarray],
+    labels: np.ndarray,
+    problem_type: str,
+    sample_weight: np.ndarray = None,
+    quantile_levels: List[float] = None,
+    max_chunk_elements: int = DEFAULT_MAX_CHUNK_ELEMENTS,
+) -> Optional[AbstractBatchedEnsembleScorer]:
+    """
+    Returns the batched scorer for `metric`, or None if `metric` has no batched kernel for `problem_type`.
+    When None is returned, callers should fall back to scoring each candidate with `compute_metric`.
+    """
+    for scorer_cls in BATCHED_ENSEMBLE_SCORERS:
+        if scorer_cls.is_supported(metric=metric, problem_type=problem_type, sample_weight=sample_weight):
+            if scorer_cls is RocAucBatchedEnsembleScorer:
+                num_positive = int((np.asarray(labels) == 1).sum())
+                if num_positive == 0 or num_positive == len(labels):
+                    # roc_auc is undefined, let the scorer raise its usual exception
+                    return None
+            return scorer_cls(
+                predictions=predictions,
+                labels=labels,
+                problem_type=problem_type,
+                sample_weight=sample_weight,
+                quantile_levels=quantile_levels,
+                max_chunk_elements=max_chunk_elements,
+            )
+    return None
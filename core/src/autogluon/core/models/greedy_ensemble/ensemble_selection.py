@@ -11,6 +11,7 @@ import pandas as pd
 from ...constants import PROBLEM_TYPES
 from ...metrics import Scorer, compute_metric, log_loss
 from ...utils import get_pred_from_proba
+from .batched_scoring import get_batched_ensemble_scorer
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +42,10 @@ class EnsembleSelection(AbstractWeightedEnsemble):
         tie_breaker: str = "random",
         subsample_size: int | None = None,
         random_state: Optional[np.random.RandomState] = None,
+        use_batched_scoring: bool = True,
+        prune_candidates: bool = False,
+        prune_correlation_threshold: float = 0.999,
+        early_stopping_rounds: int | None = None,
         **kwargs,
     ):
         self.ensemble_size = ensemble_size
@@ -53,6 +58,13 @@ class EnsembleSelection(AbstractWeightedEnsemble):
             raise ValueError(f"Unknown tie_breaker value: {tie_breaker}. Must be one of: ['random', 'second_metric']")
         self.tie_breaker = tie_breaker
         self.subsample_size = subsample_size
+        # If True, scores all candidates of an iteration in one vectorized pass when the metric has a batched kernel
+        self.use_batched_scoring = use_batched_scoring
+        # If True, candidates that are dominated by a better scoring and near-identical candidate are removed before the greedy search
+        self.prune_candidates = prune_candidates
+        self.prune_correlation_threshold = prune_correlation_threshold
+        # If specified, stops the greedy search once the best score has not improved for this many iterations
+        self.early_stopping_rounds = early_stopping_rounds
         if random_state is not None:
             self.random_state = random_state
         else:
@@ -60,8 +72,21 @@ class EnsembleSelection(AbstractWeightedEnsemble):
         self.quantile_levels = kwargs.get("quantile_levels", None)
 
     def fit(
-        self, predictions: List[np.ndarray], labels: np.ndarray, time_limit=None, identifiers=None, sample_weight=None
+        self,
+        predictions: List[np.ndarray],
+        labels: np.ndarray,
+        time_limit=None,
+        identifiers=None,
+        sample_weight=None,
+        warm_start_weights: np.ndarray | None = None,
     ):
+        """
+        Parameters
+        ----------
+        warm_start_weights : np.ndarray, optional
+            Weights of a previously fit ensemble, aligned with `predictions`.
+            If specified, the greedy search starts from this ensemble instead of from an empty ensemble.
+        """
         self.ensemble_size = int(self.ensemble_size)
         if self.ensemble_size < 1:
             raise ValueError("Ensemble size cannot be less than one!")
@@ -70,14 +95,27 @@ class EnsembleSelection(AbstractWeightedEnsemble):
         # if not isinstance(self.metric, Scorer):
         #     raise ValueError('Metric must be of type scorer')
 
-        self._fit(predictions=predictions, labels=labels, time_limit=time_limit, sample_weight=sample_weight)
+        self._fit(
+            predictions=predictions,
+            labels=labels,
+            time_limit=time_limit,
+            sample_weight=sample_weight,
+            warm_start_weights=warm_start_weights,
+        )
         self._calculate_weights()
         logger.log(15, "Ensemble weights: ")
         logger.log(15, self.weights_)
         return self
 
     # TODO: Consider having a removal stage, remove each model and see if score is affected, if improves or not effected, remove it.
-    def _fit(self, predictions: List[np.ndarray], labels: np.ndarray, time_limit=None, sample_weight=None):
+    def _fit(
+        self,
+        predictions: List[np.ndarray],
+        labels: np.ndarray,
+        time_limit=None,
+        sample_weight=None,
+        warm_start_weights: np.ndarray | None = None,
+    ):
         ensemble_size = self.ensemble_size
         if isinstance(labels, pd.Series):
             labels = labels.values
@@ -108,6 +146,41 @@ class EnsembleSelection(AbstractWeightedEnsemble):
         #         trajectory.append(ensemble_performance)
         #     ensemble_size -= n_best
 
+        warm_start_indices = []
+        if warm_start_weights is not None:
+            warm_start_indices = self._get_warm_start_indices(warm_start_weights, ensemble_size=ensemble_size)
+
+        # Greedy search runs over `candidate_indices`, all indices below refer to positions in this list
+        candidate_indices = list(range(self.num_input_models_))
+        if self.prune_candidates and self.num_input_models_ > 1:
+            candidate_indices = self._prune_candidates(
+                predictions=predictions,
+                labels=labels,
+                sample_weight=sample_weight,
+                keep_indices=set(warm_start_indices),
+            )
+            logger.log(
+                15,
+                f"Pruned {self.num_input_models_ - len(candidate_indices)} of {self.num_input_models_} "
+                f"ensemble candidates that are dominated by a better, highly correlated candidate",
+            )
+            candidate_position = {idx: j for j, idx in enumerate(candidate_indices)}
+            warm_start_indices = [candidate_position[idx] for idx in warm_start_indices]
+            predictions = [predictions[idx] for idx in candidate_indices]
+
+        batched_scorer = None
+        if self.use_batched_scoring:
+            batched_scorer = get_batched_ensemble_scorer(
+                metric=self.metric,
+                predictions=predictions,
+                labels=labels,
+                problem_type=self.problem_type,
+                sample_weight=sample_weight,
+                quantile_levels=self.quantile_levels,
+            )
+            if batched_scorer is not None:
+                logger.log(15, f"Using batched ensemble selection scoring for metric '{self.metric.name}'")
+
         time_start = time.time()
         round_scores = False
         epsilon = 1e-4
@@ -115,7 +188,29 @@ class EnsembleSelection(AbstractWeightedEnsemble):
         ensemble_prediction = np.zeros(predictions[0].shape)
         weighted_ensemble_prediction = np.zeros(predictions[0].shape)
         fant_ensemble_prediction = np.zeros(predictions[0].shape)
-        for i in range(ensemble_size):
+        if warm_start_indices:
+            ensemble = [predictions[j] for j in warm_start_indices]
+            order = list(warm_start_indices)
+            used_models = set(warm_start_indices)
+            # The loop below expects `ensemble_prediction` to be the mean of all but the last member
+            if len(ensemble) > 1:
+                ensemble_prediction[:] = np.mean(ensemble[:-1], axis=0)
+            warm_start_prediction = np.mean(ensemble, axis=0)
+            if self.problem_type in ["multiclass", "softclass"]:
+                warm_start_prediction /= warm_start_prediction.sum(axis=1)[:, np.newaxis]
+            warm_start_score = self._calculate_regret(
+                y_true=labels, y_pred_proba=warm_start_prediction, metric=self.metric, sample_weight=sample_weight
+            )
+            if np.abs(warm_start_score) > epsilon:
+                round_scores = True
+                warm_start_score = np.round(warm_start_score, round_decimals)
+            # Intermediate warm start ensembles are never selected as the best ensemble
+            trajectory = [np.inf] * (len(ensemble) - 1) + [warm_start_score]
+            logger.log(
+                15, f"Warm starting ensemble selection from {len(ensemble)} members (score: {-warm_start_score})"
+            )
+        num_rounds_without_improvement = 0
+        for i in range(len(ensemble), ensemble_size):
             scores = np.zeros((len(predictions)))
             s = len(ensemble)
 
@@ -123,19 +218,27 @@ class EnsembleSelection(AbstractWeightedEnsemble):
                 ensemble_prediction *= (s - 1) / s
                 ensemble_prediction += ensemble[-1] / s
                 weighted_ensemble_prediction[:] = (s / float(s + 1)) * ensemble_prediction
-            for j, pred in enumerate(predictions):
-                fant_ensemble_prediction[:] = weighted_ensemble_prediction + (1.0 / float(s + 1)) * pred
-                if self.problem_type in ["multiclass", "softclass"]:
-                    # Renormalize
-                    fant_ensemble_prediction /= fant_ensemble_prediction.sum(axis=1)[:, np.newaxis]
-                scores[j] = self._calculate_regret(
-                    y_true=labels,
-                    y_pred_proba=fant_ensemble_prediction,
-                    metric=self.metric,
-                    sample_weight=sample_weight,
+            if batched_scorer is not None:
+                scores[:] = batched_scorer.score(
+                    weighted_ensemble_prediction=weighted_ensemble_prediction,
+                    candidate_weight=1.0 / float(s + 1),
                 )
                 if round_scores:
-                    scores[j] = scores[j].round(round_decimals)
+                    scores = scores.round(round_decimals)
+            else:
+                for j, pred in enumerate(predictions):
+                    fant_ensemble_prediction[:] = weighted_ensemble_prediction + (1.0 / float(s + 1)) * pred
+                    if self.problem_type in ["multiclass", "softclass"]:
+                        # Renormalize
+                        fant_ensemble_prediction /= fant_ensemble_prediction.sum(axis=1)[:, np.newaxis]
+                    scores[j] = self._calculate_regret(
+                        y_true=labels,
+                        y_pred_proba=fant_ensemble_prediction,
+                        metric=self.metric,
+                        sample_weight=sample_weight,
+                    )
+                    if round_scores:
+                        scores[j] = scores[j].round(round_decimals)
 
             all_best = np.argwhere(np.isclose(scores, np.nanmin(scores), atol=0, rtol=1e-12)).flatten()
 
@@ -171,6 +274,11 @@ class EnsembleSelection(AbstractWeightedEnsemble):
             best = self.random_state.choice(all_best)
             best_score = scores[best]
 
+            if trajectory and best_score >= np.min(trajectory):
+                num_rounds_without_improvement += 1
+            else:
+                num_rounds_without_improvement = 0
+
             # If first iteration
             if i == 0:
                 # If abs value of min score is large enough, round to 6 decimal places to avoid floating point error deciding the best index.
@@ -188,6 +296,14 @@ class EnsembleSelection(AbstractWeightedEnsemble):
             if len(predictions) == 1:
                 break
 
+            if self.early_stopping_rounds is not None and num_rounds_without_improvement >= self.early_stopping_rounds:
+                logger.log(
+                    15,
+                    f"Ensemble score did not improve for {num_rounds_without_improvement} iterations, "
+                    f"early stopping at iteration {i + 1}",
+                )
+                break
+
             if time_limit is not None:
                 time_elapsed = time.time() - time_start
                 time_left = time_limit - time_elapsed
@@ -198,6 +314,7 @@ class EnsembleSelection(AbstractWeightedEnsemble):
                     )
                     break
 
+        order = [candidate_indices[j] for j in order]
         min_score = np.min(trajectory)
         first_index_of_best = trajectory.index(min_score)
 
@@ -214,6 +331,76 @@ class EnsembleSelection(AbstractWeightedEnsemble):
 
         logger.debug("Ensemble indices: " + str(self.indices_))
 
+    def _get_warm_start_indices(self, warm_start_weights: np.ndarray, ensemble_size: int) -> list[int]:
+        """
+        Converts the weights of a previously fit ensemble into a list of ensemble members, ordered by descending weight.
+        Greedy ensemble weights are multiples of `1 / n` where `n` is the size of the ensemble,
+        so the smallest `n` that reproduces the weights is used to recover the member counts.
+        """
+        warm_start_weights = np.asarray(warm_start_weights, dtype=float)
+        if len(warm_start_weights) != self.num_input_models_:
+            raise ValueError(
+                f"warm_start_weights must have one weight per model ({len(warm_start_weights)} != {self.num_input_models_})"
+            )
+        if warm_start_weights.sum() <= 0:
+            return []
+        warm_start_weights = warm_start_weights / warm_start_weights.sum()
+        counts = None
+        for n in range(1, ensemble_size + 1):
+            counts_n = warm_start_weights * n
+            if np.allclose(counts_n, np.round(counts_n), atol=1e-6):
+                counts = np.round(counts_n).astype(int)
+                break
+        if counts is None:
+            counts = np.round(warm_start_weights * ensemble_size).astype(int)
+        warm_start_indices = []
+        for idx in np.argsort(-counts, kind="stable"):
+            warm_start_indices += [int(idx)] * counts[idx]
+        return warm_start_indices[:ensemble_size]
+
+    def _prune_candidates(
+        self,
+        predictions: List[np.ndarray],
+        labels: np.ndarray,
+        sample_weight: np.ndarray | None = None,
+        keep_indices: set[int] | None = None,
+        max_rows: int = 10000,
+    ) -> list[int]:
+        """
+        Returns the indices of the candidates to consider in the greedy search.
+
+        Candidates are visited from best to worst individual score.
+        A candidate is pruned if its predictions are correlated above `prune_correlation_threshold` with a better candidate that was kept,
+        as adding it to the ensemble is nearly equivalent to adding the better candidate.
+        Correlations are computed on at most `max_rows` evenly spaced rows.
+        """
+        if keep_indices is None:
+            keep_indices = set()
+        scores = np.array(
+            [
+                self._calculate_regret(
+                    y_true=labels, y_pred_proba=pred, metric=self.metric, sample_weight=sample_weight
+                )
+                for pred in predictions
+            ]
+        )
+        scores = np.where(np.isnan(scores), np.inf, scores)
+        row_step = max(len(labels) // max_rows, 1)
+        preds_flat = np.stack([np.asarray(pred[::row_step], dtype=np.float64).ravel() for pred in predictions])
+        preds_flat -= preds_flat.mean(axis=1, keepdims=True)
+        preds_norm = np.linalg.norm(preds_flat, axis=1)
+        # Constant predictions have zero norm, they are only correlated with themselves
+        preds_norm[preds_norm == 0] = np.inf
+
+        kept = []
+        for idx in np.argsort(scores, kind="stable"):
+            if kept and idx not in keep_indices:
+                correlations = preds_flat[kept] @ preds_flat[idx] / (preds_norm[kept] * preds_norm[idx])
+                if np.max(correlations) >= self.prune_correlation_threshold:
+                    continue
+            kept.append(idx)
+        return sorted(int(idx) for idx in kept)
+
     def _calculate_regret(
         self, y_true: np.ndarray, y_pred_proba: np.ndarray, metric: Scorer, sample_weight: np.ndarray = None
     ) -> float:
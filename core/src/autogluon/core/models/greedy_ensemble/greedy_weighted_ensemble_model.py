@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import logging
 
+import numpy as np
+
 from autogluon.common.features.types import S_STACK
 
 from ...constants import MULTICLASS, QUANTILE, SOFTCLASS
@@ -56,8 +58,17 @@ class GreedyWeightedEnsembleModel(AbstractModel):
         self.features = self._set_stack_columns(base_model_names=self.base_model_names)
 
     # TODO: Check memory after loading best model predictions, only load top X model predictions that fit in memory
-    def _fit(self, X, y, X_val=None, y_val=None, time_limit=None, sample_weight=None, **kwargs):
+    def _fit(
+        self, X, y, X_val=None, y_val=None, time_limit=None, sample_weight=None, warm_start_weights=None, **kwargs
+    ):
         params = self._get_model_params()
+        # fast_mode: prune dominated candidates, warm start from `warm_start_weights` and stop early on plateau
+        fast_mode = params.pop("fast_mode", False)
+        if fast_mode:
+            params.setdefault("prune_candidates", True)
+            params.setdefault("early_stopping_rounds", 5)
+        else:
+            warm_start_weights = None
         if self.model is None:
             X = self.preprocess(X, y=y)
             self.model = self.model_base(
@@ -66,7 +77,13 @@ class GreedyWeightedEnsembleModel(AbstractModel):
                 metric=self.stopping_metric,
                 **params,
             )
-            self.model = self.model.fit(X, y, time_limit=time_limit, sample_weight=sample_weight)
+            self.model = self.model.fit(
+                X,
+                y,
+                time_limit=time_limit,
+                sample_weight=sample_weight,
+                warm_start_weights=self._get_warm_start_weights(warm_start_weights),
+            )
             self.base_model_names, self.model.weights_ = self.remove_zero_weight_models(
                 self.base_model_names, self.model.weights_
             )
@@ -86,6 +103,15 @@ class GreedyWeightedEnsembleModel(AbstractModel):
             pred_probas.append(pred_proba)
         return pred_probas
 
+    def _get_warm_start_weights(self, warm_start_weights: dict[str, float] | None):
+        """Aligns the `warm_start_weights` dictionary of model name to weight with `self.base_model_names`."""
+        if not warm_start_weights:
+            return None
+        weights = np.array([warm_start_weights.get(model, 0) for model in self.base_model_names], dtype=float)
+        if weights.sum() <= 0:
+            return None
+        return weights
+
     @staticmethod
     def remove_zero_weight_models(base_model_names, base_model_weights):
         base_models_to_keep = []
@@ -1,9 +1,55 @@
+from __future__ import annotations
+
 import copy
+import datetime
+import logging
+import os
+import platform
+import tempfile
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Iterable, Iterator
 
 import numpy as np
 import pandas as pd
 
+from autogluon.common.loaders import load_pd
+from autogluon.common.savers import save_json
+from autogluon.common.utils.resource_utils import ResourceManager
+
+from ..version import __version__
+
+logger = logging.getLogger(__name__)
+
+# Passed to `get_model_pred_proba_dict` when benchmarking: cached predictions would skip inference for all repeats
+# after the first, and concurrently predicting models would measure each other's contention instead of their own
+# inference time. Passed per call, so that the settings of the predictor are unchanged for concurrent callers.
+_BENCHMARK_PREDICT_KWARGS = dict(parallel_num_cpus=1, use_prediction_cache=False)
+
+
+def _get_data_batch(data: pd.DataFrame, batch_size: int) -> pd.DataFrame:
+    """Returns `data` resized to exactly `batch_size` rows by duplicating and/or sampling rows."""
+    data_batch = copy.deepcopy(data)
+    len_data = len(data_batch)
+    if len_data == batch_size:
+        pass
+    elif len_data < batch_size:
+        # add more rows
+        duplicate_count = int(np.ceil(batch_size / len_data))
+        data_batch = pd.concat([data_batch for _ in range(duplicate_count)])
+        len_data = len(data_batch)
+    if len_data > batch_size:
+        # sample rows
+        data_batch = data_batch.sample(n=batch_size, random_state=0)
+        len_data = len(data_batch)
+
+    if len_data != batch_size:
+        raise AssertionError(f"len(data_batch) must equal batch_size! ({len_data} != {batch_size})")
+    return data_batch
+
 
 def get_model_true_infer_speed_per_row_batch(
     data: pd.DataFrame, *, predictor, batch_size: int = 100000, repeats=1, persist=True, silent=False
@@ -37,36 +83,33 @@ def get_model_true_infer_speed_per_row_batch(
             'pred_time_test_marginal' is the prediction time needed to predict for this particular model minus dependent model inference times and global preprocessing time.
         time_per_row_transform is the time in seconds per row to do the feature preprocessing.
     """
-    data_batch = copy.deepcopy(data)
-    len_data = len(data_batch)
-    if len_data == batch_size:
-        pass
-    elif len_data < batch_size:
-        # add more rows
-        duplicate_count = int(np.ceil(batch_size / len_data))
-        data_batch = pd.concat([data_batch for _ in range(duplicate_count)])
-        len_data = len(data_batch)
-    if len_data > batch_size:
-        # sample rows
-        data_batch = data_batch.sample(n=batch_size, random_state=0)
-        len_data = len(data_batch)
-
-    if len_data != batch_size:
-        raise AssertionError(f"len(data_batch) must equal batch_size! ({len_data} != {batch_size})")
+    data_batch = _get_data_batch(data=data, batch_size=batch_size)
 
     if persist:
         predictor.persist(models="all")
 
-    ts = time.time()
+    trainer = predictor._trainer
+    models = trainer.get_model_names(can_infer=True)
+    # Models that depend on other models also spend time predicting with their ancestors
+    model_sets = {model: trainer.get_minimum_model_set(model) for model in models}
+
+    ts = time.perf_counter()
     for i in range(repeats):
-        predictor.transform_features(data_batch)
-    time_transform = (time.time() - ts) / repeats
+        X = predictor.transform_features(data_batch)
+    time_transform = (time.perf_counter() - ts) / repeats
 
     leaderboards = []
     for i in range(repeats):
-        leaderboard = predictor.leaderboard(data_batch, skip_score=True)
-        leaderboard = leaderboard[leaderboard["can_infer"]][["model", "pred_time_test", "pred_time_test_marginal"]]
-        leaderboard = leaderboard.set_index("model")
+        _, model_pred_time_dict = trainer.get_model_pred_proba_dict(
+            X=X, models=models, record_pred_time=True, **_BENCHMARK_PREDICT_KWARGS
+        )
+        leaderboard = pd.DataFrame(
+            {
+                "pred_time_test": [sum(model_pred_time_dict[m] for m in model_sets[model]) for model in models],
+                "pred_time_test_marginal": [model_pred_time_dict[model] for model in models],
+            },
+            index=pd.Index(models, name="model"),
+        )
         leaderboards.append(leaderboard)
     leaderboard = pd.concat(leaderboards)
     time_per_batch_df = leaderboard.groupby(level=0).mean()
@@ -187,3 +230,483 @@ def get_model_true_infer_speed_per_row_batch_bulk(
     infer_df_full = infer_df_full.reset_index(drop=True)
 
     return infer_df_full, infer_df_full_transform
+
+
+class _PeakMemoryMonitor:
+    """
+    Tracks the peak resident set size (RSS) of the current process by polling it on a background thread.
+    Unlike `resource.getrusage`, the peak can be measured for an arbitrary section of code rather than the lifetime of the process.
+    If the RSS cannot be retrieved (e.g. in lite mode), the peak is None.
+    """
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.process = ResourceManager.get_process()
+        self.rss_start = None
+        self.rss_peak = None
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def _get_rss(self) -> int | None:
+        if self.process is None:
+            return None
+        try:
+            return self.process.memory_info().rss
+        except Exception:
+            return None
+
+    def _poll(self):
+        while not self._stop_event.wait(self.interval):
+            self._update()
+
+    def _update(self):
+        rss = self._get_rss()
+        if rss is not None and (self.rss_peak is None or rss > self.rss_peak):
+            self.rss_peak = rss
+
+    def __enter__(self):
+        self.rss_start = self._get_rss()
+        self.rss_peak = self.rss_start
+        if self.process is not None:
+            self._thread = threading.Thread(target=self._poll, daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+        self._update()
+
+
+def _summarize_latencies(latencies: list[float], batch_size: int) -> dict:
+    latencies = np.array(latencies, dtype=np.float64)
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+    return dict(
+        latency_p50=float(p50),
+        latency_p95=float(p95),
+        latency_p99=float(p99),
+        latency_mean=float(latencies.mean()),
+        throughput=float(batch_size / p50) if p50 > 0 else float("inf"),
+    )
+
+
+def _benchmark_inference_batch(
+    data_batch: pd.DataFrame, *, predictor, models: list[str], repeats: int, persisted: bool, compiled: bool
+) -> list[dict]:
+    """Measures the latency of `transform_features` and of every model in `models` on `data_batch`."""
+    trainer = predictor._trainer
+    batch_size = len(data_batch)
+    # Models that depend on other models also spend time predicting with their ancestors
+    model_sets = {model: trainer.get_minimum_model_set(model) for model in models}
+
+    latencies_transform = []
+    latencies_model = {model: [] for model in models}
+    latencies_model_marginal = {model: [] for model in models}
+    with _PeakMemoryMonitor() as memory_monitor:
+        # Warm up to exclude one-time costs such as lazy imports from the measurement
+        X = predictor.transform_features(data_batch)
+        trainer.get_model_pred_proba_dict(X=X, models=models, **_BENCHMARK_PREDICT_KWARGS)
+        for _ in range(repeats):
+            time_start = time.perf_counter()
+            X = predictor.transform_features(data_batch)
+            latencies_transform.append(time.perf_counter() - time_start)
+
+            _, model_pred_time_dict = trainer.get_model_pred_proba_dict(
+                X=X, models=models, record_pred_time=True, **_BENCHMARK_PREDICT_KWARGS
+            )
+            for model in models:
+                latencies_model[model].append(sum(model_pred_time_dict[m] for m in model_sets[model]))
+                latencies_model_marginal[model].append(model_pred_time_dict[model])
+
+    peak_rss_mb = None
+    peak_rss_increase_mb = None
+    if memory_monitor.rss_peak is not None:
+        peak_rss_mb = float(memory_monitor.rss_peak / 1e6)
+        peak_rss_increase_mb = float((memory_monitor.rss_peak - memory_monitor.rss_start) / 1e6)
+
+    common = dict(
+        batch_size=batch_size,
+        persisted=persisted,
+        compiled=compiled,
+        peak_rss_mb=peak_rss_mb,
+        peak_rss_increase_mb=peak_rss_increase_mb,
+    )
+    results = [
+        dict(
+            name="transform_features",
+            stage="transform",
+            **common,
+            **_summarize_latencies(latencies_transform, batch_size),
+        )
+    ]
+    for model in models:
+        result = dict(name=model, stage="model", **common, **_summarize_latencies(latencies_model[model], batch_size))
+        result["latency_marginal_p50"] = float(np.percentile(latencies_model_marginal[model], 50))
+        latencies_with_transform = np.array(latencies_model[model]) + np.array(latencies_transform)
+        result["latency_with_transform_p50"] = float(np.percentile(latencies_with_transform, 50))
+        result["throughput_with_transform"] = float(batch_size / result["latency_with_transform_p50"])
+        results.append(result)
+    return results
+
+
+def _benchmark_inference_predictor(
+    data: pd.DataFrame,
+    *,
+    predictor,
+    models: list[str],
+    batch_sizes: list[int],
+    repeats: int,
+    persist_modes: list[bool],
+    compiled: bool,
+    silent: bool,
+) -> list[dict]:
+    trainer = predictor._trainer
+    models_persisted_og = list(trainer.models.keys())
+    results = []
+    try:
+        for persisted in persist_modes:
+            if trainer.models:
+                trainer.unpersist(model_names=list(trainer.models.keys()))
+            if persisted:
+                trainer.persist(model_names=models, with_ancestors=True)
+            for batch_size in batch_sizes:
+                if not silent:
+                    logger.log(
+                        20,
+                        f"Benchmarking inference: batch_size={batch_size}, persisted={persisted}, "
+                        f"compiled={compiled}",
+                    )
+                data_batch = _get_data_batch(data=data, batch_size=batch_size)
+                results += _benchmark_inference_batch(
+                    data_batch,
+                    predictor=predictor,
+                    models=models,
+                    repeats=repeats,
+                    persisted=persisted,
+                    compiled=compiled,
+                )
+    finally:
+        if trainer.models:
+            trainer.unpersist(model_names=list(trainer.models.keys()))
+        if models_persisted_og:
+            trainer.persist(model_names=models_persisted_og)
+    return results
+
+
+def benchmark_inference(
+    data: pd.DataFrame,
+    *,
+    predictor,
+    models: list[str] | None = None,
+    batch_sizes: list[int] | None = None,
+    repeats: int = 5,
+    persist_modes: list[bool] | None = None,
+    compile: bool = False,
+    compiler_configs: dict | str = "auto",
+    path: str | None = None,
+    silent: bool = False,
+) -> dict:
+    """
+    Benchmark the inference latency, throughput and memory usage of every model of a fitted TabularPredictor.
+
+    For each combination of compilation mode, persistence mode and batch size, `data` is resized to the batch size,
+    and the feature preprocessing (`transform_features`) and every model are timed separately for `repeats` repeats.
+    The time of a model includes the time of the models it depends on (as in `pred_time_test` of the leaderboard),
+    but excludes the feature preprocessing time.
+    The benchmark predicts without prediction caching and parallel DAG inference, so that every model is timed on its own,
+    without changing these settings for other callers of the predictor.
+    The models that were persisted beforehand are persisted again afterwards.
+
+    Parameters
+    ----------
+    data : :class:`pd.DataFrame`
+        Data to predict on. Rows are duplicated and/or sampled to reach each batch size. The label column is not required.
+    predictor : TabularPredictor
+        Fitted predictor to benchmark.
+    models : list[str], default = None
+        Models to benchmark. If None, benchmarks all models that can infer.
+    batch_sizes : list[int], default = [1, 10, 100, 1000, 10000, 100000]
+        Batch sizes to benchmark.
+    repeats : int, default = 5
+        Number of timed repeats per batch size, after one untimed warm-up repeat.
+        The latency percentiles are computed over the repeats, so more repeats give more reliable tail latencies.
+    persist_modes : list[bool], default = [False, True]
+        Whether to benchmark with models loaded from disk on every call (False) and/or with models persisted in memory (True).
+    compile : bool, default = False
+        If True, additionally benchmarks compiled models. The predictor is cloned to a temporary directory and the clone
+        is compiled with `compiler_configs`, leaving the original predictor unchanged.
+        Models that do not support the configured compiler remain uncompiled in the clone.
+    compiler_configs : dict or str, default = "auto"
+        Compiler configurations used when `compile=True`. Refer to `TabularPredictor.compile` for details.
+    path : str, default = None
+        If specified, the report is saved as JSON to this path. Reports of different releases can be diffed with each other.
+    silent : bool, default = False
+        If False, logs progress and a summary of the results.
+
+    Returns
+    -------
+    report : dict
+        'metadata' contains the AutoGluon version, system information and the benchmark settings.
+        'results' is a list with one entry per (name, batch_size, persisted, compiled) that contains:
+            'name': the model name, or "transform_features" for the feature preprocessing.
+            'stage': "model" or "transform".
+            'latency_p50', 'latency_p95', 'latency_p99', 'latency_mean': latency of a batch in seconds.
+            'throughput': rows per second at the median latency.
+            'peak_rss_mb', 'peak_rss_increase_mb': peak resident memory of the process while benchmarking the batch size,
+                and its increase over the resident memory at the start. Shared by all entries of the same batch size.
+        Model entries additionally contain:
+            'latency_marginal_p50': median latency of the model excluding the models it depends on.
+            'latency_with_transform_p50', 'throughput_with_transform': end-to-end latency and throughput of `predictor.predict_proba(data, model=name)`.
+        The results can be converted to a DataFrame via `pd.DataFrame(report["results"])`.
+    """
+    if batch_sizes is None:
+        batch_sizes = [1, 10, 100, 1000, 10000, 100000]
+    if persist_modes is None:
+        persist_modes = [False, True]
+    if repeats < 1:
+        raise ValueError(f"`repeats` must be at least 1. Found: {repeats}")
+    if models is None:
+        models = predictor.model_names(can_infer=True)
+    label = getattr(predictor, "label", None)
+    if label is not None and label in data.columns:
+        data = data.drop(columns=[label])
+
+    results = _benchmark_inference_predictor(
+        data,
+        predictor=predictor,
+        models=models,
+        batch_sizes=batch_sizes,
+        repeats=repeats,
+        persist_modes=persist_modes,
+        compiled=False,
+        silent=silent,
+    )
+    if compile:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            predictor_compiled = predictor.clone(path=os.path.join(tmp_dir, "predictor"), return_clone=True)
+            predictor_compiled.compile(models=models, compiler_configs=compiler_configs)
+            results += _benchmark_inference_predictor(
+                data,
+                predictor=predictor_compiled,
+                models=models,
+                batch_sizes=batch_sizes,
+                repeats=repeats,
+                persist_modes=persist_modes,
+                compiled=True,
+                silent=silent,
+            )
+            del predictor_compiled
+
+    report = dict(
+        metadata=dict(
+            autogluon_version=__version__,
+            python_version=platform.python_version(),
+            platform=platform.platform(),
+            num_cpus=ResourceManager.get_cpu_count(),
+            memory_mb=float(ResourceManager.get_memory_size("MB")),
+            timestamp=datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            problem_type=getattr(predictor, "problem_type", None),
+            num_features=len(data.columns),
+            models=list(models),
+            batch_sizes=list(batch_sizes),
+            repeats=repeats,
+            persist_modes=list(persist_modes),
+            compile=compile,
+        ),
+        results=results,
+    )
+    if path is not None:
+        save_json.save(path=path, obj=report, sanitize=False)
+        if not silent:
+            logger.log(20, f"Saved inference benchmark report to {path}")
+    if not silent:
+        _log_benchmark_inference_summary(results)
+    return report
+
+
+def _log_benchmark_inference_summary(results: list[dict]):
+    df = pd.DataFrame(results)
+    df = df[["name", "batch_size", "persisted", "compiled", "latency_p50", "latency_p99", "throughput", "peak_rss_mb"]]
+    with pd.option_context("display.max_rows", None, "display.max_columns", None, "display.width", 1000):
+        logger.log(20, f"Inference benchmark results:\n{df.to_string(index=False)}")
+
+
+def _iter_data_chunks(
+    data: pd.DataFrame | str | Iterable[pd.DataFrame], chunk_size: int, columns: list[str] | None = None
+) -> Iterator[pd.DataFrame]:
+    """Yields `data` in chunks of at most `chunk_size` rows, without loading `data` into memory if it is a file path or an iterator."""
+    if isinstance(data, pd.DataFrame):
+        chunks = [data]
+    elif isinstance(data, str):
+        chunks = load_pd.load_chunks(path=data, chunk_size=chunk_size, columns_to_keep=columns)
+    else:
+        chunks = data
+    for chunk in chunks:
+        if not isinstance(chunk, pd.DataFrame):
+            raise TypeError(f"data chunks must be pd.DataFrame, but found {type(chunk).__name__}")
+        for row_start in range(0, len(chunk), chunk_size):
+            yield chunk.iloc[row_start : row_start + chunk_size]
+
+
+def _iter_chunk_predictions(
+    data: pd.DataFrame | str | Iterable[pd.DataFrame],
+    *,
+    predict_fn: Callable[[pd.DataFrame], pd.Series | pd.DataFrame],
+    chunk_size: int,
+    columns: list[str] | None = None,
+    keep_columns: list[str] | None = None,
+    num_workers: int = 1,
+) -> Iterator[pd.Series | pd.DataFrame]:
+    """
+    Yields `predict_fn(chunk)` for every chunk of `data` in order.
+    With `num_workers > 1`, chunks are predicted concurrently on a thread pool,
+    with at most `2 * num_workers` chunks in flight to bound memory usage.
+    """
+
+    def _predict_chunk(chunk: pd.DataFrame) -> pd.Series | pd.DataFrame:
+        y_pred = predict_fn(chunk)
+        if keep_columns:
+            if isinstance(y_pred, pd.Series):
+                y_pred = y_pred.to_frame()
+            y_pred = pd.concat([chunk[keep_columns], y_pred], axis=1)
+        return y_pred
+
+    chunks = _iter_data_chunks(data=data, chunk_size=chunk_size, columns=columns)
+    if num_workers <= 1:
+        for chunk in chunks:
+            yield _predict_chunk(chunk)
+        return
+
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        futures = deque()
+        for chunk in chunks:
+            futures.append(executor.submit(_predict_chunk, chunk))
+            if len(futures) >= 2 * num_workers:
+                yield futures.popleft().result()
+        while futures:
+            yield futures.popleft().result()
+
+
+def predict_chunked(
+    data: pd.DataFrame | str | Iterable[pd.DataFrame],
+    *,
+    predictor,
+    output_path: str | None = None,
+    as_proba: bool = False,
+    chunk_size: int = 100000,
+    num_workers: int = 1,
+    keep_columns: list[str] | None = None,
+    **predict_kwargs,
+) -> Iterator[pd.Series | pd.DataFrame] | str:
+    """
+    Predict on data that does not fit in memory by streaming it through the predictor in chunks of bounded size.
+    Refer to `TabularPredictor.predict_chunked` for details.
+
+    Parameters
+    ----------
+    data : :class:`pd.DataFrame`, str or iterable of :class:`pd.DataFrame`
+        The data to predict on: a DataFrame, a path to a CSV file, a Parquet file or a directory of Parquet files,
+        or an iterable (such as a generator) of DataFrames.
+        If a file path, only the columns required for prediction and `keep_columns` are loaded.
+    predictor : TabularPredictor
+        The fitted predictor to predict with.
+    output_path : str, optional
+        If specified, the predictions are written to a Parquet file at `output_path`, and `output_path` is returned.
+        If None, a generator of the predictions of each chunk is returned.
+        The models required for prediction are only persisted in memory if `output_path` is specified,
+        as a returned generator may never be exhausted. When iterating over the generator, call `predictor.persist()`
+        beforehand to avoid loading the models from disk for every chunk.
+    as_proba : bool, default = False
+        If True, predicts prediction probabilities as `predictor.predict_proba` does, otherwise predictions as
+        `predictor.predict` does.
+    chunk_size : int, default = 100000
+        The maximum number of rows predicted at once.
+    num_workers : int, default = 1
+        The number of chunks predicted concurrently on a thread pool.
+    keep_columns : list[str], optional
+        Columns of `data`, such as an ID column, to include in the output alongside the predictions.
+    **predict_kwargs :
+        Passed to the `predict` or `predict_proba` method of the predictor's learner.
+
+    Returns
+    -------
+    A generator of predictions per chunk in the order of `data`, or `output_path` if specified.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, but was {chunk_size}")
+    if keep_columns is not None and not isinstance(keep_columns, list):
+        keep_columns = [keep_columns]
+    # The learner is called directly, as the predictor does not expose disabling the prediction cache per call
+    predict_fn = predictor._learner.predict_proba if as_proba else predictor._learner.predict
+    columns = None
+    if isinstance(data, str):
+        features = list(predictor._learner.feature_generators[0].features_in)
+        columns = features + [c for c in keep_columns or [] if c not in features]
+
+    # Predictions are not cached for every chunk. The cache is disabled per call,
+    # so that other calls to the predictor are unaffected while the caller iterates over the returned generator.
+    def _predict_chunk(chunk: pd.DataFrame) -> pd.Series | pd.DataFrame:
+        return predict_fn(chunk, use_prediction_cache=False, **predict_kwargs)
+
+    predictions = _iter_chunk_predictions(
+        data,
+        predict_fn=_predict_chunk,
+        chunk_size=chunk_size,
+        columns=columns,
+        keep_columns=keep_columns,
+        num_workers=num_workers,
+    )
+    if output_path is None:
+        return predictions
+    with _persist_models(predictor=predictor, model=predict_kwargs.get("model", None)):
+        _save_predictions_parquet(predictions=predictions, path=output_path)
+    return output_path
+
+
+@contextmanager
+def _persist_models(predictor, model: str | None = None):
+    """Persists the models required to predict with `model` into memory for the duration of the context."""
+    trainer = predictor._trainer
+    if model is None:
+        model = predictor.model_best
+    models_to_persist = [m for m in trainer.get_minimum_model_set(model) if m not in trainer.models]
+    if models_to_persist:
+        trainer.persist(model_names=models_to_persist)
+    try:
+        yield
+    finally:
+        if models_to_persist:
+            trainer.unpersist(model_names=models_to_persist)
+
+
+def _save_predictions_parquet(predictions: Iterable[pd.Series | pd.DataFrame], path: str):
+    """Writes the predictions of each chunk to a single Parquet file at `path` without holding more than one chunk in memory."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    path_tmp = f"{path}.tmp"
+    path_dir = os.path.dirname(path)
+    if path_dir:
+        os.makedirs(path_dir, exist_ok=True)
+    writer = None
+    num_rows = 0
+    try:
+        for y_pred in predictions:
+            if isinstance(y_pred, pd.Series):
+                y_pred = y_pred.to_frame()
+            y_pred.columns = [str(c) for c in y_pred.columns]
+            if writer is None:
+                table = pa.Table.from_pandas(y_pred, preserve_index=False)
+                writer = pq.ParquetWriter(path_tmp, schema=table.schema)
+            else:
+                table = pa.Table.from_pandas(y_pred, schema=writer.schema, preserve_index=False)
+            writer.write_table(table)
+            num_rows += len(y_pred)
+    finally:
+        if writer is not None:
+            writer.close()
+    if writer is None:
+        raise AssertionError("No predictions were made, `data` is empty.")
+    os.replace(path_tmp, path)
+    logger.log(20, f"Saved {num_rows} predictions to {path}")
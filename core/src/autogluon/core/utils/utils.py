@@ -6,6 +6,7 @@ import pickle
 import random
 import sys
 import time
+import warnings
 from typing import Callable, List, Tuple
 
 import numpy as np
@@ -271,6 +272,9 @@ def convert_pred_probas_to_df(
     """
     Converts a list of pred_proba model outputs to a DataFrame
 
+    The prediction probabilities of all models are written into a single preallocated block,
+    which becomes the only block of the output DataFrame without further copies.
+
     Parameters
     ----------
     pred_proba_list : List[ArrayLike]
@@ -287,16 +291,55 @@ def convert_pred_probas_to_df(
     -------
     DataFrame
     """
+    pred_proba_list = [np.asarray(pred_proba) for pred_proba in pred_proba_list]
+    num_rows = len(pred_proba_list[0]) if pred_proba_list else 0
+    dtype = np.result_type(*pred_proba_list) if pred_proba_list else np.float64
+    # pandas stores a 2D block as (num_columns, num_rows), so the transpose of a C-contiguous (num_columns, num_rows)
+    # array is used as-is by the DataFrame constructor.
+    block = np.empty((len(columns), num_rows), dtype=dtype)
     if problem_type in [MULTICLASS, SOFTCLASS, QUANTILE]:
-        pred_proba_list = np.concatenate(pred_proba_list, axis=1)
-        pred_proba_df = pd.DataFrame(data=pred_proba_list, columns=columns)
+        col_start = 0
+        for pred_proba in pred_proba_list:
+            col_end = col_start + pred_proba.shape[1]
+            block[col_start:col_end] = pred_proba.T
+            col_start = col_end
+        if col_start != len(columns):
+            raise ValueError(f"Expected {len(columns)} prediction columns, but found {col_start}.")
     else:
-        pred_proba_df = pd.DataFrame(data=np.asarray(pred_proba_list).T, columns=columns)
-    if index is not None:
-        pred_proba_df.set_index(index, inplace=True)
+        if len(pred_proba_list) != len(columns):
+            raise ValueError(f"Expected {len(columns)} prediction columns, but found {len(pred_proba_list)}.")
+        for i, pred_proba in enumerate(pred_proba_list):
+            block[i] = pred_proba
+    pred_proba_df = pd.DataFrame(data=block.T, columns=columns, index=index, copy=False)
     return pred_proba_df
 
 
+def concat_stack_features(X_stacker: DataFrame, X: DataFrame) -> DataFrame:
+    """
+    Returns a DataFrame with the stack features `X_stacker` followed by the original features `X`.
+
+    Unlike `pd.concat([X_stacker, X], axis=1)`, the original features are never copied: the output is a shallow copy
+    of `X` with the stack features inserted in front, so it shares the column arrays of `X` regardless of whether
+    pandas copy-on-write is enabled. Only the stack features are copied into the output.
+    Replacing a column of the output does not affect `X`, but without copy-on-write, in-place element-wise writes to
+    the original feature columns of the output (e.g. `X_out.loc[...] = ...`) also modify `X`. This is the same
+    requirement that already applies to `X` itself, which is shared by every model fit on it.
+    `X_stacker` and `X` must share the same index.
+    """
+    if not X_stacker.index.equals(X.index):
+        raise AssertionError("`X_stacker` and `X` must share the same index.")
+    # `pd.concat` copies the blocks of `X` unless copy-on-write is enabled globally, and `pd.concat(copy=False)`
+    # consolidates the output, which copies every column of `X` that shares a dtype with the stack features.
+    # A shallow copy keeps the blocks of `X` as-is, and inserting a column never consolidates existing blocks.
+    X_out = X.copy(deep=False)
+    with warnings.catch_warnings():
+        # Each inserted stack feature is its own block, which pandas reports as fragmentation past 100 blocks.
+        warnings.simplefilter("ignore", category=pd.errors.PerformanceWarning)
+        for i, column in enumerate(X_stacker.columns):
+            X_out.insert(i, column, X_stacker[column].to_numpy(), allow_duplicates=True)
+    return X_out
+
+
 def extract_label(data: DataFrame, label: str) -> (DataFrame, Series):
     """
     Extract the label column from a dataset and return X, y.
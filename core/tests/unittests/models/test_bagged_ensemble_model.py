@@ -1,8 +1,10 @@
+import os
+
 import numpy as np
 import pandas as pd
 
 from autogluon.common.utils.cv_splitter import CVSplitter
-from autogluon.core.models import BaggedEnsembleModel
+from autogluon.core.models import BaggedEnsembleModel, DummyModel
 
 
 def test_generate_fold_configs():
@@ -128,3 +130,46 @@ def test_generate_fold_configs_with_offset_index():
     # iloc access with those positional indices gives the correct labels
     assert X.iloc[test_idx_0].index[0] == 1000
     assert X.iloc[test_idx_1].index[0] == 1000 + n // 2
+
+
+def test_when_bagged_model_is_saved_then_oof_is_memory_mapped_from_disk(tmp_path):
+    rng = np.random.RandomState(0)
+    X = pd.DataFrame(rng.rand(40, 3), columns=["a", "b", "c"])
+    y = pd.Series(rng.randint(0, 2, size=40))
+    model = BaggedEnsembleModel(
+        model_base=DummyModel,
+        model_base_kwargs=dict(problem_type="binary", eval_metric="log_loss"),
+        path=str(tmp_path),
+        name="bag",
+        hyperparameters={"fold_fitting_strategy": "sequential_local"},
+    )
+    model.fit(X=X, y=y, k_fold=2)
+    oof_pred_proba_expected = model.predict_proba_oof()
+    oof_pred_proba_sum_expected = model._oof_pred_proba.copy()
+    model.save()
+
+    oof_pred_proba = BaggedEnsembleModel.load_oof(path=model.path)
+    assert isinstance(oof_pred_proba, np.memmap)
+    assert oof_pred_proba.dtype == np.float32
+    np.testing.assert_array_equal(oof_pred_proba, oof_pred_proba_expected)
+    np.testing.assert_array_equal(model.predict_proba_oof(), oof_pred_proba_expected)
+
+    # In-place modifications must not be written back to disk
+    oof_pred_proba[:] = 0
+    np.testing.assert_array_equal(BaggedEnsembleModel.load_oof(path=model.path), oof_pred_proba_expected)
+
+    # The `.npy` files replace `oof.pkl`, and the unnormalized OOF required to fit more folds is restored exactly
+    assert not os.path.exists(os.path.join(model.path, "utils", BaggedEnsembleModel._oof_filename))
+    model._load_oof()
+    assert model._oof_pred_proba.dtype == oof_pred_proba_sum_expected.dtype
+    np.testing.assert_array_equal(model._oof_pred_proba, oof_pred_proba_sum_expected)
+    np.testing.assert_array_equal(model._oof_pred_model_repeats, np.ones(len(X), dtype=np.uint8))
+    np.testing.assert_array_equal(model.predict_proba_oof(), oof_pred_proba_expected)
+
+    model.reduce_memory_size(remove_fit_stack=True, requires_save=True)
+    for filename in [
+        BaggedEnsembleModel._oof_pred_proba_filename,
+        BaggedEnsembleModel._oof_pred_proba_sum_filename,
+        BaggedEnsembleModel._oof_pred_model_repeats_filename,
+    ]:
+        assert not os.path.exists(os.path.join(model.path, "utils", filename))
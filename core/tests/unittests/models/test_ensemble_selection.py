@@ -0,0 +1,184 @@
+import numpy as np
+import pytest
+
+from autogluon.core.metrics import get_metric
+from autogluon.core.models.greedy_ensemble.batched_scoring import get_batched_ensemble_scorer
+from autogluon.core.models.greedy_ensemble.ensemble_selection import EnsembleSelection
+
+
+def _generate_predictions(problem_type: str, num_models: int = 12, num_rows: int = 300, seed: int = 0):
+    rng = np.random.RandomState(seed)
+    quantile_levels = None
+    if problem_type == "binary":
+        labels = rng.randint(0, 2, size=num_rows)
+        predictions = [np.clip(labels * 0.3 + rng.rand(num_rows) * 0.7, 0, 1) for _ in range(num_models)]
+    elif problem_type == "multiclass":
+        num_classes = 4
+        labels = rng.randint(0, num_classes, size=num_rows)
+        predictions = []
+        for _ in range(num_models):
+            pred = rng.rand(num_rows, num_classes)
+            pred[np.arange(num_rows), labels] += rng.rand()
+            predictions.append(pred / pred.sum(axis=1, keepdims=True))
+    elif problem_type == "regression":
+        labels = rng.randn(num_rows) * 10
+        predictions = [labels + rng.randn(num_rows) * rng.rand() * 10 for _ in range(num_models)]
+    else:
+        quantile_levels = [0.1, 0.5, 0.9]
+        labels = rng.randn(num_rows)
+        predictions = [
+            labels[:, np.newaxis] + rng.randn(num_rows, 1) + np.array(quantile_levels) - 0.5 for _ in range(num_models)
+        ]
+    # Duplicate models to exercise tie-breaking
+    predictions.append(predictions[0].copy())
+    return predictions, labels, quantile_levels
+
+
+@pytest.mark.parametrize(
+    "problem_type,metric_name",
+    [
+        ("binary", "log_loss"),
+        ("binary", "accuracy"),
+        ("binary", "roc_auc"),
+        ("multiclass", "log_loss"),
+        ("multiclass", "accuracy"),
+        ("regression", "root_mean_squared_error"),
+        ("regression", "mean_absolute_error"),
+        ("quantile", "pinball_loss"),
+    ],
+)
+@pytest.mark.parametrize("use_sample_weight", [False, True])
+def test_batched_scoring_matches_default_scoring(problem_type, metric_name, use_sample_weight):
+    predictions, labels, quantile_levels = _generate_predictions(problem_type=problem_type)
+    metric = get_metric(metric_name, problem_type=problem_type)
+    sample_weight = np.random.RandomState(1).rand(len(labels)) if use_sample_weight else None
+
+    ensembles = []
+    for use_batched_scoring in [False, True]:
+        ensemble = EnsembleSelection(
+            ensemble_size=25,
+            problem_type=problem_type,
+            metric=metric,
+            quantile_levels=quantile_levels,
+            use_batched_scoring=use_batched_scoring,
+        )
+        ensemble.fit(predictions=list(predictions), labels=labels, sample_weight=sample_weight)
+        ensembles.append(ensemble)
+    ensemble_default, ensemble_batched = ensembles
+
+    assert ensemble_default.indices_ == ensemble_batched.indices_
+    assert np.allclose(ensemble_default.trajectory_, ensemble_batched.trajectory_, rtol=1e-9)
+    assert np.array_equal(ensemble_default.weights_, ensemble_batched.weights_)
+
+
+def test_batched_scorer_chunking_matches_unchunked():
+    predictions, labels, _ = _generate_predictions(problem_type="multiclass")
+    metric = get_metric("accuracy", problem_type="multiclass")
+    weighted_ensemble_prediction = predictions[3] * 0.5
+    scores = []
+    for max_chunk_elements in [1, 2**24]:
+        batched_scorer = get_batched_ensemble_scorer(
+            metric=metric,
+            predictions=predictions,
+            labels=labels,
+            problem_type="multiclass",
+            max_chunk_elements=max_chunk_elements,
+        )
+        scores.append(batched_scorer.score(weighted_ensemble_prediction, candidate_weight=0.5))
+    assert np.array_equal(scores[0], scores[1])
+
+
+@pytest.mark.parametrize(
+    "problem_type,metric_name,use_sample_weight",
+    [
+        ("binary", "f1", False),
+        ("binary", "log_loss", True),
+        ("binary", "roc_auc", True),
+        ("regression", "r2", False),
+    ],
+)
+def test_batched_scorer_falls_back_for_unsupported_metrics(problem_type, metric_name, use_sample_weight):
+    predictions, labels, _ = _generate_predictions(problem_type=problem_type, num_models=2)
+    metric = get_metric(metric_name, problem_type=problem_type)
+    sample_weight = np.ones(len(labels)) if use_sample_weight else None
+    batched_scorer = get_batched_ensemble_scorer(
+        metric=metric,
+        predictions=predictions,
+        labels=labels,
+        problem_type=problem_type,
+        sample_weight=sample_weight,
+    )
+    assert batched_scorer is None
+
+
+@pytest.mark.parametrize("subsample_size", [None, 100])
+def test_when_predictions_are_memory_mapped_then_ensemble_is_identical(tmp_path, subsample_size):
+    predictions, labels, _ = _generate_predictions(problem_type="multiclass")
+    metric = get_metric("log_loss", problem_type="multiclass")
+    predictions_mmap = []
+    for i, pred in enumerate(predictions):
+        np.save(tmp_path / f"{i}.npy", pred)
+        predictions_mmap.append(np.load(tmp_path / f"{i}.npy", mmap_mode="c"))
+
+    ensembles = []
+    for preds in [predictions, predictions_mmap]:
+        ensemble = EnsembleSelection(
+            ensemble_size=10, problem_type="multiclass", metric=metric, subsample_size=subsample_size
+        )
+        ensemble.fit(predictions=list(preds), labels=labels)
+        ensembles.append(ensemble)
+
+    assert ensembles[0].indices_ == ensembles[1].indices_
+    assert np.array_equal(ensembles[0].weights_, ensembles[1].weights_)
+
+
+def test_when_prune_candidates_then_dominated_duplicate_candidates_are_pruned():
+    predictions, labels, _ = _generate_predictions(problem_type="multiclass")
+    metric = get_metric("log_loss", problem_type="multiclass")
+    ensemble = EnsembleSelection(ensemble_size=25, problem_type="multiclass", metric=metric, prune_candidates=True)
+    ensemble.num_input_models_ = len(predictions)
+
+    candidate_indices = ensemble._prune_candidates(predictions=predictions, labels=labels)
+    # The last model is an exact copy of the first model
+    assert (0 in candidate_indices) != (len(predictions) - 1 in candidate_indices)
+
+    ensemble.fit(predictions=list(predictions), labels=labels)
+    assert len(ensemble.weights_) == len(predictions)
+    assert set(np.flatnonzero(ensemble.weights_)).issubset(candidate_indices)
+
+
+def test_when_warm_start_weights_are_given_then_ensemble_is_not_worse_than_warm_start():
+    predictions, labels, _ = _generate_predictions(problem_type="binary")
+    metric = get_metric("log_loss", problem_type="binary")
+    ensemble_prev = EnsembleSelection(ensemble_size=5, problem_type="binary", metric=metric)
+    ensemble_prev.fit(predictions=list(predictions), labels=labels)
+
+    ensemble = EnsembleSelection(ensemble_size=25, problem_type="binary", metric=metric)
+    ensemble.fit(predictions=list(predictions), labels=labels, warm_start_weights=ensemble_prev.weights_)
+
+    warm_start_indices = ensemble._get_warm_start_indices(ensemble_prev.weights_, ensemble_size=25)
+    warm_start_weights = np.bincount(warm_start_indices, minlength=len(predictions)) / len(warm_start_indices)
+    assert np.allclose(warm_start_weights, ensemble_prev.weights_)
+    assert ensemble.indices_[: len(warm_start_indices)] == warm_start_indices
+    assert ensemble.train_score_ <= ensemble_prev.train_score_
+
+
+def test_when_early_stopping_rounds_then_ensemble_is_prefix_of_full_search():
+    predictions, labels, _ = _generate_predictions(problem_type="regression")
+    metric = get_metric("root_mean_squared_error", problem_type="regression")
+    ensembles = []
+    for early_stopping_rounds in [None, 1]:
+        ensemble = EnsembleSelection(
+            ensemble_size=50,
+            problem_type="regression",
+            metric=metric,
+            early_stopping_rounds=early_stopping_rounds,
+        )
+        ensemble.use_best = False
+        ensemble.fit(predictions=list(predictions), labels=labels)
+        ensembles.append(ensemble)
+    ensemble_full, ensemble_early = ensembles
+
+    assert len(ensemble_early.indices_) < len(ensemble_full.indices_)
+    assert ensemble_early.indices_ == ensemble_full.indices_[: len(ensemble_early.indices_)]
+    assert min(ensemble_early.trajectory_) == min(ensemble_full.trajectory_[: len(ensemble_early.trajectory_)])
@@ -4,9 +4,9 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from autogluon.core.constants import BINARY, MULTICLASS, MULTICLASS_UPPER_LIMIT, REGRESSION
+from autogluon.core.constants import BINARY, MULTICLASS, MULTICLASS_UPPER_LIMIT, QUANTILE, REGRESSION
 from autogluon.core.utils import infer_problem_type
-from autogluon.core.utils.utils import generate_train_test_split
+from autogluon.core.utils.utils import concat_stack_features, convert_pred_probas_to_df, generate_train_test_split
 
 
 class TestInferProblemType(unittest.TestCase):
@@ -225,3 +225,45 @@ def test_generate_train_test_split_edgecase():
                 X_train, X_test, y_train, y_test = generate_train_test_split(
                     X=data, y=data["label"], problem_type=problem_type, test_size=test_size / len(data)
                 )
+
+
+@pytest.mark.parametrize("problem_type", [BINARY, MULTICLASS, QUANTILE])
+def test_convert_pred_probas_to_df_matches_concatenated_predictions(problem_type):
+    rng = np.random.RandomState(0)
+    index = pd.Index(np.arange(10, 20))
+    if problem_type == BINARY:
+        pred_proba_list = [rng.rand(10).astype(np.float32) for _ in range(3)]
+        expected = np.asarray(pred_proba_list).T
+    else:
+        pred_proba_list = [rng.rand(10, 3) for _ in range(3)]
+        expected = np.concatenate(pred_proba_list, axis=1)
+    columns = [f"col_{i}" for i in range(expected.shape[1])]
+
+    pred_proba_df = convert_pred_probas_to_df(pred_proba_list, columns=columns, problem_type=problem_type, index=index)
+
+    assert list(pred_proba_df.columns) == columns
+    assert pred_proba_df.index.equals(index)
+    assert (pred_proba_df.dtypes == expected.dtype).all()
+    np.testing.assert_array_equal(pred_proba_df.to_numpy(), expected)
+
+
+@pytest.mark.parametrize("copy_on_write", [False, True])
+def test_concat_stack_features(copy_on_write):
+    X = pd.DataFrame({"a": np.arange(5.0), "b": np.arange(5), "c": list("abcde")}, index=np.arange(10, 15))
+    X_og = X.copy()
+
+    with pd.option_context("mode.copy_on_write", copy_on_write):
+        X_stacker = convert_pred_probas_to_df(
+            [np.linspace(0, 1, 5), np.linspace(1, 0, 5)], columns=["m1", "m2"], problem_type=BINARY, index=X.index
+        )
+        X_out = concat_stack_features(X_stacker=X_stacker, X=X)
+
+        assert list(X_out.columns) == ["m1", "m2", "a", "b", "c"]
+        pd.testing.assert_frame_equal(X_out, pd.concat([X_stacker, X], axis=1))
+        for column in X.columns:
+            assert np.shares_memory(X_out[column].to_numpy(), X[column].to_numpy())
+        X_out["a"] = -1.0
+        if copy_on_write:
+            X_out.loc[10, "b"] = -1
+
+    pd.testing.assert_frame_equal(X, X_og)
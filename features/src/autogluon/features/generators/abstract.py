@@ -3,22 +3,109 @@ from __future__ import annotations
 import copy
 import inspect
 import logging
+import os
 import time
 from collections import defaultdict
-from typing import Dict, List, Literal
+from functools import partial
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Literal
 
+import numpy as np
 import pandas as pd
+from numpy.typing import ArrayLike
 from pandas import DataFrame, Series
 
 from autogluon.common.features.feature_metadata import FeatureMetadata
-from autogluon.common.features.infer_types import get_type_group_map_special, get_type_map_raw, get_type_map_real
+from autogluon.common.features.infer_types import (
+    StreamingTypeInference,
+    get_type_map_raw,
+    get_type_map_real,
+)
 from autogluon.common.savers import save_pkl
 
 from ..utils import is_useless_feature
+from .compiled_plan import CompiledTransformPlan, _PlanBuilder
 
 logger = logging.getLogger(__name__)
 
 
+def _map_chunks(
+    X_chunks: Callable[[], Iterable[DataFrame]], func: Callable[[DataFrame], DataFrame]
+) -> Callable[[], Iterator[DataFrame]]:
+    """Returns a function which returns an iterator over the chunks of `X_chunks` with `func` applied to each chunk."""
+
+    def _iter_chunks() -> Iterator[DataFrame]:
+        for X_chunk in X_chunks():
+            yield func(X_chunk)
+
+    return _iter_chunks
+
+
+def _get_chunk_iterator_factory(
+    data: str | Path | list[DataFrame] | Callable[[], Iterable[DataFrame]], chunk_size: int
+) -> Callable[[], Iterable[DataFrame]]:
+    """Returns a function which returns a new iterator over the chunks of `data` each time it is called."""
+    if isinstance(data, (str, Path)):
+        from autogluon.common.loaders.load_pd import load_chunks
+
+        return partial(load_chunks, path=data, chunk_size=chunk_size)
+    elif isinstance(data, (list, tuple)):
+        return lambda: iter(data)
+    elif callable(data):
+        return data
+    raise TypeError(
+        f"data must be a path, a list of DataFrames or a function returning an iterator of DataFrames, but was {type(data).__name__}. "
+        f"Single-use iterators are not supported as the data is read multiple times."
+    )
+
+
+def _sample_chunks(
+    X_chunks: Callable[[], Iterable[DataFrame]],
+    sample_size: int,
+    random_state: int = 0,
+    type_inference: StreamingTypeInference | None = None,
+) -> tuple[DataFrame, int]:
+    """
+    Returns a uniformly random sample without replacement of at most `sample_size` rows from all chunks in their original order,
+    and the total number of rows. Holds at most `sample_size` + chunk size rows in memory.
+    If `type_inference` is specified, it is updated with every chunk.
+    """
+    rng = np.random.default_rng(random_state)
+    sample = None
+    sample_keys = np.empty(0)
+    num_rows = 0
+    for X_chunk in X_chunks():
+        if type_inference is not None:
+            type_inference.update(X_chunk)
+        # Keeping the rows with the smallest random keys across all chunks is equivalent to uniform sampling without replacement
+        X_chunk = X_chunk.reset_index(drop=True)
+        X_chunk.index = pd.RangeIndex(num_rows, num_rows + len(X_chunk))
+        num_rows += len(X_chunk)
+        keys = rng.random(len(X_chunk))
+        sample = X_chunk if sample is None else pd.concat([sample, X_chunk])
+        sample_keys = np.concatenate([sample_keys, keys])
+        if len(sample) > sample_size:
+            idx_keep = np.sort(np.argpartition(sample_keys, sample_size)[:sample_size])
+            sample = sample.iloc[idx_keep]
+            sample_keys = sample_keys[idx_keep]
+    if sample is None:
+        raise ValueError("data must contain at least one chunk.")
+    return sample.reset_index(drop=True), num_rows
+
+
+def _concat_feature_chunks(X_chunks: Callable[[], Iterable[DataFrame]], feature: str) -> Series:
+    """Returns the values of a single feature from all chunks."""
+    return pd.concat([X_chunk[feature] for X_chunk in X_chunks()], ignore_index=True)
+
+
+def _get_method_owner(cls: type, method_name: str) -> type:
+    """Returns the class in the method resolution order of `cls` which defines `method_name`."""
+    for parent in cls.__mro__:
+        if method_name in parent.__dict__:
+            return parent
+    return object
+
+
 # TODO: Add option to minimize memory usage of feature names by making them integers / strings of integers
 # TODO: Add ability to track which input features created which output features.
 # TODO: Add log of # of observation counts to high cardinality categorical features
@@ -87,6 +174,13 @@ class AbstractFeatureGenerator:
         If infer_features_in_args is None, this is ignored.
     banned_feature_special_types : List[str], default None
         List of feature special types to additionally exclude from input. Will update self.get_default_infer_features_in_args().
+    infer_types_sample_size : int, default None
+        If specified and feature_metadata_in is inferred from training data with more rows, the special types of the features are inferred
+        from a random sample of `infer_types_sample_size` rows plus the missing value counts of every feature,
+        instead of from the full values of every feature. Features whose sample is ambiguous are inferred from their full values.
+        This greatly speeds up the inference for large data, refer to :class:`autogluon.common.features.infer_types.StreamingTypeInference`.
+        In `fit_chunked`, the sampled inference is always used, and the missing values and distinct values of the features are
+        counted across all chunks.
     target_type: str | None, default None
         The problem type of the target variable, such as "binary", "multiclass", "regression".
         If None and the preprocessor requires target_type, an exception will be raised.
@@ -137,6 +231,7 @@ class AbstractFeatureGenerator:
         infer_features_in_args: dict = None,
         infer_features_in_args_strategy="overwrite",
         banned_feature_special_types: List[str] = None,
+        infer_types_sample_size: int | None = None,
         target_type: Literal["regression", "multiclass", "binary", None] = None,
         random_state: int | None = 0,
         log_prefix="",
@@ -215,6 +310,7 @@ class AbstractFeatureGenerator:
 
         self._is_updated_name = False  # If feature names have been altered by name_prefix or name_suffix
 
+        self.infer_types_sample_size = infer_types_sample_size
         self.target_type = target_type
         self.random_state = random_state
         self.log_prefix = log_prefix
@@ -259,6 +355,10 @@ class AbstractFeatureGenerator:
             If neither are set, feature_metadata_in will be inferred from the _infer_feature_metadata_in method.
         **kwargs
             Any additional arguments that a particular generator implementation could use. Passed to _fit_transform and _fit_generators methods.
+            X_chunks : Callable[[], Iterator[DataFrame]], optional
+                Used by `fit_chunked`. Returns an iterator over the full data in chunks, where X is a sample of the full data.
+                Generators with the `allow_chunked_fit` tag compute their statistics from all chunks, while the remaining logic uses X.
+                Ignored by other generators.
 
         Returns
         -------
@@ -266,6 +366,7 @@ class AbstractFeatureGenerator:
 
         """
         start_time = time.time()
+        X_chunks = kwargs.pop("X_chunks", None)
         self._log(20, f"Fitting {self.__class__.__name__}...")
         if self._is_fit:
             raise AssertionError(f"{self.__class__.__name__} is already fit.")
@@ -308,7 +409,12 @@ class AbstractFeatureGenerator:
 
         # TODO: Add option to return feature_metadata instead to avoid data copy
         #  If so, consider adding validation step to check that X_out matches the feature metadata, error/warning if not
-        X_out, type_family_groups_special = self._fit_transform(X[self.features_in], y=y, **kwargs)
+        if X_chunks is not None and self.get_tags().get("allow_chunked_fit", False):
+            X_out, type_family_groups_special = self._fit_transform(
+                X[self.features_in], y=y, X_chunks=_map_chunks(X_chunks, self._select_features_in_chunk), **kwargs
+            )
+        else:
+            X_out, type_family_groups_special = self._fit_transform(X[self.features_in], y=y, **kwargs)
 
         type_map_raw = get_type_map_raw(X_out)
         self.feature_metadata = FeatureMetadata(
@@ -357,6 +463,157 @@ class AbstractFeatureGenerator:
             self.print_generator_info(log_level=15)
         return X_out
 
+    def fit_chunked(
+        self,
+        data: str | Path | list[DataFrame] | Callable[[], Iterable[DataFrame]],
+        label: str | None = None,
+        sample_size: int = 1000000,
+        chunk_size: int = 100000,
+        feature_metadata_in: FeatureMetadata = None,
+        random_state: int = 0,
+        **kwargs,
+    ):
+        """
+        Fit generator to data that does not fit in memory, by streaming the data in chunks.
+        The data is read multiple times:
+            1. A uniformly random sample of at most `sample_size` rows is drawn from all chunks.
+                The generator is fit on this sample, which determines the features, their types and the logic of generators without chunked fit support.
+            2. Generators with the `allow_chunked_fit` tag additionally read all chunks to compute their statistics from the full data,
+                such as the category counts of CategoryFeatureGenerator, the duplicate fingerprints of DropDuplicatesFeatureGenerator,
+                the ngram frequencies of TextNgramFeatureGenerator and the missing value fill of DatetimeFeatureGenerator.
+                Inside a BulkFeatureGenerator, the chunks are transformed by the previous stages, so each stage is fit on the full output of the stages before it.
+        At most `sample_size` + `chunk_size` rows are held in memory at a time.
+        If the data has at most `sample_size` rows, this is equivalent to calling `fit` on the full data.
+
+        Parameters
+        ----------
+        data : str, Path, list of DataFrame or Callable
+            The data to fit on. Either a path to a CSV or Parquet file that is read in chunks of `chunk_size` rows,
+            a list of DataFrame chunks, or a function which returns a new iterator over the DataFrame chunks each time it is called.
+            As the data is read multiple times, a single-use iterator is not supported.
+        label : str, optional
+            The label column in the data. If specified, it is passed as `y` during fit and is not used as a feature.
+        sample_size : int, default 1000000
+            The maximum number of rows in the sample the generator is fit on.
+        chunk_size : int, default 100000
+            The number of rows per chunk when reading `data` from a file.
+        feature_metadata_in : FeatureMetadata, optional
+            Refer to `fit_transform` documentation.
+            If None, the special types of the features are inferred while sampling, from a sample of `infer_types_sample_size` rows
+            (10000 if not specified) plus missing value counts and cardinality sketches of all chunks.
+            Features whose sample is ambiguous are inferred from their values in all chunks.
+        random_state : int, default 0
+            The random state used to sample the data.
+        **kwargs
+            Passed to `fit_transform`.
+        """
+        X_chunks = _get_chunk_iterator_factory(data=data, chunk_size=chunk_size)
+        type_inference = None
+        if feature_metadata_in is None and self.feature_metadata_in is None:
+            type_inference = StreamingTypeInference(
+                sample_size=self.infer_types_sample_size or 10000, random_state=random_state
+            )
+        X, num_rows = _sample_chunks(
+            X_chunks=X_chunks, sample_size=sample_size, random_state=random_state, type_inference=type_inference
+        )
+        self._log(20, f"Fitting {self.__class__.__name__} on a sample of {len(X)} of {num_rows} rows...")
+        y = None
+        if label is not None:
+            y = X[label]
+            X = X.drop(columns=[label])
+        if len(X) < num_rows:
+            kwargs["X_chunks"] = X_chunks
+            if type_inference is not None:
+                # The special types are inferred from all chunks rather than only from the sample the generator is fit on
+                type_group_map_special = type_inference.get_type_group_map_special(
+                    X=partial(_concat_feature_chunks, X_chunks)
+                )
+                type_group_map_special = {
+                    type_special: [feature for feature in features if feature != label]
+                    for type_special, features in type_group_map_special.items()
+                }
+                feature_metadata_in = FeatureMetadata(
+                    type_map_raw=get_type_map_raw(X), type_group_map_special=type_group_map_special
+                )
+        self.fit_transform(X, y=y, feature_metadata_in=feature_metadata_in, **kwargs)
+
+    def transform_chunked(
+        self,
+        data: str | Path | list[DataFrame] | Callable[[], Iterable[DataFrame]],
+        output_path: str,
+        chunk_size: int = 100000,
+        keep_columns: list[str] | None = None,
+    ) -> str:
+        """
+        Transforms data that does not fit in memory chunk by chunk, and writes the output to a Parquet file.
+        At most one chunk of input and output data is held in memory at a time.
+        The output can be read in chunks via `autogluon.common.loaders.load_pd.load_chunks`.
+
+        Parameters
+        ----------
+        data : str, Path, list of DataFrame or Callable
+            The data to transform. Refer to `fit_chunked` documentation.
+        output_path : str
+            The path of the Parquet file to write the transformed data to.
+            Sparse features are written as dense columns, as Parquet has no sparse column type.
+            Category features with non-string categories, such as the output of `CategoryMemoryMinimizeFeatureGenerator`, are read back as their category values.
+        chunk_size : int, default 100000
+            The number of rows per chunk when reading `data` from a file.
+        keep_columns : list[str], optional
+            Columns of the input data to add to the output as-is, such as the label or an ID column.
+
+        Returns
+        -------
+        output_path : str
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if not self._is_fit:
+            raise AssertionError(f"{self.__class__.__name__} is not fit.")
+        if keep_columns:
+            keep_columns_overlap = [column for column in keep_columns if column in self.features_out]
+            if keep_columns_overlap:
+                raise ValueError(f"keep_columns must not contain output features, but found: {keep_columns_overlap}")
+        X_chunks = _get_chunk_iterator_factory(data=data, chunk_size=chunk_size)
+        output_dir = os.path.dirname(output_path)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+        output_path_tmp = output_path + ".tmp"
+        writer = None
+        try:
+            for X_chunk in X_chunks():
+                X_out = self.transform(X_chunk)
+                sparse_features = [c for c, dtype in X_out.dtypes.items() if isinstance(dtype, pd.SparseDtype)]
+                if sparse_features:
+                    X_out[sparse_features] = X_out[sparse_features].sparse.to_dense()
+                if keep_columns:
+                    X_out = pd.concat([X_chunk[keep_columns], X_out], axis=1)
+                if writer is None:
+                    table = pa.Table.from_pandas(X_out, preserve_index=False)
+                    writer = pq.ParquetWriter(output_path_tmp, table.schema)
+                else:
+                    table = pa.Table.from_pandas(X_out, schema=writer.schema, preserve_index=False)
+                writer.write_table(table)
+        finally:
+            if writer is not None:
+                writer.close()
+        if writer is None:
+            raise ValueError("data must contain at least one chunk.")
+        os.replace(output_path_tmp, output_path)
+        return output_path
+
+    def _select_features_in_chunk(self, X: DataFrame) -> DataFrame:
+        """Returns the chunk X as passed to `_fit_transform`, equivalent to the selection and pre-processing of `transform` prior to `_transform`."""
+        if self.column_names_as_str:
+            X = X.copy(deep=False)
+            X.columns = X.columns.astype(str)
+        # Generators can assume a positional index, as the chunks are reset to the default index
+        X = X[self.features_in].reset_index(drop=True)
+        if self._pre_astype_generator:
+            X = self._pre_astype_generator.transform(X)
+        return X
+
     def _fit_passthrough(self) -> tuple[FeatureMetadata, list[str]]:
         if self.passthrough_types:
             get_features_kwargs = self.passthrough_types
@@ -435,6 +692,159 @@ class AbstractFeatureGenerator:
             X_out.index = X_index
         return X_out
 
+    def transform_arrays(self, X: dict[str, ArrayLike]) -> dict[str, ArrayLike]:
+        """
+        Transforms input data in the form of a dictionary of column arrays into the output data format.
+        Equivalent to `transform`, but avoids the DataFrame construction and column selection overhead of `transform`.
+        This makes it much faster than `transform` for small batches of data, such as single rows during online inference.
+        Only supported if `can_transform_arrays()` is True, otherwise a NotImplementedError will be raised.
+
+        Parameters
+        ----------
+        X : dict[str, ArrayLike]
+            Dictionary of feature name to a 1-dimensional array of the feature's values. All arrays must have the same length.
+            Input data must contain all features in features_in, and should have the same dtypes as in the data provided to fit.
+            Category features are represented as :class:`pd.Categorical`. Extra features present in X that are not in features_in will be ignored.
+            The arrays are not altered.
+
+        Returns
+        -------
+        X_out : dict[str, ArrayLike]
+            Dictionary of feature name to array, in the same order as the columns of the output of `transform`.
+            `pd.DataFrame(X_out)` is equal to the output of `transform`.
+        """
+        if not self._is_fit:
+            raise AssertionError(f"{self.__class__.__name__} is not fit.")
+        try:
+            X = {feature: X[feature] for feature in self.features_in}
+        except KeyError:
+            missing_cols = [feature for feature in self.features_in if feature not in X]
+            raise KeyError(
+                f"{len(missing_cols)} required columns are missing from the provided dataset to transform using {self.__class__.__name__}. "
+                f"{len(missing_cols)} missing columns: {missing_cols} | "
+                f"{len(list(X.keys()))} available columns: {list(X.keys())}"
+            )
+        if self._pre_astype_generator:
+            X = self._pre_astype_generator.transform_arrays(X)
+        X_out = self._transform_arrays(X)
+        if self.passthrough and self.passthrough_stage == "first" and self.passthrough_features:
+            X_out = self._transform_arrays_passthrough(X=X, X_out=X_out)
+        for generator in self._post_generators:
+            X_out = generator.transform_arrays(X_out)
+        if self.passthrough and self.passthrough_stage == "last" and self.passthrough_features:
+            X_out = self._transform_arrays_passthrough(X=X, X_out=X_out)
+        return X_out
+
+    def _transform_arrays_passthrough(
+        self, X: dict[str, ArrayLike], X_out: dict[str, ArrayLike]
+    ) -> dict[str, ArrayLike]:
+        X_passthrough = {feature: X[feature] for feature in self.passthrough_features}
+        X_passthrough.update(X_out)
+        return X_passthrough
+
+    def can_transform_arrays(self) -> bool:
+        """
+        Returns True if `transform_arrays` is supported by this generator and all of its inner generators.
+        A generator supports `transform_arrays` if it implements `_transform_arrays` at least as specifically as `_transform`,
+        so that subclasses which override `_transform` do not silently inherit an outdated `_transform_arrays`.
+        """
+        if not self._is_fit:
+            return False
+        if not self._implements_transform_arrays():
+            return False
+        inner_generators = list(self._post_generators)
+        if self._pre_astype_generator:
+            inner_generators.append(self._pre_astype_generator)
+        return all(generator.can_transform_arrays() for generator in inner_generators)
+
+    def _implements_transform_arrays(self) -> bool:
+        """Returns True if this generator implements `_transform_arrays`, ignoring its inner generators."""
+        method_owner_transform = _get_method_owner(self.__class__, "_transform")
+        method_owner_transform_arrays = _get_method_owner(self.__class__, "_transform_arrays")
+        if method_owner_transform_arrays is AbstractFeatureGenerator:
+            return False
+        return issubclass(method_owner_transform_arrays, method_owner_transform)
+
+    def _transform_arrays(self, X: dict[str, ArrayLike]) -> dict[str, ArrayLike]:
+        """
+        Performs the inner transform logic of `transform_arrays`. The array counterpart of `_transform`.
+        Generators that support `transform_arrays` should implement this method.
+        At the point this method is called, X will contain exactly the features in self.features_in, in order.
+        X should not be altered in-place. Its arrays may be returned as-is in the output.
+        """
+        raise NotImplementedError
+
+    def compile(self) -> CompiledTransformPlan:
+        """
+        Compiles the fitted generator into a :class:`CompiledTransformPlan`, which flattens the generator and all of its inner generators
+        into a single ordered list of column-level operations.
+        `plan.transform(X)` is identical to `self.transform(X)`, but avoids the per-generator column selection,
+        intermediate DataFrame construction and concatenation overhead of `transform`.
+        This makes it much faster than `transform` for small batches of data, and faster for large batches of data.
+        Unlike `transform_arrays`, compiling is supported for all generators. Generators without an array implementation are executed
+        via `_transform` on a DataFrame containing only their input features.
+        The plan should be recompiled if the generator is altered after compiling.
+        """
+        return CompiledTransformPlan(generator=self)
+
+    def _compile(self, builder: _PlanBuilder, X: dict[str, int]) -> dict[str, int]:
+        """
+        Adds the operations of `transform` to the plan in `builder`. The counterpart of `transform` for `compile`.
+        Instead of data, X and the returned output are dictionaries of feature name to the plan's slot which holds the feature's values.
+        """
+        if _get_method_owner(self.__class__, "transform") is not AbstractFeatureGenerator:
+            # Custom `transform` logic can't be decomposed, so the generator is executed as a whole
+            X = {feature: X[feature] for feature in self.features_in}
+            return builder.add_step(
+                generator=self, func=self.transform, inputs=X, features_out=self.features_out, uses_dataframe=True
+            )
+        X = {feature: X[feature] for feature in self.features_in}
+        if self._pre_astype_generator:
+            X = self._pre_astype_generator._compile(builder=builder, X=X)
+        X_out = self._compile_transform(builder=builder, X=X)
+        if self.passthrough and self.passthrough_stage == "first" and self.passthrough_features:
+            X_out = {**{feature: X[feature] for feature in self.passthrough_features}, **X_out}
+        for generator in self._post_generators:
+            X_out = generator._compile(builder=builder, X=X_out)
+        if self.passthrough and self.passthrough_stage == "last" and self.passthrough_features:
+            X_out = {**{feature: X[feature] for feature in self.passthrough_features}, **X_out}
+        return X_out
+
+    def _compile_transform(self, builder: _PlanBuilder, X: dict[str, int]) -> dict[str, int]:
+        """
+        Adds the operations of `_transform` to the plan in `builder`. The counterpart of `_transform` for `compile`.
+        At the point this method is called, X will contain exactly the features in self.features_in, in order.
+        """
+        column_map = self._get_compiled_column_map()
+        if column_map is not None:
+            return {feature_out: X[feature_in] for feature_out, feature_in in column_map.items()}
+        features_out = self._get_features_out_before_post()
+        if self._implements_transform_arrays():
+            return builder.add_step(generator=self, func=self._transform_arrays, inputs=X, features_out=features_out)
+        return builder.add_step(
+            generator=self, func=self._transform, inputs=X, features_out=features_out, uses_dataframe=True
+        )
+
+    def _get_compiled_column_map(self) -> dict[str, str] | None:
+        """
+        Generators whose `_transform` only selects and renames input features should return a dictionary of output feature to input feature,
+        in the order of the output of `_transform`. This allows `compile` to remove the generator from the plan. Otherwise, returns None.
+        """
+        return None
+
+    def _get_features_out_before_post(self) -> list[str]:
+        """Returns the output features of `_transform`, prior to applying passthrough and post generators."""
+        if self._post_generators:
+            features_out = self._feature_metadata_before_post.get_features()
+            passthrough_features = self.passthrough_features if self.passthrough_stage == "first" else None
+        else:
+            features_out = self.features_out
+            passthrough_features = self.passthrough_features
+        if self.passthrough and passthrough_features:
+            passthrough_features = set(passthrough_features)
+            features_out = [feature for feature in features_out if feature not in passthrough_features]
+        return features_out
+
     def _fit_transform(self, X: DataFrame, y: Series, **kwargs) -> (DataFrame, dict):
         """
         Performs the inner fit_transform logic that is non-generic (specific to the generator implementation).
@@ -517,7 +927,7 @@ class AbstractFeatureGenerator:
                 "\tInferring data type of each feature based on column values. Set feature_metadata_in to manually specify special "
                 "dtypes of the features.",
             )
-            self.feature_metadata_in = self._infer_feature_metadata_in(X=X)
+            self.feature_metadata_in = self._infer_feature_metadata_in(X=X, sample_size=self.infer_types_sample_size)
         if self.features_in is None:
             self.features_in = self._infer_features_in(X=X)
             self.features_in = [feature for feature in self.features_in if feature in X.columns]
@@ -544,7 +954,7 @@ class AbstractFeatureGenerator:
 
     # TODO: Use code from problem type detection for column types. Ints/Floats could be Categorical through this method. Maybe try both?
     @staticmethod
-    def _infer_feature_metadata_in(X: DataFrame) -> FeatureMetadata:
+    def _infer_feature_metadata_in(X: DataFrame, sample_size: int | None = None) -> FeatureMetadata:
         """
         Infers the feature_metadata_in of X.
         This is used if feature_metadata_in was not provided by the user prior to fit.
@@ -554,14 +964,14 @@ class AbstractFeatureGenerator:
         ----------
         X : DataFrame
             Input data used to fit the generator.
+        sample_size : int, optional
+            If specified, the special types are inferred from a sample of at most `sample_size` rows. Refer to `FeatureMetadata.from_df`.
 
         Returns
         -------
         feature_metadata_in : FeatureMetadata object inferred from X.
         """
-        type_map_raw = get_type_map_raw(X)
-        type_group_map_special = get_type_group_map_special(X)
-        return FeatureMetadata(type_map_raw=type_map_raw, type_group_map_special=type_group_map_special)
+        return FeatureMetadata.from_df(X, sample_size=sample_size)
 
     @staticmethod
     def get_default_infer_features_in_args() -> dict:
@@ -934,6 +1344,12 @@ class AbstractFeatureGenerator:
         allow_post_generators : bool, default True
             If False, will raise an AssertionError if post_generators is specified during init.
                 This is reserved for very simple generators where including post_generators would not be sensible, such as in RenameFeatureGenerator.
+        allow_chunked_fit : bool, default False
+            If True, then `_fit_transform` accepts an `X_chunks` argument when fit via `fit_chunked`,
+                which returns an iterator over the full input data in chunks, and uses it to compute statistics from the full data.
+        allow_row_chunking : bool, default False
+            If True, then transform computes each row of the output only from the same row of the input.
+                This allows BulkFeatureGenerator to split the data into row chunks which are transformed in parallel.
         """
         return {}
 
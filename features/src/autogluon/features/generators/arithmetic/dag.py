@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from .operation import Operation
+
+_UFUNCS = {
+    "+": np.add,
+    "-": np.subtract,
+    "*": np.multiply,
+    "/": np.divide,
+}
+_COMMUTATIVE_OPS = {"+", "*"}
+
+
+class ArithmeticDAG:
+    """
+    Evaluation engine for a list of arithmetic `Operation` expressions over a fixed set of base features.
+
+    The expressions are compiled once into a single directed acyclic graph in which every sub-expression is a node:
+        1. Sub-expressions are deduplicated across all expressions (common-subexpression elimination).
+            Two sub-expressions share a node only if they are structurally identical up to the order of the operands
+            of `+` and `*`, such as `(A*B)+C` and `C+(B*A)`. Floating point addition and multiplication are commutative,
+            so shared nodes compute exactly the same values. Expressions which are only algebraically equal, such as
+            `(A+B)-B` and `(A-B)+B`, are not shared because they can differ in rounding, overflow and NaN.
+        2. Nodes are evaluated in topological order, block by block over the rows, so that the intermediate results of a block stay in cache.
+            Nodes which are expressions write directly into their column of the output array,
+            all other nodes write into a small scratch buffer whose rows are reused as soon as no later node reads them.
+
+    The output is identical to evaluating every expression on its own, except that infinite values are replaced by NaN.
+
+    The same engine is used to evaluate candidate expressions during fit and the selected expressions during transform.
+
+    Parameters
+    ----------
+    expressions : list[Operation]
+        The expressions to evaluate. The output has one column per expression, named `expression.name()`.
+    base_features : list[str]
+        The base features referenced by the expressions, in the column order of the input array of `evaluate`.
+    dtype : default np.float32
+        The dtype in which the expressions are evaluated and returned.
+    block_size : int, default 16384
+        The number of rows evaluated at once.
+
+    Attributes
+    ----------
+    names : list[str]
+        The output column names.
+    num_operations : int
+        The number of arithmetic operations in the expressions, without common-subexpression elimination.
+    num_nodes : int
+        The number of arithmetic operations evaluated per row after common-subexpression elimination.
+    num_scratch : int
+        The number of scratch rows of size `block_size` used for intermediate nodes which are not expressions.
+    """
+
+    def __init__(
+        self,
+        expressions: list[Operation],
+        base_features: list[str],
+        dtype=np.float32,
+        block_size: int = 16384,
+    ):
+        if block_size < 1:
+            raise ValueError(f"block_size must be at least 1, but was {block_size}")
+        self.base_features = list(base_features)
+        self.names = [expression.name() for expression in expressions]
+        self.dtype = np.dtype(dtype)
+        self.block_size = block_size
+        self.num_operations = 0
+
+        num_base = len(self.base_features)
+        base_idx = {feature: i for i, feature in enumerate(self.base_features)}
+        struct_ids = {}  # (op, left_id, right_id) -> node id, with sorted operand ids for commutative ops
+        nodes = []  # (op, left_id, right_id) of node id `num_base + i`
+
+        def lower(node) -> int:
+            """Recursively lowers an `Operation` to its node id."""
+            if not isinstance(node, Operation):
+                return base_idx[node]
+            left = lower(node.left)
+            right = lower(node.right)
+            self.num_operations += 1
+            if node.op in _COMMUTATIVE_OPS and right < left:
+                left, right = right, left
+            struct_key = (node.op, left, right)
+            node_id = struct_ids.get(struct_key)
+            if node_id is None:
+                node_id = num_base + len(nodes)
+                nodes.append(struct_key)
+                struct_ids[struct_key] = node_id
+            return node_id
+
+        roots = [lower(expression) for expression in expressions]
+        self.num_nodes = len(nodes)
+
+        # Assign each node its destination: the output column of the first expression it is the root of, or a scratch row.
+        root_column = {}
+        self._copies = []  # (column, node id) for expressions whose root is already written elsewhere
+        for column, root in enumerate(roots):
+            if root >= num_base and root not in root_column:
+                root_column[root] = column
+            else:
+                self._copies.append((column, root))
+
+        last_use = {}
+        for i, (_, left, right) in enumerate(nodes):
+            last_use[left] = i
+            last_use[right] = i
+
+        self._steps = []  # (ufunc, left id, right id, node id, output column or -1, scratch row or -1)
+        scratch_of = {}
+        free_scratch = []
+        self.num_scratch = 0
+        for i, (op, left, right) in enumerate(nodes):
+            node_id = num_base + i
+            for input_id in {left, right}:
+                if last_use[input_id] == i and input_id in scratch_of:
+                    free_scratch.append(scratch_of.pop(input_id))
+            column = root_column.get(node_id, -1)
+            scratch = -1
+            if column == -1:
+                if free_scratch:
+                    scratch = free_scratch.pop()
+                else:
+                    scratch = self.num_scratch
+                    self.num_scratch += 1
+                scratch_of[node_id] = scratch
+            self._steps.append((_UFUNCS[op], left, right, node_id, column, scratch))
+
+        used_base = {left for _, left, _ in nodes if left < num_base}
+        used_base.update(right for _, _, right in nodes if right < num_base)
+        used_base.update(root for _, root in self._copies if root < num_base)
+        self._used_base = sorted(used_base)
+
+    def transform(self, X: pd.DataFrame) -> pd.DataFrame:
+        """
+        Evaluates the expressions on the base features in `X`.
+
+        Parameters
+        ----------
+        X : DataFrame
+            Input data containing all `base_features`.
+
+        Returns
+        -------
+        X_out : DataFrame with one column per expression, with the index of `X`.
+        """
+        out = self.evaluate(X[self.base_features].to_numpy(dtype=self.dtype))
+        return pd.DataFrame(out, index=X.index, columns=self.names, copy=False)
+
+    def evaluate(self, X: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
+        """
+        Evaluates the expressions on a 2-dimensional array of base features.
+
+        Parameters
+        ----------
+        X : np.ndarray
+            Array of shape (num_rows, len(base_features)). Converted to `dtype` if required.
+        out : np.ndarray, optional
+            A preallocated Fortran-ordered array of shape (num_rows, len(names)) and dtype `dtype` to write the output to.
+
+        Returns
+        -------
+        out : np.ndarray
+            Fortran-ordered array of shape (num_rows, len(names)).
+        """
+        X = np.asfortranarray(X, dtype=self.dtype)
+        num_rows = X.shape[0]
+        if out is None:
+            out = np.empty((num_rows, len(self.names)), dtype=self.dtype, order="F")
+        elif out.shape != (num_rows, len(self.names)) or out.dtype != self.dtype or not out.flags.f_contiguous:
+            raise ValueError(
+                f"out must be a Fortran-ordered array of shape {(num_rows, len(self.names))} and dtype {self.dtype}, "
+                f"but found shape {out.shape} and dtype {out.dtype}"
+            )
+        block_size = min(self.block_size, max(num_rows, 1))
+        scratch = np.empty((self.num_scratch, block_size), dtype=self.dtype)
+        views = [None] * (len(self.base_features) + self.num_nodes)
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            for start in range(0, num_rows, block_size):
+                stop = min(start + block_size, num_rows)
+                for i in self._used_base:
+                    views[i] = X[start:stop, i]
+                for ufunc, left, right, node_id, column, scratch_row in self._steps:
+                    dst = out[start:stop, column] if column != -1 else scratch[scratch_row, : stop - start]
+                    views[node_id] = ufunc(views[left], views[right], out=dst)
+                for column, node_id in self._copies:
+                    out[start:stop, column] = views[node_id]
+                out_block = out[start:stop]
+                out_block[np.isinf(out_block)] = np.nan
+        return out
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}({len(self.names)} expressions, {self.num_operations} operations -> "
+            f"{self.num_nodes} nodes, {self.num_scratch} scratch rows)"
+        )
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import operator
 import warnings
 from contextlib import contextmanager
 from math import comb
@@ -26,20 +25,16 @@ from autogluon.common.features.types import (
 
 from ..abstract import AbstractFeatureGenerator
 from ..cat_as_num import CatAsNumFeatureGenerator
-from .combinations import (
-    add_higher_interaction,
-    estimate_no_higher_interaction_features,
-    get_all_bivariate_interactions,
-)
+from .combinations import estimate_no_higher_interaction_features
 from .combinations_lite import (
     add_higher_interaction as add_higher_interaction_lite,
 )
 from .combinations_lite import (
     get_all_bivariate_interactions as get_all_bivariate_interactions_lite,
 )
+from .dag import ArithmeticDAG
 from .filtering import basic_filter, filter_by_cross_correlation, filter_by_spearman
 from .memory import reduce_memory_usage
-from .operation import Operation
 
 
 class TimerLog:
@@ -176,6 +171,7 @@ class ArithmeticFeatureGenerator(AbstractFeatureGenerator):
 
         self.timelog = TimerLog()
         self.new_feats = []
+        self._dag = None
 
     def estimate_new_dtypes(self, n_numeric, n_categorical, n_binary, **kwargs) -> int:
         num_base_feats = n_numeric
@@ -258,7 +254,9 @@ class ArithmeticFeatureGenerator(AbstractFeatureGenerator):
                 print("No features left after filtering. Exiting.")
             return self
 
+        X_columns = X.columns.tolist()
         X_dict = {1: X}
+        ops_dict = {1: X_columns}
         for order in range(2, self.max_order + 1):
             if order > X.shape[1]:
                 break
@@ -269,20 +267,26 @@ class ArithmeticFeatureGenerator(AbstractFeatureGenerator):
             # 6. Generate higher-order interaction features
             with self.timelog.block(f"get_interactions_{order}-order"):
                 if order == 2:
-                    X_dict[2] = get_all_bivariate_interactions(
-                        X,
+                    candidates = get_all_bivariate_interactions_lite(
+                        X_columns,
                         max_feats=int(self.max_accept_for_pairwise / 5),
                         random_state=self.rng,
                         interaction_types=self.interaction_types,
                     )
                 else:
-                    X_dict[order] = add_higher_interaction(
-                        X,
-                        X_dict[order - 1],
+                    candidates = add_higher_interaction_lite(
+                        X_columns,
+                        ops_dict[order - 1],
                         max_feats=int(self.max_accept_for_pairwise / 5),
                         random_state=self.rng,
                         interaction_types=self.interaction_types,
                     )
+                if not candidates:
+                    break
+                candidates = {op.name(): op for op in candidates}
+                X_dict[order] = ArithmeticDAG(list(candidates.values()), X_columns, dtype=self.inner_dtype).transform(
+                    X
+                )
 
             if self.reduce_memory:
                 with self.timelog.block(f"reduce_memory_{order}-order"):
@@ -332,17 +336,19 @@ class ArithmeticFeatureGenerator(AbstractFeatureGenerator):
                 if self.verbose:
                     print(f"Using {len(use_cols)}/{n_feats_start} features after cross-correlation filtering")
 
+            ops_dict[order] = [candidates[name] for name in X_dict[order].columns]
             if len(self.new_feats) + X_dict[order].shape[1] >= self.max_new_feats:
+                max_new = self.max_new_feats - len(self.new_feats)
                 if self.use_cross_corr:
-                    max_new = self.max_new_feats - len(self.new_feats)
-                    self.new_feats.extend(novelty_scores.sort_values(ascending=False).index[:max_new].tolist())
+                    names = novelty_scores.sort_values(ascending=False).index[:max_new]
+                    self.new_feats.extend(candidates[name] for name in names)
                 else:
-                    self.new_feats.extend(X_dict[order].columns.tolist()[: self.max_new_feats - len(self.new_feats)])
+                    self.new_feats.extend(ops_dict[order][:max_new])
                 if self.verbose:
                     print(f"Reached max new features limit of {self.max_new_feats}. Stopping.")
                 break
             else:
-                self.new_feats.extend(X_dict[order].columns.tolist())
+                self.new_feats.extend(ops_dict[order])
 
     def random_selection(self, X: pd.DataFrame, y: pd.Series):
         # TODO: Improve memory efficiency for max_order > 3 by deleting unneeded intermediate results
@@ -393,6 +399,7 @@ class ArithmeticFeatureGenerator(AbstractFeatureGenerator):
     def _fit(self, X: pd.DataFrame, y: pd.Series | None, **kwargs):
         # TODO: Add a check that the original features names don't contain arithmetic operators to avoid issues in transform
         use_y = (self.selection_method != "random") and (y is not None)
+        self._dag = None
 
         # ------------------------------------------------------
         # 0) Optional row subsampling
@@ -536,97 +543,12 @@ class ArithmeticFeatureGenerator(AbstractFeatureGenerator):
     ) -> pd.DataFrame:
         """
         Fast evaluator with DAG optimization.
-        Computes common sub-expressions only once.
-        expressions: list[Operation]
+        Computes common sub-expressions only once, see `ArithmeticDAG`.
         """
-
-        # ---------------------------------------------------------------------
-        # 1) Prepare input array
-        # ---------------------------------------------------------------------
-        if self.inner_dtype != np.float64:
-            arr = X.to_numpy(dtype=self.inner_dtype)
-        else:
-            arr = X.to_numpy()
-            if not np.issubdtype(arr.dtype, np.floating):
-                arr = arr.astype(float)
-        col_idx = {c: i for i, c in enumerate(self.used_base_cols)}
-        opmap = {
-            "+": operator.add,
-            "-": operator.sub,
-            "*": operator.mul,
-            "/": operator.truediv,
-        }
-
-        # ---------------------------------------------------------------------
-        # 2) Compile DAG (only if expressions changed)
-        # ---------------------------------------------------------------------
-        compile_needed = not hasattr(self, "_compiled_dag")
-
         # FIXME: Add support for recompiling in case we pruned features
-        if compile_needed:
-            expressions: list[Operation] = self.new_feats
-
-            nodes = {}  # key -> None (placeholder)
-            expr_roots = {}  # Operation -> node key or int
-
-            def lower(node):
-                """Recursively lower Operation → DAG node or base index"""
-                if isinstance(node, Operation):
-                    left = lower(node.left)
-                    right = lower(node.right)
-                    key = (left, node.op, right)
-                    if key not in nodes:
-                        nodes[key] = None
-                    return key
-                else:
-                    # base feature name → column index
-                    return col_idx[node]
-
-            for expr in expressions:
-                expr_roots[expr] = lower(expr)
-
-            self._compiled_dag = {
-                "nodes": list(nodes.keys()),
-                "expr_roots": expr_roots,
-                "exprs": tuple(expressions),
-                "names": tuple([expression.name() for expression in expressions]),
-            }
-
-        # ---------------------------------------------------------------------
-        # 3) Evaluate DAG
-        # ---------------------------------------------------------------------
-        nodes = self._compiled_dag["nodes"]
-        expr_roots = self._compiled_dag["expr_roots"]
-        exprs = self._compiled_dag["exprs"]
-        names = self._compiled_dag["names"]
-
-        base_values = {i: arr[:, i] for i in range(arr.shape[1])}
-        results = {}
-
-        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
-            for key in nodes:
-                left, op, right = key
-
-                left_arr = base_values[left] if isinstance(left, int) else results[left]
-                right_arr = base_values[right] if isinstance(right, int) else results[right]
-
-                results[key] = opmap[op](left_arr, right_arr)
-
-        # ---------------------------------------------------------------------
-        # 4) Build output DataFrame
-        # ---------------------------------------------------------------------
-        output = {}
-        for expr, name in zip(exprs, names):
-            root = expr_roots[expr]
-            if isinstance(root, int):
-                out = base_values[root]
-            else:
-                out = results[root]
-
-            out[np.isinf(out)] = np.nan
-            output[name] = out
-
-        return pd.DataFrame(output, index=X.index)
+        if getattr(self, "_dag", None) is None:
+            self._dag = ArithmeticDAG(self.new_feats, self.used_base_cols, dtype=self.inner_dtype)
+        return self._dag.transform(X)
 
     def _transform(self, X: DataFrame) -> DataFrame:
         # Note: It is important that X have the same order as `self.features_in` when entering this method
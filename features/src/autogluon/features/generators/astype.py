@@ -8,6 +8,7 @@ from autogluon.common.features.feature_metadata import FeatureMetadata
 from autogluon.common.features.infer_types import get_bool_true_val, get_type_map_raw, get_type_map_real
 from autogluon.common.features.types import R_INT, S_BOOL
 
+from ..utils import astype_array
 from .abstract import AbstractFeatureGenerator
 
 logger = logging.getLogger(__name__)
@@ -167,6 +168,25 @@ class AsTypeFeatureGenerator(AbstractFeatureGenerator):
                     raise e
         return X
 
+    def _transform_arrays(self, X: dict) -> dict:
+        for feature, feature_bool_val in self._bool_features.items():
+            X[feature] = (np.asarray(X[feature], dtype="object") == feature_bool_val).astype(np.int8)
+        if self._int_features.size:
+            with_null_features = [feature for feature in self._int_features if pd.isnull(X[feature]).any()]
+            if with_null_features:
+                logger.warning(
+                    "WARNING: Int features without null values "
+                    "at train time contain null values at inference time! "
+                    "Imputing nulls to 0. To avoid this, pass the features as floats during fit!"
+                )
+                logger.warning(f"WARNING: Int features with nulls: {with_null_features}")
+                for feature in with_null_features:
+                    X[feature] = pd.Series(X[feature]).fillna(0).to_numpy()
+        for feature, dtype in self._type_map_real_opt.items():
+            if X[feature].dtype != dtype:
+                X[feature] = astype_array(X[feature], dtype=dtype)
+        return X
+
     def _log_invalid_dtypes(self, X: pd.DataFrame):
         """
         Logs detailed information on all feature transformations, including exceptions that occur.
@@ -35,6 +35,12 @@ class BinnedFeatureGenerator(AbstractFeatureGenerator):
     def _transform(self, X: DataFrame) -> DataFrame:
         return self._transform_bin(X)
 
+    def _transform_arrays(self, X: dict) -> dict:
+        return {
+            column: binning.bin_column(series=X[column], bins=self._bin_map[column], dtype=self._astype_map[column])
+            for column in self._bin_map
+        }
+
     @staticmethod
     def get_default_infer_features_in_args() -> dict:
         return dict(valid_raw_types=[R_INT, R_FLOAT])
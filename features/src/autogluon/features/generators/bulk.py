@@ -1,16 +1,41 @@
 from __future__ import annotations
 
 import logging
+import time
+from functools import partial
 from typing import List
 
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
 from pandas import DataFrame
 
 from autogluon.common.features.feature_metadata import FeatureMetadata
+from autogluon.common.utils.resource_utils import ResourceManager
 
-from .abstract import AbstractFeatureGenerator
+from .abstract import AbstractFeatureGenerator, _get_method_owner, _map_chunks
+from .compiled_plan import _PlanBuilder
 
 logger = logging.getLogger(__name__)
 
+# Minimum number of rows per chunk when transforming generators with the `allow_row_chunking` tag in parallel
+ROW_CHUNK_MIN_SIZE = 10000
+
+
+def _fit_transform_generator(
+    generator: AbstractFeatureGenerator, X: DataFrame, **kwargs
+) -> tuple[AbstractFeatureGenerator, DataFrame, float]:
+    # Returns the generator, as the process backend fits a copy of the generator in the worker process
+    start_time = time.time()
+    X_out = generator.fit_transform(X, **kwargs)
+    return generator, X_out, time.time() - start_time
+
+
+def _transform_generator(generator: AbstractFeatureGenerator, X: DataFrame) -> tuple[DataFrame, float]:
+    start_time = time.time()
+    X_out = generator.transform(X)
+    return X_out, time.time() - start_time
+
 
 # TODO: Add parameter to add prefix to each generator to guarantee no name collisions: 'G1_', 'G2_', etc.
 # TODO: Add argument keep_unused, which creates an identity feature generator at each stage to pipe unused
@@ -55,6 +80,18 @@ class BulkFeatureGenerator(AbstractFeatureGenerator):
         This is done to optimize inference speed.
         If False, will not perform this operation.
         If "false_recursive", will also disable this operation in all inner generators.
+    num_cpus : int or "auto", default 1
+        The number of CPUs used to fit and transform the generators of each stage concurrently.
+        Generators within a stage are independent, and are run in parallel if num_cpus > 1.
+        Additionally, during transform, generators with the `allow_row_chunking` tag (such as text n-gram, text special and datetime generators)
+        split data of at least 2 * ROW_CHUNK_MIN_SIZE rows into row chunks which are transformed in parallel.
+        At most num_cpus generators or chunks are processed at the same time.
+        If "auto", uses all CPUs available on the machine at the time of fit or transform. If 1, generators are run sequentially.
+    parallel_backend : {"threading", "loky"}, default "threading"
+        The joblib backend used if num_cpus > 1.
+        "threading" has the lowest overhead, but only speeds up generators which release the GIL, such as NumPy and pandas operations.
+        "loky" runs generators in separate processes, which also speeds up pure Python logic such as text tokenization,
+        at the cost of copying the data and the generators to each process.
     **kwargs :
         Refer to :class:`AbstractFeatureGenerator` documentation for details on valid key word arguments.
 
@@ -95,9 +132,20 @@ class BulkFeatureGenerator(AbstractFeatureGenerator):
         generators: list[list[AbstractFeatureGenerator | list]],
         pre_generators: list[AbstractFeatureGenerator | List[AbstractFeatureGenerator]] = None,
         remove_unused_features: bool | str = True,
+        num_cpus: int | str = 1,
+        parallel_backend: str = "threading",
         **kwargs,
     ):
         super().__init__(**kwargs)
+        if num_cpus != "auto" and (not isinstance(num_cpus, int) or num_cpus < 1):
+            raise ValueError(f"num_cpus must be a positive integer or 'auto', but was {num_cpus}")
+        valid_parallel_backends = ["threading", "loky"]
+        if parallel_backend not in valid_parallel_backends:
+            raise ValueError(
+                f"parallel_backend must be one of {valid_parallel_backends}, but was '{parallel_backend}'"
+            )
+        self.num_cpus = num_cpus
+        self.parallel_backend = parallel_backend
         if isinstance(remove_unused_features, str):
             assert remove_unused_features == "false_recursive", (
                 "remove_unused_features only accepts bool or 'false_recursive'"
@@ -167,10 +215,13 @@ class BulkFeatureGenerator(AbstractFeatureGenerator):
         # FeatureMetadata object based on the original input features that were unused by any feature generator.
         self._feature_metadata_in_unused: FeatureMetadata = None
 
-    def _fit_transform(self, X: DataFrame, **kwargs) -> tuple[DataFrame, dict]:
+    def _fit_transform(self, X: DataFrame, X_chunks=None, **kwargs) -> tuple[DataFrame, dict]:
         feature_metadata = self.feature_metadata_in
         for i in range(len(self.generators)):
             self._log(20, f"\tStage {i + 1} Generators:")
+            if X_chunks is not None:
+                # Each stage is fit on the chunks transformed by the previously fit stages
+                kwargs["X_chunks"] = _map_chunks(X_chunks, partial(self._transform_stages, num_stages=i))
             X, self.generators[i], feature_metadata = self._fit_transform_stage(
                 X=X,
                 generators=self.generators[i],
@@ -205,11 +256,26 @@ class BulkFeatureGenerator(AbstractFeatureGenerator):
                 if generator.verbosity > self.verbosity:
                     generator.verbosity = self.verbosity
                 generator.set_log_prefix(log_prefix=self.log_prefix + "\t\t", prepend=True)
-                feature_df_list.append(generator.fit_transform(X, feature_metadata_in=feature_metadata_in, **kwargs))
                 generator_group_valid.append(generator)
             else:
                 self._log(15, f"\t\tSkipping {generator.__class__.__name__}: No input feature with required dtypes.")
 
+        if self._get_num_cpus() > 1 and len(generator_group_valid) > 1:
+            results = self._run_parallel(
+                [
+                    delayed(_fit_transform_generator)(generator, X, feature_metadata_in=feature_metadata_in, **kwargs)
+                    for generator in generator_group_valid
+                ]
+            )
+            generator_group_valid = []
+            for generator, X_out, time_fit in results:
+                self._log(15, f"\t\t{generator.__class__.__name__} fit in {time_fit:.2f}s")
+                generator_group_valid.append(generator)
+                feature_df_list.append(X_out)
+        else:
+            for generator in generator_group_valid:
+                feature_df_list.append(generator.fit_transform(X, feature_metadata_in=feature_metadata_in, **kwargs))
+
         generators = generator_group_valid
 
         generators = [
@@ -241,14 +307,91 @@ class BulkFeatureGenerator(AbstractFeatureGenerator):
 
     def _transform(self, X: DataFrame) -> DataFrame:
         for generator_group in self.generators:
-            feature_df_list = []
+            X = self._transform_stage(X=X, generators=generator_group)
+        return X
+
+    def _transform_stage_parallel(
+        self, X: DataFrame, generators: list[AbstractFeatureGenerator], num_cpus: int
+    ) -> list[DataFrame]:
+        """
+        Transforms X with each generator of a stage in parallel, and returns the output of each generator.
+        Generators with the `allow_row_chunking` tag are split into row chunks to parallelize large data within a single generator.
+        """
+        num_chunks = min(num_cpus, len(X) // ROW_CHUNK_MIN_SIZE)
+        tasks = []
+        task_generator_idx = []
+        for i, generator in enumerate(generators):
+            if num_chunks > 1 and generator.get_tags().get("allow_row_chunking", False):
+                for row_idx in np.array_split(np.arange(len(X)), num_chunks):
+                    # Some generators assume the index of X is positional, such as with the `reset_index` of the outer generator
+                    X_chunk = X.iloc[row_idx[0] : row_idx[-1] + 1].reset_index(drop=True)
+                    tasks.append(delayed(_transform_generator)(generator, X_chunk))
+                    task_generator_idx.append(i)
+            else:
+                tasks.append(delayed(_transform_generator)(generator, X))
+                task_generator_idx.append(i)
+        if len(tasks) == 1:
+            results = [_transform_generator(generators[0], X)]
+        else:
+            results = self._run_parallel(tasks)
+
+        feature_df_chunks = [[] for _ in generators]
+        time_transform = [0.0 for _ in generators]
+        for i, (X_out, time_transform_chunk) in zip(task_generator_idx, results):
+            feature_df_chunks[i].append(X_out)
+            time_transform[i] += time_transform_chunk
+        feature_df_list = []
+        for generator, chunks, time_transform_generator in zip(generators, feature_df_chunks, time_transform):
+            self._log(10, f"\t{generator.__class__.__name__} transformed in {time_transform_generator:.2f}s")
+            if len(chunks) == 1:
+                feature_df_list.append(chunks[0])
+            else:
+                X_out = pd.concat(chunks, axis=0, ignore_index=True, copy=False)
+                X_out.index = X.index
+                feature_df_list.append(X_out)
+        return feature_df_list
+
+    def _get_num_cpus(self) -> int:
+        # Generators saved prior to the addition of `num_cpus` don't have the attribute
+        num_cpus = getattr(self, "num_cpus", 1)
+        if num_cpus == "auto":
+            # Resolved at runtime, as the generator may be used on a different machine than the one it was fit on
+            num_cpus = ResourceManager.get_cpu_count()
+        return num_cpus
+
+    def _run_parallel(self, tasks: list) -> list:
+        # Generators saved prior to the addition of `parallel_backend` don't have the attribute
+        parallel_backend = getattr(self, "parallel_backend", "threading")
+        return Parallel(n_jobs=min(self._get_num_cpus(), len(tasks)), backend=parallel_backend)(tasks)
+
+    def _transform_arrays(self, X: dict) -> dict:
+        for generator_group in self.generators:
+            X_out = dict()
             for generator in generator_group:
-                feature_df_list.append(generator.transform(X))
+                X_out.update(generator.transform_arrays(X))
+            X = X_out
+        return X
 
-            X = self._concat_features(
-                feature_df_list=feature_df_list,
-                index=X.index,
-            )
+    def _compile_transform(self, builder: _PlanBuilder, X: dict[str, int]) -> dict[str, int]:
+        if _get_method_owner(self.__class__, "_transform") is not BulkFeatureGenerator:
+            return super()._compile_transform(builder=builder, X=X)
+        for generator_group in self.generators:
+            X_out = dict()
+            for generator in generator_group:
+                X_out.update(generator._compile(builder=builder, X=X))
+            X = X_out
+        return X
+
+    def can_transform_arrays(self) -> bool:
+        if not super().can_transform_arrays():
+            return False
+        return all(
+            generator.can_transform_arrays() for generator_group in self.generators for generator in generator_group
+        )
+
+    def _transform_stages(self, X: DataFrame, num_stages: int) -> DataFrame:
+        for generator_group in self.generators[:num_stages]:
+            X = self._transform_stage(X=X, generators=generator_group)
         return X
 
     def _transform_stage(
@@ -256,9 +399,15 @@ class BulkFeatureGenerator(AbstractFeatureGenerator):
         X: DataFrame,
         generators: list["AbstractFeatureGenerator"],
     ) -> DataFrame:
-        feature_df_list = []
-        for generator in generators:
-            feature_df_list.append(generator.transform(X))
+        num_cpus = self._get_num_cpus()
+        if num_cpus > 1:
+            feature_df_list = self._transform_stage_parallel(X=X, generators=generators, num_cpus=num_cpus)
+        else:
+            feature_df_list = []
+            for generator in generators:
+                X_out, time_transform = _transform_generator(generator, X)
+                self._log(10, f"\t{generator.__class__.__name__} transformed in {time_transform:.2f}s")
+                feature_df_list.append(X_out)
 
         X = self._concat_features(
             feature_df_list=feature_df_list,
@@ -335,3 +484,6 @@ class BulkFeatureGenerator(AbstractFeatureGenerator):
     @staticmethod
     def get_default_infer_features_in_args() -> dict:
         return dict()
+
+    def _more_tags(self):
+        return {"allow_chunked_fit": True}
@@ -94,9 +94,9 @@ class CategoryFeatureGenerator(AbstractFeatureGenerator):
         if minimize_memory:
             self._post_generators = [CategoryMemoryMinimizeFeatureGenerator()] + self._post_generators
 
-    def _fit_transform(self, X: DataFrame, **kwargs) -> (DataFrame, dict):
+    def _fit_transform(self, X: DataFrame, X_chunks=None, **kwargs) -> (DataFrame, dict):
         if self._stateful_categories:
-            X_out, self.category_map, self._fillna_map = self._generate_category_map(X=X)
+            X_out, self.category_map, self._fillna_map = self._generate_category_map(X=X, X_chunks=X_chunks)
             if self._fillna_map is not None:
                 for column in self._fillna_map:
                     X_out[column] = X_out[column].fillna(self._fillna_map[column])
@@ -115,6 +115,22 @@ class CategoryFeatureGenerator(AbstractFeatureGenerator):
     def _transform(self, X: DataFrame) -> DataFrame:
         return self._generate_features_category(X)
 
+    def _transform_arrays(self, X: dict) -> dict:
+        X_category = dict()
+        if self.features_in and self.category_map is not None:
+            for column, column_map in self.category_map.items():
+                values = X[column]
+                if isinstance(values, pd.Categorical):
+                    X_category[column] = pd.Categorical(values, categories=column_map)
+                else:
+                    # Equivalent to `pd.Categorical(values, categories=column_map)`, but avoids its input validation overhead
+                    codes = column_map.get_indexer_for(values)
+                    X_category[column] = pd.Categorical.from_codes(codes, dtype=CategoricalDtype(column_map))
+            if self._fillna_map is not None:
+                for column, column_fillna_val in self._fillna_map.items():
+                    X_category[column] = X_category[column].fillna(column_fillna_val)
+        return X_category
+
     @staticmethod
     def get_default_infer_features_in_args() -> dict:
         return dict(
@@ -136,13 +152,27 @@ class CategoryFeatureGenerator(AbstractFeatureGenerator):
             X_category = DataFrame(index=X.index)
         return X_category
 
-    def _generate_category_map(self, X: DataFrame) -> (DataFrame, dict):
+    def _generate_category_map(self, X: DataFrame, X_chunks=None) -> (DataFrame, dict):
+        """
+        Generates the category map from X.
+        If X_chunks is specified, X is a sample of the full data and the category counts are computed from all chunks of the full data instead.
+        """
         if self.features_in:
             fill_nan_map = dict()
             category_map = dict()
             X_category = X.astype("category")
+            if X_chunks is not None:
+                category_counts_full = self._get_category_counts_chunked(X=X, X_chunks=X_chunks)
+            else:
+                category_counts_full = None
             for column in X_category:
-                rank = X_category[column].value_counts().sort_values(ascending=True)
+                if category_counts_full is not None:
+                    category_counts, original_cat_order = category_counts_full[column]
+                    # Include the categories of the full data which are absent from the sample X
+                    X_category[column] = X_category[column].astype(CategoricalDtype(categories=original_cat_order))
+                else:
+                    category_counts = X_category[column].value_counts()
+                rank = category_counts.sort_values(ascending=True)
                 if self._minimum_cat_count is not None:
                     rank = rank[rank >= self._minimum_cat_count]
                 if self._maximum_num_cat is not None:
@@ -180,6 +210,39 @@ class CategoryFeatureGenerator(AbstractFeatureGenerator):
         else:
             return DataFrame(index=X.index), None, None
 
+    @staticmethod
+    def _get_category_counts_chunked(X: DataFrame, X_chunks) -> dict[str, tuple[pd.Series, list]]:
+        """
+        Returns the category counts of each feature over all chunks, sorted by descending count,
+        and the categories in the order `X.astype("category")` would have if X was the full data.
+        """
+        category_counts = {column: [] for column in X.columns}
+        for X_chunk in X_chunks():
+            X_chunk = X_chunk.astype("category")
+            for column in X_chunk.columns:
+                # Aggregate after each chunk to bound memory by the number of unique categories
+                category_counts_chunk = X_chunk[column].value_counts(sort=False)
+                category_counts_chunk.index = pd.Index(category_counts_chunk.index.to_numpy())
+                category_counts[column].append(category_counts_chunk)
+                category_counts[column] = [pd.concat(category_counts[column]).groupby(level=0, sort=False).sum()]
+
+        category_counts_full = dict()
+        for column in X.columns:
+            column_counts = category_counts[column][0] if category_counts[column] else pd.Series(dtype="int64")
+            # Categories in order of appearance
+            original_cat_order = list(column_counts.index)
+            if not isinstance(X[column].dtype, CategoricalDtype):
+                # Equivalent to the category order inferred by pandas
+                try:
+                    original_cat_order = sorted(original_cat_order)
+                except TypeError:
+                    pass
+            category_counts_full[column] = (
+                column_counts.sort_values(ascending=False, kind="stable"),
+                original_cat_order,
+            )
+        return category_counts_full
+
     def _remove_features_in(self, features: list):
         super()._remove_features_in(features)
         if self.category_map:
@@ -192,4 +255,4 @@ class CategoryFeatureGenerator(AbstractFeatureGenerator):
                     self._fillna_map.pop(feature)
 
     def _more_tags(self):
-        return {"feature_interactions": False}
+        return {"feature_interactions": False, "allow_chunked_fit": True, "allow_row_chunking": True}
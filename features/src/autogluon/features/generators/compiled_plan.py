@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Callable
+
+import numpy as np
+import pandas as pd
+from numpy.typing import ArrayLike
+from pandas import DataFrame
+
+from ..utils import series_to_array
+
+if TYPE_CHECKING:
+    from .abstract import AbstractFeatureGenerator
+
+logger = logging.getLogger(__name__)
+
+
+class _PlanStep:
+    """A single column-level operation of a CompiledTransformPlan, reading and writing numbered column slots."""
+
+    def __init__(
+        self,
+        generator: AbstractFeatureGenerator,
+        func: Callable[[dict], dict],
+        inputs: dict[str, int],
+        outputs: dict[str, int],
+        uses_dataframe: bool = False,
+    ):
+        self.generator = generator
+        self.func = func
+        self.inputs = list(inputs.items())
+        self.outputs = list(outputs.items())
+        self.uses_dataframe = uses_dataframe
+
+    def __call__(self, slots: list, num_rows: int):
+        X = {feature: slots[slot] for feature, slot in self.inputs}
+        if self.uses_dataframe:
+            X_out = self.func(DataFrame(X, index=pd.RangeIndex(num_rows), copy=False))
+            for feature, slot in self.outputs:
+                slots[slot] = series_to_array(X_out[feature])
+        else:
+            X_out = self.func(X)
+            for feature, slot in self.outputs:
+                slots[slot] = X_out[feature]
+
+    def __repr__(self) -> str:
+        func_name = "_transform" if self.uses_dataframe else "_transform_arrays"
+        return f"{self.generator.__class__.__name__}.{func_name}({len(self.inputs)} -> {len(self.outputs)} features)"
+
+
+class _PlanBuilder:
+    """Collects the steps of a CompiledTransformPlan while traversing a generator tree via `AbstractFeatureGenerator._compile`."""
+
+    def __init__(self, features_in: list[str]):
+        self.num_slots = len(features_in)
+        self.steps: list[_PlanStep] = []
+
+    def add_step(
+        self,
+        generator: AbstractFeatureGenerator,
+        func: Callable[[dict], dict],
+        inputs: dict[str, int],
+        features_out: list[str],
+        uses_dataframe: bool = False,
+    ) -> dict[str, int]:
+        """Adds a step which computes `features_out` from `inputs`, returning the slots the step writes `features_out` to."""
+        outputs = {feature: self.num_slots + i for i, feature in enumerate(features_out)}
+        self.num_slots += len(outputs)
+        self.steps.append(
+            _PlanStep(generator=generator, func=func, inputs=inputs, outputs=outputs, uses_dataframe=uses_dataframe)
+        )
+        return outputs
+
+
+class CompiledTransformPlan:
+    """
+    A fitted feature generator flattened into a single ordered list of column-level operations, created via `AbstractFeatureGenerator.compile()`.
+
+    `AbstractFeatureGenerator.transform` walks the generator tree on every call: each generator re-selects its `features_in`,
+    builds an intermediate DataFrame and each BulkFeatureGenerator stage concatenates the outputs of its generators.
+    The compiled plan resolves all of this once:
+        1. Every generator output is assigned a numbered column slot. Column selection, renaming, passthrough and stage concatenation
+            only change which slots a later operation reads, so they cost nothing at transform time.
+        2. Generators which only select or rename columns (such as identity, drop unique and drop duplicates) are removed from the plan.
+        3. Operations whose outputs are not used by the final output are removed from the plan.
+        4. The remaining operations are executed in order via `_transform_arrays` on 1-dimensional arrays.
+            Generators without an array implementation (such as text n-grams) are executed via `_transform` on a DataFrame of only their input columns.
+
+    The output of the plan is identical to the output of the generator it was compiled from.
+
+    Parameters
+    ----------
+    generator : AbstractFeatureGenerator
+        The fitted feature generator to compile.
+
+    Attributes
+    ----------
+    features_in : list[str]
+        The input features of the plan, identical to `generator.features_in`.
+    features_out : list[str]
+        The output features of the plan, identical to `generator.features_out`.
+    steps : list
+        The operations of the plan, in execution order.
+    """
+
+    def __init__(self, generator: AbstractFeatureGenerator):
+        if not generator.is_fit():
+            raise AssertionError(f"{generator.__class__.__name__} is not fit.")
+        self.features_in = list(generator.features_in)
+        self.features_out = list(generator.features_out)
+        self._column_names_as_str = generator.column_names_as_str
+
+        builder = _PlanBuilder(features_in=self.features_in)
+        X_slots = {feature: i for i, feature in enumerate(self.features_in)}
+        X_out_slots = generator._compile(builder=builder, X=X_slots)
+        self._input_slots = list(X_slots.items())
+        self._output_slots = [(feature, X_out_slots[feature]) for feature in self.features_out]
+        self._num_slots = builder.num_slots
+        self.steps = self._prune_steps(steps=builder.steps, output_slots=self._output_slots)
+
+    @staticmethod
+    def _prune_steps(steps: list[_PlanStep], output_slots: list[tuple[str, int]]) -> list[_PlanStep]:
+        """Removes steps which do not contribute to the output slots."""
+        live_slots = {slot for _, slot in output_slots}
+        steps_to_keep = []
+        for step in reversed(steps):
+            if any(slot in live_slots for _, slot in step.outputs):
+                steps_to_keep.append(step)
+                live_slots.update(slot for _, slot in step.inputs)
+        return steps_to_keep[::-1]
+
+    def transform(self, X: DataFrame) -> DataFrame:
+        """
+        Transforms input data into the output data format. Identical to `generator.transform(X)`.
+
+        Parameters
+        ----------
+        X : DataFrame
+            Input data to be transformed.
+
+        Returns
+        -------
+        X_out : DataFrame object which is the transformed version of the input data X.
+        """
+        if self._column_names_as_str:
+            X = X.copy(deep=False)
+            X.columns = X.columns.astype(str)
+        self._check_missing_features(X.columns)
+        slots = self._execute({feature: series_to_array(X[feature]) for feature in self.features_in}, num_rows=len(X))
+        X_out = {feature: slots[slot] for feature, slot in self._output_slots}
+        return DataFrame(X_out, index=X.index, columns=self.features_out, copy=False)
+
+    def transform_arrays(self, X: dict[str, ArrayLike]) -> dict[str, ArrayLike]:
+        """
+        Transforms input data in the form of a dictionary of column arrays into the output data format.
+        Identical to `generator.transform_arrays(X)`, but also supported if `generator.can_transform_arrays()` is False.
+
+        Parameters
+        ----------
+        X : dict[str, ArrayLike]
+            Dictionary of feature name to a 1-dimensional array of the feature's values. All arrays must have the same length.
+            Category features are represented as :class:`pd.Categorical`. The arrays are not altered.
+
+        Returns
+        -------
+        X_out : dict[str, ArrayLike]
+            Dictionary of feature name to array, in the order of `features_out`.
+        """
+        slots = self._execute(X, num_rows=self._get_num_rows(X))
+        return {feature: slots[slot] for feature, slot in self._output_slots}
+
+    def transform_to_numpy(
+        self, X: DataFrame | dict[str, ArrayLike], dtype=np.float32, out: np.ndarray = None
+    ) -> np.ndarray:
+        """
+        Transforms input data into a single 2-dimensional NumPy array of shape (num_rows, len(features_out)).
+        Category features are represented by their category codes, with missing values as NaN.
+
+        Parameters
+        ----------
+        X : DataFrame or dict[str, ArrayLike]
+            Input data to be transformed, either as a DataFrame or as a dictionary of column arrays as in `transform_arrays`.
+        dtype : default np.float32
+            The dtype of the output array. Ignored if `out` is specified.
+        out : np.ndarray, optional
+            A preallocated array of shape (num_rows, len(features_out)) to write the output to.
+            Reusing the same array across calls avoids allocating the output on every call.
+
+        Returns
+        -------
+        X_out : np.ndarray
+            The transformed data. If `out` is specified, `out` is returned.
+        """
+        if isinstance(X, DataFrame):
+            if self._column_names_as_str:
+                X = X.copy(deep=False)
+                X.columns = X.columns.astype(str)
+            self._check_missing_features(X.columns)
+            num_rows = len(X)
+            X = {feature: series_to_array(X[feature]) for feature in self.features_in}
+        else:
+            num_rows = self._get_num_rows(X)
+        slots = self._execute(X, num_rows=num_rows)
+        if out is None:
+            out = np.empty((num_rows, len(self._output_slots)), dtype=dtype)
+        elif out.shape != (num_rows, len(self._output_slots)):
+            raise ValueError(f"out must have shape {(num_rows, len(self._output_slots))}, but found shape {out.shape}")
+        for i, (feature, slot) in enumerate(self._output_slots):
+            values = slots[slot]
+            if isinstance(values, pd.Categorical):
+                codes = values.codes
+                out[:, i] = codes
+                if (codes == -1).any():
+                    out[codes == -1, i] = np.nan
+            else:
+                out[:, i] = np.asarray(values)
+        return out
+
+    def _execute(self, X: dict[str, ArrayLike], num_rows: int) -> list:
+        slots = [None] * self._num_slots
+        try:
+            for feature, slot in self._input_slots:
+                slots[slot] = X[feature]
+        except KeyError:
+            self._check_missing_features(X.keys())
+        for step in self.steps:
+            step(slots=slots, num_rows=num_rows)
+        return slots
+
+    @staticmethod
+    def _get_num_rows(X: dict[str, ArrayLike]) -> int:
+        return len(next(iter(X.values()))) if X else 0
+
+    def _check_missing_features(self, features):
+        features = set(features)
+        missing_features = [feature for feature in self.features_in if feature not in features]
+        if missing_features:
+            raise KeyError(
+                f"{len(missing_features)} required columns are missing from the provided dataset to transform using {self.__class__.__name__}. "
+                f"{len(missing_features)} missing columns: {missing_features} | "
+                f"{len(features)} available columns: {list(features)}"
+            )
+
+    def __repr__(self) -> str:
+        steps_str = "".join(f"\n\t{i}: {step}" for i, step in enumerate(self.steps))
+        return (
+            f"{self.__class__.__name__}({len(self.features_in)} -> {len(self.features_out)} features, "
+            f"{len(self.steps)} steps){steps_str}"
+        )
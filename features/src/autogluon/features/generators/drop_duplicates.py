@@ -3,18 +3,62 @@ from __future__ import annotations
 import hashlib
 import logging
 from collections import defaultdict
-from typing import Union
+from typing import Callable, Union
 
 import numpy as np
 import pandas as pd
+from joblib import Parallel, delayed
 from pandas import DataFrame
 
 from autogluon.common.features.types import R_BOOL, R_CATEGORY, R_FLOAT, R_INT
+from autogluon.common.utils.resource_utils import ResourceManager
 
 from .abstract import AbstractFeatureGenerator
 
 logger = logging.getLogger(__name__)
 
+# The maximum number of values hashed at once by a worker of the hash method, bounding its temporary memory
+HASH_BLOCK_SIZE = 1 << 22
+
+
+def _splitmix64(x: np.ndarray) -> np.ndarray:
+    """Applies the splitmix64 finalizer to an array of uint64 in place, mapping each value to a pseudo-random 64-bit value."""
+    x += np.uint64(0x9E3779B97F4A7C15)
+    x ^= x >> np.uint64(30)
+    x *= np.uint64(0xBF58476D1CE4E5B9)
+    x ^= x >> np.uint64(27)
+    x *= np.uint64(0x94D049BB133111EB)
+    x ^= x >> np.uint64(31)
+    return x
+
+
+def _hash_columns(values: np.ndarray, row_salt: np.ndarray) -> np.ndarray:
+    """
+    Returns an order-sensitive 64-bit hash of each column of `values`, a 2-dimensional array of 64-bit values which is overwritten.
+    Each value is mixed with a per-row salt and the mixed values are summed, so equal columns always have equal hashes.
+    """
+    values = values.view(np.uint64)
+    values ^= row_salt[:, None]
+    return _splitmix64(values).sum(axis=0, dtype=np.uint64)
+
+
+def _get_numeric_values(X: DataFrame) -> np.ndarray:
+    """Returns the values of numeric features as a new float64 array, with -0.0 normalized to 0.0 and all missing values as the same NaN."""
+    values = X.to_numpy(dtype=np.float64, na_value=np.nan, copy=True)
+    values[values == 0] = 0.0
+    values[np.isnan(values)] = np.nan
+    return values
+
+
+def _get_category_codes(X: DataFrame) -> np.ndarray:
+    """Returns the codes of the values of each feature in order of first appearance, with missing values as their own value."""
+    return np.column_stack([pd.factorize(X[feature], use_na_sentinel=False)[0].astype(np.int64) for feature in X])
+
+
+def _get_generic_hashes(X: DataFrame) -> np.ndarray:
+    """Returns the 64-bit hash of each value of each feature."""
+    return np.column_stack([pd.util.hash_pandas_object(X[feature], index=False).to_numpy() for feature in X])
+
 
 # TODO: Not necessary to exist after fitting, can just update outer context feature_out/feature_in and then delete this
 class DropDuplicatesFeatureGenerator(AbstractFeatureGenerator):
@@ -33,26 +77,41 @@ class DropDuplicatesFeatureGenerator(AbstractFeatureGenerator):
         but should be near impossible in practice.
         If None or greater than the number of rows, will perform exact duplicate detection (most expensive).
         It is recommended to keep this value below 100000 to maintain reasonable fit times.
+        Ignored if method="hash", which always performs exact duplicate detection.
+    method : {"sample", "hash"}, default "sample"
+        The duplicate detection method.
+        If "sample", features are grouped by summary statistics and compared on samples of the rows.
+        If "hash", a 64-bit hash of every feature is computed over all rows, features are bucketed by their hash,
+        and only features within the same bucket are compared for exact equality.
+        Numeric features are hashed in batches of columns as contiguous NumPy arrays, and category and boolean features are hashed via their
+        codes in order of first appearance, so that they are duplicates if they contain the same information as with "sample".
+        The time to fit scales linearly with the number of features and rows, which is much faster for very wide data, such as 20000+ features.
+        If `sample_size_init` is smaller than the number of rows, the features are first hashed on a sample of the rows to filter candidates.
+    num_cpus : int or "auto", default 1
+        The number of threads used to hash the features if method="hash". If "auto", uses all available CPUs.
     **kwargs :
         Refer to :class:`AbstractFeatureGenerator` documentation for details on valid key word arguments.
     """
 
-    def __init__(self, sample_size_init=1000, sample_size_final=5000, **kwargs):
+    def __init__(
+        self, sample_size_init=1000, sample_size_final=5000, method: str = "sample", num_cpus: int | str = 1, **kwargs
+    ):
         super().__init__(**kwargs)
+        valid_methods = ["sample", "hash"]
+        if method not in valid_methods:
+            raise ValueError(f"method must be one of {valid_methods}, but was '{method}'")
+        if num_cpus != "auto" and (not isinstance(num_cpus, int) or num_cpus < 1):
+            raise ValueError(f"num_cpus must be a positive integer or 'auto', but was {num_cpus}")
         self.sample_size_init = sample_size_init
         self.sample_size_final = sample_size_final
+        self.method = method
+        self.num_cpus = num_cpus
 
-    def _fit_transform(self, X: DataFrame, **kwargs) -> (DataFrame, dict):
-        if self.sample_size_init is not None and len(X) > self.sample_size_init:
-            features_to_check = self._drop_duplicate_features(
-                X, self.feature_metadata_in, keep=False, sample_size=self.sample_size_init
-            )
-            X_candidates = X[features_to_check]
+    def _fit_transform(self, X: DataFrame, X_chunks=None, **kwargs) -> (DataFrame, dict):
+        if self.method == "hash":
+            features_to_drop = self._fit_hash(X, X_chunks=X_chunks)
         else:
-            X_candidates = X
-        features_to_drop = self._drop_duplicate_features(
-            X_candidates, self.feature_metadata_in, sample_size=self.sample_size_final
-        )
+            features_to_drop = self._fit_sample(X, X_chunks=X_chunks)
         self._remove_features_in(features_to_drop)
         if features_to_drop:
             self._log(15, f"\t{len(features_to_drop)} duplicate columns removed: {features_to_drop}")
@@ -61,9 +120,59 @@ class DropDuplicatesFeatureGenerator(AbstractFeatureGenerator):
             X = X[self.features_in]
         return X, self.feature_metadata_in.type_group_map_special
 
+    def _fit_sample(self, X: DataFrame, X_chunks=None) -> list[str]:
+        if self.sample_size_init is not None and len(X) > self.sample_size_init:
+            features_to_check = self._drop_duplicate_features(
+                X, self.feature_metadata_in, keep=False, sample_size=self.sample_size_init
+            )
+            X_candidates = X[features_to_check]
+        else:
+            X_candidates = X
+        if X_chunks is not None:
+            # X is a sample of the full data. Features which are duplicates in the full data are duplicates in any sample,
+            # so the duplicates of the sample are the candidates that are verified on the full data.
+            features_to_check = self._drop_duplicate_features(
+                X_candidates, self.feature_metadata_in, keep=False, sample_size=self.sample_size_final
+            )
+            features_to_drop = self._drop_duplicate_features_chunked(X_chunks, features=features_to_check)
+        else:
+            features_to_drop = self._drop_duplicate_features(
+                X_candidates, self.feature_metadata_in, sample_size=self.sample_size_final
+            )
+        return features_to_drop
+
+    def _fit_hash(self, X: DataFrame, X_chunks=None) -> list[str]:
+        features_to_check = list(X.columns)
+        if self.sample_size_init is not None and len(X) > self.sample_size_init:
+            X_sample = X.sample(self.sample_size_init, random_state=0, replace=True)
+            features_to_check = self._drop_duplicate_features_hash(
+                X_sample, self.feature_metadata_in, keep=False, num_cpus=self._get_num_cpus()
+            )
+        if X_chunks is not None:
+            # Refer to `_fit_sample`: the duplicates of the sample are the candidates that are verified on the full data.
+            features_to_check = self._drop_duplicate_features_hash(
+                X[features_to_check], self.feature_metadata_in, keep=False, num_cpus=self._get_num_cpus()
+            )
+            return self._drop_duplicate_features_chunked(X_chunks, features=features_to_check)
+        return self._drop_duplicate_features_hash(
+            X[features_to_check], self.feature_metadata_in, num_cpus=self._get_num_cpus()
+        )
+
+    def _get_num_cpus(self) -> int:
+        if self.num_cpus == "auto":
+            # Resolved at fit time, as the generator may be fit on a different machine than the one it was created on
+            return ResourceManager.get_cpu_count()
+        return self.num_cpus
+
     def _transform(self, X: DataFrame) -> DataFrame:
         return X
 
+    def _transform_arrays(self, X: dict) -> dict:
+        return X
+
+    def _get_compiled_column_map(self) -> dict[str, str]:
+        return {feature: feature for feature in self.features_in}
+
     @staticmethod
     def get_default_infer_features_in_args() -> dict:
         return dict()
@@ -98,6 +207,154 @@ class DropDuplicatesFeatureGenerator(AbstractFeatureGenerator):
 
         return features_to_remove
 
+    @classmethod
+    def _drop_duplicate_features_hash(
+        cls, X: DataFrame, feature_metadata_in, keep: Union[str, bool] = "first", num_cpus: int = 1
+    ) -> list[str]:
+        """
+        Exact duplicate detection in linear time via 64-bit column hashes, refer to the `method` parameter.
+        Features are duplicates under the same rules as in `_drop_duplicate_features` without sampling.
+        """
+        if keep is True:
+            keep = "first"
+        elif keep not in ("first", "last") and keep is not False:
+            raise ValueError(f"Invalid keep={keep!r}. Expected 'first', 'last', False (or True).")
+        if X.shape[1] <= 1:
+            return []
+        X_columns = set(X.columns)
+        features_numeric = [
+            feature
+            for feature in feature_metadata_in.get_features(valid_raw_types=[R_INT, R_FLOAT])
+            if feature in X_columns
+        ]
+        features_categorical = [
+            feature
+            for feature in feature_metadata_in.get_features(valid_raw_types=[R_CATEGORY, R_BOOL])
+            if feature in X_columns
+        ]
+        features_other = set(features_numeric + features_categorical)
+        features_generic = [feature for feature in X.columns if feature not in features_other]
+
+        # Each task hashes a batch of columns, so that at most HASH_BLOCK_SIZE values are hashed at once
+        row_salt = _splitmix64(np.arange(len(X), dtype=np.uint64))
+        batch_size = max(1, HASH_BLOCK_SIZE // max(len(X), 1))
+        tasks = []
+        for kind, features, get_values in [
+            ("numeric", features_numeric, _get_numeric_values),
+            ("categorical", features_categorical, _get_category_codes),
+            ("generic", features_generic, _get_generic_hashes),
+        ]:
+            for i in range(0, len(features), batch_size):
+                tasks.append((kind, features[i : i + batch_size], get_values))
+
+        def _hash_batch(features: list[str], get_values: Callable[[DataFrame], np.ndarray]) -> np.ndarray:
+            return _hash_columns(get_values(X[features]), row_salt=row_salt)
+
+        if num_cpus > 1 and len(tasks) > 1:
+            hashes = Parallel(n_jobs=min(num_cpus, len(tasks)), backend="threading")(
+                delayed(_hash_batch)(features, get_values) for _, features, get_values in tasks
+            )
+        else:
+            hashes = [_hash_batch(features, get_values) for _, features, get_values in tasks]
+
+        buckets: dict[tuple[str, int], list[str]] = defaultdict(list)
+        for (kind, features, _), features_hashes in zip(tasks, hashes):
+            for feature, feature_hash in zip(features, features_hashes):
+                buckets[(kind, int(feature_hash))].append(feature)
+
+        # Different features can have the same hash, although very unlikely, so features are confirmed to be equal within each bucket.
+        # The values of the features are fetched for batches of buckets with at most `batch_size` features in total.
+        column_order = {feature: i for i, feature in enumerate(X.columns)}
+        features_to_remove = []
+        for kind, get_values in [
+            ("numeric", _get_numeric_values),
+            ("categorical", _get_category_codes),
+            ("generic", None),
+        ]:
+            kind_buckets = [bucket for (bucket_kind, _), bucket in buckets.items() if bucket_kind == kind]
+            kind_buckets = [bucket for bucket in kind_buckets if len(bucket) > 1]
+            while kind_buckets:
+                num_buckets, num_features = 0, 0
+                while num_buckets < len(kind_buckets) and (
+                    num_buckets == 0 or num_features + len(kind_buckets[num_buckets]) <= batch_size
+                ):
+                    num_features += len(kind_buckets[num_buckets])
+                    num_buckets += 1
+                batch_buckets, kind_buckets = kind_buckets[:num_buckets], kind_buckets[num_buckets:]
+                features = [feature for bucket in batch_buckets for feature in bucket]
+                if get_values is None:
+                    values = {feature: X[feature] for feature in features}
+                else:
+                    values = dict(zip(features, get_values(X[features]).T))
+                for bucket in batch_buckets:
+                    for dup_group in cls._group_equal_features(bucket, values=values, kind=kind):
+                        dup_group = sorted(dup_group, key=column_order.get)
+                        if keep == "first":
+                            features_to_remove += dup_group[1:]
+                        elif keep == "last":
+                            features_to_remove += dup_group[:-1]
+                        else:
+                            features_to_remove += dup_group
+        return features_to_remove
+
+    @staticmethod
+    def _group_equal_features(features: list[str], values: dict, kind: str) -> list[list[str]]:
+        """Returns the groups of at least 2 features with equal values."""
+        dup_groups: list[list[str]] = []
+        for feature in features:
+            for dup_group in dup_groups:
+                if kind == "generic":
+                    is_equal = values[dup_group[0]].equals(values[feature])
+                else:
+                    is_equal = np.array_equal(values[dup_group[0]], values[feature], equal_nan=kind == "numeric")
+                if is_equal:
+                    dup_group.append(feature)
+                    break
+            else:
+                dup_groups.append([feature])
+        return [dup_group for dup_group in dup_groups if len(dup_group) > 1]
+
+    def _drop_duplicate_features_chunked(self, X_chunks, features: list[str]) -> list[str]:
+        """
+        Returns the features which are exact duplicates of an earlier feature in `features`, computed over all chunks of the full data
+        by incrementally fingerprinting each feature. Identical to `_drop_duplicate_features` without sampling on the concatenated chunks.
+        """
+        if len(features) <= 1:
+            return []
+        features_numeric = set(self.feature_metadata_in.get_features(valid_raw_types=[R_INT, R_FLOAT]))
+        features_categorical = set(self.feature_metadata_in.get_features(valid_raw_types=[R_CATEGORY, R_BOOL]))
+        fingerprints = {feature: hashlib.blake2b(digest_size=16) for feature in features}
+        # Categorical features are compared by the order of first appearance of their values, ignoring the actual values
+        category_ordinals = {feature: dict() for feature in features if feature in features_categorical}
+        for X_chunk in X_chunks():
+            for feature in features:
+                if feature in features_numeric:
+                    self._update_fingerprint_numeric(fingerprints[feature], X_chunk[feature])
+                elif feature in features_categorical:
+                    codes, uniques = pd.factorize(X_chunk[feature].astype("object"), use_na_sentinel=False)
+                    ordinals = category_ordinals[feature]
+                    uniques_ordinals = np.array(
+                        [ordinals.setdefault(val, len(ordinals)) for val in uniques], dtype=np.int64
+                    )
+                    fingerprints[feature].update(np.ascontiguousarray(uniques_ordinals[codes]).view(np.uint8))
+                else:
+                    values = pd.util.hash_pandas_object(X_chunk[feature], index=False).to_numpy()
+                    fingerprints[feature].update(np.ascontiguousarray(values).view(np.uint8))
+
+        dup_groups: dict[tuple[str, bytes], list[str]] = defaultdict(list)
+        for feature in features:
+            if feature in features_numeric:
+                feature_kind = "numeric"
+            elif feature in features_categorical:
+                feature_kind = "categorical"
+            else:
+                feature_kind = "generic"
+            dup_groups[(feature_kind, fingerprints[feature].digest())].append(feature)
+        features_to_remove = []
+        for dup_group in dup_groups.values():
+            features_to_remove += dup_group[1:]
+        return features_to_remove
+
     @classmethod
     def _drop_duplicate_features_generic(cls, X: DataFrame, keep: Union[str, bool] = "first"):
         """Generic duplication dropping method. Much slower than optimized variants, but can handle all data types."""
@@ -145,6 +402,14 @@ class DropDuplicatesFeatureGenerator(AbstractFeatureGenerator):
         h.update(np.ascontiguousarray(mask).view(np.uint8))
         return h.digest()
 
+    @classmethod
+    def _update_fingerprint_numeric(cls, h, s: pd.Series):
+        """
+        Updates the hash `h` with the fingerprint of a chunk of a numeric-like Series.
+        The final digest depends on the chunk boundaries, so features are only comparable if they are fingerprinted over the same chunks.
+        """
+        h.update(cls._fingerprint_numeric_series_full(s))
+
     @classmethod
     def _drop_duplicate_features_numeric(
         cls,
@@ -181,14 +446,7 @@ class DropDuplicatesFeatureGenerator(AbstractFeatureGenerator):
 
         # ---- Vectorized stats pass (cheap) ----
         # Note: pandas reductions skipna by default, consistent across these stats.
-        stats = pd.DataFrame(
-            {
-                "sum": X.sum(axis=0),
-                "std": X.std(axis=0, ddof=0),
-                "min": X.min(axis=0),
-                "max": X.max(axis=0),
-            }
-        ).round(6)
+        stats = cls._get_numeric_stats(X).round(6)
 
         # ---- Bucket by stats ----
         bucket_map: dict[tuple[float, float, float, float], list[str]] = defaultdict(list)
@@ -226,6 +484,36 @@ class DropDuplicatesFeatureGenerator(AbstractFeatureGenerator):
 
         return to_remove
 
+    @staticmethod
+    def _get_numeric_stats(X: DataFrame) -> DataFrame:
+        """Returns the sum, std, min and max of each column of `X`, computing the stats of sparse columns without converting them to dense."""
+        sparse_cols = [c for c, dtype in X.dtypes.items() if isinstance(dtype, pd.SparseDtype)]
+        X_dense = X.drop(columns=sparse_cols) if sparse_cols else X
+        stats = pd.DataFrame(
+            {
+                "sum": X_dense.sum(axis=0),
+                "std": X_dense.std(axis=0, ddof=0),
+                "min": X_dense.min(axis=0),
+                "max": X_dense.max(axis=0),
+            }
+        )
+        if sparse_cols:
+            X_sparse = X[sparse_cols].sparse.to_coo().tocsc().astype(np.float64)
+            col_sum = np.asarray(X_sparse.sum(axis=0)).ravel()
+            col_mean = col_sum / len(X)
+            col_var = np.asarray(X_sparse.multiply(X_sparse).sum(axis=0)).ravel() / len(X) - col_mean**2
+            stats_sparse = pd.DataFrame(
+                {
+                    "sum": col_sum,
+                    "std": np.sqrt(np.maximum(col_var, 0)),
+                    "min": X_sparse.min(axis=0).toarray().ravel(),
+                    "max": X_sparse.max(axis=0).toarray().ravel(),
+                },
+                index=sparse_cols,
+            )
+            stats = pd.concat([stats, stats_sparse]).loc[list(X.columns)]
+        return stats
+
     @classmethod
     def _drop_duplicate_features_categorical(cls, X: DataFrame, keep: Union[str, bool] = "first"):
         """
@@ -269,4 +557,4 @@ class DropDuplicatesFeatureGenerator(AbstractFeatureGenerator):
         return features_to_remove
 
     def _more_tags(self):
-        return {"feature_interactions": False}
+        return {"feature_interactions": False, "allow_chunked_fit": True}
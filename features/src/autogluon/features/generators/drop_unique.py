@@ -29,6 +29,12 @@ class DropUniqueFeatureGenerator(AbstractFeatureGenerator):
     def _transform(self, X: DataFrame) -> DataFrame:
         return X
 
+    def _transform_arrays(self, X: dict) -> dict:
+        return X
+
+    def _get_compiled_column_map(self) -> dict[str, str]:
+        return {feature: feature for feature in self.features_in}
+
     @staticmethod
     def get_default_infer_features_in_args() -> dict:
         return dict()
@@ -2,10 +2,12 @@ import logging
 import warnings
 
 import numpy as np
+import pandas as pd
 from pandas import DataFrame
 
 from autogluon.common.features.types import R_OBJECT
 
+from ..utils import series_to_array
 from .abstract import AbstractFeatureGenerator
 
 logger = logging.getLogger(__name__)
@@ -72,6 +74,22 @@ class FillNaFeatureGenerator(AbstractFeatureGenerator):
                     X = X.fillna(self._fillna_feature_map, inplace=False, downcast=False)
         return X
 
+    def _transform_arrays(self, X: dict) -> dict:
+        for feature, feature_fillna_val in self._fillna_feature_map.items():
+            values = X[feature]
+            is_null = pd.isnull(values)
+            if not is_null.any():
+                continue
+            if isinstance(values, np.ndarray) and values.dtype == object:
+                values = values.copy()
+                values[is_null] = feature_fillna_val
+            else:
+                with warnings.catch_warnings():
+                    warnings.simplefilter(action="ignore", category=FutureWarning)
+                    values = series_to_array(pd.Series(values).fillna(feature_fillna_val, downcast=False))
+            X[feature] = values
+        return X
+
     @staticmethod
     def get_default_infer_features_in_args() -> dict:
         return dict()
@@ -1,3 +1,7 @@
+from __future__ import annotations
+
+from collections import defaultdict
+
 import numpy as np
 import pandas as pd
 
@@ -52,6 +56,121 @@ AGGREGATION_REGISTRY = {
     "pct_rank": {"kind": "rowwise"},
 }
 
+# Quantile of each quantile aggregation, computed from the sorted values of each group by the "numpy" engine
+QUANTILE_AGGREGATIONS = {
+    "median": 0.5,
+    "q10": 0.10,
+    "q25": 0.25,
+    "q75": 0.75,
+    "q90": 0.90,
+}
+
+
+def groupby_aggregate(
+    codes: np.ndarray,
+    num_groups: int,
+    X_num: np.ndarray,
+    aggregations: list[str],
+    return_sorted: bool = False,
+) -> tuple[dict[str, np.ndarray], list[list[np.ndarray]] | None]:
+    """
+    Computes the group aggregations of all numeric columns of `X_num` at once, equivalent to
+    `X.groupby(cat, observed=True).agg(...)` with the aggregations of AGGREGATION_REGISTRY for each numeric column.
+
+    The rows are sorted by group once, so that each group is a contiguous segment. Sums, counts and squared deviations
+    of all columns are reduced per segment in a single vectorized pass. Order statistics (min, max, median, quantiles and nunique)
+    are read from the values sorted within each segment, which yields exact quantiles with the linear interpolation of pandas.
+
+    Parameters
+    ----------
+    codes : np.ndarray
+        The group code of each row in [0, num_groups), or -1 for rows without a group, such as from `pd.factorize`.
+        Every group must contain at least one row.
+    num_groups : int
+        The number of groups.
+    X_num : np.ndarray
+        Float array of shape (num_rows, num_columns). NaN values are ignored, as in pandas.
+    aggregations : list[str]
+        The group aggregations to compute. Must be keys of AGGREGATION_REGISTRY with kind "group".
+    return_sorted : bool, default False
+        If True, additionally returns the sorted non-NaN values of each group for each column, used for `pct_rank`.
+
+    Returns
+    -------
+    stats : dict[str, np.ndarray]
+        Dictionary of aggregation to an array of shape (num_groups, num_columns). Groups without non-NaN values are NaN, except for count and nunique.
+    sorted_values : list[list[np.ndarray]] or None
+        If `return_sorted`, for each column the list of sorted non-NaN values of each group.
+    """
+    if num_groups == 0:
+        stats = {agg: np.empty((0, X_num.shape[1])) for agg in aggregations}
+        return stats, [[] for _ in range(X_num.shape[1])] if return_sorted else None
+    has_group = codes != -1
+    if not has_group.all():
+        codes = codes[has_group]
+        X_num = X_num[has_group]
+    order = np.argsort(codes, kind="stable")
+    codes = codes[order]
+    X_num = X_num[order]
+    group_sizes = np.bincount(codes, minlength=num_groups)
+    starts = np.zeros(num_groups, dtype=np.int64)
+    np.cumsum(group_sizes[:-1], out=starts[1:])
+
+    valid = ~np.isnan(X_num)
+    counts = np.add.reduceat(valid, starts, axis=0).astype(np.int64)
+    has_values = counts > 0
+    stats = dict()
+    with np.errstate(invalid="ignore", divide="ignore"):
+        if "mean" in aggregations or "std" in aggregations:
+            sums = np.add.reduceat(np.where(valid, X_num, 0.0), starts, axis=0)
+            mean = sums / counts
+            if "mean" in aggregations:
+                stats["mean"] = mean
+            if "std" in aggregations:
+                # Two-pass variance for numerical stability, as in pandas
+                deviations = np.where(valid, X_num - np.repeat(mean, group_sizes, axis=0), 0.0)
+                var = np.add.reduceat(deviations * deviations, starts, axis=0) / (counts - 1)
+                var[counts <= 1] = np.nan
+                stats["std"] = np.sqrt(var)
+    if "count" in aggregations:
+        stats["count"] = counts.astype(float)
+
+    order_aggregations = [
+        agg for agg in aggregations if agg in ["min", "max", "nunique"] + list(QUANTILE_AGGREGATIONS)
+    ]
+    sorted_values = [] if return_sorted else None
+    if order_aggregations or return_sorted:
+        for agg in order_aggregations:
+            stats[agg] = np.full((num_groups, X_num.shape[1]), np.nan)
+        for j in range(X_num.shape[1]):
+            # NaN values are sorted to the end of each segment
+            values = X_num[np.lexsort((X_num[:, j], codes)), j]
+            counts_j = counts[:, j]
+            has_values_j = has_values[:, j]
+            for agg in order_aggregations:
+                if agg == "min":
+                    stats[agg][has_values_j, j] = values[starts[has_values_j]]
+                elif agg == "max":
+                    stats[agg][has_values_j, j] = values[(starts + counts_j - 1)[has_values_j]]
+                elif agg == "nunique":
+                    is_new = np.ones(len(values), dtype=bool)
+                    is_new[1:] = values[1:] != values[:-1]
+                    is_new[starts] = True
+                    is_new &= ~np.isnan(values)
+                    stats[agg][:, j] = np.add.reduceat(is_new, starts)
+                else:
+                    position = QUANTILE_AGGREGATIONS[agg] * (counts_j[has_values_j] - 1)
+                    lower = np.floor(position).astype(np.int64)
+                    upper = np.minimum(lower + 1, counts_j[has_values_j] - 1)
+                    starts_j = starts[has_values_j]
+                    values_lower = values[starts_j + lower]
+                    values_upper = values[starts_j + upper]
+                    stats[agg][has_values_j, j] = values_lower + (values_upper - values_lower) * (position - lower)
+            if return_sorted:
+                sorted_values.append([values[start : start + count] for start, count in zip(starts, counts_j)])
+    stats = {agg: stats[agg] for agg in aggregations}
+    return stats, sorted_values
+
 
 def rank_categoricals_by_small_counts(
     X: pd.DataFrame,
@@ -96,6 +215,12 @@ class GroupByFeatureGenerator(AbstractFeatureGenerator):
       - Keeps EXACT category-to-code mapping semantics (Index.get_indexer on raw arrays)
       - Keeps EXACT feature insertion order as the original dict-based transform
       - Keeps pct_rank semantics identical (pct_rank is output whenever requested, even if drop_basic=True)
+
+    Fit engines (`engine=`):
+      - "numpy" (default): factorizes each categorical once and computes the aggregations of all its numeric pairs
+        in a single segmented pass via `groupby_aggregate`, including exact quantiles from the sorted segments.
+      - "pandas": one pandas groupby per (categorical, numeric) pair. Slower, kept as the reference implementation.
+      Both engines produce the same group statistics up to floating point rounding.
     """
 
     def __init__(
@@ -114,6 +239,7 @@ class GroupByFeatureGenerator(AbstractFeatureGenerator):
         min_num_cardinality_thresh=10,
         max_features=500,
         random_state=42,
+        engine: str = "numpy",
         **kwargs,
     ):
         super().__init__(random_state=random_state, **kwargs)
@@ -134,6 +260,9 @@ class GroupByFeatureGenerator(AbstractFeatureGenerator):
         unknown = set(self.aggregations) - set(AGGREGATION_REGISTRY)
         if unknown:
             raise ValueError(f"Unknown aggregations: {unknown}")
+        if engine not in ["numpy", "pandas"]:
+            raise ValueError(f"engine must be one of {['numpy', 'pandas']}, but was: {engine}")
+        self.engine = engine
 
     def _to_dataframe(self, X):
         if isinstance(X, pd.DataFrame):
@@ -230,70 +359,101 @@ class GroupByFeatureGenerator(AbstractFeatureGenerator):
         self.pairs_ = []
         self.output_columns_ = []
 
+        pairs = self._select_pairs(ranked_cats=ranked_cats, ranked_nums=ranked_nums)
+        if self.engine == "numpy":
+            self._fit_group_stats_numpy(X, pairs=pairs, group_aggs=group_aggs, pct_rank="pct_rank" in rowwise_aggs)
+        else:
+            self._fit_group_stats_pandas(X, pairs=pairs, group_aggs=group_aggs, pct_rank="pct_rank" in rowwise_aggs)
+
+        for cat, num in pairs:
+            # record order (matches original dict insertion order)
+            self.pairs_.append((cat, num))
+
+            # EXACT output layout:
+            # - group aggs only when not drop_basic
+            if not drop_basic:
+                for agg in group_aggs:
+                    self.output_columns_.append(f"{num}__by__{cat}__{agg}")
+
+            # - pct_rank ALWAYS when requested (matches your original transform)
+            if "pct_rank" in rowwise_aggs:
+                self.output_columns_.append(f"{num}__by__{cat}__pct_rank")
+
+            # - relatives in the same nested loop order as original
+            if self._relative_enabled():
+                for agg in self.relative_to_aggs:
+                    if "diff" in self.relative_ops:
+                        self.output_columns_.append(f"{num}__minus__by__{cat}_{agg}")
+                    if "ratio" in self.relative_ops:
+                        self.output_columns_.append(f"{num}__ratio__by__{cat}_{agg}")
+
+        return self
+
+    def _select_pairs(self, ranked_cats: list, ranked_nums: list) -> list[tuple]:
+        """Returns the (categorical, numeric) pairs in order of preference, up to the `max_features` budget."""
         features_per_pair = self._features_per_pair()
         budget = self.max_features if self.max_features is not None else float("inf")
         used_features = 0
-
+        pairs = []
         for cat in ranked_cats:
             if cat not in self.categorical_features:
                 continue
-
             for num in ranked_nums:
                 if num not in self.numeric_features:
                     continue
-
                 if used_features + features_per_pair > budget:
-                    return self
-
-                # group-level stats
-                if group_aggs:
-                    named_aggs = {
-                        name: pd.NamedAgg(column=num, aggfunc=AGGREGATION_REGISTRY[name]["agg"]) for name in group_aggs
-                    }
-                    stats = X.groupby(cat, observed=True).agg(**named_aggs).astype(float)
-                else:
-                    stats = pd.DataFrame(index=X[cat].dropna().unique())
-
-                self.group_stats_[(cat, num)] = stats
-
-                idx = stats.index
-                self.group_index_[(cat, num)] = idx
-                self.group_values_[(cat, num)] = {
-                    agg: stats[agg].to_numpy(dtype=float, copy=False) for agg in stats.columns
-                }
-
-                if "pct_rank" in rowwise_aggs:
-                    g = X[[cat, num]].dropna()
-                    s = g.groupby(cat, observed=True)[num].apply(
-                        lambda t: np.sort(t.to_numpy(dtype=float, copy=False))
-                    )
-                    self.pct_rank_keys_[(cat, num)] = s.index.to_numpy()
-                    self.pct_rank_vals_[(cat, num)] = s.to_numpy()  # dtype=object
-
-                # record order (matches original dict insertion order)
-                self.pairs_.append((cat, num))
-
-                # EXACT output layout:
-                # - group aggs only when not drop_basic
-                if not drop_basic:
-                    for agg in group_aggs:
-                        self.output_columns_.append(f"{num}__by__{cat}__{agg}")
-
-                # - pct_rank ALWAYS when requested (matches your original transform)
-                if "pct_rank" in rowwise_aggs:
-                    self.output_columns_.append(f"{num}__by__{cat}__pct_rank")
-
-                # - relatives in the same nested loop order as original
-                if self._relative_enabled():
-                    for agg in self.relative_to_aggs:
-                        if "diff" in self.relative_ops:
-                            self.output_columns_.append(f"{num}__minus__by__{cat}_{agg}")
-                        if "ratio" in self.relative_ops:
-                            self.output_columns_.append(f"{num}__ratio__by__{cat}_{agg}")
-
+                    return pairs
+                pairs.append((cat, num))
                 used_features += features_per_pair
-
-        return self
+        return pairs
+
+    def _set_group_stats(self, cat, num, stats: pd.DataFrame):
+        self.group_stats_[(cat, num)] = stats
+        self.group_index_[(cat, num)] = stats.index
+        self.group_values_[(cat, num)] = {agg: stats[agg].to_numpy(dtype=float, copy=False) for agg in stats.columns}
+
+    def _fit_group_stats_pandas(self, X: pd.DataFrame, pairs: list[tuple], group_aggs: list[str], pct_rank: bool):
+        for cat, num in pairs:
+            # group-level stats
+            if group_aggs:
+                named_aggs = {
+                    name: pd.NamedAgg(column=num, aggfunc=AGGREGATION_REGISTRY[name]["agg"]) for name in group_aggs
+                }
+                stats = X.groupby(cat, observed=True).agg(**named_aggs).astype(float)
+            else:
+                stats = pd.DataFrame(index=X[cat].dropna().unique())
+            self._set_group_stats(cat, num, stats)
+
+            if pct_rank:
+                g = X[[cat, num]].dropna()
+                s = g.groupby(cat, observed=True)[num].apply(lambda t: np.sort(t.to_numpy(dtype=float, copy=False)))
+                self.pct_rank_keys_[(cat, num)] = s.index.to_numpy()
+                self.pct_rank_vals_[(cat, num)] = s.to_numpy()  # dtype=object
+
+    def _fit_group_stats_numpy(self, X: pd.DataFrame, pairs: list[tuple], group_aggs: list[str], pct_rank: bool):
+        nums_by_cat = defaultdict(list)
+        for cat, num in pairs:
+            nums_by_cat[cat].append(num)
+        for cat, nums in nums_by_cat.items():
+            # Sorted identically to the index of `X.groupby(cat, observed=True)`
+            codes, uniques = pd.factorize(X[cat], sort=True)
+            idx = pd.Index(uniques, name=cat)
+            X_num = X[nums].to_numpy(dtype=float, na_value=np.nan)
+            stats_all, sorted_values = groupby_aggregate(
+                codes=codes, num_groups=len(idx), X_num=X_num, aggregations=group_aggs, return_sorted=pct_rank
+            )
+            idx_values = idx.to_numpy()
+            for j, num in enumerate(nums):
+                stats = pd.DataFrame({agg: stats_all[agg][:, j] for agg in group_aggs}, index=idx)
+                self._set_group_stats(cat, num, stats)
+                if pct_rank:
+                    has_values = np.array([len(values) > 0 for values in sorted_values[j]], dtype=bool)
+                    # Assign element-wise, as numpy would otherwise create a 2D array from equal length values
+                    pct_rank_vals = np.empty(int(has_values.sum()), dtype=object)
+                    for i, values in enumerate(values for values in sorted_values[j] if len(values) > 0):
+                        pct_rank_vals[i] = values
+                    self.pct_rank_keys_[(cat, num)] = idx_values[has_values]
+                    self.pct_rank_vals_[(cat, num)] = pct_rank_vals
 
     # ----------------------------
     # TRANSFORM
@@ -311,7 +471,8 @@ class GroupByFeatureGenerator(AbstractFeatureGenerator):
 
         n = len(X)
         m = len(self.output_columns_)
-        out = np.empty((n, m), dtype=float)
+        # Fortran order, so that each output column is contiguous and written in place, and the DataFrame is built without a copy
+        out = np.empty((n, m), dtype=float, order="F")
         col_i = 0
 
         # cache numeric arrays once
@@ -322,6 +483,7 @@ class GroupByFeatureGenerator(AbstractFeatureGenerator):
         codes_cache = {}  # cat -> np.ndarray[int]
         missing_cache = {}  # cat -> np.ndarray[bool]
         safe_cache = {}  # cat -> np.ndarray[int] with -1 replaced by 0 for take()
+        order_cache = {}  # cat -> np.ndarray[int] of the rows sorted by code, for pct_rank
 
         for cat, num in self.pairs_:
             x = num_cache[num]
@@ -349,23 +511,26 @@ class GroupByFeatureGenerator(AbstractFeatureGenerator):
             codes = codes_cache[cat]
             missing = missing_cache[cat]
             safe_codes = safe_cache[cat]
+            has_missing = missing.any()
 
             # ---- group aggs mapping ----
             if idx is not None and vals_dict is not None and len(vals_dict) > 0:
                 for agg, vals in vals_dict.items():
-                    col = vals.take(safe_codes).astype(float, copy=False)
-                    if missing.any():
-                        col = col.copy()
+                    # write directly into the output column when it is part of the output
+                    col = out[:, col_i] if not drop_basic else np.empty(n, dtype=float)
+                    np.take(vals.astype(float, copy=False), safe_codes, out=col)
+                    if has_missing:
                         col[missing] = np.nan
 
-                    mapped[agg] = col
-
                     if not drop_basic:
                         if self.fill_value is np.nan:
-                            out[:, col_i] = col
+                            mapped[agg] = col
                         else:
-                            out[:, col_i] = np.where(np.isnan(col), self.fill_value, col)
+                            mapped[agg] = col.copy()
+                            col[np.isnan(col)] = self.fill_value
                         col_i += 1
+                    else:
+                        mapped[agg] = col
             else:
                 # fallback identical to your original
                 stats = self.group_stats_.get((cat, num), None)
@@ -401,11 +566,12 @@ class GroupByFeatureGenerator(AbstractFeatureGenerator):
                             dist_by_code[pos[ok]] = dists[ok]
                             self.pct_rank_by_code_[(cat, num)] = dist_by_code
 
-                        vidx = np.flatnonzero(valid)
+                        # rows sorted by code, identical to a stable sort of the valid rows by code
+                        if cat not in order_cache:
+                            order_cache[cat] = np.argsort(codes, kind="mergesort")
+                        vidx = order_cache[cat]
+                        vidx = vidx[valid[vidx]]
                         vcode = codes[vidx]
-                        order = np.argsort(vcode, kind="mergesort")
-                        vidx = vidx[order]
-                        vcode = vcode[order]
 
                         breaks = np.r_[0, 1 + np.flatnonzero(vcode[1:] != vcode[:-1]), vcode.size]
                         for b0, b1 in zip(breaks[:-1], breaks[1:]):
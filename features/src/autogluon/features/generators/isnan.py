@@ -55,6 +55,16 @@ class IsNanFeatureGenerator(AbstractFeatureGenerator):
                 is_nan_features["__nan__." + feature] = X[feature].isnull().astype(np.uint8)
         return pd.DataFrame(is_nan_features, index=X.index)
 
+    def _transform_arrays(self, X: dict) -> dict:
+        is_nan_features = dict()
+        for feature in self.features_in:
+            if feature in self._null_feature_map:
+                null_val = self._null_feature_map[feature]
+                is_nan_features["__nan__." + feature] = np.asarray(X[feature] == null_val).astype(np.uint8)
+            else:
+                is_nan_features["__nan__." + feature] = pd.isnull(X[feature]).astype(np.uint8)
+        return is_nan_features
+
     @staticmethod
     def get_default_infer_features_in_args() -> dict:
         return dict()
@@ -26,6 +26,14 @@ class CategoryMemoryMinimizeFeatureGenerator(AbstractFeatureGenerator):
     def _transform(self, X: DataFrame) -> DataFrame:
         return self._minimize_categorical_memory_usage(X)
 
+    def _transform_arrays(self, X: dict) -> dict:
+        if self._category_maps:
+            X = {
+                column: X[column].rename_categories(new_categories)
+                for column, new_categories in self._category_maps.items()
+            }
+        return X
+
     @staticmethod
     def get_default_infer_features_in_args() -> dict:
         return dict(valid_raw_types=[R_CATEGORY])
@@ -81,6 +89,12 @@ class NumericMemoryMinimizeFeatureGenerator(AbstractFeatureGenerator):
     def _transform(self, X):
         return self._minimize_numeric_memory_usage(X)
 
+    def _transform_arrays(self, X: dict) -> dict:
+        return {
+            column: np.clip(values, self._clip_min, self._clip_max).astype(self.dtype_out)
+            for column, values in X.items()
+        }
+
     @staticmethod
     def get_default_infer_features_in_args() -> dict:
         return dict(valid_raw_types=[R_INT])
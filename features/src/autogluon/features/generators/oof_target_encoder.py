@@ -148,42 +148,46 @@ class OOFTargetEncodingFeatureGenerator(AbstractFeatureGenerator):
 
         alpha = self.alpha
 
-        store = []
         self.encodings_ = {}
 
         # =====================================================
-        # Per-column encoding using factorize + np.bincount
+        # Factorize all columns once into a shared code space
         # =====================================================
-        for col in self.cols_:
-            col_values = X_cat[col]
-
+        # Column i owns the codes [cat_offsets[i], cat_offsets[i + 1]), so that the sums and counts of all columns
+        # are computed with a single np.bincount per target instead of one per column and target.
+        n_cols = len(self.cols_)
+        codes_all = np.empty((n_cols, n), dtype=np.int64)  # (n_cols, n), -1 for NaN / missing category
+        cat_offsets = np.zeros(n_cols + 1, dtype=np.int64)
+        uniques_all = []
+        for i, col in enumerate(self.cols_):
             # Factorize categories once; sorted to mimic groupby index order
-            codes, uniques = pd.factorize(col_values, sort=True)
-            # codes == -1 corresponds to NaN / missing category
-            mask_valid = codes >= 0
-            codes_valid = codes[mask_valid]
-            Y_valid = Y[mask_valid]
-            n_cat = len(uniques)
-
-            # ---------------------------------------
-            # Global (all-data) sums & counts
-            # ---------------------------------------
-            count_all = np.bincount(codes_valid, minlength=n_cat).astype(float)  # (n_cat,)
-
-            sum_all = np.vstack(
-                [np.bincount(codes_valid, weights=Y_valid[:, j], minlength=n_cat) for j in range(self.n_targets)]
-            ).T  # (n_cat, n_targets)
-
-            with np.errstate(invalid="ignore", divide="ignore"):
-                mean_all = sum_all / count_all[:, None]  # (n_cat, n_targets)
+            codes, uniques = pd.factorize(X_cat[col], sort=True)
+            codes_all[i] = np.where(codes >= 0, codes + cat_offsets[i], -1)
+            cat_offsets[i + 1] = cat_offsets[i] + len(uniques)
+            uniques_all.append(uniques)
+        n_cat_total = int(cat_offsets[-1])
+
+        # ---------------------------------------
+        # Global (all-data) sums & counts
+        # ---------------------------------------
+        count_all, sum_all = self._get_category_sums(codes_all, Y=Y, minlength=n_cat_total)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean_all = sum_all / count_all[:, None]  # (n_cat_total, n_targets)
+
+        global_mean_all = np.empty((n_cols, self.n_targets), dtype=float)
+        for i, col in enumerate(self.cols_):
+            cat_slice = slice(cat_offsets[i], cat_offsets[i + 1])
+            mean_col = mean_all[cat_slice]
+            count_col = count_all[cat_slice]
 
             # global_mean as in original _transform:
             # mean of per-category means
-            global_mean = np.nanmean(mean_all, axis=0)  # (n_targets,)
+            global_mean = np.nanmean(mean_col, axis=0)  # (n_targets,)
+            global_mean_all[i] = global_mean
 
             # Smoothed per-category encodings used at inference
-            denom_all = count_all[:, None] + alpha
-            num_all = mean_all * count_all[:, None] + alpha * global_mean[None, :]
+            denom_all = count_col[:, None] + alpha
+            num_all = mean_col * count_col[:, None] + alpha * global_mean[None, :]
 
             with np.errstate(divide="ignore", invalid="ignore"):
                 enc_all = num_all / denom_all  # (n_cat, n_targets)
@@ -194,86 +198,88 @@ class OOFTargetEncodingFeatureGenerator(AbstractFeatureGenerator):
             else:
                 names_out = [f"{col}__te_class{j}" for j in range(self.n_targets)]
 
-            # enc_df = pd.DataFrame(enc_all, index=uniques, columns=names_out)
-            # global_mean_series = pd.Series(global_mean, index=names_out)
-            #
-            # # Store lightweight stats for inference
-            # self.encodings_[col] = dict(
-            #     enc=enc_df,
-            #     global_mean=global_mean_series,
-            # )
-
             # Store lightweight, numeric-only info for fast transform
             self.encodings_[col] = dict(
-                categories=uniques.to_numpy(copy=False),  # np.array of categories, length n_cat
+                categories=uniques_all[i].to_numpy(copy=False),  # np.array of categories, length n_cat
                 enc_matrix=enc_all.astype(float, copy=False),  # shape (n_cat, n_targets)
                 global_mean=global_mean.astype(float, copy=False),  # shape (n_targets,)
                 names=names_out,  # list of output column names for this feature
             )
 
-            # ------------------------
-            # OOF encodings (fast)
-            # ------------------------
-            oof = np.zeros((n, self.n_targets), dtype=float)
-
-            for tr_idx, val_idx in kf_splits:
-                val_mask = np.zeros(n, dtype=bool)
-                val_mask[val_idx] = True
-                tr_mask_valid = mask_valid & ~val_mask
+        # ------------------------
+        # OOF encodings (fast)
+        # ------------------------
+        oof = np.empty((n, n_cols, self.n_targets), dtype=float)
 
-                codes_tr = codes[tr_mask_valid]
-                Y_tr = Y[tr_mask_valid]
+        for tr_idx, val_idx in kf_splits:
+            tr_mask = np.ones(n, dtype=bool)
+            tr_mask[val_idx] = False
 
-                if codes_tr.size == 0:
-                    # Degenerate case: no training rows for this fold
-                    oof[val_idx, :] = global_mean[None, :]
-                    continue
+            # Per-category sums & counts on the *training* portion, for all columns at once
+            count_tr, sum_tr = self._get_category_sums(codes_all[:, tr_mask], Y=Y[tr_mask], minlength=n_cat_total)
 
-                # Per-category sums & counts on the *training* portion
-                count_tr = np.bincount(codes_tr, minlength=n_cat).astype(float)  # (n_cat,)
-                sum_tr = np.vstack(
-                    [np.bincount(codes_tr, weights=Y_tr[:, j], minlength=n_cat) for j in range(self.n_targets)]
-                ).T  # (n_cat, n_targets)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                mean_tr = sum_tr / count_tr[:, None]  # (n_cat_total, n_targets)
 
-                with np.errstate(divide="ignore", invalid="ignore"):
-                    mean_tr = sum_tr / count_tr[:, None]  # (n_cat, n_targets)
+            valid_cats = count_tr > 0
 
-                valid_cats = count_tr > 0
+            # Encodings of each category in the shared code space, followed by the default of each column for NaN / unseen
+            enc_tr = np.empty((n_cat_total + n_cols, self.n_targets), dtype=float)
+            for i in range(n_cols):
+                cat_slice = slice(cat_offsets[i], cat_offsets[i + 1])
+                if not valid_cats[cat_slice].any():
+                    # Degenerate case: no training rows for this fold
+                    enc_tr[cat_slice] = global_mean_all[i]
+                    enc_tr[n_cat_total + i] = global_mean_all[i]
+                    continue
+                count_col = count_tr[cat_slice]
+                mean_col = mean_tr[cat_slice]
+                valid_cats_col = valid_cats[cat_slice]
 
                 # m_mean: mean of per-category means over categories that appear in training
-                m_mean = np.where(valid_cats[:, None], mean_tr, np.nan)
+                m_mean = np.where(valid_cats_col[:, None], mean_col, np.nan)
                 m_mean = np.nanmean(m_mean, axis=0)  # (n_targets,)
 
-                denom = count_tr[:, None] + alpha
-                num = mean_tr * count_tr[:, None] + alpha * m_mean[None, :]
+                denom = count_col[:, None] + alpha
+                num = mean_col * count_col[:, None] + alpha * m_mean[None, :]
 
                 with np.errstate(divide="ignore", invalid="ignore"):
-                    enc_tr = num / denom  # (n_cat, n_targets)
+                    enc_col = num / denom  # (n_cat, n_targets)
 
-                enc_tr[~valid_cats, :] = m_mean
+                enc_col[~valid_cats_col, :] = m_mean
+                enc_tr[cat_slice] = enc_col
+                enc_tr[n_cat_total + i] = m_mean
 
-                # Assign encodings to OOF for this fold
-                enc_val = np.zeros((len(val_idx), self.n_targets), dtype=float)
-                enc_val[:] = m_mean[None, :]
+            # Assign encodings to OOF for this fold
+            val_codes = codes_all[:, val_idx]  # (n_cols, n_val)
+            val_codes = np.where(val_codes >= 0, val_codes, n_cat_total + np.arange(n_cols)[:, None])
+            oof[val_idx] = enc_tr[val_codes.T]  # (n_val, n_cols, n_targets)
 
-                val_codes = codes[val_idx]
-                non_nan_mask = val_codes >= 0
-                if np.any(non_nan_mask):
-                    enc_val[non_nan_mask, :] = enc_tr[val_codes[non_nan_mask]]
-
-                oof[val_idx, :] = enc_val
-
-            # Build DataFrame for this column, aligned to original index
-            if self.n_targets == 1:
-                df_oof = pd.DataFrame(oof, columns=names_out, index=original_index)
-            else:
-                df_oof = pd.DataFrame(oof, columns=names_out, index=original_index)
-            store.append(df_oof)
-
-        self.train_encoded_ = pd.concat(store, axis=1)
+        names_out_all = [name for col in self.cols_ for name in self.encodings_[col]["names"]]
+        self.train_encoded_ = pd.DataFrame(
+            oof.reshape(n, n_cols * self.n_targets), columns=names_out_all, index=original_index
+        )
 
         return self
 
+    @staticmethod
+    def _get_category_sums(codes: np.ndarray, Y: np.ndarray, minlength: int) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the count and the per-target sum of Y of each category, given the codes of shape (n_cols, n_rows) in a shared code space.
+        Codes of -1 (NaN / missing category) are ignored.
+        """
+        n_cols = codes.shape[0]
+        codes_flat = codes.ravel()
+        mask_valid = codes_flat >= 0
+        codes_valid = codes_flat[mask_valid]
+        count = np.bincount(codes_valid, minlength=minlength).astype(float)  # (minlength,)
+        sums = np.empty((minlength, Y.shape[1]), dtype=float)
+        for j in range(Y.shape[1]):
+            # Each column sees the rows in the same order as a per-column np.bincount, giving identical sums
+            weights = np.tile(Y[:, j], n_cols)[mask_valid]
+            sums[:, j] = np.bincount(codes_valid, weights=weights, minlength=minlength)
+        return count, sums
+
     def _fit_transform(self, X: pd.DataFrame, y: pd.Series, **kwargs):
         self._fit(X, y)
 
@@ -304,32 +310,25 @@ class OOFTargetEncodingFeatureGenerator(AbstractFeatureGenerator):
         offset = 0
         for col in self.cols_:
             info = self.encodings_[col]
-            categories = info["categories"]  # np.array, shape (n_cat,)
-            enc_matrix = info["enc_matrix"]  # np.array, shape (n_cat, n_targets)
-            global_mean = info["global_mean"]  # np.array, shape (n_targets,)
+            category_index, enc_matrix_with_default = self._get_transform_lookup(info)
             names = info["names"]  # list[str], length n_targets
 
-            n_targets = enc_matrix.shape[1]
-
-            # Extract raw values once, no copy if possible
-            col_vals = X[col].to_numpy(dtype=object, copy=False)
-
-            # Use a Categorical with fixed categories from fit to get stable codes
-            cat = pd.Categorical(col_vals, categories=categories, ordered=False)
-            codes = cat.codes  # int array; -1 for NaN/unseen categories
-
-            # Prepare block for this column
-            block = np.empty((n_rows, n_targets), dtype=float)
-            # Start with global_mean everywhere (handles NaN/unseen)
-            block[:] = global_mean[None, :]
+            n_targets = len(names)
+            n_cat = len(category_index)
 
-            # For valid codes, index into enc_matrix
-            valid_mask = codes >= 0
-            if np.any(valid_mask):
-                block[valid_mask, :] = enc_matrix[codes[valid_mask]]
+            # codes: -1 for NaN/unseen categories, which index the last row of enc_matrix_with_default (global_mean)
+            col_vals = X[col]
+            if isinstance(col_vals.dtype, pd.CategoricalDtype):
+                # Only look up the (few) categories of the input instead of every row
+                col_codes = col_vals.cat.codes.to_numpy()
+                codes = category_index.get_indexer(col_vals.cat.categories)
+                codes = np.append(codes, -1)[col_codes]
+            else:
+                codes = category_index.get_indexer(col_vals.to_numpy(dtype=object, copy=False))
+            codes[codes == -1] = n_cat
 
-            # Place block into the big encoded_all array
-            encoded_all[:, offset : offset + n_targets] = block
+            # Write the encodings straight into the big encoded_all array
+            np.take(enc_matrix_with_default, codes, axis=0, out=encoded_all[:, offset : offset + n_targets])
             encoded_colnames.extend(names)
             offset += n_targets
 
@@ -343,6 +342,17 @@ class OOFTargetEncodingFeatureGenerator(AbstractFeatureGenerator):
             # Only passthrough + new encodings
             return pd.concat([X[self.passthrough_cols_], encoded_df], axis=1)
 
+    @staticmethod
+    def _get_transform_lookup(info: dict) -> tuple[pd.Index, np.ndarray]:
+        """
+        Returns the category index of a column, whose hash table is built once on first use and reused by every transform call,
+        and its encodings with global_mean appended as the last row for NaN/unseen categories.
+        """
+        if "category_index" not in info:
+            info["category_index"] = pd.Index(info["categories"], dtype=object)
+            info["enc_matrix_with_default"] = np.vstack([info["enc_matrix"], info["global_mean"][None, :]])
+        return info["category_index"], info["enc_matrix_with_default"]
+
     @staticmethod
     def get_default_infer_features_in_args() -> dict:
         return dict(
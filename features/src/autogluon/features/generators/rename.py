@@ -50,6 +50,16 @@ class RenameFeatureGenerator(AbstractFeatureGenerator):
             X.columns = self.features_out
         return X
 
+    def _transform_arrays(self, X: dict) -> dict:
+        if self._is_updated_name:
+            X = dict(zip(self.features_out, X.values()))
+        return X
+
+    def _get_compiled_column_map(self) -> dict[str, str]:
+        if self._is_updated_name:
+            return dict(zip(self.features_out, self.features_in))
+        return {feature: feature for feature in self.features_in}
+
     def _get_renamed_features(self, X: DataFrame) -> (DataFrame, dict):
         X_columns_orig = list(X.columns)
         X_columns_new = list(X.columns)
@@ -1,10 +1,14 @@
 import copy
 import logging
+import numbers
 import traceback
+from functools import partial
 
 import numpy as np
 import pandas as pd
 from pandas import DataFrame, Series
+from scipy.sparse import csr_matrix, hstack
+from sklearn.feature_extraction.text import CountVectorizer, TfidfVectorizer
 from sklearn.feature_selection import SelectKBest, f_classif, f_regression
 
 from autogluon.common.features.types import S_IMAGE_BYTEARRAY, S_IMAGE_PATH, S_TEXT, S_TEXT_NGRAM
@@ -12,13 +16,15 @@ from autogluon.common.utils.lite import disable_if_lite_mode
 from autogluon.common.utils.resource_utils import ResourceManager
 
 from ..vectorizers import downscale_vectorizer, get_ngram_freq, vectorizer_auto_ml_default
-from .abstract import AbstractFeatureGenerator
+from .abstract import AbstractFeatureGenerator, _map_chunks
 
 logger = logging.getLogger(__name__)
 
+# During chunked fit, at most this many times `max_features` candidate ngrams are taken from the sample
+CHUNKED_FIT_CANDIDATE_RATIO = 10
+
 
 # TODO: Add argument to define the text preprocessing logic
-# TODO: Add argument to output ngrams as a sparse matrix
 # TODO: Add HashingVectorizer support
 # TODO: Documentation
 class TextNgramFeatureGenerator(AbstractFeatureGenerator):
@@ -46,6 +52,12 @@ class TextNgramFeatureGenerator(AbstractFeatureGenerator):
         ngram features will be removed in least frequent to most frequent order.
         Note: For vectorizer_strategy values other than 'combined', the resulting ngrams may use more than this value.
         It is recommended to only increase this value above 0.15 if confident that higher values will not result in out-of-memory errors.
+    sparse : bool, default False
+        If True, the ngram features are output as pandas sparse columns (:class:`pd.SparseDtype` with a fill value of 0) instead of dense columns.
+        As most ngrams are absent from most rows, this reduces the memory usage of the ngram features by orders of magnitude,
+        allowing for much larger vocabularies under the same `max_memory_ratio`, which is then computed from the sparse size of the ngrams.
+        LightGBM, XGBoost, CatBoost and linear models consume sparse features without converting them to dense.
+        Other models convert the features to dense during preprocessing.
     **kwargs :
         Refer to :class:`AbstractFeatureGenerator` documentation for details on valid key word arguments.
     """
@@ -57,6 +69,7 @@ class TextNgramFeatureGenerator(AbstractFeatureGenerator):
         max_memory_ratio=0.15,
         prefilter_tokens=False,
         prefilter_token_count=100,
+        sparse=False,
         **kwargs,
     ):
         super().__init__(**kwargs)
@@ -80,10 +93,13 @@ class TextNgramFeatureGenerator(AbstractFeatureGenerator):
         self.prefilter_tokens = prefilter_tokens
         self.prefilter_token_count = prefilter_token_count
         self.token_mask = None
+        self.sparse = sparse
         self._feature_names_dict = dict()
 
-    def _fit_transform(self, X: DataFrame, y: Series = None, problem_type: str = None, **kwargs) -> (DataFrame, dict):
-        X_out = self._fit_transform_ngrams(X)
+    def _fit_transform(
+        self, X: DataFrame, y: Series = None, problem_type: str = None, X_chunks=None, **kwargs
+    ) -> (DataFrame, dict):
+        X_out = self._fit_transform_ngrams(X, X_chunks=X_chunks)
 
         if self.prefilter_tokens and self.prefilter_token_count >= X_out.shape[1]:
             logger.warning(
@@ -104,7 +120,7 @@ class TextNgramFeatureGenerator(AbstractFeatureGenerator):
         if self.prefilter_tokens:
             scoring_function = f_classif if problem_type == "binary" else f_regression
             selector = SelectKBest(scoring_function, k=self.prefilter_token_count)
-            selector.fit(X_out, y)
+            selector.fit(X_out.sparse.to_coo().tocsr() if self.sparse else X_out, y)
             self.token_mask = selector.get_support()
             X_out = X_out[X_out.columns[self.token_mask]]  # select the columns that are most correlated with y
 
@@ -131,7 +147,7 @@ class TextNgramFeatureGenerator(AbstractFeatureGenerator):
     def get_default_infer_features_in_args() -> dict:
         return dict(required_special_types=[S_TEXT], invalid_special_types=[S_IMAGE_PATH, S_IMAGE_BYTEARRAY])
 
-    def _fit_transform_ngrams(self, X):
+    def _fit_transform_ngrams(self, X, X_chunks=None):
         if not self.features_in:
             return DataFrame(index=X.index)
         features_nlp_to_remove = []
@@ -153,15 +169,18 @@ class TextNgramFeatureGenerator(AbstractFeatureGenerator):
         self._log(15, f"{self.vectorizer_default_raw}", self.log_prefix + "\t\t")
         for nlp_feature in self.vectorizer_features:
             # TODO: Preprocess text?
-            if nlp_feature == "__nlp__":  # Combine Text Fields
-                features_in_str = X[self.features_in].astype(str)
-                text_list = list(set([". ".join(row) for row in features_in_str.values]))
-            else:
-                text_list = list(X[nlp_feature].astype(str).drop_duplicates().values)
+            text_list = self._get_text_list(X, nlp_feature=nlp_feature)
             vectorizer_raw = copy.deepcopy(self.vectorizer_default_raw)
             try:
-                # Don't use transform_matrix output because it may contain fewer rows due to drop_duplicates call.
-                vectorizer_fit, _ = self._train_vectorizer(text_list, vectorizer_raw)
+                if X_chunks is not None and self._can_train_vectorizer_chunked(vectorizer_raw):
+                    vectorizer_fit = self._train_vectorizer_chunked(
+                        text_list,
+                        text_chunks=_map_chunks(X_chunks, partial(self._get_text_list, nlp_feature=nlp_feature)),
+                        vectorizer=vectorizer_raw,
+                    )
+                else:
+                    # Don't use transform_matrix output because it may contain fewer rows due to drop_duplicates call.
+                    vectorizer_fit, _ = self._train_vectorizer(text_list, vectorizer_raw)
                 self._log(
                     20,
                     f"{vectorizer_fit.__class__.__name__} fit with vocabulary size = {len(vectorizer_fit.vocabulary_)}",
@@ -226,6 +245,14 @@ class TextNgramFeatureGenerator(AbstractFeatureGenerator):
             X_text_ngram = DataFrame(index=X.index)
         return X_text_ngram
 
+    def _get_text_list(self, X: DataFrame, nlp_feature: str) -> list:
+        """Returns the unique texts of `nlp_feature` in X to fit the vectorizer on."""
+        if nlp_feature == "__nlp__":  # Combine Text Fields
+            features_in_str = X[self.features_in].astype(str)
+            return list(set([". ".join(row) for row in features_in_str.values]))
+        else:
+            return list(X[nlp_feature].astype(str).drop_duplicates().values)
+
     def _generate_ngrams(self, X, downsample_ratio: int = None):
         X_nlp_features_combined = []
         for nlp_feature, vectorizer_fit in zip(self.vectorizer_features, self.vectorizers):
@@ -250,13 +277,23 @@ class TextNgramFeatureGenerator(AbstractFeatureGenerator):
                 )
                 self._feature_names_dict[nlp_feature] = nlp_features_names_final
 
-            transform_array = transform_matrix.toarray()
-            # This count could technically overflow in absurd situations. Consider making dtype a variable that is computed.
-            nonzero_count = np.count_nonzero(transform_array, axis=1).astype(np.uint16)
-            transform_array = np.append(transform_array, np.expand_dims(nonzero_count, axis=1), axis=1)
-            X_nlp_features = pd.DataFrame(
-                transform_array, columns=self._feature_names_dict[nlp_feature], index=X.index
-            )  # TODO: Consider keeping sparse
+            if self.sparse:
+                transform_matrix = csr_matrix(transform_matrix)
+                transform_matrix.eliminate_zeros()
+                nonzero_count = transform_matrix.getnnz(axis=1).astype(np.uint16)
+                # Appending the uint16 count upcasts the ngram counts to uint16, identical to the dense output
+                transform_matrix = hstack([transform_matrix, csr_matrix(nonzero_count[:, np.newaxis])], format="csc")
+                X_nlp_features = pd.DataFrame.sparse.from_spmatrix(
+                    transform_matrix, columns=self._feature_names_dict[nlp_feature], index=X.index
+                )
+            else:
+                transform_array = transform_matrix.toarray()
+                # This count could technically overflow in absurd situations. Consider making dtype a variable that is computed.
+                nonzero_count = np.count_nonzero(transform_array, axis=1).astype(np.uint16)
+                transform_array = np.append(transform_array, np.expand_dims(nonzero_count, axis=1), axis=1)
+                X_nlp_features = pd.DataFrame(
+                    transform_array, columns=self._feature_names_dict[nlp_feature], index=X.index
+                )
             X_nlp_features_combined.append(X_nlp_features)
 
         if X_nlp_features_combined:
@@ -275,8 +312,13 @@ class TextNgramFeatureGenerator(AbstractFeatureGenerator):
     ):
         @disable_if_lite_mode(ret=downsample_ratio)
         def _adjust_per_memory_constraints(downsample_ratio: int):
-            # This assumes that the ngrams eventually turn into int32/float32 downstream
-            predicted_ngrams_memory_usage_bytes = len(text_data) * 4 * (transform_matrix.shape[1] + 1) + 80
+            if self.sparse:
+                # This assumes that the ngrams eventually turn into a float32 CSR matrix downstream (4 byte value + 4 byte index),
+                # with the `_total_` feature being non-zero for every row.
+                predicted_ngrams_memory_usage_bytes = (transform_matrix.nnz + len(text_data)) * 8 + 80
+            else:
+                # This assumes that the ngrams eventually turn into int32/float32 downstream
+                predicted_ngrams_memory_usage_bytes = len(text_data) * 4 * (transform_matrix.shape[1] + 1) + 80
             mem_avail = ResourceManager.get_available_virtual_mem()
             mem_rss = ResourceManager.get_memory_rss()
             predicted_rss = mem_rss + predicted_ngrams_memory_usage_bytes
@@ -315,7 +357,61 @@ class TextNgramFeatureGenerator(AbstractFeatureGenerator):
         vectorizer.stop_words_ = None  # Reduces object size by 100x+ on large datasets, no effect on usability
         return vectorizer, transform_matrix
 
+    @staticmethod
+    def _can_train_vectorizer_chunked(vectorizer) -> bool:
+        # TfidfVectorizer's idf weights and a fixed vocabulary are fit on the sample instead
+        return (
+            isinstance(vectorizer, CountVectorizer)
+            and not isinstance(vectorizer, TfidfVectorizer)
+            and vectorizer.vocabulary is None
+        )
+
+    @staticmethod
+    def _train_vectorizer_chunked(text_data: list, text_chunks, vectorizer):
+        """
+        Fits a CountVectorizer with the document frequencies and term counts of the full data,
+        where `text_data` is the text of a sample of the full data and `text_chunks` returns an iterator over the text of the full data in chunks.
+
+        The candidate ngrams are the ngrams of the sample, as collecting all ngrams of the full data would require unbounded memory.
+        If `max_features` is set, only the CHUNKED_FIT_CANDIDATE_RATIO * max_features most frequent ngrams of the sample are kept as candidates,
+        which bounds the size of the candidate vocabulary that is transformed for each chunk.
+        The counts of the candidates are then accumulated over all chunks, and `min_df`, `max_df` and `max_features` are applied
+        identically to `CountVectorizer.fit`. Texts are deduplicated within each chunk rather than across chunks.
+        """
+        min_df, max_df, max_features = vectorizer.min_df, vectorizer.max_df, vectorizer.max_features
+        max_candidates = None if max_features is None else CHUNKED_FIT_CANDIDATE_RATIO * max_features
+        vectorizer.set_params(min_df=1, max_df=1.0, max_features=max_candidates)
+        vectorizer.fit(text_data)
+        vectorizer.set_params(min_df=min_df, max_df=max_df, max_features=max_features)
+        candidates = vectorizer.get_feature_names_out()
+
+        term_counts = np.zeros(len(candidates), dtype=np.int64)
+        doc_counts = np.zeros(len(candidates), dtype=np.int64)
+        num_docs = 0
+        for text_chunk in text_chunks():
+            transform_matrix = vectorizer.transform(text_chunk)
+            term_counts += np.asarray(transform_matrix.sum(axis=0, dtype=np.int64)).ravel()
+            doc_counts += transform_matrix.getnnz(axis=0)
+            num_docs += transform_matrix.shape[0]
+
+        max_doc_count = max_df if isinstance(max_df, numbers.Integral) else max_df * num_docs
+        min_doc_count = min_df if isinstance(min_df, numbers.Integral) else min_df * num_docs
+        mask = (doc_counts >= min_doc_count) & (doc_counts <= max_doc_count)
+        if max_features is not None and mask.sum() > max_features:
+            candidates_idx = np.flatnonzero(mask)
+            top_idx = candidates_idx[np.argsort(-term_counts[candidates_idx], kind="stable")[:max_features]]
+            mask = np.zeros(len(candidates), dtype=bool)
+            mask[top_idx] = True
+        if not mask.any():
+            raise ValueError("After pruning, no terms remain. Try a lower min_df or a higher max_df.")
+        vectorizer.vocabulary_ = {term: i for i, term in enumerate(candidates[mask])}
+        vectorizer.stop_words_ = None  # Reduces object size by 100x+ on large datasets, no effect on usability
+        return vectorizer
+
     def _remove_features_in(self, features):
         super()._remove_features_in(features)
         if features:
             self.vectorizer_features = [feature for feature in self.vectorizer_features if feature not in features]
+
+    def _more_tags(self):
+        return {"allow_chunked_fit": True, "allow_row_chunking": True}
@@ -165,3 +165,6 @@ class TextSpecialFeatureGenerator(AbstractFeatureGenerator):
             for feature in features:
                 if feature in self._symbols_per_feature:
                     self._symbols_per_feature.pop(feature)
+
+    def _more_tags(self):
+        return {"allow_row_chunking": True}
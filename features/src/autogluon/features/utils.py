@@ -1,7 +1,10 @@
 import logging
 
 import numpy as np
+import pandas as pd
+from numpy.typing import ArrayLike
 from pandas import DataFrame, Series
+from pandas.api.extensions import ExtensionDtype
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +38,21 @@ def clip_and_astype(df: DataFrame, columns: list = None, clip_min=0, clip_max=25
     return df
 
 
+def series_to_array(X: Series) -> ArrayLike:
+    """
+    Returns the values of a Series as an array without copying.
+    Extension dtypes such as category are returned as their pandas array (e.g. `pd.Categorical`), other dtypes as a NumPy array.
+    """
+    if isinstance(X.dtype, ExtensionDtype):
+        return X.array
+    return X.to_numpy()
+
+
+def astype_array(values: ArrayLike, dtype) -> ArrayLike:
+    """Converts the dtype of a 1-dimensional array with identical semantics to `Series.astype`."""
+    return series_to_array(pd.Series(values, copy=False).astype(dtype))
+
+
 # TODO: Consider NaN values as a separate value?
 def is_useless_feature(X: Series) -> bool:
     """If a feature has the same value for every row, it carries no useful information"""
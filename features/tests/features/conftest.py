@@ -102,6 +102,11 @@ class GeneratorHelper:
         # Ensure input_data is not altered inplace by transform when extra columns are present
         assert input_data_with_extra.equals(original_input_data_with_extra)
 
+        # Ensure the compiled transform plan output is the same as transform
+        output_data_compiled = generator.compile().transform(input_data_with_extra)
+        assert output_data.equals(output_data_compiled)
+        assert input_data_with_extra.equals(original_input_data_with_extra)
+
         # Ensure feature_metadata_in is as expected
         if expected_feature_metadata_in_full is not None:
             assert expected_feature_metadata_in_full == generator.feature_metadata_in.to_dict(inverse=True)
@@ -0,0 +1,75 @@
+import numpy as np
+import pandas as pd
+
+from autogluon.features.generators import ArithmeticFeatureGenerator
+from autogluon.features.generators.arithmetic.dag import ArithmeticDAG
+from autogluon.features.generators.arithmetic.operation import Operation
+
+
+def _evaluate_naive(expr, X: pd.DataFrame) -> np.ndarray:
+    if not isinstance(expr, Operation):
+        return X[expr].to_numpy(dtype=np.float64)
+    left = _evaluate_naive(expr.left, X)
+    right = _evaluate_naive(expr.right, X)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        return {"+": np.add, "-": np.subtract, "*": np.multiply, "/": np.divide}[expr.op](left, right)
+
+
+def test_dag_shares_common_subexpressions():
+    ab = Operation("A", "B", "*")
+    expressions = [
+        Operation(ab, "C", "+"),
+        Operation(Operation("B", "A", "*"), "C", "-"),
+        Operation("A", "B", "*"),
+        Operation(Operation(ab, "C", "/"), "B", "-"),
+        Operation("B", Operation("A", "C", "+"), "-"),
+    ]
+    dag = ArithmeticDAG(expressions, base_features=["A", "B", "C"])
+
+    assert dag.names == ["(A*B)+C", "(B*A)-C", "A*B", "((A*B)/C)-B", "B-(A+C)"]
+    assert dag.num_operations == 10
+    # A*B is computed once and read from the output column of the expression "A*B"
+    assert dag.num_nodes == 7
+    assert dag.num_scratch == 1
+
+
+def test_dag_block_evaluation_matches_naive_evaluation():
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(rng.normal(size=(1000, 4)).round(1), columns=["A", "B", "C", "D"])
+    X.loc[::5, "B"] = 0
+    X.loc[::7, "C"] = np.nan
+    ab = Operation("A", "B", "/")
+    expressions = [
+        ab,
+        Operation(ab, "C", "*"),
+        Operation(Operation(ab, "C", "*"), "D", "-"),
+        Operation(Operation("C", "D", "+"), Operation("A", "B", "-"), "/"),
+        Operation(Operation("A", "B", "*"), "B", "/"),
+        Operation("D", "C", "-"),
+        # algebraically equal to A, but must not share a node with each other since they differ in rounding and NaN
+        Operation(Operation("A", "B", "+"), "B", "-"),
+        Operation(Operation("A", "B", "-"), "B", "+"),
+    ]
+    X_out = ArithmeticDAG(expressions, base_features=list(X.columns), dtype=np.float64, block_size=64).transform(X)
+
+    assert list(X_out.columns) == [expr.name() for expr in expressions]
+    assert X_out.index.equals(X.index)
+    for expr in expressions:
+        expected = _evaluate_naive(expr, X)
+        expected[np.isinf(expected)] = np.nan
+        np.testing.assert_array_equal(X_out[expr.name()].to_numpy(), expected)
+    assert not np.isinf(X_out.to_numpy()).any()
+
+
+def test_arithmetic_spearman_selection_transform():
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(rng.normal(size=(500, 5)).round(2), columns=[f"c{i}" for i in range(5)])
+    y = pd.Series(rng.normal(size=500))
+    generator = ArithmeticFeatureGenerator(selection_method="spearman", max_new_feats=20, random_state=0)
+
+    X_out = generator.fit_transform(X, y)
+
+    assert X_out.shape == (500, 20)
+    assert all(isinstance(expr, Operation) for expr in generator.new_feats)
+    assert list(X_out.columns) == [expr.name() for expr in generator.new_feats]
+    pd.testing.assert_frame_equal(generator.transform(X), X_out)
@@ -1,13 +1,16 @@
 import numpy as np
+import pandas as pd
 import pytest
 from packaging.version import Version
 from sklearn.feature_extraction.text import CountVectorizer
 
 from autogluon.features.generators import (
     AutoMLPipelineFeatureGenerator,
+    DropDuplicatesFeatureGenerator,
     IdentityFeatureGenerator,
     TextNgramFeatureGenerator,
 )
+from autogluon.features.utils import series_to_array
 
 
 def test_auto_ml_pipeline_feature_generator(generator_helper, data_helper):
@@ -525,3 +528,123 @@ def test_add_custom_feature_generators():
     fg_main_stage = fg.generators[2]
     assert fg_main_stage[-2] == gen_1
     assert fg_main_stage[-1] == gen_2
+
+
+def test_auto_ml_pipeline_feature_generator_transform_arrays(data_helper):
+    # Given
+    input_data = data_helper.generate_multi_feature_full().drop(columns=["text"])
+    generator = AutoMLPipelineFeatureGenerator(enable_text_ngram_features=False, enable_text_special_features=False)
+    generator.fit(input_data)
+    input_data_test = input_data.copy()
+    input_data_test.loc[0, "obj"] = "unseen"
+    input_data_test.loc[1, "int_bool"] = None
+
+    # When
+    assert generator.can_transform_arrays()
+    expected_output_data = generator.transform(input_data_test)
+    output_data = generator.transform_arrays({col: series_to_array(input_data_test[col]) for col in input_data_test})
+    output_data_row = generator.transform_arrays(
+        {col: series_to_array(input_data_test[col].iloc[[2]]) for col in input_data_test}
+    )
+
+    # Then
+    pd.testing.assert_frame_equal(pd.DataFrame(output_data, index=input_data_test.index), expected_output_data)
+    pd.testing.assert_frame_equal(
+        pd.DataFrame(output_data_row),
+        generator.transform(input_data_test.iloc[[2]]).reset_index(drop=True),
+    )
+
+
+def test_auto_ml_pipeline_feature_generator_with_text_ngram_cannot_transform_arrays(data_helper):
+    input_data = data_helper.generate_multi_feature_full()
+    generator = AutoMLPipelineFeatureGenerator(
+        vectorizer=CountVectorizer(min_df=2, ngram_range=(1, 3), dtype=np.uint8)
+    )
+    assert not generator.can_transform_arrays()
+    generator.fit(input_data)
+    assert not generator.can_transform_arrays()
+
+
+def test_auto_ml_pipeline_feature_generator_compile(data_helper):
+    # Given
+    input_data = data_helper.generate_multi_feature_full()
+    generator = AutoMLPipelineFeatureGenerator(
+        vectorizer=CountVectorizer(min_df=2, ngram_range=(1, 3), dtype=np.uint8)
+    )
+    generator.fit(input_data)
+    input_data_test = input_data.copy()
+    input_data_test.index = input_data_test.index + 100
+    input_data_test.loc[100, "obj"] = "unseen"
+    input_data_test.loc[101, "int_bool"] = None
+
+    # When
+    plan = generator.compile()
+    expected_output_data = generator.transform(input_data_test)
+    output_data = plan.transform(input_data_test)
+    output_data_row = plan.transform(input_data_test.iloc[[2]])
+    output_data_numpy = plan.transform_to_numpy(input_data_test, dtype=np.float64)
+
+    # Then
+    assert plan.features_in == generator.features_in
+    assert plan.features_out == generator.features_out
+    step_generators = [step.generator.__class__ for step in plan.steps]
+    assert DropDuplicatesFeatureGenerator not in step_generators
+    assert IdentityFeatureGenerator not in step_generators
+    assert [step.uses_dataframe for step in plan.steps if step.generator.__class__ is TextNgramFeatureGenerator] == [
+        True
+    ]
+    pd.testing.assert_frame_equal(output_data, expected_output_data)
+    pd.testing.assert_frame_equal(output_data_row, generator.transform(input_data_test.iloc[[2]]))
+    expected_output_data_numpy = np.stack(
+        [
+            expected_output_data[col].cat.codes.replace(-1, np.nan)
+            if isinstance(expected_output_data[col].dtype, pd.CategoricalDtype)
+            else expected_output_data[col]
+            for col in expected_output_data
+        ],
+        axis=1,
+    ).astype(np.float64)
+    np.testing.assert_array_equal(output_data_numpy, expected_output_data_numpy)
+    out = np.empty_like(output_data_numpy)
+    assert plan.transform_to_numpy(input_data_test, out=out) is out
+
+
+def test_auto_ml_pipeline_feature_generator_fit_chunked(tmp_path):
+    # Given
+    rng = np.random.RandomState(0)
+    num_rows = 2000
+    input_data = pd.DataFrame(
+        {
+            "int": rng.randint(0, 10, num_rows),
+            "float": rng.randn(num_rows),
+            "obj": rng.choice([f"c{i}" for i in range(50)], num_rows),
+            "datetime": pd.to_datetime(rng.randint(1e9, 1.6e9, num_rows), unit="s"),
+        }
+    )
+    input_data["float_near_dup"] = input_data["float"]
+    input_data.loc[num_rows - 1, "float_near_dup"] = 0.5
+    input_data["label"] = rng.randint(0, 2, num_rows)
+    path_data = str(tmp_path / "train.parquet")
+    path_output = str(tmp_path / "output" / "train_transformed.parquet")
+    input_data.to_parquet(path_data, index=False, row_group_size=300)
+
+    generator_full = AutoMLPipelineFeatureGenerator()
+    generator_chunked = AutoMLPipelineFeatureGenerator()
+
+    # When
+    expected_output_data = generator_full.fit_transform(input_data.drop(columns=["label"]))
+    generator_chunked.fit_chunked(path_data, label="label", sample_size=500, chunk_size=300)
+    output = generator_chunked.transform_chunked(path_data, output_path=path_output, keep_columns=["label"])
+    output_data = pd.read_parquet(output)
+
+    # Then
+    assert output == path_output
+    assert generator_chunked.features_in == generator_full.features_in
+    assert generator_chunked.features_out == generator_full.features_out
+    assert list(output_data.columns) == ["label"] + generator_full.features_out
+    assert np.array_equal(output_data["label"].to_numpy(), input_data["label"].to_numpy())
+    # Parquet only restores the category dtype of string categories
+    output_data = output_data.drop(columns=["label"]).astype(expected_output_data.dtypes.to_dict())
+    pd.testing.assert_frame_equal(output_data, expected_output_data)
+    with pytest.raises(TypeError):
+        generator_chunked.fit_chunked(iter([input_data]))
@@ -1,4 +1,6 @@
 import numpy as np
+import pandas as pd
+import pytest
 from packaging.version import Version
 from sklearn.feature_extraction.text import CountVectorizer
 
@@ -13,6 +15,7 @@ from autogluon.features.generators import (
     IdentityFeatureGenerator,
     TextNgramFeatureGenerator,
     TextSpecialFeatureGenerator,
+    bulk,
 )
 
 
@@ -208,3 +211,55 @@ def test_bulk_feature_generator_no_dummy(generator_helper, data_helper):
 
     assert generator.transform(input_data_transform).shape == (9, 0)
     assert generator.transform(input_data_transform.head(5)).shape == (5, 0)
+
+
+@pytest.mark.parametrize("parallel_backend", ["threading", "loky"])
+def test_bulk_feature_generator_parallel(data_helper, monkeypatch, parallel_backend):
+    # Given
+    input_data = data_helper.generate_multi_feature_full()
+    # Ensure row chunking is used during transform despite the small data
+    monkeypatch.setattr(bulk, "ROW_CHUNK_MIN_SIZE", 3)
+
+    def get_generator(**kwargs):
+        text_ngram_feature_generator = TextNgramFeatureGenerator(
+            vectorizer=CountVectorizer(min_df=2, ngram_range=(1, 3), max_features=1000, dtype=np.uint8)
+        )
+        text_ngram_feature_generator.max_memory_ratio = None
+        return BulkFeatureGenerator(
+            generators=[
+                [AsTypeFeatureGenerator(convert_bool_method="v2")],
+                [FillNaFeatureGenerator()],
+                [
+                    IdentityFeatureGenerator(infer_features_in_args=dict(valid_raw_types=[R_INT, R_FLOAT])),
+                    CategoryFeatureGenerator(),
+                    DatetimeFeatureGenerator(),
+                    TextSpecialFeatureGenerator(),
+                    text_ngram_feature_generator,
+                ],
+                [DropUniqueFeatureGenerator()],
+            ],
+            reset_index=True,
+            **kwargs,
+        )
+
+    generator_serial = get_generator()
+    generator_parallel = get_generator(num_cpus=3, parallel_backend=parallel_backend)
+
+    # When
+    expected_output_data = generator_serial.fit_transform(input_data)
+    output_data = generator_parallel.fit_transform(input_data)
+
+    # Then
+    pd.testing.assert_frame_equal(output_data, expected_output_data)
+    assert generator_parallel.features_out == generator_serial.features_out
+    assert all(
+        generator.is_fit() for generator_group in generator_parallel.generators for generator in generator_group
+    )
+    pd.testing.assert_frame_equal(generator_parallel.transform(input_data), generator_serial.transform(input_data))
+
+
+def test_bulk_feature_generator_invalid_num_cpus():
+    with pytest.raises(ValueError):
+        BulkFeatureGenerator(generators=[[IdentityFeatureGenerator()]], num_cpus=0)
+    with pytest.raises(ValueError):
+        BulkFeatureGenerator(generators=[[IdentityFeatureGenerator()]], parallel_backend="unknown")
@@ -1,4 +1,5 @@
 import numpy as np
+import pandas as pd
 
 from autogluon.features.generators import CategoryFeatureGenerator
 
@@ -69,3 +70,29 @@ def test_category_feature_generator(generator_helper, data_helper):
             assert list(output_data[col].cat.categories) == expected_cat_categories_lst[i]
             assert list(output_data[col]) in expected_cat_values_lst[i]
             assert list(output_data[col].cat.codes) in expected_cat_codes_lst[i]
+
+
+def test_category_feature_generator_chunked_fit():
+    # Given
+    rng = np.random.RandomState(0)
+    categories = [f"c{i}" for i in range(100)]
+    input_data = pd.DataFrame({"obj": rng.choice(categories, 2000, p=np.arange(1, 101) / np.arange(1, 101).sum())})
+    input_data["cat"] = input_data["obj"].astype("category")
+    input_data_chunks = [input_data.iloc[i : i + 300] for i in range(0, len(input_data), 300)]
+    # Some categories occur once or never in the sample
+    sample = input_data.iloc[:50]
+
+    generator_full = CategoryFeatureGenerator(minimum_cat_count=5, fillna="mode")
+    generator_chunked = CategoryFeatureGenerator(minimum_cat_count=5, fillna="mode")
+
+    # When
+    generator_full.fit(input_data)
+    generator_chunked.fit_transform(sample, X_chunks=lambda: iter(input_data_chunks))
+
+    # Then
+    assert generator_chunked.get_tags()["allow_chunked_fit"]
+    assert len(generator_chunked.category_map["obj"]) > sample["obj"].nunique()
+    for col in ["obj", "cat"]:
+        assert list(generator_chunked.category_map[col]) == list(generator_full.category_map[col])
+    assert generator_chunked._fillna_map == generator_full._fillna_map
+    pd.testing.assert_frame_equal(generator_chunked.transform(input_data), generator_full.transform(input_data))
@@ -1,3 +1,7 @@
+import numpy as np
+import pandas as pd
+import pytest
+
 from autogluon.features.generators import DatetimeFeatureGenerator
 
 
@@ -128,3 +132,34 @@ def test_datetime_feature_generator_advanced(generator_helper, data_helper):
     )
 
     assert expected_output_data_feat_datetime == list(output_data["datetime_as_object"].values)
+
+
+def test_datetime_feature_generator_chunked_fit():
+    # Given
+    rng = np.random.RandomState(0)
+    input_data = pd.DataFrame({"datetime": pd.to_datetime(rng.randint(1e9, 1.6e9, 1000), unit="s")})
+    input_data.loc[rng.choice(len(input_data), 50, replace=False), "datetime"] = pd.NaT
+    input_data_chunks = [input_data.iloc[i : i + 300] for i in range(0, len(input_data), 300)]
+
+    generator_full = DatetimeFeatureGenerator()
+    generator_chunked = DatetimeFeatureGenerator()
+
+    # When
+    generator_full.fit(input_data)
+    generator_chunked.fit_transform(input_data.iloc[:100], X_chunks=lambda: iter(input_data_chunks))
+
+    # Then
+    fillna_full = generator_full._fillna_map["datetime"]
+    fillna_chunked = generator_chunked._fillna_map["datetime"]
+    assert abs(fillna_chunked - fillna_full) < pd.Timedelta(seconds=1)
+
+
+def test_datetime_feature_generator_chunked_fit_all_nan_raises():
+    # Given
+    input_data = pd.DataFrame({"datetime": pd.to_datetime(pd.Series([pd.NaT] * 20))})
+    input_data_chunks = [input_data.iloc[i : i + 5] for i in range(0, len(input_data), 5)]
+    generator_chunked = DatetimeFeatureGenerator()
+
+    # When/Then
+    with pytest.raises(ValueError):
+        generator_chunked.fit_transform(input_data.iloc[:10], X_chunks=lambda: iter(input_data_chunks))
@@ -1,5 +1,6 @@
 import numpy as np
 import pandas as pd
+import pytest
 
 from autogluon.common import FeatureMetadata
 from autogluon.features.generators import DropDuplicatesFeatureGenerator
@@ -183,6 +184,27 @@ def test_drop_duplicates_numeric_edge_cases(generator_helper):
         assert removed_feature not in output_data.columns
 
 
+def test_drop_duplicates_sparse_features():
+    df = pd.DataFrame(
+        {
+            "A": [0, 1, 0, 3, 0],
+            "B": pd.arrays.SparseArray([0, 1, 0, 3, 0], fill_value=0),
+            "C": pd.arrays.SparseArray([0, 0, 2, 0, 0], fill_value=0),
+            "D": pd.arrays.SparseArray([0, 0, 2, 0, 0], fill_value=0),
+            "E": pd.arrays.SparseArray([0, 0, 0, 2, 0], fill_value=0),
+        }
+    )
+    feature_metadata_in = FeatureMetadata.from_df(df)
+
+    # Drop B because it has identical values to A, even though A is dense
+    # Drop D because C and D are identical
+    expected_dropped = ["B", "D"]
+    actual_dropped = DropDuplicatesFeatureGenerator._drop_duplicate_features(
+        X=df, feature_metadata_in=feature_metadata_in
+    )
+    assert expected_dropped == actual_dropped
+
+
 def test_drop_duplicates_category_edge_cases():
     df = pd.DataFrame(
         {
@@ -264,3 +286,94 @@ def test_drop_duplicates_category_edge_cases():
     expected_dropped_7 = ["D"]
     actual_dropped_7 = feature_generator._drop_duplicate_features(X=df, feature_metadata_in=feature_metadata_in)
     assert expected_dropped_7 == actual_dropped_7
+
+
+def test_drop_duplicates_feature_generator_chunked_fit():
+    # Given
+    rng = np.random.RandomState(0)
+    num_rows = 1000
+    input_data = pd.DataFrame({"a": rng.randn(num_rows), "cat_a": rng.choice(["x", "y", None], num_rows)})
+    input_data["a_dup"] = input_data["a"]
+    input_data["a_near_dup"] = input_data["a"]
+    input_data["cat_a_dup"] = input_data["cat_a"].map({"x": "y", "y": "x"})
+    input_data["cat_a_near_dup"] = input_data["cat_a"]
+    input_data["obj"] = [[i % 3] for i in range(num_rows)]
+    input_data["obj_dup"] = input_data["obj"]
+    # Only differ from "a" and "cat_a" outside of the sample
+    input_data.loc[num_rows - 1, "a_near_dup"] = 0.5
+    input_data.loc[num_rows - 1, "cat_a_near_dup"] = "z"
+    input_data["obj"] = input_data["obj"].astype(str)
+    input_data["obj_dup"] = input_data["obj_dup"].astype(str)
+    input_data["cat_a"] = input_data["cat_a"].astype("category")
+    input_data["cat_a_dup"] = input_data["cat_a_dup"].astype("category")
+    input_data["cat_a_near_dup"] = input_data["cat_a_near_dup"].astype("category")
+    input_data_chunks = [input_data.iloc[i : i + 300] for i in range(0, num_rows, 300)]
+
+    generator_full = DropDuplicatesFeatureGenerator()
+    generator_chunked = DropDuplicatesFeatureGenerator()
+
+    # When
+    generator_full.fit(input_data)
+    generator_chunked.fit_transform(input_data.iloc[:100], X_chunks=lambda: iter(input_data_chunks))
+
+    # Then
+    assert generator_full.features_in == ["a", "cat_a", "a_near_dup", "cat_a_near_dup", "obj"]
+    assert generator_chunked.features_in == generator_full.features_in
+
+
+def test_drop_duplicates_hash_method_matches_sample_method():
+    # Given
+    rng = np.random.RandomState(0)
+    num_rows = 200
+    df = pd.DataFrame(
+        {
+            "a": rng.randn(num_rows),
+            "b": rng.randint(0, 5, num_rows),
+            "cat": rng.choice(["x", "y", "z"], num_rows),
+            "obj": rng.choice(["u", "v"], num_rows),
+        }
+    )
+    df.loc[::7, "a"] = np.nan
+    df["a_dup"] = df["a"]
+    df["a_neg_zero"] = df["a"].where(df["a"] != df["a"].iloc[1], -0.0)
+    df["a_pos_zero_dup"] = df["a_neg_zero"].replace(-0.0, 0.0)
+    df["b_float_dup"] = df["b"].astype(float)
+    df["cat"] = df["cat"].astype("category")
+    df["cat_renamed_dup"] = df["cat"].cat.rename_categories({"x": "p", "y": "q", "z": "r"})
+    df["obj_dup"] = df["obj"]
+    df["obj_differs"] = df["obj"]
+    df.loc[num_rows - 1, "obj_differs"] = "w"
+    feature_metadata_in = FeatureMetadata.from_df(df)
+
+    # When
+    for keep in ["first", "last", False]:
+        dropped_sample = DropDuplicatesFeatureGenerator._drop_duplicate_features(
+            X=df, feature_metadata_in=feature_metadata_in, keep=keep
+        )
+        dropped_hash = DropDuplicatesFeatureGenerator._drop_duplicate_features_hash(
+            X=df, feature_metadata_in=feature_metadata_in, keep=keep
+        )
+
+        # Then
+        assert sorted(dropped_hash) == sorted(dropped_sample)
+    assert sorted(dropped_hash) == sorted(
+        ["a", "a_dup", "a_neg_zero", "a_pos_zero_dup", "b", "b_float_dup", "cat", "cat_renamed_dup", "obj", "obj_dup"]
+    )
+
+    generator_sample = DropDuplicatesFeatureGenerator()
+    generator_hash = DropDuplicatesFeatureGenerator(method="hash", num_cpus=2)
+    generator_sample.fit(df)
+    generator_hash.fit(df)
+    assert generator_hash.features_in == generator_sample.features_in
+    pd.testing.assert_frame_equal(generator_hash.transform(df), generator_sample.transform(df))
+
+    # "auto" is resolved when fitting, so the CPU count of the machine the generator was created on is not stored
+    generator_hash_auto = DropDuplicatesFeatureGenerator(method="hash", num_cpus="auto")
+    generator_hash_auto.fit(df)
+    assert generator_hash_auto.num_cpus == "auto"
+    assert generator_hash_auto.features_in == generator_sample.features_in
+
+
+def test_drop_duplicates_invalid_method():
+    with pytest.raises(ValueError):
+        DropDuplicatesFeatureGenerator(method="exact")
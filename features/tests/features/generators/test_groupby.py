@@ -0,0 +1,83 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from autogluon.features.generators import GroupByFeatureGenerator
+from autogluon.features.generators.groupby import groupby_aggregate
+
+AGGREGATIONS = ("mean", "std", "median", "count", "nunique", "min", "max", "q10", "q25", "q75", "q90", "pct_rank")
+
+
+def _generate_data(num_rows: int = 1000) -> pd.DataFrame:
+    rng = np.random.RandomState(0)
+    X = pd.DataFrame(
+        {
+            "cat": rng.choice(["a", "b", "c", None], num_rows),
+            "cat_2": pd.Categorical(rng.choice(["x", "y", "z"], num_rows), categories=["w", "x", "y", "z"]),
+            "num_float": rng.randn(num_rows),
+            "num_int": rng.randint(0, 30, num_rows),
+        }
+    )
+    X.loc[rng.choice(num_rows, 100), "num_float"] = np.nan
+    X.loc[X["cat"] == "c", "num_float"] = np.nan
+    return X
+
+
+@pytest.mark.parametrize("drop_basic_groupby_when_relative", [True, False])
+def test_groupby_feature_generator_engines_are_identical(drop_basic_groupby_when_relative):
+    # Given
+    X = _generate_data()
+    X_test = X.copy()
+    X_test.loc[:5, "cat"] = "unseen"
+
+    # When
+    outputs = []
+    for engine in ["pandas", "numpy"]:
+        generator = GroupByFeatureGenerator(
+            aggregations=AGGREGATIONS,
+            relative_ops=("diff", "ratio"),
+            drop_basic_groupby_when_relative=drop_basic_groupby_when_relative,
+            engine=engine,
+        )
+        generator.fit(X)
+        outputs.append(generator.transform(X_test))
+
+    # Then
+    assert len(generator.pairs_) == 4
+    assert outputs[0].shape == (len(X), len(generator.output_columns_))
+    pd.testing.assert_frame_equal(outputs[0], outputs[1], rtol=1e-10)
+
+
+def test_groupby_aggregate_matches_pandas():
+    # Given
+    X = _generate_data()
+    codes, uniques = pd.factorize(X["cat"], sort=True)
+    aggregations = [agg for agg in AGGREGATIONS if agg != "pct_rank"]
+
+    # When
+    stats, sorted_values = groupby_aggregate(
+        codes=codes,
+        num_groups=len(uniques),
+        X_num=X[["num_float", "num_int"]].to_numpy(dtype=float),
+        aggregations=aggregations,
+        return_sorted=True,
+    )
+
+    # Then
+    grouped = X.groupby("cat")["num_int"]
+    np.testing.assert_allclose(stats["mean"][:, 1], grouped.mean())
+    np.testing.assert_allclose(stats["std"][:, 1], grouped.std())
+    np.testing.assert_allclose(stats["q25"][:, 1], grouped.quantile(0.25))
+    np.testing.assert_allclose(stats["nunique"][:, 1], grouped.nunique())
+    # Group "c" only contains NaN values of num_float
+    assert np.isnan(stats["median"][2, 0])
+    assert stats["count"][2, 0] == 0
+    assert len(sorted_values[0][2]) == 0
+    np.testing.assert_array_equal(
+        sorted_values[1][0], np.sort(X.loc[X["cat"] == "a", "num_int"].to_numpy(dtype=float))
+    )
+
+
+def test_groupby_feature_generator_invalid_engine():
+    with pytest.raises(ValueError):
+        GroupByFeatureGenerator(engine="invalid")
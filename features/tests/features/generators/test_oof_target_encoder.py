@@ -283,6 +283,31 @@ def test_oof_target_encoding_unseen_and_nan_categories():
     assert val_unseen == pytest.approx(val_nan)
 
 
+def test_oof_target_encoding_category_dtype_transform_matches_object():
+    # Given
+    rng = np.random.RandomState(0)
+    X_train = pd.DataFrame({"feat": rng.choice(["a", "b", "c", None], 200), "feat_2": rng.choice(["x", "y"], 200)})
+    y = pd.Series(rng.randint(0, 3, 200))
+    X_test = pd.DataFrame({"feat": ["a", "d", np.nan, "b", "c"], "feat_2": ["y", "x", "z", "x", np.nan]})
+    X_test_category = X_test.astype({"feat": pd.CategoricalDtype(["d", "c", "b", "a", "e"]), "feat_2": "category"})
+
+    generator = OOFTargetEncodingFeatureGenerator(target_type="multiclass", n_splits=3, random_state=0)
+
+    # When
+    X_train_enc = generator.fit_transform(X_train, y=y)
+    X_test_enc = generator.transform(X_test)
+    X_test_category_enc = generator.transform(X_test_category)
+
+    # Then
+    assert X_train_enc.shape == (200, 6)
+    assert not X_train_enc.isna().any().any()
+    pd.testing.assert_frame_equal(X_test_enc, X_test_category_enc)
+    for feat in ["feat", "feat_2"]:
+        info = generator.encodings_[feat]
+        # Unseen and missing categories are encoded as the global mean
+        np.testing.assert_array_equal(X_test_enc.loc[1 if feat == "feat" else 2, info["names"]], info["global_mean"])
+
+
 def test_oof_target_encoding_estimate_no_of_new_features(data_helper):
     # Given
     X = data_helper.generate_multi_feature_standard()  # has "obj" (object) and "cat" (category)
@@ -1,4 +1,5 @@
 import numpy as np
+import pandas as pd
 from sklearn.feature_extraction.text import CountVectorizer
 
 from autogluon.common.features.feature_metadata import FeatureMetadata
@@ -90,3 +91,57 @@ def test_text_ngram_feature_generator_categorical_nan(generator_helper, data_hel
     )
 
     assert expected_output_data_feat_total == list(output_data["__nlp__._total_"].values)
+
+
+def test_text_ngram_feature_generator_sparse(generator_helper, data_helper):
+    # Given
+    input_data = data_helper.generate_multi_feature_full()
+
+    toy_vectorizer = CountVectorizer(min_df=2, ngram_range=(1, 3), max_features=1000, dtype=np.uint8)
+
+    # max_memory_ratio=None in test to avoid CI reducing ngrams non-deterministically.
+    generator = TextNgramFeatureGenerator(max_memory_ratio=None, vectorizer=toy_vectorizer, sparse=True)
+    generator_dense = TextNgramFeatureGenerator(max_memory_ratio=None, vectorizer=toy_vectorizer)
+
+    # When
+    output_data = generator_helper.fit_transform_assert(
+        input_data=input_data,
+        generator=generator,
+        expected_feature_metadata_in_full=expected_feature_metadata_in_full,
+        expected_feature_metadata_full=expected_feature_metadata_full,
+    )
+    output_data_dense = generator_dense.fit_transform(input_data)
+
+    # Then
+    assert all(isinstance(dtype, pd.SparseDtype) for dtype in output_data.dtypes)
+    assert expected_output_data_feat_total == list(output_data["__nlp__._total_"].values)
+    pd.testing.assert_frame_equal(output_data.sparse.to_dense(), output_data_dense)
+
+
+def test_text_ngram_feature_generator_chunked_fit():
+    # Given
+    rng = np.random.RandomState(0)
+    words = np.array([f"w{i}" for i in range(100)])
+    word_p = 1 / np.arange(1, 101)
+    input_data = pd.DataFrame(
+        {"text": [" ".join(rng.choice(words, rng.randint(5, 20), p=word_p / word_p.sum())) for _ in range(1000)]}
+    )
+    input_data_chunks = [input_data.iloc[i : i + 300] for i in range(0, len(input_data), 300)]
+    feature_metadata_in = FeatureMetadata(type_map_raw={"text": "object"}, type_group_map_special={"text": ["text"]})
+
+    def _get_generator():
+        vectorizer = CountVectorizer(min_df=0.02, max_df=0.9, ngram_range=(1, 2), max_features=200, dtype=np.uint8)
+        return TextNgramFeatureGenerator(max_memory_ratio=None, vectorizer=vectorizer)
+
+    generator_full = _get_generator()
+    generator_chunked = _get_generator()
+
+    # When
+    generator_full.fit(input_data, feature_metadata_in=feature_metadata_in)
+    generator_chunked.fit_transform(
+        input_data.iloc[:200], feature_metadata_in=feature_metadata_in, X_chunks=lambda: iter(input_data_chunks)
+    )
+
+    # Then
+    assert generator_chunked.vectorizers[0].vocabulary_ == generator_full.vectorizers[0].vocabulary_
+    pd.testing.assert_frame_equal(generator_chunked.transform(input_data), generator_full.transform(input_data))
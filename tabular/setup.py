@@ -32,6 +32,7 @@ install_requires = [
     "pandas",  # version range defined in `core/_setup_utils.py`
     "scikit-learn",  # version range defined in `core/_setup_utils.py`
     "networkx",  # version range defined in `core/_setup_utils.py`
+    "threadpoolctl>=3.1,<4",  # also required by scikit-learn
     f"{ag.PACKAGE_NAME}.core=={version}",
     f"{ag.PACKAGE_NAME}.features=={version}",
 ]
@@ -182,6 +182,7 @@ class AbstractTabularLearner(AbstractLearner):
         as_multiclass: bool = True,
         inverse_transform: bool = True,
         transform_features: bool = True,
+        use_prediction_cache: bool = True,
     ):
         X_index = copy.deepcopy(X.index) if as_pandas else None
         if X.empty:
@@ -189,7 +190,9 @@ class AbstractTabularLearner(AbstractLearner):
         else:
             if transform_features:
                 X = self.transform_features(X)
-            y_pred_proba = self.load_trainer().predict_proba(X, model=model)
+            y_pred_proba = self.load_trainer().predict_proba(
+                X, model=model, use_prediction_cache=use_prediction_cache
+            )
         y_pred_proba = self._post_process_predict_proba(
             y_pred_proba=y_pred_proba,
             as_pandas=as_pandas,
@@ -208,6 +211,7 @@ class AbstractTabularLearner(AbstractLearner):
         transform_features: bool = True,
         *,
         decision_threshold: float | None = None,
+        use_prediction_cache: bool = True,
     ):
         if decision_threshold is None:
             decision_threshold = 0.5
@@ -219,6 +223,7 @@ class AbstractTabularLearner(AbstractLearner):
             as_multiclass=False,
             inverse_transform=False,
             transform_features=transform_features,
+            use_prediction_cache=use_prediction_cache,
         )
         problem_type = self.label_cleaner.problem_type_transform or self.problem_type
         y_pred = get_pred_from_proba(
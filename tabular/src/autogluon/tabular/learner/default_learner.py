@@ -13,11 +13,13 @@ from autogluon.common.utils.log_utils import convert_time_in_s_to_log_friendly
 from autogluon.core.constants import AUTO_WEIGHT, BALANCE_WEIGHT, BINARY, MULTICLASS, QUANTILE, REGRESSION
 from autogluon.core.data import LabelCleaner
 from autogluon.core.data.cleaner import Cleaner
+from autogluon.core.metrics import Scorer
 from autogluon.core.utils.time import sample_df_for_time_func, time_func
 from autogluon.core.utils.utils import augment_rare_classes, extract_column
 
 from ..trainer import AutoTrainer
 from .abstract_learner import AbstractTabularLearner
+from .feature_cache import FeatureGeneratorCache
 
 logger = logging.getLogger(__name__)
 
@@ -55,6 +57,7 @@ class DefaultLearner(AbstractTabularLearner):
         verbosity: int = 2,
         raise_on_model_failure: bool = False,
         time_limit_preprocessing: float | None = None,
+        feature_cache: FeatureGeneratorCache | None = None,
         **trainer_fit_kwargs,
     ):
         """Arguments:
@@ -77,6 +80,9 @@ class DefaultLearner(AbstractTabularLearner):
             If None, no time limit is placed on preprocessing.
             This time limit is not strictly enforced and is only passed to parts of the preprocessing
             pipeline that support time limits.
+        feature_cache: FeatureGeneratorCache | None
+            If specified, the fitted feature generator and the transformed data are loaded from the cache
+            if a previous fit used identical data and an identical feature generator, and stored in the cache otherwise.
         """
         # TODO: if provided, feature_types in X, X_val are ignored right now, need to pass to Learner/trainer and update this documentation.
         self._time_limit = time_limit
@@ -141,6 +147,7 @@ class DefaultLearner(AbstractTabularLearner):
                 holdout_frac=holdout_frac,
                 num_bag_folds=num_bag_folds,
                 time_limit=time_limit_for_preprocessing,
+                feature_cache=feature_cache,
             )
         )
         if X_og is not None:
@@ -269,6 +276,7 @@ class DefaultLearner(AbstractTabularLearner):
         holdout_frac: float = 1,
         num_bag_folds: int = 0,
         time_limit: float | None = None,
+        feature_cache: FeatureGeneratorCache | None = None,
     ):
         """General data processing steps used for all models."""
         X = self._check_for_non_finite_values(X, name="train", is_train=True)
@@ -362,9 +370,10 @@ class DefaultLearner(AbstractTabularLearner):
             y_unlabeled = pd.Series(np.nan, index=X_unlabeled.index) if X_unlabeled is not None else None
             y_list = [y, y_val, y_test_super, y_unlabeled]
             y_super = pd.concat(y_list, ignore_index=True)
-            X_super = self.fit_transform_features(
+            X_super = self._fit_transform_features_cached(
                 X_super,
                 y_super,
+                feature_cache=feature_cache,
                 problem_type=self.label_cleaner.problem_type_transform,
                 eval_metric=self.eval_metric,
                 time_limit=time_limit,
@@ -391,6 +400,40 @@ class DefaultLearner(AbstractTabularLearner):
         X_test = self.bundle_weights(X_test, w_test, "X_test", is_train=False)
         return X, y, X_val, y_val, X_test, y_test, X_unlabeled, holdout_frac, num_bag_folds, groups
 
+    def _fit_transform_features_cached(
+        self, X: DataFrame, y: Series, feature_cache: FeatureGeneratorCache | None = None, **kwargs
+    ) -> DataFrame:
+        """Identical to `fit_transform_features`, but skips fitting the feature generator if its fit is cached in `feature_cache`."""
+        if feature_cache is None:
+            return self.fit_transform_features(X, y, **kwargs)
+        # Every kwarg forwarded to the feature generator fit is part of the key, such as `time_limit`
+        fit_kwargs_key = {name: value.name if isinstance(value, Scorer) else value for name, value in kwargs.items()}
+        key = feature_cache.compute_key(
+            X,
+            y,
+            self.feature_generator,
+            label=self.label,
+            ignored_columns=self.ignored_columns,
+            **fit_kwargs_key,
+        )
+        if key is None:
+            return self.fit_transform_features(X, y, **kwargs)
+        cached = feature_cache.get(key)
+        if cached is not None:
+            self.feature_generator, X_out = cached
+            logger.log(
+                20,
+                f"Loaded the fitted {self.feature_generator.__class__.__name__} and transformed data from the feature cache "
+                f'"{feature_cache.root_path}", skipping feature generator fit ...',
+            )
+            self.feature_generator.print_feature_metadata_info()
+            return X_out
+        time_start = time.time()
+        X_out = self.fit_transform_features(X, y, **kwargs)
+        fit_time = time.time() - time_start
+        feature_cache.put(key, self.feature_generator, X_out, fit_time=fit_time)
+        return X_out
+
     def bundle_weights(self, X: DataFrame | None, w: Series | None, name: str, is_train=False) -> DataFrame:
         if is_train:
             if w is not None:
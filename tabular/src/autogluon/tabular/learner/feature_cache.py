@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import pickle
+import shutil
+import uuid
+from hashlib import md5
+from pathlib import Path
+
+import pandas as pd
+from pandas import DataFrame, Series
+
+from autogluon.features import __version__ as features_version
+
+from ..trainer.prediction_cache import compute_dataset_hash
+from ..version import __version__
+
+logger = logging.getLogger(__name__)
+
+
+class FeatureGeneratorCache:
+    """
+    A disk-backed cache of fitted feature generators and the data they transformed during fit, shared across predictor fits.
+
+    Fitting the feature generator is skipped entirely if a previous fit used identical input data and an identical feature generator.
+    Entries are keyed by a content hash of (see `compute_key`):
+        1. The input data and labels passed to the feature generator.
+        2. The unfit feature generator, including all of its hyperparameters.
+        3. The learner context which influences the fit: label, ignored columns, and every kwarg passed to the
+           feature generator fit, such as problem type, eval metric and the preprocessing time limit.
+        4. The AutoGluon version and the cache format version, so that upgrading AutoGluon invalidates all entries.
+
+    Each entry is a directory containing the pickled fitted feature generator and the transformed data as a Parquet file,
+    which is loaded into memory in full on a cache hit. Pandas dtypes that Parquet does not preserve (such as sparse and some categorical dtypes)
+    are restored from the dtypes stored alongside, so the cached data is identical to the data returned by the original fit.
+    Entries are written to a temporary directory and renamed when complete, so multiple processes can share the same cache.
+    When the total size of the entries exceeds `max_disk_bytes`, the least recently used entries are evicted.
+
+    Parameters
+    ----------
+    root_path : str
+        Directory the cache entries are stored in.
+    max_disk_bytes : int, optional
+        Maximum total size of the cache entries. If None, defaults to 10 GB.
+    """
+
+    cache_version = 1
+    default_max_disk_bytes = 10 * 1024**3
+    _generator_filename = "feature_generator.pkl"
+    _data_filename = "X.parquet"
+    _dtypes_filename = "dtypes.pkl"
+    _metadata_filename = "metadata.json"
+
+    def __init__(self, root_path: str, max_disk_bytes: int | None = None):
+        self.root_path = Path(root_path)
+        self.max_disk_bytes = max_disk_bytes if max_disk_bytes is not None else self.default_max_disk_bytes
+        self.num_hits = 0
+        self.num_misses = 0
+
+    @classmethod
+    def compute_key(cls, X: DataFrame, y: Series | None, feature_generator, **context) -> str | None:
+        """
+        Computes the key of the entry which fitting `feature_generator` on `X` and `y` produces.
+        `feature_generator` must not be fit yet. `context` contains any additional values the output of the fit depends on.
+        Returns None if the inputs cannot be hashed, in which case the fit cannot be cached.
+        """
+        hasher = md5()
+        hasher.update(f"{cls.cache_version}|{__version__}|{features_version}".encode())
+        try:
+            hasher.update(compute_dataset_hash(X).encode())
+            if y is not None:
+                hasher.update(str(y.dtype).encode())
+                hasher.update(pd.util.hash_pandas_object(y, index=True).values.tobytes())
+            hasher.update(pickle.dumps(feature_generator, protocol=4))
+        except (TypeError, AttributeError, pickle.PicklingError) as e:
+            logger.log(
+                20,
+                f"\tUnable to hash the input data or feature generator, feature cache is disabled for this fit: {e}",
+            )
+            return None
+        hasher.update(repr(sorted(context.items())).encode())
+        return hasher.hexdigest()
+
+    def _path_entry(self, key: str) -> Path:
+        return self.root_path / key
+
+    def get(self, key: str):
+        """
+        Returns the (fitted feature generator, transformed data) of the entry `key`, or None if the entry is not cached.
+        """
+        path_entry = self._path_entry(key)
+        if not path_entry.is_dir():
+            self.num_misses += 1
+            return None
+        try:
+            with open(path_entry / self._generator_filename, "rb") as f:
+                feature_generator = pickle.load(f)
+            with open(path_entry / self._dtypes_filename, "rb") as f:
+                dtypes = pickle.load(f)
+            X = pd.read_parquet(path_entry / self._data_filename)
+            for column, dtype in dtypes.items():
+                if X[column].dtype != dtype:
+                    X[column] = X[column].astype(dtype)
+        except (OSError, EOFError, KeyError, ValueError, pickle.UnpicklingError):
+            logger.warning(
+                f"Cached feature generator {key} is corrupted. The feature generator will be fit from scratch."
+            )
+            shutil.rmtree(path_entry, ignore_errors=True)
+            self.num_misses += 1
+            return None
+        # The modification time of the entry directory is its last access time for eviction
+        os.utime(path_entry)
+        self.num_hits += 1
+        return feature_generator, X
+
+    def put(self, key: str, feature_generator, X: DataFrame, fit_time: float | None = None) -> bool:
+        """
+        Stores the fitted feature generator and the data it transformed during fit as entry `key`.
+        Returns False if the data cannot be stored, such as if it contains columns of arbitrary Python objects.
+        """
+        path_entry = self._path_entry(key)
+        if path_entry.is_dir():
+            return True
+        self.root_path.mkdir(parents=True, exist_ok=True)
+        path_tmp = self.root_path / f".tmp-{key}-{uuid.uuid4().hex}"
+        try:
+            path_tmp.mkdir()
+            # Parquet does not support sparse columns, they are stored dense and restored via their dtype
+            X_dense = {
+                column: X[column].sparse.to_dense() if isinstance(X[column].dtype, pd.SparseDtype) else X[column]
+                for column in X.columns
+            }
+            DataFrame(X_dense, index=X.index, copy=False).to_parquet(path_tmp / self._data_filename)
+            with open(path_tmp / self._dtypes_filename, "wb") as f:
+                pickle.dump(X.dtypes, f, protocol=4)
+            with open(path_tmp / self._generator_filename, "wb") as f:
+                pickle.dump(feature_generator, f, protocol=4)
+            with open(path_tmp / self._metadata_filename, "w") as f:
+                json.dump({"version": __version__, "shape": list(X.shape), "fit_time": fit_time}, f)
+            os.rename(path_tmp, path_entry)
+        except (OSError, TypeError, ValueError, NotImplementedError, AttributeError, pickle.PicklingError) as e:
+            # Raised if the data or the feature generator cannot be serialized, or if the entry cannot be written
+            shutil.rmtree(path_tmp, ignore_errors=True)
+            if path_entry.is_dir():
+                # Another process stored the same entry concurrently
+                return True
+            logger.log(20, f"\tUnable to store the fitted feature generator in the feature cache: {e}")
+            return False
+        self._evict()
+        return True
+
+    def clear(self):
+        if self.root_path.exists():
+            logger.debug(f"Removing feature cache {self.root_path}")
+            shutil.rmtree(self.root_path)
+
+    def _get_entries(self) -> list[tuple[Path, int, float]]:
+        """Returns the (path, size, last access time) of every complete entry."""
+        entries = []
+        if not self.root_path.exists():
+            return entries
+        for path_entry in self.root_path.iterdir():
+            if not path_entry.is_dir() or path_entry.name.startswith(".tmp-"):
+                continue
+            try:
+                size = sum(path.stat().st_size for path in path_entry.iterdir())
+                last_access = path_entry.stat().st_mtime
+            except FileNotFoundError:
+                # Evicted concurrently
+                continue
+            entries.append((path_entry, size, last_access))
+        return entries
+
+    @property
+    def disk_bytes(self) -> int:
+        return sum(size for _, size, _ in self._get_entries())
+
+    def _evict(self):
+        """Removes least recently used entries until the cache fits in `max_disk_bytes`"""
+        entries = self._get_entries()
+        total_bytes = sum(size for _, size, _ in entries)
+        if total_bytes <= self.max_disk_bytes:
+            return
+        for path_entry, size, _ in sorted(entries, key=lambda entry: entry[2]):
+            if total_bytes <= self.max_disk_bytes:
+                break
+            logger.debug(f"Evicting cached feature generator {path_entry.name}")
+            shutil.rmtree(path_entry, ignore_errors=True)
+            total_bytes -= size
+
+
+def get_feature_cache(feature_cache: str | dict | None) -> FeatureGeneratorCache | None:
+    """
+    Constructs the feature cache from the `feature_cache` argument of `TabularPredictor.fit`.
+    `feature_cache` is either the cache directory, or a dictionary of `FeatureGeneratorCache` init kwargs.
+    """
+    if feature_cache is None:
+        return None
+    if isinstance(feature_cache, (str, Path)):
+        feature_cache = {"root_path": str(feature_cache)}
+    elif isinstance(feature_cache, dict):
+        feature_cache = feature_cache.copy()
+        if "path" in feature_cache:
+            feature_cache["root_path"] = feature_cache.pop("path")
+        if "root_path" not in feature_cache:
+            raise ValueError(f"`feature_cache` must contain the key 'path' if it is a dict. Value: {feature_cache}")
+    else:
+        raise TypeError(
+            f"`feature_cache` must be a str, dict or None. Found: {type(feature_cache)} | Value: {feature_cache}"
+        )
+    return FeatureGeneratorCache(**feature_cache)
@@ -13,7 +13,7 @@ import pandas as pd
 from pandas import DataFrame, Series
 
 from autogluon.common.features.types import R_BOOL, R_CATEGORY, R_FLOAT, R_INT
-from autogluon.common.utils.pandas_utils import get_approximate_df_mem_usage
+from autogluon.common.utils.pandas_utils import get_approximate_df_mem_usage, get_sparse_features, to_csr_matrix
 from autogluon.common.utils.resource_utils import ResourceManager
 from autogluon.common.utils.try_import import try_import_lightgbm
 from autogluon.core.constants import BINARY, MULTICLASS, QUANTILE, REGRESSION, SOFTCLASS
@@ -56,6 +56,10 @@ class LGBModel(AbstractModel):
         self._features_internal_map = None
         self._requires_remap = None
         self._features_internal_lgbm = None
+        # If the training data contains pandas sparse features, the data is converted to a scipy CSR matrix instead of being densified
+        self._sparse_dtype = None
+        self._features_sparse_lgbm = None
+        self._categorical_features_sparse_lgbm = None
 
     def _set_default_params(self):
         default_params = get_param_baseline(problem_type=self.problem_type)
@@ -578,6 +582,23 @@ class LGBModel(AbstractModel):
 
         return X_new
 
+    def _preprocess(self, X: pd.DataFrame, is_train: bool = False, **kwargs):
+        X = super()._preprocess(X, **kwargs)
+        if is_train:
+            sparse_features = get_sparse_features(X)
+            if sparse_features:
+                dense_dtypes = [dtype for dtype in X.dtypes if not isinstance(dtype, pd.SparseDtype)]
+                # Mirrors LightGBM's own conversion of DataFrames
+                self._sparse_dtype = np.float64 if any(dtype == np.float64 for dtype in dense_dtypes) else np.float32
+                self._features_sparse_lgbm = list(X.columns)
+                self._categorical_features_sparse_lgbm = list(X.select_dtypes(include="category").columns)
+                logger.log(15, f"\tUsing CSR matrix input for LightGBM due to {len(sparse_features)} sparse features")
+            else:
+                self._sparse_dtype = None
+        if getattr(self, "_sparse_dtype", None) is not None:
+            X = to_csr_matrix(X, dtype=self._sparse_dtype)
+        return X
+
     def generate_datasets(
         self,
         X: DataFrame,
@@ -597,12 +618,19 @@ class LGBModel(AbstractModel):
     ):
         lgb_dataset_params_keys = ["two_round"]  # Keys that are specific to lightGBM Dataset object construction.
         data_params = {key: params[key] for key in lgb_dataset_params_keys if key in params}.copy()
+        dataset_kwargs = dict()
 
         X = self.preprocess(X, y=y, is_train=True)
         if X_val is not None:
             X_val = self.preprocess(X_val)
         if X_test is not None:
             X_test = self.preprocess(X_test)
+        if self._sparse_dtype is not None:
+            # Feature names and categorical features cannot be inferred from a CSR matrix
+            dataset_kwargs = dict(
+                feature_name=self._features_sparse_lgbm,
+                categorical_feature=self._categorical_features_sparse_lgbm,
+            )
         # TODO: Try creating multiple Datasets for subsets of features, then combining with Dataset.add_features_from(), this might avoid memory spike
 
         y_og = None
@@ -627,6 +655,7 @@ class LGBModel(AbstractModel):
             save=save,
             weight=sample_weight,
             init_score=init_train,
+            **dataset_kwargs,
         )
         # dataset_train = construct_dataset_lowest_memory(X=X, y=y, location=self.path + 'datasets/train', params=data_params)
         if X_val is not None:
@@ -640,6 +669,7 @@ class LGBModel(AbstractModel):
                 save=save,
                 weight=sample_weight_val,
                 init_score=init_val,
+                **dataset_kwargs,
             )
             # dataset_val = construct_dataset_lowest_memory(X=X_val, y=y_val, location=self.path + 'datasets/val', reference=dataset_train, params=data_params)
         else:
@@ -655,6 +685,7 @@ class LGBModel(AbstractModel):
                 save=save,
                 weight=sample_weight_test,
                 init_score=init_test,
+                **dataset_kwargs,
             )
         else:
             dataset_test = None
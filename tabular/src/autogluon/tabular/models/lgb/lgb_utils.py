@@ -105,13 +105,30 @@ def softclass_lgbobj(preds, train_data):
 
 
 def construct_dataset(
-    x: DataFrame, y: Series, location=None, reference=None, params=None, save=False, weight=None, init_score=None
+    x: DataFrame,
+    y: Series,
+    location=None,
+    reference=None,
+    params=None,
+    save=False,
+    weight=None,
+    init_score=None,
+    feature_name="auto",
+    categorical_feature="auto",
 ):
     try_import_lightgbm()
     import lightgbm as lgb
 
     dataset = lgb.Dataset(
-        data=x, label=y, reference=reference, free_raw_data=True, params=params, weight=weight, init_score=init_score
+        data=x,
+        label=y,
+        reference=reference,
+        free_raw_data=True,
+        params=params,
+        weight=weight,
+        init_score=init_score,
+        feature_name=feature_name,
+        categorical_feature=categorical_feature,
     )
 
     if save:
@@ -12,7 +12,7 @@ from sklearn.compose import ColumnTransformer
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.impute import SimpleImputer
 from sklearn.pipeline import Pipeline
-from sklearn.preprocessing import QuantileTransformer, StandardScaler
+from sklearn.preprocessing import MaxAbsScaler, QuantileTransformer, StandardScaler
 
 from autogluon.common.features.types import R_BOOL, R_CATEGORY, R_FLOAT, R_INT, R_OBJECT, S_BOOL, S_TEXT_AS_CATEGORY
 from autogluon.common.utils.log_utils import fix_sklearnex_logging_if_kaggle
@@ -23,7 +23,7 @@ from autogluon.core.utils.exceptions import TimeLimitExceeded
 
 from .hyperparameters.parameters import IGNORE, INCLUDE, ONLY, _get_solver, get_param_baseline, preprocess_params_set
 from .hyperparameters.searchspaces import get_default_searchspace
-from .lr_preprocessing_utils import NlpDataPreprocessor, OheFeaturesGenerator
+from .lr_preprocessing_utils import NlpDataPreprocessor, OheFeaturesGenerator, SparseFeaturesToCSR
 
 logger = logging.getLogger(__name__)
 
@@ -85,7 +85,7 @@ class LinearModel(AbstractModel):
         return re.split("[ ]+", s)
 
     def _get_types_of_features(self, df):
-        """Returns dict with keys: : 'continuous', 'skewed', 'onehot', 'embed', 'language', values = ordered list of feature-names falling into each category.
+        """Returns dict with keys: : 'continuous', 'skewed', 'sparse', 'onehot', 'embed', 'language', values = ordered list of feature-names falling into each category.
         Each value is a list of feature-names corresponding to columns in original dataframe.
         """
         continuous_featnames = self._feature_metadata.get_features(
@@ -152,6 +152,10 @@ class LinearModel(AbstractModel):
                 ]
             )
             transformer_list.append(("cont", pipeline, feature_types["continuous"]))
+        if feature_types.get("sparse", None):
+            # MaxAbsScaler preserves sparsity, unlike StandardScaler
+            pipeline = Pipeline(steps=[("csr", SparseFeaturesToCSR()), ("scaler", MaxAbsScaler())])
+            transformer_list.append(("sparse", pipeline, feature_types["sparse"]))
         if feature_types.get("bool", None):
             pipeline = Pipeline(steps=[("scaler", StandardScaler())])
             transformer_list.append(("bool", pipeline, feature_types["bool"]))
@@ -307,10 +311,13 @@ class LinearModel(AbstractModel):
     def _select_continuous(self, df, features):
         # continuous = numeric features to rescale
         # skewed = features to which we will apply power (ie. log / box-cox) transform before normalization
+        # sparse = pandas sparse features to rescale without converting to dense
         types_of_features = defaultdict(list)
         skew_threshold = self.params["proc.skew_threshold"]
         for feature in features:
-            if skew_threshold is not None and (np.abs(df[feature].skew()) > self.params["proc.skew_threshold"]):
+            if isinstance(df[feature].dtype, pd.SparseDtype):
+                types_of_features["sparse"].append(feature)
+            elif skew_threshold is not None and (np.abs(df[feature].skew()) > self.params["proc.skew_threshold"]):
                 types_of_features["skewed"].append(feature)
             else:
                 types_of_features["continuous"].append(feature)
@@ -1,5 +1,7 @@
+import numpy as np
 from sklearn.base import BaseEstimator, TransformerMixin
 
+from autogluon.common.utils.pandas_utils import to_csr_matrix
 from autogluon.features.generators import OneHotEncoderFeatureGenerator
 
 
@@ -20,6 +22,16 @@ class OheFeaturesGenerator(BaseEstimator, TransformerMixin):
         return self.feature_names_
 
 
+class SparseFeaturesToCSR(BaseEstimator, TransformerMixin):
+    """Converts pandas sparse features to a scipy CSR matrix without converting them to dense."""
+
+    def fit(self, X, y=None):
+        return self
+
+    def transform(self, X, y=None):
+        return to_csr_matrix(X, dtype=np.float64)
+
+
 class NlpDataPreprocessor(BaseEstimator, TransformerMixin):
     def __init__(self, nlp_cols):
         self.nlp_cols = nlp_cols
@@ -4,6 +4,7 @@ import numpy as np
 from scipy.sparse import csr_matrix, hstack
 from sklearn.base import BaseEstimator, TransformerMixin
 
+from autogluon.common.utils.pandas_utils import get_sparse_features, to_csr_matrix
 from autogluon.core.constants import BINARY, MULTICLASS, REGRESSION, SOFTCLASS
 from autogluon.core.metrics import Scorer
 
@@ -154,7 +155,12 @@ class OheFeatureGenerator(BaseEstimator, TransformerMixin):
         if self.cat_cols:
             X_list.append(self.ohe_encs.transform(X[self.cat_cols]))
         if self.other_cols:
-            X_list.append(csr_matrix(X[self.other_cols]))
+            X_other = X[self.other_cols]
+            if get_sparse_features(X_other):
+                # Avoid converting pandas sparse features to dense
+                X_list.append(to_csr_matrix(X_other, dtype=np.float32))
+            else:
+                X_list.append(csr_matrix(X_other))
         return hstack(X_list, format="csr")
 
     def get_feature_names(self):
@@ -1,2 +1,3 @@
 from .interpretable_predictor import InterpretableTabularPredictor
 from .predictor import TabularPredictor
+from .serving_predictor import TabularServingPredictor
@@ -9,7 +9,7 @@ import pprint
 import shutil
 import time
 import warnings
-from typing import Any, Literal, Optional, Union, overload
+from typing import Any, Iterable, Iterator, Literal, Optional, Union, overload
 
 import networkx as nx
 import numpy as np
@@ -64,6 +64,7 @@ from autogluon.core.utils import (
     plot_summary_of_models,
     plot_tabular_models,
 )
+from autogluon.core.utils.infer_utils import benchmark_inference, predict_chunked
 from autogluon.core.utils.loaders import load_pkl, load_str
 from autogluon.core.utils.savers import save_pkl, save_str
 from autogluon.core.utils.utils import generate_train_test_split_combined
@@ -76,9 +77,11 @@ from ..configs.pipeline_presets import (
 )
 from ..configs.presets_configs import tabular_presets_alias, tabular_presets_dict
 from ..learner import AbstractTabularLearner, DefaultLearner
+from ..learner.feature_cache import get_feature_cache
 from ..registry import ag_model_registry
 from ..trainer.abstract_trainer import AbstractTabularTrainer
 from ..version import __version__
+from .serving_predictor import TabularServingPredictor
 
 logger = logging.getLogger(__name__)  # return autogluon root logger
 
@@ -1105,6 +1108,16 @@ class TabularPredictor:
                 If None, no time limit is placed on preprocessing.
                 Note, this is not strictly enforced as not all preprocessing code can be
                 interrupted to abide by the time limit.
+            feature_cache: str or dict, default = None
+                If specified, caches the fitted feature generator and the transformed training data on disk, shared across predictor fits.
+                Subsequent fits with identical training, tuning and unlabeled data, identical `feature_generator` and identical
+                `label`, `problem_type`, `eval_metric` and preprocessing time limit load the fitted feature generator from the cache instead of fitting it,
+                skipping data preprocessing entirely. Useful when repeatedly fitting predictors on the same dataset, such as in hyperparameter sweeps.
+                If str, the directory the cache is stored in.
+                If dict, supports the keys:
+                    "path": str, the directory the cache is stored in.
+                    "max_disk_bytes": int, default = 10 GB. When the cache exceeds this size, the least recently used entries are removed.
+                Refer to `autogluon.tabular.learner.feature_cache.FeatureGeneratorCache` for details.
 
         Returns
         -------
@@ -1206,6 +1219,7 @@ class TabularPredictor:
         learning_curves = kwargs["learning_curves"]
         raise_on_model_failure = kwargs["raise_on_model_failure"]
         time_limit_preprocessing = kwargs["time_limit_preprocessing"]
+        feature_cache = get_feature_cache(kwargs["feature_cache"])
 
         if ag_args is None:
             ag_args = {}
@@ -1454,6 +1468,7 @@ class TabularPredictor:
             callbacks=callbacks,
             raise_on_model_failure=raise_on_model_failure,
             time_limit_preprocessing=time_limit_preprocessing,
+            feature_cache=feature_cache,
         )
         ag_post_fit_kwargs = dict(
             keep_only_best=kwargs["keep_only_best"],
@@ -2724,6 +2739,110 @@ class TabularPredictor:
             transform_features=transform_features,
         )
 
+    def predict_chunked(
+        self,
+        data: pd.DataFrame | str | Iterable[pd.DataFrame],
+        output_path: str | None = None,
+        model: str | None = None,
+        *,
+        chunk_size: int = 100000,
+        num_workers: int = 1,
+        keep_columns: list[str] | None = None,
+        decision_threshold: float | None = None,
+    ) -> Iterator[pd.Series | pd.DataFrame] | str:
+        """
+        Equivalent to `predictor.predict`, but streams `data` through the predictor in chunks of at most `chunk_size` rows.
+        This allows predicting on data that is larger than memory with a fixed memory footprint,
+        as neither `data` nor the predictions of all rows are held in memory at once.
+
+        Prediction caching is disabled while each chunk is predicted.
+        If `output_path` is specified, the models required for prediction are persisted in memory for the duration of the prediction.
+        Otherwise, call `predictor.persist()` beforehand to avoid loading the models from disk for every chunk.
+
+        Parameters
+        ----------
+        data : :class:`pd.DataFrame`, str or iterable of :class:`pd.DataFrame`
+            The data to make predictions for. Can be one of:
+                A str path to a CSV file, a Parquet file or a directory of Parquet files.
+                    Only the columns required for prediction and `keep_columns` are loaded.
+                An iterable (such as a generator) of DataFrames.
+                A DataFrame.
+        output_path : str, optional
+            If specified, the predictions are written to a single Parquet file at `output_path`, and `output_path` is returned.
+            If None, returns a generator that yields the predictions of each chunk in order.
+        model : str, optional
+            The name of the model to get predictions from. Defaults to None, which uses the highest scoring model on the validation set.
+        chunk_size : int, default = 100000
+            The maximum number of rows to predict on at once. Larger values improve throughput but increase memory usage.
+        num_workers : int, default = 1
+            The number of chunks to predict concurrently on a thread pool.
+            Increasing this improves throughput if the models leave CPU cores idle, at the cost of `num_workers` times the memory usage.
+        keep_columns : list[str], optional
+            Columns of `data`, such as an ID column, to include in the output in addition to the predictions.
+            If specified, the output of each chunk is a DataFrame instead of a Series.
+        decision_threshold : float, optional
+            Refer to `predictor.predict` for details.
+
+        Returns
+        -------
+        A generator of :class:`pd.Series` predictions per chunk, or `output_path` if specified.
+        The predictions are identical to `predictor.predict(data)`.
+
+        Examples
+        --------
+        >>> predictor.predict_chunked("test.parquet", output_path="predictions.parquet", keep_columns=["id"])
+        >>> for y_pred in predictor.predict_chunked("test.csv", chunk_size=10000):
+        >>>     ...
+        """
+        self._assert_is_fit("predict_chunked")
+        if decision_threshold is None:
+            decision_threshold = self.decision_threshold
+        return predict_chunked(
+            data,
+            predictor=self,
+            output_path=output_path,
+            as_proba=False,
+            chunk_size=chunk_size,
+            num_workers=num_workers,
+            keep_columns=keep_columns,
+            model=model,
+            decision_threshold=decision_threshold,
+        )
+
+    def predict_proba_chunked(
+        self,
+        data: pd.DataFrame | str | Iterable[pd.DataFrame],
+        output_path: str | None = None,
+        model: str | None = None,
+        as_multiclass: bool = True,
+        *,
+        chunk_size: int = 100000,
+        num_workers: int = 1,
+        keep_columns: list[str] | None = None,
+    ) -> Iterator[pd.DataFrame | pd.Series] | str:
+        """
+        Equivalent to `predictor.predict_proba`, but streams `data` through the predictor in chunks of at most `chunk_size` rows.
+        Refer to `predictor.predict_chunked` for details.
+        When writing to `output_path`, the columns of the Parquet file are the class labels converted to str.
+        """
+        self._assert_is_fit("predict_proba_chunked")
+        if not self.can_predict_proba:
+            raise AssertionError(
+                f'`predictor.predict_proba_chunked` is not supported when problem_type="{self.problem_type}". '
+                f"Please call `predictor.predict_chunked` instead."
+            )
+        return predict_chunked(
+            data,
+            predictor=self,
+            output_path=output_path,
+            as_proba=True,
+            chunk_size=chunk_size,
+            num_workers=num_workers,
+            keep_columns=keep_columns,
+            model=model,
+            as_multiclass=as_multiclass,
+        )
+
     def predict_from_proba(
         self, y_pred_proba: pd.DataFrame | np.ndarray, decision_threshold: float | None = None
     ) -> pd.Series | np.array:
@@ -3916,6 +4035,157 @@ class TabularPredictor:
         self._assert_is_fit("unpersist")
         return self._learner.load_trainer().unpersist(model_names=models)
 
+    def benchmark_inference(
+        self,
+        data: pd.DataFrame | str,
+        models: list[str] | None = None,
+        batch_sizes: list[int] | None = None,
+        repeats: int = 5,
+        persist_modes: list[bool] | None = None,
+        compile: bool = False,
+        compiler_configs: dict | str = "auto",
+        path: str | None = None,
+        silent: bool = False,
+    ) -> dict:
+        """
+        Benchmark the inference latency, throughput and memory usage of the predictor's models across batch sizes.
+
+        The feature preprocessing time and the time of each model are measured separately,
+        and each configuration is reported with its p50/p95/p99 latency, throughput and peak resident memory (RSS).
+        Models are benchmarked both when loaded from disk on every call and when persisted in memory,
+        and optionally when compiled. The predictor is left in the same state as before the benchmark.
+        The returned report can be saved as JSON via `path` to compare inference performance between releases.
+
+        Parameters
+        ----------
+        data : :class:`pd.DataFrame` or str
+            Data to predict on. Rows are duplicated and/or sampled to reach each batch size. The label column is not required.
+            If str is passed, `data` will be loaded using the str value as the file path.
+        models : list[str], default = None
+            Models to benchmark. If None, benchmarks all models that can infer.
+        batch_sizes : list[int], default = [1, 10, 100, 1000, 10000, 100000]
+            Batch sizes to benchmark.
+        repeats : int, default = 5
+            Number of timed repeats per batch size. Latency percentiles are computed over the repeats.
+        persist_modes : list[bool], default = [False, True]
+            Whether to benchmark models loaded from disk on every call (False) and/or models persisted in memory (True).
+        compile : bool, default = False
+            If True, additionally benchmarks compiled models. Compilation is done on a temporary clone of the predictor,
+            leaving this predictor unchanged. Refer to `predictor.compile` for details.
+        compiler_configs : dict or str, default = "auto"
+            Compiler configurations used when `compile=True`. Refer to `predictor.compile` for details.
+        path : str, default = None
+            If specified, the report is saved as JSON to this path.
+        silent : bool, default = False
+            If False, logs progress and a summary of the results.
+
+        Returns
+        -------
+        Dictionary with the 'metadata' of the benchmark and the list of 'results'.
+        Refer to `autogluon.core.utils.infer_utils.benchmark_inference` for a description of the results.
+        The results can be converted to a DataFrame via `pd.DataFrame(report["results"])`.
+        """
+        self._assert_is_fit("benchmark_inference")
+        data = self._get_dataset(data)
+        return benchmark_inference(
+            data,
+            predictor=self,
+            models=models,
+            batch_sizes=batch_sizes,
+            repeats=repeats,
+            persist_modes=persist_modes,
+            compile=compile,
+            compiler_configs=compiler_configs,
+            path=path,
+            silent=silent,
+        )
+
+    def get_serving_predictor(self, model: str = "best") -> TabularServingPredictor:
+        """
+        Returns a TabularServingPredictor for low-latency online inference on single rows or small batches.
+
+        The serving predictor accepts a dict, a list of dicts, a NumPy array or a DataFrame,
+        applies the feature generators directly on NumPy arrays when supported, and predicts with `model` and its persisted ancestors.
+        Its predictions are identical to `predictor.predict(data, model=model)` but with a fraction of the per-call overhead.
+
+        Parameters
+        ----------
+        model : str, default = "best"
+            The model to predict with. If "best", uses `predictor.model_best`.
+            For the lowest latency, use a model that does not require bagging or stacking, for example via `predictor.refit_full()`.
+
+        Returns
+        -------
+        TabularServingPredictor
+
+        Examples
+        --------
+        >>> serving_predictor = predictor.get_serving_predictor()
+        >>> serving_predictor.predict({"age": 39, "workclass": "State-gov", ...})
+        """
+        self._assert_is_fit("get_serving_predictor")
+        return TabularServingPredictor(predictor=self, model=model)
+
+    def set_parallel_inference(self, num_cpus: int | str | None = "auto", save_trainer: bool = False):
+        """
+        Enables or disables parallel inference across models.
+        When enabled, models that do not depend on each other (such as all level 1 models) predict concurrently on a thread pool,
+        and stacker models start predicting as soon as their base models are done.
+        This reduces the latency of `predict`, `predict_proba`, `leaderboard`, `evaluate` and `predict_multi` when many models are involved.
+        Predictions are identical to sequential inference.
+
+        Parameters
+        ----------
+        num_cpus : int | str | None, default = "auto"
+            The total number of CPUs shared by concurrently predicting models. Each model reserves the number of CPUs it was fit with.
+            If "auto", uses all available CPUs.
+            If None or 1, disables parallel inference (the default behavior).
+        save_trainer : bool, default = False
+            If True, self._trainer is saved with the new value, such that it is reflected when predictor is loaded in future from disk.
+        """
+        self._assert_is_fit("set_parallel_inference")
+        if num_cpus is not None and num_cpus != "auto":
+            if not isinstance(num_cpus, int) or num_cpus < 1:
+                raise ValueError(f'`num_cpus` must be a positive int, "auto", or None. Found: {num_cpus}')
+        self._trainer.parallel_inference_num_cpus = num_cpus
+        if save_trainer:
+            self._trainer.save()
+
+    def set_prediction_cache(
+        self,
+        use_cache: bool = True,
+        max_disk_bytes: int | None = None,
+        max_memory_bytes: int | None = None,
+        save_trainer: bool = False,
+    ):
+        """
+        Enables or disables caching of model predictions.
+        When enabled, the prediction probabilities of each model are cached, keyed on a hash of the transformed input data
+        and the version of the model. Repeated calls to `leaderboard`, `evaluate`, `predict`, `predict_proba`, `predict_multi`
+        and `predict_proba_multi` on the same data skip inference for models that were already computed.
+        Cached predictions are stored as one `.npy` file per model and data under the predictor's directory,
+        with the most recently used predictions also kept in memory.
+        Refitting, calibrating or otherwise re-saving a model invalidates its cached predictions.
+
+        Parameters
+        ----------
+        use_cache : bool, default = True
+            If True, enables the prediction cache. If False, disables the prediction cache and deletes all cached predictions.
+        max_disk_bytes : int, default = None
+            Maximum total size in bytes of cached predictions on disk. Least recently used predictions are evicted first.
+            If None, defaults to 2 GB.
+        max_memory_bytes : int, default = None
+            Maximum total size in bytes of cached predictions kept in memory. If None, defaults to 256 MB.
+        save_trainer : bool, default = False
+            If True, self._trainer is saved with the new value, such that it is reflected when predictor is loaded in future from disk.
+        """
+        self._assert_is_fit("set_prediction_cache")
+        self._trainer.set_prediction_cache(
+            use_cache=use_cache, max_disk_bytes=max_disk_bytes, max_memory_bytes=max_memory_bytes
+        )
+        if save_trainer:
+            self._trainer.save()
+
     # TODO: `total_resources = None` during refit, fix this.
     #  refit_full doesn't account for user-specified resources at fit time, nor does it allow them to specify for refit.
     def refit_full(
@@ -5442,6 +5712,7 @@ class TabularPredictor:
             test_data=None,
             raise_on_model_failure=False,
             time_limit_preprocessing=None,
+            feature_cache=None,
             # experimental
             _experimental_dynamic_hyperparameters=False,
             adapt_num_bag_folds_to_n_classes=False,
@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from autogluon.core.constants import BINARY, MULTICLASS, QUANTILE
+from autogluon.core.utils import get_pred_from_proba
+from autogluon.features.utils import series_to_array
+
+logger = logging.getLogger(__name__)
+
+
+class TabularServingPredictor:
+    """
+    Low-latency predictor for online inference on single rows or small batches, created via `TabularPredictor.get_serving_predictor`.
+
+    `TabularPredictor.predict` is optimized for throughput on large DataFrames, and has a fixed overhead of several milliseconds per call
+    that dominates the latency of small batches. TabularServingPredictor minimizes this overhead:
+        1. Inputs are accepted as a dict, a list of dicts (records), a NumPy array or a NumPy structured array, without requiring a DataFrame.
+        2. The feature generators are compiled into a flat plan of column operations via `compile()`, which operates on NumPy arrays
+            instead of DataFrames. Feature generators without an array implementation (such as text n-gram features) are applied to a DataFrame
+            of only their input features instead.
+        3. The model and its ancestors are persisted in memory, and their inference order is computed once instead of on every call.
+        4. Predictions are decoded to labels via a precomputed lookup array instead of pandas operations.
+
+    Predictions are identical to `TabularPredictor.predict` and `TabularPredictor.predict_proba` with `as_pandas=False`.
+    For the lowest latency, use a model that does not require bagging or stacking, for example via `predictor.refit_full()`.
+
+    Parameters
+    ----------
+    predictor : TabularPredictor
+        The fitted predictor to serve.
+    model : str, default = "best"
+        The model to predict with. If "best", uses `predictor.model_best`.
+
+    Attributes
+    ----------
+    features : list[str]
+        The input features required for prediction, in the order expected for NumPy array inputs.
+    uses_transform_arrays : bool
+        Whether all feature generators are applied via the fast `transform_arrays` path, without any DataFrame operations.
+    """
+
+    def __init__(self, predictor, model: str = "best"):
+        self._learner = predictor._learner
+        self._trainer = predictor._trainer
+        if model == "best":
+            model = predictor.model_best
+        elif model not in self._trainer.get_model_names(can_infer=True):
+            raise ValueError(
+                f"Model '{model}' does not exist or cannot infer. "
+                f"Valid models: {self._trainer.get_model_names(can_infer=True)}"
+            )
+        self.model = model
+        self.problem_type = self._learner.problem_type
+        self.decision_threshold = predictor.decision_threshold
+
+        self._feature_generators = self._learner.feature_generators
+        self.features = list(self._feature_generators[0].features_in)
+        self._feature_dtypes = self._get_feature_dtypes()
+        self._feature_plans = [feature_generator.compile() for feature_generator in self._feature_generators]
+        self.uses_transform_arrays = all(
+            not step.uses_dataframe for feature_plan in self._feature_plans for step in feature_plan.steps
+        )
+
+        models_to_persist = [m for m in self._trainer.get_minimum_model_set(model) if m not in self._trainer.models]
+        if models_to_persist:
+            self._trainer.persist(model_names=models_to_persist)
+        self._model_pred_order = self._trainer._construct_model_pred_order([model])
+        self._label_lookup = self._get_label_lookup()
+
+    def _get_feature_dtypes(self) -> dict[str, np.dtype]:
+        """Returns the NumPy dtype each input feature is converted to. Features without a NumPy equivalent, such as category, are kept as object."""
+        feature_metadata_in_real = getattr(self._feature_generators[0], "_feature_metadata_in_real", None)
+        feature_dtypes = dict()
+        for feature in self.features:
+            dtype = np.dtype("O")
+            if feature_metadata_in_real is not None and feature in feature_metadata_in_real.type_map_raw:
+                try:
+                    dtype = np.dtype(feature_metadata_in_real.get_feature_type_raw(feature))
+                except TypeError:
+                    pass
+            feature_dtypes[feature] = dtype
+        return feature_dtypes
+
+    def _get_label_lookup(self) -> np.ndarray | None:
+        """Returns the array that maps internal class indices to the original labels, or None if not a classification problem."""
+        problem_type = self._learner.label_cleaner.problem_type_transform or self.problem_type
+        if problem_type not in [BINARY, MULTICLASS]:
+            return None
+        num_classes = len(self._learner.class_labels_transformed)
+        return self._learner.label_cleaner.inverse_transform(pd.Series(np.arange(num_classes))).to_numpy()
+
+    def predict(self, data: dict | list[dict] | np.ndarray | pd.DataFrame) -> np.ndarray:
+        """
+        Predicts the labels of `data`.
+
+        Parameters
+        ----------
+        data : dict, list[dict], np.ndarray or pd.DataFrame
+            The data to predict on. Refer to `predict_proba` for the supported formats.
+
+        Returns
+        -------
+        np.ndarray of predictions, with one entry per row of `data`.
+        """
+        y_pred_proba = self._predict_proba_internal(data)
+        problem_type = self._learner.label_cleaner.problem_type_transform or self.problem_type
+        decision_threshold = self.decision_threshold if self.decision_threshold is not None else 0.5
+        y_pred = get_pred_from_proba(
+            y_pred_proba=y_pred_proba, problem_type=problem_type, decision_threshold=decision_threshold
+        )
+        if self._label_lookup is not None:
+            return self._label_lookup[y_pred]
+        elif self.problem_type == QUANTILE:
+            return y_pred
+        return self._learner.label_cleaner.inverse_transform(pd.Series(y_pred)).to_numpy()
+
+    def predict_proba(
+        self, data: dict | list[dict] | np.ndarray | pd.DataFrame, as_multiclass: bool = True
+    ) -> np.ndarray:
+        """
+        Predicts the class probabilities of `data`. For regression, predicts the target value.
+
+        Parameters
+        ----------
+        data : dict, list[dict], np.ndarray or pd.DataFrame
+            The data to predict on, containing the features in `self.features`. Can be one of:
+                dict of feature name to value: a single row.
+                dict of feature name to a list or array of values: a batch of rows.
+                list of dicts of feature name to value: a batch of rows.
+                np.ndarray: a single row (1-dimensional) or a batch of rows (2-dimensional), with columns in the order of `self.features`.
+                    Structured arrays are matched to features by field name instead.
+                pd.DataFrame: a batch of rows.
+        as_multiclass : bool, default = True
+            Refer to `TabularPredictor.predict_proba` for details.
+
+        Returns
+        -------
+        np.ndarray of prediction probabilities, with columns in the order of `predictor.class_labels` for classification.
+        """
+        y_pred_proba = self._predict_proba_internal(data)
+        return self._learner._post_process_predict_proba(
+            y_pred_proba=y_pred_proba, as_pandas=False, as_multiclass=as_multiclass
+        )
+
+    def _predict_proba_internal(self, data) -> np.ndarray:
+        X = self.transform_features(data)
+        model_pred_proba_dict = dict()
+        for model in self._model_pred_order:
+            model_pred_proba_dict[model] = self._trainer._predict_proba_model_with_pred_dict(
+                X=X, model=model, model_pred_proba_dict=model_pred_proba_dict
+            )
+        return model_pred_proba_dict[self.model]
+
+    def transform_features(self, data: dict | list[dict] | np.ndarray | pd.DataFrame) -> pd.DataFrame:
+        """Returns the transformed features of `data`, identical to `TabularPredictor.transform_features(data)` up to the index."""
+        X = self._to_arrays(data)
+        for feature_plan in self._feature_plans:
+            X = feature_plan.transform_arrays(X)
+        return pd.DataFrame(X, copy=False)
+
+    def _to_arrays(self, data: dict | list[dict] | np.ndarray | pd.DataFrame) -> dict[str, Any]:
+        """Converts `data` to a dictionary of feature name to a 1-dimensional array of the feature's values."""
+        if isinstance(data, pd.DataFrame):
+            self._check_missing_features(data.columns)
+            return {feature: series_to_array(data[feature]) for feature in self.features}
+        elif isinstance(data, dict):
+            self._check_missing_features(data.keys())
+            is_single_row = all(np.ndim(data[feature]) == 0 for feature in self.features)
+            if is_single_row:
+                return {feature: self._to_array([data[feature]], feature=feature) for feature in self.features}
+            return {feature: self._to_array(data[feature], feature=feature) for feature in self.features}
+        elif isinstance(data, list):
+            for row in data:
+                self._check_missing_features(row.keys())
+            return {
+                feature: self._to_array([row[feature] for row in data], feature=feature) for feature in self.features
+            }
+        elif isinstance(data, np.ndarray):
+            if data.dtype.names is not None:
+                self._check_missing_features(data.dtype.names)
+                data = data.reshape(-1)
+                return {feature: self._to_array(data[feature], feature=feature) for feature in self.features}
+            if data.ndim == 1:
+                data = data.reshape(1, -1)
+            if data.ndim != 2 or data.shape[1] != len(self.features):
+                raise ValueError(
+                    f"NumPy array input must have shape (num_features,) or (num_rows, num_features) with "
+                    f"num_features={len(self.features)}, but found shape {data.shape}. Expected features: {self.features}"
+                )
+            return {feature: self._to_array(data[:, i], feature=feature) for i, feature in enumerate(self.features)}
+        raise TypeError(
+            f"Unsupported data type: {type(data).__name__}. Valid types: dict, list of dicts, np.ndarray, pd.DataFrame"
+        )
+
+    def _to_array(self, values, feature: str) -> np.ndarray:
+        try:
+            return np.asarray(values, dtype=self._feature_dtypes[feature])
+        except (TypeError, ValueError):
+            # For example, missing values in an int feature. Handled by the feature generators identically to `transform`.
+            return np.asarray(values, dtype="O")
+
+    def _check_missing_features(self, features):
+        features = set(features)
+        missing_features = [feature for feature in self.features if feature not in features]
+        if missing_features:
+            raise KeyError(
+                f"{len(missing_features)} required features are missing from the provided data: {missing_features}"
+            )
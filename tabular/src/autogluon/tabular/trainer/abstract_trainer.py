@@ -43,6 +43,7 @@ from autogluon.core.trainer import AbstractTrainer
 from autogluon.core.trainer.utils import process_hyperparameters
 from autogluon.core.utils import (
     compute_permutation_feature_importance,
+    concat_stack_features,
     convert_pred_probas_to_df,
     default_holdout_frac,
     extract_column,
@@ -64,6 +65,9 @@ from autogluon.core.utils.feature_selection import FeatureSelector
 from autogluon.core.utils.loaders import load_pkl
 from autogluon.core.utils.savers import save_pkl
 
+from .parallel_inference import predict_model_dag_parallel
+from .prediction_cache import PredictionCache, compute_dataset_hash, get_prediction_cache
+
 logger = logging.getLogger(__name__)
 
 
@@ -243,6 +247,12 @@ class AbstractTabularTrainer(AbstractTrainer[AbstractModel]):
         self.callbacks: list[AbstractCallback] = []
         self._callback_early_stop = False
 
+        #: If not None, the CPU budget used to predict with independent models concurrently in `get_model_pred_proba_dict`.
+        self.parallel_inference_num_cpus: int | str | None = None
+
+        #: If not None, caches the predictions of models on repeatedly seen inference data in `get_model_pred_proba_dict`.
+        self.prediction_cache: PredictionCache | None = None
+
     @property
     def _path_attr(self) -> str:
         """Path to cached model graph attributes"""
@@ -1067,15 +1077,17 @@ class AbstractTabularTrainer(AbstractTrainer[AbstractModel]):
             **kwargs,
         )
 
-    def predict(self, X: pd.DataFrame, model: str | None = None) -> np.ndarray:
+    def predict(self, X: pd.DataFrame, model: str | None = None, use_prediction_cache: bool = True) -> np.ndarray:
         if model is None:
             model = self._get_best()
-        return self._predict_model(X=X, model=model)
+        return self._predict_model(X=X, model=model, use_prediction_cache=use_prediction_cache)
 
-    def predict_proba(self, X: pd.DataFrame, model: str | None = None) -> np.ndarray:
+    def predict_proba(
+        self, X: pd.DataFrame, model: str | None = None, use_prediction_cache: bool = True
+    ) -> np.ndarray:
         if model is None:
             model = self._get_best()
-        return self._predict_proba_model(X=X, model=model)
+        return self._predict_proba_model(X=X, model=model, use_prediction_cache=use_prediction_cache)
 
     def _get_best(self) -> str:
         if self.model_best is not None:
@@ -1307,6 +1319,8 @@ class AbstractTabularTrainer(AbstractTrainer[AbstractModel]):
         model_pred_time_dict: dict | None = None,
         record_pred_time: bool = False,
         use_val_cache: bool = False,
+        parallel_num_cpus: int | str | None = None,
+        use_prediction_cache: bool = True,
     ):
         """
         Optimally computes pred_probas (or predictions if regression) for each model in `models`.
@@ -1336,6 +1350,16 @@ class AbstractTabularTrainer(AbstractTrainer[AbstractModel]):
         use_val_cache : bool, default = False
             Whether to fetch cached val prediction probabilities for models instead of predicting on the data.
             Only set to True if X is equal to the validation data and you want to skip live predictions.
+        parallel_num_cpus : int | str | None, default = None
+            If specified, predicts with independent models concurrently on a thread pool using at most `parallel_num_cpus` CPUs,
+            scheduling each model as soon as its dependencies are computed. Each model reserves its `fit_num_cpus` from this budget.
+            If "auto", uses all available CPUs.
+            If None, uses `self.parallel_inference_num_cpus`, which defaults to None (sequential inference).
+        use_prediction_cache : bool, default = True
+            If True and `self.prediction_cache` is enabled (refer to `set_prediction_cache`),
+            models whose predictions on `X` are cached are not predicted on, and new predictions are added to the cache.
+            The marginal inference time of a cached model is the time spent retrieving its predictions from the cache.
+            If False, the prediction cache is neither read nor written for this call only.
 
         Returns
         -------
@@ -1362,27 +1386,137 @@ class AbstractTabularTrainer(AbstractTrainer[AbstractModel]):
             )
             model_pred_order = [model for model in model_pred_order if model in model_set]
 
-        # Compute model predictions in topological order
-        for model_name in model_pred_order:
-            if record_pred_time:
-                time_start = time.time()
+        prediction_cache = self._get_prediction_cache() if use_prediction_cache else None
+        if prediction_cache is not None and model_pred_order:
+            time_start_lookup = time.perf_counter()
+            dataset_hash = compute_dataset_hash(X)
+            model_versions = self._get_model_versions(models=model_pred_order)
+            cached_pred_proba_dict, _ = prediction_cache.get(dataset_hash=dataset_hash, model_versions=model_versions)
+            if cached_pred_proba_dict:
+                model_pred_proba_dict.update(cached_pred_proba_dict)
+                # The inference times stored in the cache were measured by an earlier call, possibly on other hardware
+                # or another batch size, so cached models report the time spent retrieving their predictions instead.
+                time_lookup = (time.perf_counter() - time_start_lookup) / len(cached_pred_proba_dict)
+                for model in cached_pred_proba_dict:
+                    model_pred_time_dict[model] = time_lookup
+                model_pred_order = self._construct_model_pred_order_with_pred_dict(
+                    models, models_to_ignore=list(model_pred_proba_dict.keys())
+                )
+        else:
+            prediction_cache = None
+        # Inference times are always recorded when caching, as they are stored alongside the cached predictions
+        record_pred_time_inner = record_pred_time or prediction_cache is not None
+
+        if parallel_num_cpus is None:
+            parallel_num_cpus = getattr(self, "parallel_inference_num_cpus", None)
+        if parallel_num_cpus == "auto":
+            parallel_num_cpus = ResourceManager.get_cpu_count()
+
+        if parallel_num_cpus is not None and parallel_num_cpus > 1 and len(model_pred_order) > 1:
+            predict_model_dag_parallel(
+                model_pred_order=model_pred_order,
+                model_graph=self.model_graph,
+                predict_func=lambda m: self._predict_proba_model_with_pred_dict(
+                    X=X, model=m, model_pred_proba_dict=model_pred_proba_dict
+                ),
+                model_pred_proba_dict=model_pred_proba_dict,
+                num_cpus=parallel_num_cpus,
+                model_num_cpus=self.get_models_attribute_dict(attribute="fit_num_cpus", models=model_pred_order),
+                model_pred_time_dict=model_pred_time_dict if record_pred_time_inner else None,
+            )
+        else:
+            # Compute model predictions in topological order
+            for model_name in model_pred_order:
+                if record_pred_time_inner:
+                    time_start = time.perf_counter()
+
+                model_pred_proba_dict[model_name] = self._predict_proba_model_with_pred_dict(
+                    X=X, model=model_name, model_pred_proba_dict=model_pred_proba_dict
+                )
 
-            model = self.load_model(model_name=model_name)
-            if isinstance(model, StackerEnsembleModel):
-                preprocess_kwargs = dict(infer=False, model_pred_proba_dict=model_pred_proba_dict)
-                model_pred_proba_dict[model_name] = model.predict_proba(X, **preprocess_kwargs)
-            else:
-                model_pred_proba_dict[model_name] = model.predict_proba(X)
+                if record_pred_time_inner:
+                    time_end = time.perf_counter()
+                    model_pred_time_dict[model_name] = time_end - time_start
 
-            if record_pred_time:
-                time_end = time.time()
-                model_pred_time_dict[model_name] = time_end - time_start
+        if prediction_cache is not None and model_pred_order:
+            prediction_cache.put(
+                dataset_hash=dataset_hash,
+                model_versions={m: model_versions[m] for m in model_pred_order if m in model_versions},
+                model_pred_proba_dict=model_pred_proba_dict,
+                model_pred_time_dict=model_pred_time_dict,
+            )
 
         if record_pred_time:
             return model_pred_proba_dict, model_pred_time_dict
         else:
             return model_pred_proba_dict
 
+    def _predict_proba_model_with_pred_dict(
+        self, X: pd.DataFrame, model: str, model_pred_proba_dict: dict[str, np.ndarray]
+    ) -> np.ndarray:
+        """Returns the pred_proba of `model`. If `model` is a stacker, its base model pred_probas are read from `model_pred_proba_dict`."""
+        model = self.load_model(model_name=model)
+        if isinstance(model, StackerEnsembleModel):
+            preprocess_kwargs = dict(infer=False, model_pred_proba_dict=model_pred_proba_dict)
+            return model.predict_proba(X, **preprocess_kwargs)
+        else:
+            return model.predict_proba(X)
+
+    def set_prediction_cache(
+        self, use_cache: bool = True, max_disk_bytes: int | None = None, max_memory_bytes: int | None = None
+    ):
+        """
+        Enables or disables caching of model predictions in `get_model_pred_proba_dict`.
+        Refer to `autogluon.tabular.trainer.prediction_cache.FileBasedPredictionCache` for details.
+        """
+        if use_cache:
+            self.prediction_cache = get_prediction_cache(
+                use_cache=True,
+                root_path=self._path_prediction_cache,
+                max_disk_bytes=max_disk_bytes,
+                max_memory_bytes=max_memory_bytes,
+            )
+        else:
+            if getattr(self, "prediction_cache", None) is not None:
+                self.prediction_cache.clear()
+            self.prediction_cache = None
+
+    @property
+    def _path_prediction_cache(self) -> str:
+        return os.path.join(self.path_utils, "prediction_cache")
+
+    def _get_prediction_cache(self) -> PredictionCache | None:
+        prediction_cache = getattr(self, "prediction_cache", None)
+        if prediction_cache is not None:
+            # Keep the cache next to the trainer if the predictor was moved or cloned
+            prediction_cache.root_path = Path(self._path_prediction_cache)
+        return prediction_cache
+
+    def _get_model_versions(self, models: list[str]) -> dict[str, str]:
+        """
+        Returns a version string for each model that changes whenever the model artifact or any of its ancestors' artifacts are re-saved,
+        such as after refitting or calibrating. Models whose artifact is not saved to disk are excluded from the output.
+        """
+        model_set = set()
+        for model in models:
+            model_set.update(self.get_minimum_model_set(model))
+        model_file_versions = {}
+        for model in model_set:
+            model_type = self.get_model_attribute(model=model, attribute="type")
+            model_path = os.path.join(self.path, self.get_model_attribute(model=model, attribute="path"))
+            try:
+                stat = os.stat(os.path.join(model_path, model_type.model_file_name))
+            except OSError:
+                continue
+            model_file_versions[model] = f"{model_type.__name__}-{stat.st_mtime_ns}-{stat.st_size}"
+
+        model_versions = {}
+        for model in models:
+            ancestors = sorted(self.get_minimum_model_set(model))
+            if all(m in model_file_versions for m in ancestors):
+                model_versions[model] = "|".join(f"{m}:{model_file_versions[m]}" for m in ancestors)
+        return model_versions
+
     def get_model_oof_dict(self, models: list[str]) -> dict:
         """
         Returns a dictionary of out-of-fold prediction probabilities, keyed by model name
@@ -1450,6 +1584,8 @@ class AbstractTabularTrainer(AbstractTrainer[AbstractModel]):
         -------
         np.ndarray
             model OOF prediction probabilities (if classification) or predictions (if regression)
+            If available, this is a copy-on-write memory map of the OOF file saved next to the model,
+            so rows are only read from disk when accessed and the bagged model itself is not loaded.
         """
         if use_refit_parent and self.get_model_attribute(model=model, attribute="refit_full", default=False):
             model = self.get_model_attribute(model=model, attribute="refit_full_parent")
@@ -1545,7 +1681,14 @@ class AbstractTabularTrainer(AbstractTrainer[AbstractModel]):
             pred_proba_list=pred_proba_list, problem_type=self.problem_type, columns=stack_column_names, index=X.index
         )
         if use_orig_features:
-            X = pd.concat([X_stacker, X], axis=1)
+            if fit:
+                mem_saved_mb = X.memory_usage(index=False, deep=False).sum() / 1e6
+                logger.log(
+                    20,
+                    f"\tAssembled {len(stack_column_names)} stack features from {len(base_models)} base models "
+                    f"without copying the original features ({mem_saved_mb:.1f} MB peak memory saved)",
+                )
+            X = concat_stack_features(X_stacker=X_stacker, X=X)
         else:
             X = X_stacker
         return X
@@ -2147,6 +2290,9 @@ class AbstractTabularTrainer(AbstractTrainer[AbstractModel]):
 
         if child_hyperparameters is None:
             child_hyperparameters = {}
+        warm_start_weights = None
+        if child_hyperparameters.get("fast_mode", False):
+            warm_start_weights = self._get_weighted_ensemble_warm_start_weights(base_model_names=base_model_names)
 
         if save_bag_folds is None:
             can_infer_dict = self.get_models_attribute_dict("can_infer", models=base_model_names)
@@ -2205,7 +2351,10 @@ class AbstractTabularTrainer(AbstractTrainer[AbstractModel]):
             time_limit=time_limit,
             ens_sample_weight=w,
             fit_kwargs=dict(
-                feature_metadata=feature_metadata, num_classes=self.num_classes, groups=None
+                feature_metadata=feature_metadata,
+                num_classes=self.num_classes,
+                groups=None,
+                warm_start_weights=warm_start_weights,
             ),  # FIXME: Is this the right way to do this?
             total_resources=total_resources,
         )
@@ -2221,6 +2370,30 @@ class AbstractTabularTrainer(AbstractTrainer[AbstractModel]):
                         self.model_best = weighted_ensemble_model_name
         return models
 
+    def _get_weighted_ensemble_warm_start_weights(self, base_model_names: list[str]) -> dict[str, float] | None:
+        """
+        Returns the model weights of the most recently fit weighted ensemble that shares base models with `base_model_names`,
+        or None if there is no such weighted ensemble.
+        Refit models are matched to their refit parent, so that weighted ensembles fit after `refit_full` warm start from the original ensemble.
+        """
+        base_model_keys = {
+            model: self.get_model_attribute(model=model, attribute="refit_full_parent", default=model)
+            for model in base_model_names
+        }
+        for model in reversed(self.get_model_names()):
+            model_weights = self.get_model_attribute(model=model, attribute="model_weights", default=None)
+            if model_weights is None:
+                continue
+            warm_start_weights = {}
+            for base_model, key in base_model_keys.items():
+                weight = float(model_weights.get(base_model, model_weights.get(key, 0)))
+                if weight > 0:
+                    warm_start_weights[base_model] = weight
+            if warm_start_weights:
+                logger.log(15, f"Warm starting weighted ensemble from the weights of {model}")
+                return warm_start_weights
+        return None
+
     def _train_single(
         self,
         X: pd.DataFrame,
@@ -2519,6 +2692,14 @@ class AbstractTabularTrainer(AbstractTrainer[AbstractModel]):
             and model._user_params.get("refit_folds", False),
             **fit_metadata,
         )
+        if isinstance(model, WeightedEnsembleModel):
+            # Cached so later weighted ensembles can warm start without loading this model from disk
+            try:
+                model_metadata["model_weights"] = model._get_model_weights()
+            except Exception as e:
+                logger.log(
+                    15, f"Unable to get the model weights of {model.name}, it will not be used to warm start: {e}"
+                )
         return model_metadata
 
     def _add_model(
@@ -3649,15 +3830,30 @@ class AbstractTabularTrainer(AbstractTrainer[AbstractModel]):
             logger.log(30, "Warning: AutoGluon did not successfully train any models")
         return model_names_fit
 
-    def _predict_model(self, X: pd.DataFrame, model: str, model_pred_proba_dict: dict | None = None) -> np.ndarray:
-        y_pred_proba = self._predict_proba_model(X=X, model=model, model_pred_proba_dict=model_pred_proba_dict)
+    def _predict_model(
+        self,
+        X: pd.DataFrame,
+        model: str,
+        model_pred_proba_dict: dict | None = None,
+        use_prediction_cache: bool = True,
+    ) -> np.ndarray:
+        y_pred_proba = self._predict_proba_model(
+            X=X, model=model, model_pred_proba_dict=model_pred_proba_dict, use_prediction_cache=use_prediction_cache
+        )
         return get_pred_from_proba(y_pred_proba=y_pred_proba, problem_type=self.problem_type)
 
     def _predict_proba_model(
-        self, X: pd.DataFrame, model: str, model_pred_proba_dict: dict | None = None
+        self,
+        X: pd.DataFrame,
+        model: str,
+        model_pred_proba_dict: dict | None = None,
+        use_prediction_cache: bool = True,
     ) -> np.ndarray:
         model_pred_proba_dict = self.get_model_pred_proba_dict(
-            X=X, models=[model], model_pred_proba_dict=model_pred_proba_dict
+            X=X,
+            models=[model],
+            model_pred_proba_dict=model_pred_proba_dict,
+            use_prediction_cache=use_prediction_cache,
         )
         if not isinstance(model, str):
             model = model.name
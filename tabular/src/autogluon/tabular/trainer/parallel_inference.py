@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable
+
+import networkx as nx
+import numpy as np
+from threadpoolctl import threadpool_limits
+
+logger = logging.getLogger(__name__)
+
+
+def predict_model_dag_parallel(
+    model_pred_order: list[str],
+    model_graph: nx.DiGraph,
+    predict_func: Callable[[str], np.ndarray],
+    model_pred_proba_dict: dict[str, np.ndarray],
+    num_cpus: int,
+    model_num_cpus: dict[str, int] | None = None,
+    model_pred_time_dict: dict[str, float] | None = None,
+) -> dict[str, np.ndarray]:
+    """
+    Computes the prediction probabilities of every model in `model_pred_order` on a thread pool,
+    scheduling the model dependency graph so that independent models run concurrently.
+
+    A model is dispatched as soon as all of its dependencies in `model_graph` are present in `model_pred_proba_dict`
+    and enough of the `num_cpus` budget is free to run it. Each finished result is immediately stored in `model_pred_proba_dict`,
+    so stacker models start as soon as their own base models finish rather than waiting for the entire previous stack level.
+    Threads are used instead of processes because model inference is dominated by native code that releases the GIL
+    (LightGBM, XGBoost, CatBoost, NumPy, PyTorch), and threads avoid serializing the models and `X`.
+    To avoid oversubscribing the CPU budget, each model predicts with its OpenMP thread count capped
+    to the CPUs reserved for it. The OpenMP limit is local to the worker thread,
+    so concurrently running models do not affect each other.
+
+    Parameters
+    ----------
+    model_pred_order : list[str]
+        The models to predict with, in a valid topological order. Used as the dispatch priority.
+    model_graph : nx.DiGraph
+        The model dependency graph. An edge `A -> B` indicates that `B` requires the predictions of `A`.
+        Dependencies that are not in `model_pred_order` must already be present in `model_pred_proba_dict`.
+    predict_func : Callable[[str], np.ndarray]
+        Function that, given a model name, returns the model's prediction probabilities.
+        Stacker models must read their base model predictions from `model_pred_proba_dict`.
+    model_pred_proba_dict : dict[str, np.ndarray]
+        Dictionary of model name to prediction probabilities. Mutated in-place.
+    num_cpus : int
+        The total CPU budget shared by all concurrently running models.
+    model_num_cpus : dict[str, int], optional
+        The number of CPUs each model requires. Defaults to 1 per model. Values are capped to `num_cpus`.
+        Each model's OpenMP thread count is limited to this value during inference.
+    model_pred_time_dict : dict[str, float], optional
+        If specified, the marginal inference time in seconds of each model is stored in this dictionary. Mutated in-place.
+
+    Returns
+    -------
+    model_pred_proba_dict : dict[str, np.ndarray]
+    """
+    num_cpus = max(int(num_cpus), 1)
+    if model_num_cpus is None:
+        model_num_cpus = dict()
+    model_set = set(model_pred_order)
+    model_priority = {model: i for i, model in enumerate(model_pred_order)}
+    model_cpus = {model: min(max(int(model_num_cpus.get(model) or 1), 1), num_cpus) for model in model_pred_order}
+
+    remaining_dependencies: dict[str, set[str]] = {}
+    for model in model_pred_order:
+        dependencies = {m for m in model_graph.predecessors(model) if m in model_set}
+        missing = [m for m in model_graph.predecessors(model) if m not in model_set and m not in model_pred_proba_dict]
+        if missing:
+            raise AssertionError(
+                f"Model {model} depends on models {missing} which are neither predicted nor precomputed."
+            )
+        remaining_dependencies[model] = dependencies
+
+    ready = [model for model in model_pred_order if not remaining_dependencies[model]]
+    cpus_available = num_cpus
+    futures: dict[Future, str] = {}
+
+    def _predict(model_name: str) -> tuple[np.ndarray, float]:
+        # Only limit OpenMP: its thread count is a per-thread setting, whereas BLAS limits are process-wide.
+        with threadpool_limits(limits=model_cpus[model_name], user_api="openmp"):
+            time_start = time.perf_counter()
+            y_pred_proba = predict_func(model_name)
+        return y_pred_proba, time.perf_counter() - time_start
+
+    with ThreadPoolExecutor(max_workers=min(num_cpus, len(model_pred_order)) or 1) as executor:
+        while ready or futures:
+            # Dispatch ready models in priority order while CPU budget remains.
+            # A model is always dispatched when nothing is running to guarantee progress.
+            ready.sort(key=lambda m: model_priority[m])
+            not_dispatched = []
+            for model in ready:
+                if model_cpus[model] <= cpus_available or not futures:
+                    cpus_available -= model_cpus[model]
+                    futures[executor.submit(_predict, model)] = model
+                else:
+                    not_dispatched.append(model)
+            ready = not_dispatched
+
+            done, _ = wait(list(futures.keys()), return_when=FIRST_COMPLETED)
+            for future in done:
+                model = futures.pop(future)
+                cpus_available += model_cpus[model]
+                try:
+                    y_pred_proba, pred_time = future.result()
+                except Exception:
+                    for pending in futures:
+                        pending.cancel()
+                    raise
+                model_pred_proba_dict[model] = y_pred_proba
+                if model_pred_time_dict is not None:
+                    model_pred_time_dict[model] = pred_time
+                for successor in model_graph.successors(model):
+                    if successor in remaining_dependencies and model in remaining_dependencies[successor]:
+                        remaining_dependencies[successor].remove(model)
+                        if not remaining_dependencies[successor]:
+                            ready.append(successor)
+    return model_pred_proba_dict
@@ -0,0 +1,290 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import pickle
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from hashlib import md5
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+class PredictionCache(ABC):
+    """
+    A prediction cache is a key-value store for tabular model prediction probabilities.
+    Entries are keyed by (dataset_hash, model_name, model_version) and store a (pred_proba, pred_time) pair,
+    where `dataset_hash` identifies the transformed input data (see `compute_dataset_hash`) and `model_version`
+    identifies the fitted state of the model, so that refitting or calibrating a model invalidates its entries.
+    """
+
+    def __init__(self, root_path: str):
+        self.root_path = Path(root_path)
+
+    @abstractmethod
+    def get(self, dataset_hash: str, model_versions: dict[str, str]) -> tuple[dict[str, np.ndarray], dict[str, float]]:
+        """
+        Returns the (model_pred_proba_dict, model_pred_time_dict) of all models in `model_versions` that are cached.
+        Models that are not cached are absent from the output.
+        """
+
+    @abstractmethod
+    def put(
+        self,
+        dataset_hash: str,
+        model_versions: dict[str, str],
+        model_pred_proba_dict: dict[str, np.ndarray],
+        model_pred_time_dict: dict[str, float] | None = None,
+    ) -> None:
+        """Stores the prediction probabilities of all models in `model_versions` that are present in `model_pred_proba_dict`."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        pass
+
+
+def get_prediction_cache(
+    use_cache: bool,
+    root_path: str,
+    max_disk_bytes: int | None = None,
+    max_memory_bytes: int | None = None,
+) -> PredictionCache:
+    if use_cache:
+        return FileBasedPredictionCache(
+            root_path=root_path, max_disk_bytes=max_disk_bytes, max_memory_bytes=max_memory_bytes
+        )
+    else:
+        return NoOpPredictionCache(root_path=root_path)
+
+
+def compute_dataset_hash(X: pd.DataFrame) -> str:
+    """
+    Compute a unique string that identifies the (transformed) input data.
+    Unlike `autogluon.common.utils.utils.hash_pandas_df`, this avoids copying `X` and accounts for column names, column order and dtypes.
+    """
+    hasher = md5()
+    hasher.update(str(X.shape).encode("utf-8"))
+    hasher.update(str(list(X.columns)).encode("utf-8"))
+    hasher.update(str(list(X.dtypes)).encode("utf-8"))
+    hasher.update(pd.util.hash_pandas_object(X, index=True).values.tobytes())
+    return hasher.hexdigest()
+
+
+class NoOpPredictionCache(PredictionCache):
+    """A dummy (no-op) prediction cache."""
+
+    def get(self, dataset_hash: str, model_versions: dict[str, str]) -> tuple[dict[str, np.ndarray], dict[str, float]]:
+        return {}, {}
+
+    def put(
+        self,
+        dataset_hash: str,
+        model_versions: dict[str, str],
+        model_pred_proba_dict: dict[str, np.ndarray],
+        model_pred_time_dict: dict[str, float] | None = None,
+    ) -> None:
+        pass
+
+    def clear(self) -> None:
+        pass
+
+
+class FileBasedPredictionCache(PredictionCache):
+    """
+    A disk-backed cache of model prediction probabilities with an in-memory tier.
+
+    Each entry is stored as its own `.npy` file, so reads and writes only touch the requested models.
+    An index file tracks the size, inference time and last access time of every entry.
+    When the total size of the entries exceeds `max_disk_bytes`, the least recently used entries are evicted.
+    The most recently used entries are additionally kept in memory, up to `max_memory_bytes`.
+
+    Parameters
+    ----------
+    root_path : str
+        Directory the cache files are stored in.
+    max_disk_bytes : int, optional
+        Maximum total size of the cached prediction files. If None, defaults to 2 GB.
+    max_memory_bytes : int, optional
+        Maximum total size of the in-memory tier. If None, defaults to 256 MB. If 0, the in-memory tier is disabled.
+    """
+
+    _index_filename = "index.json"
+    default_max_disk_bytes = 2 * 1024**3
+    default_max_memory_bytes = 256 * 1024**2
+
+    def __init__(self, root_path: str, max_disk_bytes: int | None = None, max_memory_bytes: int | None = None):
+        super().__init__(root_path=root_path)
+        self.max_disk_bytes = max_disk_bytes if max_disk_bytes is not None else self.default_max_disk_bytes
+        self.max_memory_bytes = max_memory_bytes if max_memory_bytes is not None else self.default_max_memory_bytes
+        self._memory: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._memory_bytes = 0
+        self._index: dict[str, dict] | None = None
+        self.num_hits = 0
+        self.num_misses = 0
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # The in-memory tier and the index are reconstructed from disk on first use
+        state["_memory"] = OrderedDict()
+        state["_memory_bytes"] = 0
+        state["_index"] = None
+        return state
+
+    @property
+    def path_index(self) -> Path:
+        return self.root_path / self._index_filename
+
+    @staticmethod
+    def _get_key(dataset_hash: str, model: str, model_version: str) -> str:
+        return md5(f"{dataset_hash}|{model}|{model_version}".encode("utf-8")).hexdigest()
+
+    def _path_entry(self, key: str) -> Path:
+        return self.root_path / f"{key}.npy"
+
+    def get(self, dataset_hash: str, model_versions: dict[str, str]) -> tuple[dict[str, np.ndarray], dict[str, float]]:
+        index = self._load_index()
+        model_pred_proba_dict = {}
+        model_pred_time_dict = {}
+        time_now = time.time()
+        for model, model_version in model_versions.items():
+            key = self._get_key(dataset_hash, model, model_version)
+            entry = index.get(key)
+            if entry is None:
+                self.num_misses += 1
+                continue
+            y_pred_proba = self._memory.get(key)
+            if y_pred_proba is not None:
+                self._memory.move_to_end(key)
+                # Copy to ensure in-place modifications by the caller do not corrupt the cache
+                y_pred_proba = y_pred_proba.copy()
+            else:
+                try:
+                    y_pred_proba = np.load(self._path_entry(key), allow_pickle=False)
+                except (OSError, ValueError, pickle.UnpicklingError):
+                    logger.warning(
+                        f"Cached predictions of model {model} are corrupted. Predictions will be made from scratch."
+                    )
+                    self._remove_entry(index=index, key=key)
+                    self.num_misses += 1
+                    continue
+                self._add_to_memory(key=key, y_pred_proba=y_pred_proba.copy())
+            entry["last_access"] = time_now
+            model_pred_proba_dict[model] = y_pred_proba
+            model_pred_time_dict[model] = entry["pred_time"]
+            self.num_hits += 1
+        if model_pred_proba_dict:
+            self._save_index(index)
+        return model_pred_proba_dict, model_pred_time_dict
+
+    def put(
+        self,
+        dataset_hash: str,
+        model_versions: dict[str, str],
+        model_pred_proba_dict: dict[str, np.ndarray],
+        model_pred_time_dict: dict[str, float] | None = None,
+    ) -> None:
+        index = self._load_index()
+        self.root_path.mkdir(parents=True, exist_ok=True)
+        time_now = time.time()
+        updated = False
+        for model, model_version in model_versions.items():
+            y_pred_proba = model_pred_proba_dict.get(model)
+            if y_pred_proba is None:
+                continue
+            key = self._get_key(dataset_hash, model, model_version)
+            if key in index:
+                continue
+            if isinstance(y_pred_proba, (pd.DataFrame, pd.Series)):
+                y_pred_proba = y_pred_proba.to_numpy()
+            if y_pred_proba.dtype == object:
+                # Only plain numeric arrays are cached
+                continue
+            path_entry = self._path_entry(key)
+            path_tmp = path_entry.with_suffix(".tmp.npy")
+            np.save(path_tmp, y_pred_proba, allow_pickle=False)
+            os.replace(path_tmp, path_entry)
+            pred_time = None if model_pred_time_dict is None else model_pred_time_dict.get(model)
+            index[key] = {
+                "model": model,
+                "size": int(path_entry.stat().st_size),
+                "pred_time": pred_time,
+                "last_access": time_now,
+            }
+            self._add_to_memory(key=key, y_pred_proba=y_pred_proba.copy())
+            updated = True
+        if updated:
+            self._evict(index)
+            self._save_index(index)
+
+    def clear(self) -> None:
+        index = self._load_index()
+        for key in list(index.keys()):
+            self._remove_entry(index=index, key=key)
+        if self.path_index.exists():
+            logger.debug(f"Removing existing cached predictions index {self.path_index}")
+            self.path_index.unlink()
+        self._index = {}
+
+    @property
+    def disk_bytes(self) -> int:
+        return sum(entry["size"] for entry in self._load_index().values())
+
+    def _add_to_memory(self, key: str, y_pred_proba: np.ndarray):
+        if self.max_memory_bytes <= 0 or y_pred_proba.nbytes > self.max_memory_bytes:
+            return
+        if key in self._memory:
+            return
+        self._memory[key] = y_pred_proba
+        self._memory_bytes += y_pred_proba.nbytes
+        while self._memory_bytes > self.max_memory_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= evicted.nbytes
+
+    def _evict(self, index: dict[str, dict]):
+        """Removes least recently used entries until the cache fits in `max_disk_bytes`"""
+        total_bytes = sum(entry["size"] for entry in index.values())
+        if total_bytes <= self.max_disk_bytes:
+            return
+        keys_by_last_access = sorted(index.keys(), key=lambda k: index[k]["last_access"])
+        for key in keys_by_last_access:
+            if total_bytes <= self.max_disk_bytes:
+                break
+            total_bytes -= index[key]["size"]
+            logger.debug(f"Evicting cached predictions of model {index[key]['model']}")
+            self._remove_entry(index=index, key=key)
+
+    def _remove_entry(self, index: dict[str, dict], key: str):
+        index.pop(key, None)
+        y_pred_proba = self._memory.pop(key, None)
+        if y_pred_proba is not None:
+            self._memory_bytes -= y_pred_proba.nbytes
+        path_entry = self._path_entry(key)
+        if path_entry.exists():
+            path_entry.unlink()
+
+    def _load_index(self) -> dict[str, dict]:
+        if self._index is None:
+            index = {}
+            if self.path_index.exists():
+                try:
+                    with open(self.path_index) as f:
+                        index = json.load(f)
+                except (OSError, ValueError):
+                    logger.warning("Cached predictions index is corrupted. Predictions will be made from scratch.")
+                    index = {}
+            self._index = index
+        return self._index
+
+    def _save_index(self, index: dict[str, dict]):
+        self.root_path.mkdir(parents=True, exist_ok=True)
+        path_tmp = self.path_index.with_suffix(".tmp")
+        with open(path_tmp, "w") as f:
+            json.dump(index, f)
+        os.replace(path_tmp, self.path_index)
+        self._index = index
@@ -0,0 +1,104 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from autogluon.features.generators import AutoMLPipelineFeatureGenerator
+from autogluon.tabular import TabularPredictor
+from autogluon.tabular.learner import DefaultLearner
+from autogluon.tabular.learner.feature_cache import FeatureGeneratorCache
+from autogluon.tabular.testing import FitHelper
+
+
+def _generate_data(num_rows: int = 200, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.RandomState(seed)
+    return pd.DataFrame(
+        {
+            "float": rng.randn(num_rows),
+            "int": rng.randint(0, 100, num_rows),
+            "cat": rng.choice(["a", "b", "c", None], num_rows),
+            "bool": rng.choice(["yes", "no"], num_rows),
+            "text": [" ".join(rng.choice(["good", "bad", "great", "awful", "fine"], 6)) for _ in range(num_rows)],
+        }
+    )
+
+
+def test_feature_cache_get_put_restores_fitted_generator_and_dtypes(tmp_path):
+    X = _generate_data()
+    y = pd.Series(np.arange(len(X)) % 2)
+    cache = FeatureGeneratorCache(root_path=str(tmp_path))
+    feature_generator = AutoMLPipelineFeatureGenerator(text_ngram_params={"sparse": True}, verbosity=0)
+    key = cache.compute_key(X, y, feature_generator, label="label")
+
+    assert key == cache.compute_key(
+        X.copy(),
+        y.copy(),
+        AutoMLPipelineFeatureGenerator(text_ngram_params={"sparse": True}, verbosity=0),
+        label="label",
+    )
+    assert key != cache.compute_key(X, y, AutoMLPipelineFeatureGenerator(verbosity=0), label="label")
+    assert key != cache.compute_key(X, y, feature_generator, label="other_label")
+    assert key != cache.compute_key(X.iloc[1:], y.iloc[1:], feature_generator, label="label")
+    assert cache.get(key) is None
+
+    X_out = feature_generator.fit_transform(X, y)
+    assert any(isinstance(dtype, pd.SparseDtype) for dtype in X_out.dtypes)
+    assert cache.put(key, feature_generator, X_out)
+
+    # Reload from disk to verify persistence
+    cache = FeatureGeneratorCache(root_path=str(tmp_path))
+    feature_generator_cached, X_out_cached = cache.get(key)
+    pd.testing.assert_frame_equal(X_out_cached, X_out)
+    pd.testing.assert_frame_equal(feature_generator_cached.transform(X), X_out)
+    assert cache.num_hits == 1
+
+    cache.clear()
+    assert cache.get(key) is None
+
+
+def test_feature_cache_lru_eviction(tmp_path):
+    X = pd.DataFrame({"a": np.zeros(1000)})
+    cache = FeatureGeneratorCache(root_path=str(tmp_path))
+    cache.put("A", None, X)
+    entry_size = cache.disk_bytes
+    cache.max_disk_bytes = 2 * entry_size
+    cache.put("B", None, X)
+    # Make B the least recently used entry, regardless of the file system timestamp resolution
+    os.utime(tmp_path / "B", (0, 0))
+    cache.get("A")
+    cache.put("C", None, X)
+    assert cache.get("A") is not None
+    assert cache.get("B") is None
+    assert cache.get("C") is not None
+    assert cache.disk_bytes <= 2 * entry_size
+
+
+def test_predictor_fit_with_feature_cache_skips_feature_generator_fit(tmp_path, monkeypatch):
+    train_data, test_data, dataset_info = FitHelper.load_dataset("toy_binary_10")
+    fit_kwargs = dict(hyperparameters={"GBM": {"num_boost_round": 10}}, feature_cache=str(tmp_path / "feature_cache"))
+    predictor = TabularPredictor(label=dataset_info["label"], path=str(tmp_path / "p1")).fit(train_data, **fit_kwargs)
+    X_transformed_expected = predictor.transform_features(test_data)
+    pred_proba_expected = predictor.predict_proba(test_data)
+
+    def _fit_transform_features(*args, **kwargs):
+        raise AssertionError("The feature generator must be loaded from the feature cache")
+
+    monkeypatch.setattr(DefaultLearner, "fit_transform_features", _fit_transform_features)
+    predictor = TabularPredictor(label=dataset_info["label"], path=str(tmp_path / "p2")).fit(train_data, **fit_kwargs)
+
+    pd.testing.assert_frame_equal(predictor.transform_features(test_data), X_transformed_expected)
+    pd.testing.assert_frame_equal(predictor.predict_proba(test_data), pred_proba_expected)
+
+
+def test_predictor_fit_with_different_preprocessing_time_limit_does_not_reuse_feature_cache(tmp_path):
+    train_data, _, dataset_info = FitHelper.load_dataset("toy_binary_10")
+    path_cache = tmp_path / "feature_cache"
+    for i, time_limit_preprocessing in enumerate([100, 200]):
+        TabularPredictor(label=dataset_info["label"], path=str(tmp_path / f"p{i}")).fit(
+            train_data,
+            hyperparameters={"GBM": {"num_boost_round": 10}},
+            feature_cache=str(path_cache),
+            time_limit_preprocessing=time_limit_preprocessing,
+        )
+
+    assert len(FeatureGeneratorCache(root_path=str(path_cache))._get_entries()) == 2
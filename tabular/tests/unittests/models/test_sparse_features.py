@@ -0,0 +1,66 @@
+import shutil
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from autogluon.features.generators import AutoMLPipelineFeatureGenerator
+from autogluon.tabular import TabularPredictor
+
+
+def _generate_text_data(num_rows: int = 600, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.RandomState(seed)
+    words = np.array(["good", "bad", "great", "awful"] + [f"w{i}" for i in range(50)])
+    data = pd.DataFrame(
+        {
+            "text": [" ".join(rng.choice(words, rng.randint(3, 15))) for _ in range(num_rows)],
+            "float": rng.randn(num_rows),
+            "cat": rng.choice(["a", "b", "c"], num_rows),
+        }
+    )
+    score = data["text"].str.count("good|great") - data["text"].str.count("bad|awful") + data["float"] * 0.3
+    data["label"] = np.where(score > 0, "pos", "neg")
+    return data
+
+
+@pytest.mark.parametrize(
+    "hyperparameters",
+    [
+        {"GBM": {"num_boost_round": 20}},
+        {"XGB": {"n_estimators": 20}},
+        {"CAT": {"iterations": 20}},
+        {"LR": {}},
+    ],
+)
+def test_when_text_ngram_features_are_sparse_then_models_fit_and_predict(hyperparameters):
+    data = _generate_text_data()
+    train_data, test_data = data.iloc[:450], data.iloc[450:]
+    feature_generator = AutoMLPipelineFeatureGenerator(text_ngram_params={"sparse": True}, verbosity=0)
+    predictor = TabularPredictor(label="label").fit(
+        train_data, hyperparameters=hyperparameters, feature_generator=feature_generator
+    )
+
+    X_transformed = predictor.transform_features(test_data)
+    sparse_features = [c for c, dtype in X_transformed.dtypes.items() if isinstance(dtype, pd.SparseDtype)]
+    assert len(sparse_features) > 10
+
+    y_pred = predictor.predict(test_data)
+    assert (y_pred == test_data["label"]).mean() > 0.7
+    shutil.rmtree(predictor.path, ignore_errors=True)
+
+
+def test_when_features_are_sparse_then_lightgbm_uses_csr_input_with_identical_predictions():
+    data = _generate_text_data()
+    train_data, test_data = data.iloc[:450], data.iloc[450:]
+    predictions = []
+    for sparse in [False, True]:
+        feature_generator = AutoMLPipelineFeatureGenerator(text_ngram_params={"sparse": sparse}, verbosity=0)
+        predictor = TabularPredictor(label="label").fit(
+            train_data, hyperparameters={"GBM": {"num_boost_round": 20}}, feature_generator=feature_generator
+        )
+        model = predictor._trainer.load_model("LightGBM")
+        assert (model._sparse_dtype is not None) == sparse
+        predictions.append(predictor.predict_proba(test_data).to_numpy())
+        shutil.rmtree(predictor.path, ignore_errors=True)
+
+    assert np.allclose(predictions[0], predictions[1], atol=1e-2)
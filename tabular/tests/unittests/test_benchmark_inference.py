@@ -0,0 +1,56 @@
+import json
+import shutil
+
+import pandas as pd
+
+from autogluon.tabular import TabularPredictor
+from autogluon.tabular.testing import FitHelper
+
+
+def test_benchmark_inference(tmp_path, monkeypatch):
+    train_data, test_data, dataset_info = FitHelper.load_dataset("toy_binary_10")
+    predictor = TabularPredictor(label=dataset_info["label"], problem_type=dataset_info["problem_type"]).fit(
+        train_data,
+        hyperparameters={"GBM": {"num_boost_round": 10}, "DUMMY": {}},
+    )
+    predictor.persist(models=["LightGBM"], with_ancestors=False)
+    predictor.set_prediction_cache()
+    predictor._trainer.parallel_inference_num_cpus = 2
+    models = predictor.model_names(can_infer=True)
+
+    def _predict_model_dag_parallel(*args, **kwargs):
+        raise AssertionError("Parallel DAG inference must be disabled while benchmarking")
+
+    monkeypatch.setattr(
+        "autogluon.tabular.trainer.abstract_trainer.predict_model_dag_parallel", _predict_model_dag_parallel
+    )
+    get_model_pred_proba_dict_og = predictor._trainer.get_model_pred_proba_dict
+
+    def _get_model_pred_proba_dict(*args, **kwargs):
+        # The settings are disabled per call, so concurrent callers of the predictor are unaffected while benchmarking
+        assert predictor._trainer.parallel_inference_num_cpus == 2
+        assert predictor._trainer.prediction_cache is not None
+        return get_model_pred_proba_dict_og(*args, **kwargs)
+
+    monkeypatch.setattr(predictor._trainer, "get_model_pred_proba_dict", _get_model_pred_proba_dict)
+    path_report = str(tmp_path / "report.json")
+
+    report = predictor.benchmark_inference(test_data, batch_sizes=[1, 50], repeats=3, path=path_report)
+
+    results = pd.DataFrame(report["results"])
+    assert len(results) == 2 * 2 * (len(models) + 1)
+    assert set(results["name"]) == set(models) | {"transform_features"}
+    assert (results["latency_p50"] <= results["latency_p99"]).all()
+    assert (results["throughput"] > 0).all()
+    results_model = results[results["stage"] == "model"]
+    assert (results_model["latency_marginal_p50"] <= results_model["latency_p50"] + 1e-9).all()
+    assert report["metadata"]["batch_sizes"] == [1, 50]
+    with open(path_report) as f:
+        assert json.load(f) == report
+
+    # The predictor state is unchanged after benchmarking
+    assert list(predictor._trainer.models.keys()) == ["LightGBM"]
+    assert predictor._trainer.prediction_cache is not None
+    assert predictor._trainer.prediction_cache.num_hits == 0
+    assert predictor._trainer.parallel_inference_num_cpus == 2
+    shutil.rmtree(predictor.path, ignore_errors=True)
@@ -0,0 +1,86 @@
+import shutil
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from autogluon.tabular import TabularPredictor
+
+
+def _generate_data(num_rows: int, seed: int) -> pd.DataFrame:
+    rng = np.random.RandomState(seed)
+    data = pd.DataFrame(
+        {
+            "float": rng.randn(num_rows),
+            "int": rng.randint(0, 10, num_rows),
+            "cat": rng.choice(["a", "b", "c", None], num_rows),
+        }
+    )
+    data["label"] = np.array(["x", "y", "z"])[(data["int"] + (data["cat"] == "a")) % 3]
+    return data
+
+
+@pytest.fixture(scope="module")
+def fitted_predictor():
+    train_data = _generate_data(num_rows=500, seed=0)
+    test_data = _generate_data(num_rows=1000, seed=1).drop(columns=["label"])
+    test_data["id"] = np.arange(len(test_data)) * 10
+    predictor = TabularPredictor(label="label", problem_type="multiclass").fit(
+        train_data,
+        hyperparameters={"GBM": {"num_boost_round": 10}, "DUMMY": {}},
+    )
+    yield predictor, test_data
+    shutil.rmtree(predictor.path, ignore_errors=True)
+
+
+@pytest.mark.parametrize("data_format", ["dataframe", "iterator", "csv", "parquet"])
+@pytest.mark.parametrize("num_workers", [1, 3])
+def test_predict_chunked_is_identical_to_predict(fitted_predictor, tmp_path, data_format, num_workers):
+    predictor, test_data = fitted_predictor
+    test_data_chunked = test_data
+    if data_format == "iterator":
+        test_data_chunked = (test_data.iloc[i : i + 300] for i in range(0, len(test_data), 300))
+    elif data_format == "csv":
+        test_data_chunked = str(tmp_path / "test.csv")
+        test_data.to_csv(test_data_chunked, index=False)
+        test_data = pd.read_csv(test_data_chunked)
+    elif data_format == "parquet":
+        test_data_chunked = str(tmp_path / "test.parquet")
+        test_data.to_parquet(test_data_chunked, index=False, row_group_size=250)
+
+    y_pred_chunks = list(predictor.predict_chunked(test_data_chunked, chunk_size=128, num_workers=num_workers))
+
+    assert max(len(y_pred) for y_pred in y_pred_chunks) == 128
+    pd.testing.assert_series_equal(pd.concat(y_pred_chunks), predictor.predict(test_data))
+    assert list(predictor._trainer.models.keys()) == []
+
+
+def test_predict_proba_chunked_to_parquet(fitted_predictor, tmp_path):
+    predictor, test_data = fitted_predictor
+    path_data = str(tmp_path / "test.csv")
+    path_output = str(tmp_path / "output" / "pred_proba.parquet")
+    test_data.to_csv(path_data, index=False)
+
+    output = predictor.predict_proba_chunked(path_data, output_path=path_output, chunk_size=100, keep_columns=["id"])
+
+    assert output == path_output
+    y_pred_proba = pd.read_parquet(path_output)
+    y_pred_proba_expected = predictor.predict_proba(pd.read_csv(path_data))
+    assert list(y_pred_proba.columns) == ["id"] + [str(c) for c in predictor.class_labels]
+    assert np.array_equal(y_pred_proba["id"].to_numpy(), test_data["id"].to_numpy())
+    assert np.allclose(y_pred_proba.drop(columns=["id"]).to_numpy(), y_pred_proba_expected.to_numpy())
+
+
+def test_when_predict_chunked_generator_is_partially_consumed_then_predictor_state_is_unchanged(fitted_predictor):
+    predictor, test_data = fitted_predictor
+    prediction_cache_og = predictor._trainer.prediction_cache
+    prediction_cache = object()
+    predictor._trainer.prediction_cache = prediction_cache
+    try:
+        y_pred_chunks = predictor.predict_chunked(test_data, chunk_size=128)
+        next(y_pred_chunks)
+
+        assert predictor._trainer.prediction_cache is prediction_cache
+        assert list(predictor._trainer.models.keys()) == []
+    finally:
+        predictor._trainer.prediction_cache = prediction_cache_og
@@ -0,0 +1,81 @@
+import shutil
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from autogluon.tabular import TabularPredictor
+
+
+def _generate_data(problem_type: str, num_rows: int = 200, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.RandomState(seed)
+    data = pd.DataFrame(
+        {
+            "float": rng.randn(num_rows),
+            "int": rng.randint(0, 10, num_rows),
+            "cat": rng.choice(["a", "b", "c", None], num_rows),
+            "bool_str": rng.choice(["yes", "no"], num_rows),
+            "datetime": pd.to_datetime("2020-01-01") + pd.to_timedelta(rng.randint(0, 1000, num_rows), unit="D"),
+        }
+    )
+    if problem_type == "binary":
+        data["label"] = np.where(data["float"] + (data["cat"] == "a") > 0.5, "pos", "neg")
+    elif problem_type == "multiclass":
+        data["label"] = np.array(["x", "y", "z"])[data["int"] % 3]
+    else:
+        data["label"] = data["float"] * 3 + data["int"]
+    return data
+
+
+@pytest.mark.parametrize("problem_type", ["binary", "multiclass", "regression"])
+def test_serving_predictor_predictions_are_identical(problem_type):
+    train_data = _generate_data(problem_type=problem_type)
+    test_data = _generate_data(problem_type=problem_type, num_rows=20, seed=1).drop(columns=["label"])
+    test_data.loc[0, "cat"] = "unseen"
+    test_data.loc[1, "bool_str"] = None
+    predictor = TabularPredictor(label="label", problem_type=problem_type).fit(
+        train_data,
+        hyperparameters={"GBM": {"num_boost_round": 10}, "DUMMY": {}},
+        fit_weighted_ensemble=True,
+    )
+    serving_predictor = predictor.get_serving_predictor()
+    assert serving_predictor.model == predictor.model_best
+    assert serving_predictor.uses_transform_arrays
+
+    y_pred = predictor.predict(test_data).to_numpy()
+    if predictor.can_predict_proba:
+        y_pred_proba = predictor.predict_proba(test_data, as_pandas=False)
+    else:
+        y_pred_proba = predictor.predict(test_data, as_pandas=False)
+
+    records = test_data.to_dict(orient="records")
+    for data in [test_data, records, test_data.to_dict(orient="list")]:
+        assert np.array_equal(serving_predictor.predict(data), y_pred)
+        assert np.allclose(serving_predictor.predict_proba(data), y_pred_proba)
+    for i, record in enumerate(records[:5]):
+        assert np.array_equal(serving_predictor.predict(record), y_pred[[i]])
+        row = np.array([record[feature] for feature in serving_predictor.features], dtype=object)
+        assert np.allclose(serving_predictor.predict_proba(row), y_pred_proba[[i]])
+
+    with pytest.raises(KeyError):
+        serving_predictor.predict({"float": 1.0})
+    shutil.rmtree(predictor.path, ignore_errors=True)
+
+
+def test_serving_predictor_with_model_and_decision_threshold():
+    train_data = _generate_data(problem_type="binary")
+    test_data = _generate_data(problem_type="binary", num_rows=20, seed=1).drop(columns=["label"])
+    predictor = TabularPredictor(label="label", problem_type="binary").fit(
+        train_data, hyperparameters={"GBM": {"num_boost_round": 10}, "DUMMY": {}}
+    )
+    predictor.set_decision_threshold(0.3)
+
+    serving_predictor = predictor.get_serving_predictor(model="LightGBM")
+
+    assert np.array_equal(
+        serving_predictor.predict(test_data), predictor.predict(test_data, model="LightGBM").to_numpy()
+    )
+    assert "LightGBM" in predictor._trainer.models
+    with pytest.raises(ValueError):
+        predictor.get_serving_predictor(model="unknown_model")
+    shutil.rmtree(predictor.path, ignore_errors=True)
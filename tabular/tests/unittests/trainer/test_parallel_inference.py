@@ -0,0 +1,145 @@
+import shutil
+import threading
+import time
+
+import networkx as nx
+import numpy as np
+import pytest
+from threadpoolctl import threadpool_info, threadpool_limits
+
+from autogluon.tabular import TabularPredictor
+from autogluon.tabular.testing import FitHelper
+from autogluon.tabular.trainer.parallel_inference import predict_model_dag_parallel
+
+
+def _make_graph() -> nx.DiGraph:
+    graph = nx.DiGraph()
+    graph.add_nodes_from(["A", "B", "C", "S1", "S2"])
+    graph.add_edges_from([("A", "S1"), ("B", "S1"), ("C", "S2"), ("S1", "S2")])
+    return graph
+
+
+def test_predict_model_dag_parallel_respects_dependencies():
+    graph = _make_graph()
+    lock = threading.Lock()
+    finished = []
+    max_concurrent = [0]
+    running = [0]
+
+    def predict_func(model):
+        with lock:
+            running[0] += 1
+            max_concurrent[0] = max(max_concurrent[0], running[0])
+        for dependency in graph.predecessors(model):
+            assert dependency in model_pred_proba_dict
+        time.sleep(0.05)
+        with lock:
+            running[0] -= 1
+            finished.append(model)
+        return np.array([len(model)])
+
+    model_pred_proba_dict = {}
+    model_pred_time_dict = {}
+    predict_model_dag_parallel(
+        model_pred_order=["A", "B", "C", "S1", "S2"],
+        model_graph=graph,
+        predict_func=predict_func,
+        model_pred_proba_dict=model_pred_proba_dict,
+        num_cpus=4,
+        model_pred_time_dict=model_pred_time_dict,
+    )
+    assert set(model_pred_proba_dict.keys()) == {"A", "B", "C", "S1", "S2"}
+    assert set(model_pred_time_dict.keys()) == {"A", "B", "C", "S1", "S2"}
+    assert max_concurrent[0] >= 3
+    assert finished[-1] == "S2"
+
+
+def test_predict_model_dag_parallel_respects_num_cpus():
+    graph = _make_graph()
+    lock = threading.Lock()
+    max_concurrent = [0]
+    running = [0]
+
+    def predict_func(model):
+        with lock:
+            running[0] += 1
+            max_concurrent[0] = max(max_concurrent[0], running[0])
+        time.sleep(0.02)
+        with lock:
+            running[0] -= 1
+        return np.array([0])
+
+    predict_model_dag_parallel(
+        model_pred_order=["A", "B", "C", "S1", "S2"],
+        model_graph=graph,
+        predict_func=predict_func,
+        model_pred_proba_dict={},
+        num_cpus=4,
+        model_num_cpus={"A": 2, "B": 2, "C": 2},
+    )
+    assert max_concurrent[0] <= 2
+
+
+def test_predict_model_dag_parallel_caps_openmp_threads_to_model_num_cpus():
+    graph = _make_graph()
+    model_num_cpus = {"A": 1, "B": 2, "C": 1, "S1": 2, "S2": 1}
+    openmp_num_threads = {}
+
+    def predict_func(model):
+        openmp_num_threads[model] = [info["num_threads"] for info in threadpool_info() if info["user_api"] == "openmp"]
+        return np.array([0])
+
+    with threadpool_limits(limits=4, user_api="openmp"):
+        predict_model_dag_parallel(
+            model_pred_order=["A", "B", "C", "S1", "S2"],
+            model_graph=graph,
+            predict_func=predict_func,
+            model_pred_proba_dict={},
+            num_cpus=4,
+            model_num_cpus=model_num_cpus,
+        )
+    for model, num_threads in openmp_num_threads.items():
+        assert all(n <= model_num_cpus[model] for n in num_threads)
+
+
+def test_predict_model_dag_parallel_raises_model_exception():
+    graph = _make_graph()
+
+    def predict_func(model):
+        if model == "B":
+            raise ValueError("failed")
+        return np.array([0])
+
+    with pytest.raises(ValueError, match="failed"):
+        predict_model_dag_parallel(
+            model_pred_order=["A", "B", "C", "S1", "S2"],
+            model_graph=graph,
+            predict_func=predict_func,
+            model_pred_proba_dict={},
+            num_cpus=2,
+        )
+
+
+def test_parallel_inference_identical_to_sequential():
+    train_data, test_data, dataset_info = FitHelper.load_dataset("toy_multiclass_30")
+    predictor = TabularPredictor(label=dataset_info["label"], problem_type=dataset_info["problem_type"]).fit(
+        train_data,
+        hyperparameters={"GBM": {"num_boost_round": 10}, "RF": {"n_estimators": 5}, "KNN": {}},
+        num_bag_folds=2,
+        num_stack_levels=1,
+    )
+    pred_proba_multi_sequential = predictor.predict_proba_multi(test_data)
+    leaderboard_sequential = predictor.leaderboard(test_data)
+
+    predictor.set_parallel_inference(num_cpus=4)
+    pred_proba_multi_parallel = predictor.predict_proba_multi(test_data)
+    leaderboard_parallel = predictor.leaderboard(test_data)
+
+    assert set(pred_proba_multi_sequential.keys()) == set(pred_proba_multi_parallel.keys())
+    for model in pred_proba_multi_sequential:
+        assert pred_proba_multi_sequential[model].equals(pred_proba_multi_parallel[model])
+    assert leaderboard_sequential["score_test"].equals(leaderboard_parallel["score_test"])
+    assert leaderboard_parallel["pred_time_test_marginal"].notnull().all()
+
+    predictor.set_parallel_inference(num_cpus=None)
+    shutil.rmtree(predictor.path, ignore_errors=True)
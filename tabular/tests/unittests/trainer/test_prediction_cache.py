@@ -0,0 +1,97 @@
+import shutil
+
+import numpy as np
+import pandas as pd
+
+from autogluon.tabular import TabularPredictor
+from autogluon.tabular.testing import FitHelper
+from autogluon.tabular.trainer.prediction_cache import FileBasedPredictionCache, compute_dataset_hash
+
+
+def test_compute_dataset_hash_depends_on_values_and_columns():
+    df = pd.DataFrame({"a": [1, 2, 3], "b": [0.1, 0.2, 0.3]})
+    assert compute_dataset_hash(df) == compute_dataset_hash(df.copy())
+    assert compute_dataset_hash(df) != compute_dataset_hash(df.rename(columns={"a": "c"}))
+    assert compute_dataset_hash(df) != compute_dataset_hash(df[["b", "a"]])
+    df_changed = df.copy()
+    df_changed.loc[1, "b"] = 5
+    assert compute_dataset_hash(df) != compute_dataset_hash(df_changed)
+
+
+def test_file_based_prediction_cache_get_put(tmp_path):
+    cache = FileBasedPredictionCache(root_path=str(tmp_path))
+    model_versions = {"A": "v1", "B": "v1"}
+    pred_proba = {"A": np.array([0.1, 0.2]), "B": np.array([0.3, 0.4])}
+    cache.put("hash", model_versions, pred_proba, {"A": 1.0, "B": 2.0})
+
+    # Reload from disk to verify persistence
+    cache = FileBasedPredictionCache(root_path=str(tmp_path))
+    cached_pred_proba, cached_pred_time = cache.get("hash", {"A": "v1", "B": "v2", "C": "v1"})
+    assert list(cached_pred_proba.keys()) == ["A"]
+    assert np.array_equal(cached_pred_proba["A"], pred_proba["A"])
+    assert cached_pred_time == {"A": 1.0}
+    assert cache.num_hits == 1
+    assert cache.num_misses == 2
+
+    cache.clear()
+    assert cache.get("hash", model_versions) == ({}, {})
+
+
+def test_file_based_prediction_cache_lru_eviction(tmp_path):
+    y_pred_proba = np.zeros(1000)
+    entry_size = len(y_pred_proba.tobytes()) + 128  # .npy header
+    cache = FileBasedPredictionCache(root_path=str(tmp_path), max_disk_bytes=2 * entry_size, max_memory_bytes=0)
+    cache.put("hash", {"A": "v1"}, {"A": y_pred_proba})
+    cache.put("hash", {"B": "v1"}, {"B": y_pred_proba})
+    # Access A so that B is the least recently used
+    cache.get("hash", {"A": "v1"})
+    cache.put("hash", {"C": "v1"}, {"C": y_pred_proba})
+    cached_pred_proba, _ = cache.get("hash", {"A": "v1", "B": "v1", "C": "v1"})
+    assert set(cached_pred_proba.keys()) == {"A", "C"}
+    assert cache.disk_bytes <= 2 * entry_size
+
+
+def test_prediction_cache_skips_inference():
+    train_data, test_data, dataset_info = FitHelper.load_dataset("toy_multiclass_30")
+    predictor = TabularPredictor(label=dataset_info["label"], problem_type=dataset_info["problem_type"]).fit(
+        train_data,
+        hyperparameters={"GBM": {"num_boost_round": 10}, "KNN": {}},
+        num_bag_folds=2,
+        num_stack_levels=1,
+    )
+    leaderboard_expected = predictor.leaderboard(test_data)
+    pred_proba_expected = predictor.predict_proba_multi(test_data)
+
+    predictor.set_prediction_cache()
+    leaderboard_uncached = predictor.leaderboard(test_data)
+    prediction_cache = predictor._trainer.prediction_cache
+    num_models = len(predictor.model_names())
+    assert prediction_cache.num_hits == 0
+
+    leaderboard = predictor.leaderboard(test_data)
+    assert prediction_cache.num_hits == num_models
+    assert leaderboard["score_test"].equals(leaderboard_expected["score_test"])
+    # Cache hits report the time spent retrieving the predictions instead of the inference times of the earlier call
+    pred_time_marginal = leaderboard.set_index("model")["pred_time_test_marginal"]
+    pred_time_marginal_uncached = leaderboard_uncached.set_index("model")["pred_time_test_marginal"]
+    assert (pred_time_marginal != pred_time_marginal_uncached[pred_time_marginal.index]).all()
+    pred_proba = predictor.predict_proba_multi(test_data)
+    for model in pred_proba_expected:
+        assert pred_proba[model].equals(pred_proba_expected[model])
+
+    # Different data must not hit the cache
+    num_hits = prediction_cache.num_hits
+    predictor.predict_proba(test_data.iloc[:10])
+    assert prediction_cache.num_hits == num_hits
+
+    # The cache can be bypassed for a single call without disabling it
+    num_hits, num_misses = prediction_cache.num_hits, prediction_cache.num_misses
+    predictor._trainer.get_model_pred_proba_dict(
+        X=predictor.transform_features(test_data), models=predictor.model_names(), use_prediction_cache=False
+    )
+    assert (prediction_cache.num_hits, prediction_cache.num_misses) == (num_hits, num_misses)
+    assert predictor._trainer.prediction_cache is prediction_cache
+
+    predictor.set_prediction_cache(use_cache=False)
+    assert predictor._trainer.prediction_cache is None
+    shutil.rmtree(predictor.path, ignore_errors=True)
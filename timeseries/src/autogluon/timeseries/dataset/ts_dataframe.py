@@ -115,6 +115,9 @@ class TimeSeriesDataFrame(pd.DataFrame):
 
     index: pd.MultiIndex  # type: ignore
     _metadata = ["_static_features"]
+    # Attributes that are not propagated to derived dataframes, see `_get_index_cache`
+    _internal_names = pd.DataFrame._internal_names + ["_index_cache"]
+    _internal_names_set = set(_internal_names)
 
     IRREGULAR_TIME_INDEX_FREQSTR: Final[str] = "IRREG"
     ITEMID: Final[str] = "item_id"
@@ -388,9 +391,33 @@ class TimeSeriesDataFrame(pd.DataFrame):
         """
         return cls(iterable_dataset, num_cpus=num_cpus)
 
+    def _get_index_cache(self) -> dict[str, Any]:
+        """Cache of values that only depend on the index, such as ``indptr``.
+
+        Pandas indexes are immutable and every operation that modifies the index of a dataframe (e.g., assigning
+        ``df.index``, ``sort_index(inplace=True)`` or dropping rows) replaces the index object. Therefore, the cache is
+        valid as long as ``self.index`` is the same object that it was computed for, and is reset otherwise.
+        """
+        cache = self.__dict__.get("_index_cache")
+        if cache is None or cache["index"] is not self.index:
+            cache = {"index": self.index}
+            self._index_cache = cache
+        return cache
+
+    def _set_indptr_from_lengths(self, lengths: np.ndarray) -> None:
+        """Store the ``indptr`` of a dataframe with a sorted index, given the number of rows of each item.
+
+        Used by methods that select rows of a sorted dataframe, where the ``indptr`` of the result is known without
+        inspecting its index. Items with zero selected rows are skipped.
+        """
+        lengths = lengths[lengths > 0]
+        self._get_index_cache()["indptr"] = np.concatenate([[0], np.cumsum(lengths)]).astype(np.int32)
+
     @property
     def item_ids(self) -> pd.Index:
         """List of unique time series IDs contained in the data set."""
+        if self.index.is_monotonic_increasing:
+            return self.index.levels[0].take(self.index.codes[0][self.get_indptr()[:-1]])
         return self.index.unique(level=self.ITEMID)
 
     @classmethod
@@ -532,8 +559,11 @@ class TimeSeriesDataFrame(pd.DataFrame):
         Computed using a random subset of the time series for speed. This may sometimes result in incorrectly inferred
         values. For reliable results, use :meth:`~autogluon.timeseries.TimeSeriesDataFrame.infer_frequency`.
         """
-        inferred_freq = self.infer_frequency(num_items=50)
-        return None if inferred_freq == self.IRREGULAR_TIME_INDEX_FREQSTR else inferred_freq
+        cache = self._get_index_cache()
+        if "freq" not in cache:
+            inferred_freq = self.infer_frequency(num_items=50)
+            cache["freq"] = None if inferred_freq == self.IRREGULAR_TIME_INDEX_FREQSTR else inferred_freq
+        return cache["freq"]
 
     @property
     def num_items(self):
@@ -545,6 +575,10 @@ class TimeSeriesDataFrame(pd.DataFrame):
 
         Returns a ``pandas.Series`` with ``item_id`` as index and number of observations per item as values.
         """
+        if self.index.is_monotonic_increasing:
+            indptr = self.get_indptr()
+            item_ids = self.index.levels[0].take(self.index.codes[0][indptr[:-1]])
+            return pd.Series(np.diff(indptr).astype(np.int64), index=item_ids, name="count")
         counts = pd.Series(self.index.codes[0]).value_counts(sort=False)
         counts.index = self.index.levels[0][counts.index]
         return counts
@@ -596,12 +630,21 @@ class TimeSeriesDataFrame(pd.DataFrame):
         """
 
         nanosecond_before_cutoff = cutoff_time - pd.Timedelta(nanoseconds=1)
-        data_before = self.loc[(slice(None), slice(None, nanosecond_before_cutoff)), :]
-        data_after = self.loc[(slice(None), slice(cutoff_time, None)), :]
-        before = TimeSeriesDataFrame(data_before, static_features=self.static_features)
-        after = TimeSeriesDataFrame(data_after, static_features=self.static_features)
+        before = self._select_timestamps(slice(None, nanosecond_before_cutoff))
+        after = self._select_timestamps(slice(cutoff_time, None))
         return before, after
 
+    def _select_timestamps(self, timestamps: slice) -> TimeSeriesDataFrame:
+        """Select rows with timestamps in the (inclusive) ``timestamps`` slice from each time series."""
+        if self.index.is_monotonic_increasing:
+            # If the index is sorted, the selected positions are increasing, so the selected rows of each item are
+            # counted by locating the item boundaries among the selected positions
+            positions = self.index.get_locs((slice(None), timestamps))
+            result = TimeSeriesDataFrame(self.iloc[positions], static_features=self.static_features)
+            result._set_indptr_from_lengths(np.diff(np.searchsorted(positions, self.get_indptr())))
+            return result
+        return TimeSeriesDataFrame(self.loc[(slice(None), timestamps), :], static_features=self.static_features)
+
     def slice_by_timestep(self, start_index: int | None = None, end_index: int | None = None) -> TimeSeriesDataFrame:
         """Select a subsequence from each time series between start (inclusive) and end (exclusive) indices.
 
@@ -724,20 +767,16 @@ class TimeSeriesDataFrame(pd.DataFrame):
                 # Return empty dataframe with same structure
                 return self.loc[np.zeros(len(self), dtype=bool)]
 
-            starts = starts[valid_slices]
-            slice_start = slice_start[valid_slices]
-            slice_end = slice_end[valid_slices]
-
-            # We put 1 at the slice_start index for each item and -1 at the slice_end index for each item.
-            # After we apply cumsum we get the indicator mask selecting values between slice_start and slice_end
-            # cumsum([0, 0, 1, 0, 0, -1, 0]) -> [0, 0, 1, 1, 1, 0, 0]
-            # We need array of size len(self) + 1 in case events[starts + slice_end] tries to access position len(self)
-            events = np.zeros(len(self) + 1, dtype=np.int8)
-            events[starts + slice_start] += 1
-            events[starts + slice_end] -= 1
-            mask = np.cumsum(events)[:-1].astype(bool)
-            # loc[mask] returns a view of the original data - modifying it will produce a SettingWithCopyWarning
-            return self.loc[mask]
+            # The slice of each item is a contiguous range of rows, so the selected positions and the indptr of the
+            # result follow from offset arithmetic without constructing a boolean mask over all rows
+            slice_lengths = (slice_end - slice_start)[valid_slices].astype(np.int64)
+            slice_offsets = (starts + slice_start)[valid_slices].astype(np.int64)
+            new_starts = np.cumsum(slice_lengths) - slice_lengths
+            positions = np.arange(slice_lengths.sum()) + np.repeat(slice_offsets - new_starts, slice_lengths)
+            # iloc[positions] marks the result as a copy of the original data - modifying it will produce a SettingWithCopyWarning
+            result = self.iloc[positions]
+            result._set_indptr_from_lengths(slice_lengths)
+            return result
         else:
             # Fall back to a slow groupby operation
             result = self.groupby(level=self.ITEMID, sort=False, as_index=False).nth(slice(start_index, end_index))
@@ -764,10 +803,7 @@ class TimeSeriesDataFrame(pd.DataFrame):
             raise ValueError(f"end_time {end_time} is earlier than start_time {start_time}")
 
         nanosecond_before_end_time = end_time - pd.Timedelta(nanoseconds=1)
-        return TimeSeriesDataFrame(
-            self.loc[(slice(None), slice(start_time, nanosecond_before_end_time)), :],
-            static_features=self.static_features,
-        )
+        return self._select_timestamps(slice(start_time, nanosecond_before_end_time))
 
     @classmethod
     def from_pickle(cls, filepath_or_buffer: Any) -> TimeSeriesDataFrame:
@@ -973,8 +1009,11 @@ class TimeSeriesDataFrame(pd.DataFrame):
 
         if suffix is not None:
             for data in [train_data, test_data]:
+                indptr = data.get_indptr()
                 new_item_id = data.index.levels[0].astype(str) + suffix
                 data.index = data.index.set_levels(levels=new_item_id, level=0)
+                # Renaming the items does not change the positions of the time series
+                data._get_index_cache()["indptr"] = indptr
                 if data.static_features is not None:
                     data.static_features.index = data.static_features.index.astype(str)
                     data.static_features.index += suffix
@@ -1116,7 +1155,17 @@ class TimeSeriesDataFrame(pd.DataFrame):
 
         This method assumes that the TimeSeriesDataFrame is sorted by [item_id, timestamp].
         """
-        return np.concatenate([[0], np.cumsum(self.num_timesteps_per_item().to_numpy())]).astype(np.int32)
+        cache = self._get_index_cache()
+        if "indptr" not in cache:
+            if self.index.is_monotonic_increasing:
+                item_codes = self.index.codes[0]
+                item_boundaries = np.flatnonzero(item_codes[1:] != item_codes[:-1]) + 1
+                cache["indptr"] = np.concatenate([[0], item_boundaries, [len(self)] if len(self) > 0 else []])
+            else:
+                cache["indptr"] = np.concatenate([[0], np.cumsum(self.num_timesteps_per_item().to_numpy())])
+            cache["indptr"] = cache["indptr"].astype(np.int32)
+        # Copy to ensure in-place modifications by the caller do not corrupt the cache
+        return cache["indptr"].copy()
 
     # inline typing stubs for various overridden methods
     if TYPE_CHECKING:
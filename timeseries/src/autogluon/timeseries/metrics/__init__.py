@@ -5,11 +5,12 @@ from typing import Any, Sequence, Type
 
 import numpy as np
 
-from .abstract import TimeSeriesScorer
+from .abstract import ScoringContext, TimeSeriesScorer
 from .point import MAE, MAPE, MASE, MSE, RMSE, RMSLE, RMSSE, SMAPE, WAPE, WCD
 from .quantile import SQL, WQL
 
 __all__ = [
+    "ScoringContext",
     "TimeSeriesScorer",
     "check_get_evaluation_metric",
     "MAE",
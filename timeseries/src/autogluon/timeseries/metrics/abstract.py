@@ -1,3 +1,4 @@
+import copy
 import warnings
 from typing import Sequence, overload
 
@@ -109,9 +110,7 @@ class TimeSeriesScorer:
         data_past = data.slice_by_timestep(None, -self.prediction_length)
         data_future = data.slice_by_timestep(-self.prediction_length, None)
 
-        assert not predictions.isna().any().any(), "Predictions contain NaN values."
-        assert (predictions.num_timesteps_per_item() == self.prediction_length).all()
-        assert data_future.index.equals(predictions.index), "Prediction and data indices do not match."
+        self._check_predictions(data_future=data_future, predictions=predictions)
 
         try:
             with warning_filter():
@@ -133,6 +132,76 @@ class TimeSeriesScorer:
 
     score = __call__
 
+    def score_batch(
+        self,
+        data: "TimeSeriesDataFrame | ScoringContext",
+        predictions: Sequence[TimeSeriesDataFrame],
+        target: str = "target",
+    ) -> list[float]:
+        """Compute a separate score for each of multiple forecasts of the same data, e.g., one score per model.
+
+        Equivalent to calling ``score(data, prediction)`` for each prediction, but the data is split into past and
+        future parts and the auxiliary metrics on past data (see :meth:`save_past_metrics`) are computed only once.
+        The forecasts are not combined: each score only depends on the corresponding forecast.
+
+        If a subclass overrides ``__call__`` or ``score`` without overriding ``score_batch``, each forecast is instead
+        scored with the overridden method, so that the batched and individual scores stay identical.
+
+        Parameters
+        ----------
+        data : TimeSeriesDataFrame or ScoringContext
+            Time series data, where the last ``prediction_length`` values of each time series are the forecast horizon.
+            Pass a :class:`ScoringContext` to additionally reuse the precomputed values across calls and metrics.
+        predictions : Sequence[TimeSeriesDataFrame]
+            Forecasts for the forecast horizon of ``data``.
+        target : str, default = "target"
+            Name of the column in ``data`` that contains the target time series.
+
+        Returns
+        -------
+        scores : list[float]
+            Score of each forecast in greater-is-better format, in the same order as ``predictions``.
+        """
+        if isinstance(data, ScoringContext):
+            context = data
+            if context.prediction_length != self.prediction_length or context.target != target:
+                raise ValueError(
+                    f"ScoringContext with prediction_length={context.prediction_length}, target={context.target} "
+                    f"cannot be used to score {self.name} with prediction_length={self.prediction_length}, "
+                    f"target={target}"
+                )
+        else:
+            context = ScoringContext(data, prediction_length=self.prediction_length, target=target)
+
+        score_method = self._get_overridden_score_method()
+        if score_method is not None:
+            return [score_method(context.data, prediction, target=target) for prediction in predictions]
+
+        scorer = context.get_scorer(self)
+        scores = []
+        for prediction in predictions:
+            self._check_predictions(data_future=context.data_future, predictions=prediction)
+            with warning_filter():
+                metric_value = scorer.compute_metric(
+                    data_future=context.data_future, predictions=prediction, target=target
+                )
+            scores.append(metric_value * self.sign)
+        return scores
+
+    def _get_overridden_score_method(self):
+        """Return ``score`` or ``__call__`` if a subclass overrides it more recently than ``score_batch``, else None."""
+        score_batch_owner = _get_method_owner(type(self), "score_batch")
+        for method_name in ["score", "__call__"]:
+            owner = _get_method_owner(type(self), method_name)
+            if owner is not score_batch_owner and issubclass(owner, score_batch_owner):
+                return getattr(self, method_name)
+        return None
+
+    def _check_predictions(self, data_future: TimeSeriesDataFrame, predictions: TimeSeriesDataFrame) -> None:
+        assert not predictions.isna().any().any(), "Predictions contain NaN values."
+        assert (predictions.num_timesteps_per_item() == self.prediction_length).all()
+        assert data_future.index.equals(predictions.index), "Prediction and data indices do not match."
+
     def compute_metric(
         self,
         data_future: TimeSeriesDataFrame,
@@ -270,3 +339,50 @@ class TimeSeriesScorer:
             raise ValueError(f"All horizon_weight values must be finite (got {horizon_weight})")
         horizon_weight_np = horizon_weight_np * prediction_length / horizon_weight_np.sum()
         return horizon_weight_np.reshape([1, prediction_length])
+
+
+def _get_method_owner(cls: type, method_name: str) -> type:
+    """Return the class in the MRO of ``cls`` that defines ``method_name``."""
+    for owner in cls.__mro__:
+        if method_name in vars(owner):
+            return owner
+    raise AttributeError(f"{cls.__name__} has no method {method_name}")
+
+
+class ScoringContext:
+    """Evaluation window shared by all forecasts that are scored on the same data.
+
+    Splits the data into past and future parts once, and computes the auxiliary metrics on past data (see
+    :meth:`TimeSeriesScorer.save_past_metrics`) once per metric. Used to score the predictions of multiple models,
+    possibly with multiple metrics, via :meth:`TimeSeriesScorer.score_batch`.
+
+    Parameters
+    ----------
+    data : TimeSeriesDataFrame
+        Time series data, where the last ``prediction_length`` values of each time series are the forecast horizon.
+    prediction_length : int
+        The length of the forecast horizon.
+    target : str, default = "target"
+        Name of the column in ``data`` that contains the target time series.
+    """
+
+    def __init__(self, data: TimeSeriesDataFrame, prediction_length: int, target: str = "target"):
+        self.data = data
+        self.prediction_length = prediction_length
+        self.target = target
+        self.data_past = data.slice_by_timestep(None, -prediction_length)
+        self.data_future = data.slice_by_timestep(-prediction_length, None)
+        # id(metric) -> (metric, copy of metric with saved past metrics). Reference to the metric ensures the id stays valid
+        self._scorers: dict[int, tuple[TimeSeriesScorer, TimeSeriesScorer]] = {}
+
+    def get_scorer(self, metric: TimeSeriesScorer) -> TimeSeriesScorer:
+        """Return a copy of ``metric`` with the auxiliary metrics on past data of this window saved."""
+        if id(metric) not in self._scorers:
+            seasonal_period = (
+                get_seasonality(self.data.freq) if metric.seasonal_period is None else metric.seasonal_period
+            )
+            scorer = copy.deepcopy(metric)
+            with warning_filter():
+                scorer.save_past_metrics(data_past=self.data_past, target=self.target, seasonal_period=seasonal_period)
+            self._scorers[id(metric)] = (metric, scorer)
+        return self._scorers[id(metric)][1]
@@ -7,7 +7,7 @@ import pandas as pd
 
 from autogluon.timeseries import TimeSeriesDataFrame
 
-from .abstract import TimeSeriesScorer
+from .abstract import ScoringContext, TimeSeriesScorer
 from .utils import in_sample_abs_seasonal_error, in_sample_squared_seasonal_error
 
 logger = logging.getLogger(__name__)
@@ -428,6 +428,10 @@ class RMSLE(TimeSeriesScorer):
             errors *= self.horizon_weight
         return np.sqrt(self._safemean(errors))
 
+    def _check_target(self, data: TimeSeriesDataFrame, target: str = "target") -> None:
+        if (data[target] < 0).any():
+            raise ValueError(f"{self.name} cannot be used if target time series contains negative values!")
+
     def __call__(
         self,
         data: TimeSeriesDataFrame,
@@ -435,8 +439,7 @@ class RMSLE(TimeSeriesScorer):
         target: str = "target",
         **kwargs,
     ) -> float:
-        if (data[target] < 0).any():
-            raise ValueError(f"{self.name} cannot be used if target time series contains negative values!")
+        self._check_target(data, target=target)
         return super().__call__(
             data=data,
             predictions=predictions,
@@ -444,6 +447,15 @@ class RMSLE(TimeSeriesScorer):
             **kwargs,
         )
 
+    def score_batch(
+        self,
+        data: TimeSeriesDataFrame | ScoringContext,
+        predictions: Sequence[TimeSeriesDataFrame],
+        target: str = "target",
+    ) -> list[float]:
+        self._check_target(data.data if isinstance(data, ScoringContext) else data, target=target)
+        return super().score_batch(data=data, predictions=predictions, target=target)
+
 
 class WCD(TimeSeriesScorer):
     r"""Weighted cumulative discrepancy.
@@ -1,11 +1,14 @@
 import logging
+import math
+import os
+import tempfile
 import time
 from multiprocessing import TimeoutError
 from typing import Any, Callable
 
 import numpy as np
 import pandas as pd
-from joblib import Parallel, cpu_count, delayed
+from joblib import Parallel, cpu_count, delayed, effective_n_jobs
 from scipy.stats import norm
 
 from autogluon.core.utils.exceptions import TimeLimitExceeded
@@ -22,7 +25,16 @@ logger = logging.getLogger(__name__)
 class AbstractLocalModel(AbstractTimeSeriesModel):
     """Abstract class for local forecasting models that are trained separately for each time series.
 
-    Prediction is parallelized across CPU cores using joblib.Parallel.
+    Prediction is parallelized across CPU cores using joblib.Parallel. Models that implement ``_predict_batch``
+    instead predict all time series at once with vectorized operations, unless ``use_batch_predict=False``.
+
+    If ``use_chunked_predict=True``, the target values are shared with the joblib workers via memory-mapped files and
+    each worker predicts a contiguous range of ``predict_chunk_size`` time series, writing the forecasts directly
+    into a memory-mapped output array. This avoids pickling each time series and each forecast, which dominates the
+    prediction time for datasets with many short time series.
+
+    Models can keep a state per item across calls to ``predict`` (e.g., fitted parameters) by implementing
+    ``_load_item_states``, ``_save_item_states`` and ``_predict_with_local_model_state``.
 
     Attributes
     ----------
@@ -69,7 +81,8 @@ class AbstractLocalModel(AbstractTimeSeriesModel):
     def allowed_hyperparameters(self) -> list[str]:
         return (
             super().allowed_hyperparameters
-            + ["use_fallback_model", "max_ts_length", "n_jobs"]
+            + ["use_fallback_model", "max_ts_length", "n_jobs", "use_batch_predict"]
+            + ["use_chunked_predict", "predict_chunk_size"]
             + self.allowed_local_model_args
         )
 
@@ -89,6 +102,9 @@ class AbstractLocalModel(AbstractTimeSeriesModel):
             "n_jobs": AG_DEFAULT_N_JOBS,
             "use_fallback_model": True,
             "max_ts_length": self.default_max_ts_length,
+            "use_batch_predict": True,
+            "use_chunked_predict": False,
+            "predict_chunk_size": None,
         }
 
     @staticmethod
@@ -144,56 +160,260 @@ class AbstractLocalModel(AbstractTimeSeriesModel):
         indptr = data.get_indptr()
         target_series = data[self.target].droplevel(level=TimeSeriesDataFrame.ITEMID)
         all_series = (target_series[indptr[i] : indptr[i + 1]] for i in range(len(indptr) - 1))
+        item_ids = data.item_ids
+        item_states = self._load_item_states(item_ids)
 
         # timeout ensures that no individual job takes longer than time_limit
         # TODO: a job started late may still exceed time_limit - how to prevent that?
         time_limit = kwargs.get("time_limit")
+        # end_time ensures that no new jobs are started after time_limit is exceeded
+        end_time = None if time_limit is None else time.time() + time_limit
+
+        # batched implementations are stateless, so they are skipped if the model keeps per-item states
+        if model_params.get("use_batch_predict", True) and item_states is None and self._supports_batch_predict():
+            batch_predictions = self._predict_batch_with_fallback(
+                target_series,
+                indptr=indptr,
+                use_fallback_model=model_params["use_fallback_model"],
+                end_time=end_time,
+            )
+            if batch_predictions is not None:
+                predictions, number_failed_models = batch_predictions
+                self._log_failed_models(number_failed_models, num_items=len(indptr) - 1)
+                predictions_df = pd.DataFrame(
+                    predictions, index=self.get_forecast_horizon_index(data), columns=self._dummy_forecast.columns
+                )
+                return TimeSeriesDataFrame(predictions_df)
+
         # TODO: Take into account num_cpus once the TimeSeriesPredictor API is updated
         n_jobs = self._compute_n_jobs(model_params["n_jobs"])
         timeout = None if n_jobs == 1 else time_limit
-        # end_time ensures that no new jobs are started after time_limit is exceeded
-        end_time = None if time_limit is None else time.time() + time_limit
+
+        if model_params.get("use_chunked_predict", False):
+            predictions, number_failed_models, new_item_states = self._predict_chunked(
+                target_series,
+                indptr=indptr,
+                n_jobs=n_jobs,
+                chunk_size=model_params.get("predict_chunk_size"),
+                use_fallback_model=model_params["use_fallback_model"],
+                timeout=timeout,
+                end_time=end_time,
+                item_states=item_states,
+            )
+            if item_states is not None:
+                self._save_item_states(item_ids, new_item_states)
+            self._log_failed_models(number_failed_models, num_items=len(indptr) - 1)
+            predictions_df = pd.DataFrame(
+                predictions, index=self.get_forecast_horizon_index(data), columns=self._dummy_forecast.columns
+            )
+            return TimeSeriesDataFrame(predictions_df)
+
         executor = Parallel(n_jobs=n_jobs, timeout=timeout)
 
         try:
             with warning_filter():
                 predictions_with_flags = executor(
                     delayed(self._predict_wrapper)(
-                        ts, use_fallback_model=model_params["use_fallback_model"], end_time=end_time
+                        ts,
+                        use_fallback_model=model_params["use_fallback_model"],
+                        end_time=end_time,
+                        item_state=None if item_states is None else item_states[i],
                     )
-                    for ts in all_series
+                    for i, ts in enumerate(all_series)
                 )
         except TimeoutError:
             raise TimeLimitExceeded
 
-        number_failed_models = sum(failed_flag for _, failed_flag in predictions_with_flags)
+        if item_states is not None:
+            self._save_item_states(item_ids, [new_state for _, _, new_state in predictions_with_flags])
+        number_failed_models = sum(failed_flag for _, failed_flag, _ in predictions_with_flags)
+        self._log_failed_models(number_failed_models, num_items=len(predictions_with_flags))
+        predictions_df = pd.concat([pred for pred, _, _ in predictions_with_flags])
+        predictions_df.index = self.get_forecast_horizon_index(data)
+        return TimeSeriesDataFrame(predictions_df)
+
+    def _log_failed_models(self, number_failed_models: int, num_items: int):
         if number_failed_models > 0:
-            fraction_failed_models = number_failed_models / len(predictions_with_flags)
+            fraction_failed_models = number_failed_models / num_items
             logger.warning(
                 f"\tWarning: {self.name} failed for {number_failed_models} time series "
                 f"({fraction_failed_models:.1%}). Fallback model SeasonalNaive was used for these time series."
             )
-        predictions_df = pd.concat([pred for pred, _ in predictions_with_flags])
-        predictions_df.index = self.get_forecast_horizon_index(data)
-        return TimeSeriesDataFrame(predictions_df)
+
+    def _predict_batch_with_fallback(
+        self,
+        target_series: pd.Series,
+        indptr: np.ndarray,
+        use_fallback_model: bool,
+        end_time: float | None = None,
+    ) -> tuple[np.ndarray, int] | None:
+        """Predict all time series at once via `_predict_batch`, handling edge cases identically to `_predict_wrapper`.
+
+        Time series that contain only NaNs are predicted with the dummy forecast. Time series for which the batched
+        forecast contains NaN or Inf values are predicted one by one via `_predict_wrapper`, which applies the fallback
+        model if necessary.
+
+        Returns None if the model has no batched implementation, otherwise a tuple of the predictions of shape
+        [num_items * prediction_length, num_columns] and the number of time series for which the fallback model was used.
+        """
+        target = target_series.to_numpy(dtype=np.float64)
+        with warning_filter(), np.errstate(all="ignore"):
+            predictions = self._predict_batch(target, indptr=indptr)
+        if predictions is None:
+            return None
+
+        is_all_nan = np.add.reduceat(~np.isnan(target), indptr[:-1], dtype=np.int64) == 0
+        predictions[is_all_nan] = self._dummy_forecast.to_numpy()
+        number_failed_models = 0
+        with warning_filter():
+            for i in np.flatnonzero(~np.isfinite(predictions).all(axis=(1, 2))):
+                result, model_failed, _ = self._predict_wrapper(
+                    target_series[indptr[i] : indptr[i + 1]], use_fallback_model=use_fallback_model, end_time=end_time
+                )
+                predictions[i] = result[self._dummy_forecast.columns].to_numpy()
+                number_failed_models += model_failed
+        return predictions.reshape(-1, predictions.shape[-1]), number_failed_models
+
+    def _predict_chunked(
+        self,
+        target_series: pd.Series,
+        indptr: np.ndarray,
+        n_jobs: int,
+        chunk_size: int | None = None,
+        use_fallback_model: bool = True,
+        timeout: float | None = None,
+        end_time: float | None = None,
+        item_states: list | None = None,
+    ) -> tuple[np.ndarray, int, list | None]:
+        """Predict contiguous ranges of time series (chunks) in parallel via `_predict_chunk`.
+
+        The target values, timestamps and indptr are stored in memory-mapped files once, so that each joblib task only
+        receives the location of the files and the item range of its chunk. Workers write the forecasts directly into
+        a preallocated memory-mapped output array of shape [num_items, prediction_length, num_columns]. Per-item
+        states, if any, are passed to and returned from each chunk as a list.
+
+        Returns a tuple of the predictions of shape [num_items * prediction_length, num_columns], the number of
+        time series for which the fallback model was used and the new item states (None if ``item_states`` is None).
+        """
+        num_items = len(indptr) - 1
+        if chunk_size is None:
+            # a few chunks per worker balance the load if some time series take longer than others
+            chunk_size = max(math.ceil(num_items / (4 * effective_n_jobs(n_jobs))), 1)
+        chunks = [(start, min(start + chunk_size, num_items)) for start in range(0, num_items, chunk_size)]
+        num_columns = len(self._dummy_forecast.columns)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            np.save(os.path.join(temp_dir, "target.npy"), target_series.to_numpy(dtype=np.float64))
+            np.save(os.path.join(temp_dir, "timestamps.npy"), target_series.index.to_numpy(dtype="datetime64[ns]"))
+            np.save(os.path.join(temp_dir, "indptr.npy"), indptr)
+            output = np.lib.format.open_memmap(
+                os.path.join(temp_dir, "output.npy"),
+                mode="w+",
+                dtype=np.float64,
+                shape=(num_items, self.prediction_length, num_columns),
+            )
+            try:
+                with warning_filter():
+                    chunk_results = Parallel(n_jobs=n_jobs, timeout=timeout)(
+                        delayed(self._predict_chunk)(
+                            temp_dir,
+                            start=start,
+                            end=end,
+                            use_fallback_model=use_fallback_model,
+                            end_time=end_time,
+                            item_states=None if item_states is None else item_states[start:end],
+                        )
+                        for start, end in chunks
+                    )
+            except TimeoutError:
+                raise TimeLimitExceeded
+            predictions = np.array(output).reshape(-1, num_columns)
+            del output
+
+        chunk_times = [chunk_time for _, chunk_time, _ in chunk_results]
+        logger.debug(
+            f"\t{self.name}: predicted {len(chunks)} chunks of up to {chunk_size} time series "
+            f"(mean chunk time {np.mean(chunk_times):.2f}s, max chunk time {np.max(chunk_times):.2f}s)"
+        )
+        number_failed_models = sum(number_failed for number_failed, _, _ in chunk_results)
+        new_item_states = None
+        if item_states is not None:
+            new_item_states = [state for _, _, chunk_states in chunk_results for state in chunk_states]
+        return predictions, number_failed_models, new_item_states
+
+    def _predict_chunk(
+        self,
+        temp_dir: str,
+        start: int,
+        end: int,
+        use_fallback_model: bool,
+        end_time: float | None = None,
+        item_states: list | None = None,
+    ) -> tuple[int, float, list | None]:
+        """Predict the time series ``start, ..., end - 1`` stored in ``temp_dir`` and write them to the output array.
+
+        Before each time series, the chunk checks if one more time series at the average time per time series so far
+        would exceed ``end_time``. This way, the chunk stops early instead of starting a time series that cannot
+        finish in time.
+
+        Returns the number of time series for which the fallback model was used, the time spent on the chunk and the
+        new states of the items in the chunk (None if ``item_states`` is None).
+        """
+        chunk_start_time = time.time()
+        target = np.load(os.path.join(temp_dir, "target.npy"), mmap_mode="r")
+        timestamps = np.load(os.path.join(temp_dir, "timestamps.npy"), mmap_mode="r")
+        indptr = np.load(os.path.join(temp_dir, "indptr.npy"), mmap_mode="r")
+        output = np.load(os.path.join(temp_dir, "output.npy"), mmap_mode="r+")
+
+        number_failed_models = 0
+        new_item_states = None if item_states is None else []
+        for i in range(start, end):
+            if end_time is not None and i > start:
+                time_per_item = (time.time() - chunk_start_time) / (i - start)
+                if time.time() + time_per_item >= end_time:
+                    raise TimeLimitExceeded
+            time_series = pd.Series(
+                np.array(target[indptr[i] : indptr[i + 1]]),
+                index=pd.DatetimeIndex(np.array(timestamps[indptr[i] : indptr[i + 1]])),
+            )
+            result, model_failed, new_state = self._predict_wrapper(
+                time_series,
+                use_fallback_model=use_fallback_model,
+                end_time=end_time,
+                item_state=None if item_states is None else item_states[i - start],
+            )
+            output[i] = result[self._dummy_forecast.columns].to_numpy()
+            number_failed_models += model_failed
+            if new_item_states is not None:
+                new_item_states.append(new_state)
+        output.flush()
+        return number_failed_models, time.time() - chunk_start_time, new_item_states
 
     def _predict_wrapper(
         self,
         time_series: pd.Series,
         use_fallback_model: bool,
         end_time: float | None = None,
-    ) -> tuple[pd.DataFrame, bool]:
+        item_state: Any | None = None,
+    ) -> tuple[pd.DataFrame, bool, Any | None]:
+        """Predict a single time series.
+
+        Returns the forecast, whether the fallback model was used and the new state of the item (None if no state
+        should be kept).
+        """
         if end_time is not None and time.time() >= end_time:
             raise TimeLimitExceeded
 
         model_failed = False
+        new_state = None
         if time_series.isna().all():
             result = self._dummy_forecast.copy()
         else:
             try:
-                result = self._predict_with_local_model(
+                result, new_state = self._predict_with_local_model_state(
                     time_series=time_series,
                     local_model_args=self._local_model_args.copy(),
+                    item_state=item_state,
                 )
                 if not np.isfinite(result.values).all():
                     raise RuntimeError("Forecast contains NaN or Inf values.")
@@ -206,9 +426,10 @@ class AbstractLocalModel(AbstractTimeSeriesModel):
                         seasonal_period=self._seasonal_period,
                     )
                     model_failed = True
+                    new_state = None
                 else:
                     raise
-        return result, model_failed
+        return result, model_failed, new_state
 
     def _predict_with_local_model(
         self,
@@ -217,6 +438,51 @@ class AbstractLocalModel(AbstractTimeSeriesModel):
     ) -> pd.DataFrame:
         raise NotImplementedError
 
+    def _predict_with_local_model_state(
+        self,
+        time_series: pd.Series,
+        local_model_args: dict,
+        item_state: Any | None = None,
+    ) -> tuple[pd.DataFrame, Any | None]:
+        """Same as `_predict_with_local_model`, but additionally receives the state of the item returned by
+        `_load_item_states` (None if the item has no state) and returns the new state of the item."""
+        return self._predict_with_local_model(time_series=time_series, local_model_args=local_model_args), None
+
+    def _load_item_states(self, item_ids: pd.Index) -> list | None:
+        """Load the states of the given items that are passed to `_predict_with_local_model_state`.
+
+        Returns None if the model does not keep per-item states, otherwise a list with the state of each item
+        (None for items without a state).
+        """
+        return None
+
+    def _save_item_states(self, item_ids: pd.Index, item_states: list) -> None:
+        """Save the states returned by `_predict_with_local_model_state` for the given items."""
+        pass
+
+    def _supports_batch_predict(self) -> bool:
+        """Whether the model overrides `_predict_batch`, so that the target is not converted for models without it."""
+        return type(self)._predict_batch is not AbstractLocalModel._predict_batch
+
+    def _predict_batch(self, target: np.ndarray, indptr: np.ndarray) -> np.ndarray | None:
+        """Optional batched implementation of `_predict_with_local_model` for all time series at once.
+
+        Parameters
+        ----------
+        target
+            Array of shape [num_timesteps] containing the target values of all time series, one after another.
+        indptr
+            Array of shape [num_items + 1], where the target values of item ``i`` are ``target[indptr[i] : indptr[i + 1]]``.
+
+        Returns
+        -------
+        predictions
+            Array of shape [num_items, prediction_length, num_columns] with the columns of ``self._dummy_forecast``,
+            or None if the model has no batched implementation. Predictions for time series that only contain NaNs
+            are ignored.
+        """
+        return None
+
 
 def seasonal_naive_forecast(
     target: np.ndarray, prediction_length: int, quantile_levels: list[float], seasonal_period: int
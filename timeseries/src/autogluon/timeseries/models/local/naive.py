@@ -1,5 +1,6 @@
 import numpy as np
 import pandas as pd
+from scipy.stats import norm
 
 from autogluon.timeseries.models.local.abstract_local_model import (
     AbstractLocalModel,
@@ -22,6 +23,9 @@ class NaiveModel(AbstractLocalModel):
         When set to a float between 0.0 and 1.0, that fraction of available CPU cores is used.
         When set to a positive integer, that many cores are used.
         When set to -1, all CPU cores are used.
+    use_batch_predict : bool, default = True
+        If True, all time series are predicted at once using vectorized NumPy operations instead of one joblib task per
+        time series. Predictions are identical up to floating point rounding.
     """
 
     ag_priority = 100
@@ -39,6 +43,15 @@ class NaiveModel(AbstractLocalModel):
             seasonal_period=1,
         )
 
+    def _predict_batch(self, target: np.ndarray, indptr: np.ndarray) -> np.ndarray:
+        return _seasonal_naive_forecast_batch(
+            target,
+            indptr=indptr,
+            prediction_length=self.prediction_length,
+            quantile_levels=self.quantile_levels,
+            seasonal_period=1,
+        )
+
     def _more_tags(self) -> dict:
         return {"allow_nan": True}
 
@@ -65,6 +78,9 @@ class SeasonalNaiveModel(AbstractLocalModel):
         When set to a float between 0.0 and 1.0, that fraction of available CPU cores is used.
         When set to a positive integer, that many cores are used.
         When set to -1, all CPU cores are used.
+    use_batch_predict : bool, default = True
+        If True, all time series are predicted at once using vectorized NumPy operations instead of one joblib task per
+        time series. Predictions are identical up to floating point rounding.
     """
 
     ag_priority = 100
@@ -82,6 +98,15 @@ class SeasonalNaiveModel(AbstractLocalModel):
             seasonal_period=local_model_args["seasonal_period"],
         )
 
+    def _predict_batch(self, target: np.ndarray, indptr: np.ndarray) -> np.ndarray:
+        return _seasonal_naive_forecast_batch(
+            target,
+            indptr=indptr,
+            prediction_length=self.prediction_length,
+            quantile_levels=self.quantile_levels,
+            seasonal_period=self._local_model_args["seasonal_period"],
+        )
+
     def _more_tags(self) -> dict:
         return {"allow_nan": True}
 
@@ -96,6 +121,9 @@ class AverageModel(AbstractLocalModel):
         When set to a float between 0.0 and 1.0, that fraction of available CPU cores is used.
         When set to a positive integer, that many cores are used.
         When set to -1, all CPU cores are used.
+    use_batch_predict : bool, default = True
+        If True, all time series are predicted at once using vectorized NumPy operations instead of one joblib task per
+        time series. Predictions are identical up to floating point rounding.
     max_ts_length : int | None, default = None
         If not None, only the last ``max_ts_length`` time steps of each time series will be used to train the model.
         This significantly speeds up fitting and usually leads to no change in accuracy.
@@ -115,6 +143,15 @@ class AverageModel(AbstractLocalModel):
         stats_repeated = np.tile(stats_marginal.values, [self.prediction_length, 1])
         return pd.DataFrame(stats_repeated, columns=stats_marginal.index)
 
+    def _predict_batch(self, target: np.ndarray, indptr: np.ndarray) -> np.ndarray:
+        return _seasonal_average_forecast_batch(
+            target,
+            indptr=indptr,
+            prediction_length=self.prediction_length,
+            quantile_levels=self.quantile_levels,
+            seasonal_period=1,
+        )
+
     def _more_tags(self) -> dict:
         return {"allow_nan": True}
 
@@ -136,6 +173,9 @@ class SeasonalAverageModel(AbstractLocalModel):
         When set to a float between 0.0 and 1.0, that fraction of available CPU cores is used.
         When set to a positive integer, that many cores are used.
         When set to -1, all CPU cores are used.
+    use_batch_predict : bool, default = True
+        If True, all time series are predicted at once using vectorized NumPy operations instead of one joblib task per
+        time series. Predictions are identical up to floating point rounding.
     max_ts_length : int | None, default = None
         If not None, only the last ``max_ts_length`` time steps of each time series will be used to train the model.
         This significantly speeds up fitting and usually leads to no change in accuracy.
@@ -168,5 +208,149 @@ class SeasonalAverageModel(AbstractLocalModel):
             result = result.fillna(stats_marginal)
         return result
 
+    def _predict_batch(self, target: np.ndarray, indptr: np.ndarray) -> np.ndarray:
+        return _seasonal_average_forecast_batch(
+            target,
+            indptr=indptr,
+            prediction_length=self.prediction_length,
+            quantile_levels=self.quantile_levels,
+            seasonal_period=self._local_model_args["seasonal_period"],
+        )
+
     def _more_tags(self) -> dict:
         return {"allow_nan": True}
+
+
+def _get_item_ids_and_positions(indptr: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """For each row of the concatenated time series, get the index of its item and its position within the item."""
+    lengths = np.diff(indptr)
+    item_ids = np.repeat(np.arange(len(lengths)), lengths)
+    positions = np.arange(indptr[-1]) - np.repeat(indptr[:-1], lengths)
+    return item_ids, positions
+
+
+def _seasonal_naive_forecast_batch(
+    target: np.ndarray,
+    indptr: np.ndarray,
+    prediction_length: int,
+    quantile_levels: list[float],
+    seasonal_period: int,
+) -> np.ndarray:
+    """Batched version of `seasonal_naive_forecast` using segmented reductions over all time series.
+
+    Returns an array of shape [num_items, prediction_length, 1 + len(quantile_levels)].
+    """
+    starts = indptr[:-1].astype(np.int64)
+    lengths = np.diff(indptr).astype(np.int64)
+    item_ids, positions = _get_item_ids_and_positions(indptr)
+    rows = np.arange(len(target))
+    is_nan = np.isnan(target)
+
+    # At least seasonal_period + 2 values are required to compute sigma for seasonal naive
+    is_seasonal = (lengths > seasonal_period + 1) & (seasonal_period > 1)
+    values = target
+    if is_seasonal.any():
+        # Series with NaNs among the last seasonal_period + 2 values are forward filled, leading NaNs are filled with the mean
+        is_tail = positions >= (lengths - (seasonal_period + 2))[item_ids]
+        needs_fill = is_seasonal & (np.add.reduceat(is_nan & is_tail, starts, dtype=np.int64) > 0)
+        if needs_fill.any():
+            ffill_idx = np.where(is_nan, 0, rows)
+            ffill_idx[starts] = starts
+            filled = target[np.maximum.accumulate(ffill_idx)]
+            is_nan_filled = np.isnan(filled)
+            fill_value = np.add.reduceat(np.where(is_nan_filled, 0.0, filled), starts) / np.add.reduceat(
+                ~is_nan_filled, starts, dtype=np.int64
+            )
+            filled = np.where(is_nan_filled, fill_value[item_ids], filled)
+            values = np.where(needs_fill[item_ids], filled, target)
+
+    # Residuals of the naive (lag 1) or seasonal naive (lag seasonal_period) forecast
+    lag = np.where(is_seasonal, seasonal_period, 1)[item_ids]
+    has_lag = positions >= lag
+    squared_residuals = np.square(values - values[np.where(has_lag, rows - lag, rows)])
+    is_valid = has_lag & ~np.isnan(squared_residuals)
+    sigma = np.sqrt(
+        np.add.reduceat(np.where(is_valid, squared_residuals, 0.0), starts)
+        / np.add.reduceat(is_valid, starts, dtype=np.int64)
+    )
+    # Naive sigma is NaN if there are no two consecutive non-nan observations
+    sigma[~is_seasonal & np.isnan(sigma)] = 0.0
+
+    last_observed_idx = np.maximum.reduceat(np.where(np.isfinite(target), rows, -1), starts)
+    last_observed_value = np.where(last_observed_idx >= 0, target[last_observed_idx], np.nan)
+    mean = np.repeat(last_observed_value[:, None], prediction_length, axis=1)
+    steps = np.arange(1, prediction_length + 1)
+    sigma_factor = np.repeat(np.sqrt(steps)[None, :], len(lengths), axis=0)
+    if is_seasonal.any():
+        seasonal_idx = indptr[1:][is_seasonal, None] - seasonal_period + np.arange(prediction_length) % seasonal_period
+        mean[is_seasonal] = values[seasonal_idx]
+        sigma_factor[is_seasonal] = np.sqrt(steps // seasonal_period + 1)
+    sigma_per_timestep = sigma[:, None] * sigma_factor
+
+    forecast = np.empty((len(lengths), prediction_length, 1 + len(quantile_levels)))
+    forecast[:, :, 0] = mean
+    for i, q in enumerate(quantile_levels):
+        forecast[:, :, i + 1] = mean + norm.ppf(q) * sigma_per_timestep
+    return forecast
+
+
+def _get_grouped_mean_and_quantiles(
+    values: np.ndarray, group_ids: np.ndarray, quantile_levels: list[float]
+) -> tuple[np.ndarray, np.ndarray]:
+    """Compute the mean and quantiles of the non-NaN values in each group, identical to `pd.Series.quantile`.
+
+    Returns the sorted unique group ids and an array of shape [num_groups, 1 + len(quantile_levels)].
+    """
+    # Sort by group, then by value. NaNs are sorted to the end of each group.
+    order = np.lexsort((values, group_ids))
+    sorted_values = values[order]
+    sorted_group_ids = group_ids[order]
+    group_starts = np.flatnonzero(np.concatenate([[True], sorted_group_ids[1:] != sorted_group_ids[:-1]]))
+    is_valid = ~np.isnan(sorted_values)
+    counts = np.add.reduceat(is_valid, group_starts, dtype=np.int64)
+
+    stats = np.empty((len(group_starts), 1 + len(quantile_levels)))
+    stats[:, 0] = np.add.reduceat(np.where(is_valid, sorted_values, 0.0), group_starts) / counts
+    for i, q in enumerate(quantile_levels):
+        # Linear interpolation between the closest ranks, as in np.percentile which is used by pd.Series.quantile
+        virtual_idx = (counts - 1) * (q * 100.0 / 100)
+        prev_idx = np.maximum(np.floor(virtual_idx).astype(np.int64), 0)
+        next_idx = np.minimum(prev_idx + 1, np.maximum(counts - 1, 0))
+        gamma = virtual_idx - prev_idx
+        a = sorted_values[group_starts + prev_idx]
+        b = sorted_values[group_starts + next_idx]
+        diff = b - a
+        stats[:, i + 1] = np.where(gamma >= 0.5, b - diff * (1 - gamma), a + diff * gamma)
+    stats[counts == 0] = np.nan
+    return sorted_group_ids[group_starts], stats
+
+
+def _seasonal_average_forecast_batch(
+    target: np.ndarray,
+    indptr: np.ndarray,
+    prediction_length: int,
+    quantile_levels: list[float],
+    seasonal_period: int,
+) -> np.ndarray:
+    """Batched version of `SeasonalAverageModel._predict_with_local_model`, equivalent to `AverageModel` if
+    seasonal_period is 1.
+
+    Returns an array of shape [num_items, prediction_length, 1 + len(quantile_levels)].
+    """
+    num_items = len(indptr) - 1
+    item_ids, positions = _get_item_ids_and_positions(indptr)
+    _, stats_marginal = _get_grouped_mean_and_quantiles(target, item_ids, quantile_levels)
+    forecast = np.repeat(stats_marginal[:, None, :], prediction_length, axis=1)
+    if seasonal_period > 1:
+        season_ids = item_ids.astype(np.int64) * seasonal_period + positions % seasonal_period
+        seasons, stats_per_season = _get_grouped_mean_and_quantiles(target, season_ids, quantile_levels)
+
+        next_season = (np.diff(indptr) - 1) % seasonal_period + 1
+        season_in_forecast_horizon = (next_season[:, None] + np.arange(prediction_length)) % seasonal_period
+        forecast_season_ids = np.arange(num_items)[:, None] * seasonal_period + season_in_forecast_horizon
+        idx = np.minimum(np.searchsorted(seasons, forecast_season_ids), len(seasons) - 1)
+        is_observed = seasons[idx] == forecast_season_ids
+        forecast_per_season = np.where(is_observed[..., None], stats_per_season[idx], np.nan)
+        # Use statistics over all timesteps to fill values for seasons that are missing from training data
+        forecast = np.where(np.isnan(forecast_per_season), forecast, forecast_per_season)
+    return forecast
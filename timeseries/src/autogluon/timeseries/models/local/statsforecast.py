@@ -1,18 +1,100 @@
+import hashlib
 import logging
+import os
 from typing import Any, Type
 
 import numpy as np
 import pandas as pd
 
+from autogluon.common.loaders import load_pkl
+from autogluon.common.savers import save_pkl
+from autogluon.timeseries.dataset import TimeSeriesDataFrame
+
 from .abstract_local_model import AbstractLocalModel
 
 logger = logging.getLogger(__name__)
 
 
 class AbstractStatsForecastModel(AbstractLocalModel):
-    """Wrapper for StatsForecast models."""
+    """Wrapper for StatsForecast models.
+
+    Models with ``supports_state_cache = True`` accept the hyperparameter ``use_state_cache``. If enabled, the fitted
+    local model of each item is stored in ``<model path>/utils/local_model_state_cache.pkl``, together with the last
+    timestamp and a hash of the last ``num_fingerprint_values`` values of the time series that it was fit on. Note
+    that ``predict`` then writes to the model directory. The cache only keeps the items of the most recent call to
+    ``predict`` and is replaced atomically, so concurrent calls do not corrupt it (the last call wins).
+
+    When ``predict`` later receives a time series that extends the cached one with new observations, the cached model
+    is applied to the updated series via ``forward``, which skips parameter estimation and automatic model selection.
+    The local model is refit from scratch if the item is not in the cache, the last ``num_fingerprint_values`` values
+    before the cached last timestamp have changed, or the one-step-ahead RMSE on the new observations exceeds
+    ``state_drift_threshold`` times the in-sample RMSE of the cached model. Changes to older values of the time series
+    are not detected, as this would require storing the full history of each item.
+    """
 
     init_time_in_seconds = 15  # numba compilation for the first run
+    supports_state_cache: bool = False
+    state_cache_filename = "local_model_state_cache.pkl"
+    # number of values before the cached last timestamp that must be unchanged to reuse the cached model
+    num_fingerprint_values: int = 64
+
+    @property
+    def allowed_hyperparameters(self) -> list[str]:
+        return super().allowed_hyperparameters + ["use_state_cache", "state_drift_threshold"]
+
+    def _get_default_hyperparameters(self) -> dict:
+        return {
+            **super()._get_default_hyperparameters(),
+            "use_state_cache": False,
+            "state_drift_threshold": 3.0,
+        }
+
+    def _fit(self, train_data: TimeSeriesDataFrame, time_limit: int | None = None, **kwargs):
+        super()._fit(train_data=train_data, time_limit=time_limit, **kwargs)
+        # states cached by a previous fit may have been created with different model arguments
+        state_cache_path = self._get_state_cache_path()
+        if os.path.exists(state_cache_path):
+            os.remove(state_cache_path)
+        return self
+
+    def _get_state_cache_path(self) -> str:
+        return os.path.join(self.path, "utils", self.state_cache_filename)
+
+    def _load_item_states(self, item_ids: pd.Index) -> list | None:
+        if not (self.supports_state_cache and self.get_hyperparameters().get("use_state_cache", False)):
+            return None
+        state_cache_path = self._get_state_cache_path()
+        state_cache = load_pkl.load(path=state_cache_path, verbose=False) if os.path.exists(state_cache_path) else {}
+        return [state_cache.get(item_id) for item_id in item_ids]
+
+    def _save_item_states(self, item_ids: pd.Index, item_states: list) -> None:
+        # only the items of the current data are kept, which bounds the size of the cache
+        state_cache = {item_id: state for item_id, state in zip(item_ids, item_states) if state is not None}
+        state_cache_path = self._get_state_cache_path()
+        # write to a temporary file first, so that an interrupted write never leaves a truncated cache
+        state_cache_path_tmp = f"{state_cache_path}.{os.getpid()}.tmp"
+        save_pkl.save(path=state_cache_path_tmp, object=state_cache, verbose=False)
+        os.replace(state_cache_path_tmp, state_cache_path)
+        logger.debug(f"\t{self.name}: cached state for {len(state_cache)} of {len(item_ids)} time series")
+
+    def _get_series_fingerprint(self, values: np.ndarray) -> str:
+        tail = np.ascontiguousarray(values[-self.num_fingerprint_values :], dtype=np.float64)
+        return hashlib.sha1(tail.tobytes()).hexdigest()
+
+    def _get_num_new_observations(self, time_series: pd.Series, state: dict) -> int | None:
+        """Number of observations in ``time_series`` after the end of the series that ``state`` was created for, or
+        None if ``time_series`` does not extend that series."""
+        timestamps = time_series.index
+        end = timestamps.searchsorted(state["last_timestamp"], side="right")
+        if end == 0 or timestamps[end - 1] != state["last_timestamp"]:
+            return None
+        if self._get_series_fingerprint(time_series.to_numpy(dtype=np.float64)[:end]) != state["fingerprint"]:
+            return None
+        return len(timestamps) - end
+
+    def _get_series_local_model_args(self, time_series: pd.Series, local_model_args: dict) -> dict:
+        """Adjust the local model arguments to the given time series."""
+        return local_model_args
 
     def _update_local_model_args(self, local_model_args: dict[str, Any]) -> dict[str, Any]:
         seasonal_period = local_model_args.pop("seasonal_period")
@@ -46,16 +128,69 @@ class AbstractStatsForecastModel(AbstractLocalModel):
 
 
 class AbstractProbabilisticStatsForecastModel(AbstractStatsForecastModel):
+    supports_state_cache = True
+
     def _predict_with_local_model(
         self,
         time_series: pd.Series,
         local_model_args: dict,
     ) -> pd.DataFrame:
         levels, quantile_to_key = self._get_confidence_levels()
+        local_model_args = self._get_series_local_model_args(time_series, local_model_args)
 
         forecast = self._get_local_model(local_model_args).forecast(
             h=self.prediction_length, y=time_series.values.ravel(), level=levels
         )
+        return self._forecast_to_dataframe(forecast, quantile_to_key)
+
+    def _predict_with_local_model_state(
+        self,
+        time_series: pd.Series,
+        local_model_args: dict,
+        item_state: dict | None = None,
+    ) -> tuple[pd.DataFrame, dict | None]:
+        model_params = self.get_hyperparameters()
+        if not model_params.get("use_state_cache", False):
+            return super()._predict_with_local_model_state(time_series, local_model_args, item_state=item_state)
+
+        levels, quantile_to_key = self._get_confidence_levels()
+        local_model_args = self._get_series_local_model_args(time_series, local_model_args)
+        y = time_series.to_numpy(dtype=np.float64)
+
+        if item_state is not None and item_state["local_model_args"] == local_model_args:
+            num_new_observations = self._get_num_new_observations(time_series, item_state)
+            if num_new_observations is not None:
+                try:
+                    # apply the cached model to the updated series without re-estimating its parameters
+                    forecast = item_state["model"].forward(y=y, h=self.prediction_length, level=levels, fitted=True)
+                    start = len(y) - num_new_observations
+                    new_residuals = y[start:] - forecast["fitted"][start:]
+                    new_rmse = np.sqrt(np.mean(np.square(new_residuals))) if num_new_observations > 0 else 0.0
+                    is_drift = new_rmse > model_params["state_drift_threshold"] * item_state["rmse"]
+                    if not is_drift and np.isfinite(forecast["mean"]).all():
+                        new_state = {
+                            **item_state,
+                            "last_timestamp": time_series.index[-1],
+                            "fingerprint": self._get_series_fingerprint(y),
+                        }
+                        return self._forecast_to_dataframe(forecast, quantile_to_key), new_state
+                except Exception:
+                    logger.debug(f"\t{self.name}: failed to update cached state, refitting the local model")
+
+        model = self._get_local_model(local_model_args).fit(y=y)
+        forecast = model.predict(h=self.prediction_length, level=levels)
+        in_sample_residuals = y - model.predict_in_sample()["fitted"]
+        new_state = {
+            "model": model,
+            "local_model_args": local_model_args,
+            "rmse": np.sqrt(np.nanmean(np.square(in_sample_residuals))),
+            "last_timestamp": time_series.index[-1],
+            "fingerprint": self._get_series_fingerprint(y),
+        }
+        return self._forecast_to_dataframe(forecast, quantile_to_key), new_state
+
+    @staticmethod
+    def _forecast_to_dataframe(forecast: dict[str, np.ndarray], quantile_to_key: dict[str, str]) -> pd.DataFrame:
         predictions = {"mean": forecast["mean"]}
         for q, key in quantile_to_key.items():
             predictions[q] = forecast[key]
@@ -131,6 +266,13 @@ class AutoARIMAModel(AbstractProbabilisticStatsForecastModel):
     max_ts_length : int, default = 2500
         If not None, only the last ``max_ts_length`` time steps of each time series will be used to train the model.
         This significantly speeds up fitting and usually leads to no change in accuracy.
+    use_state_cache : bool, default = False
+        If True, the fitted model for each time series is cached in the model directory. If the time series passed
+        to predict extends a cached time series with new observations, the cached model is applied to the new
+        observations without re-estimating its parameters.
+    state_drift_threshold : float, default = 3.0
+        A cached model is refit if its one-step-ahead RMSE on the new observations exceeds state_drift_threshold
+        times its in-sample RMSE.
     """
 
     ag_priority = 60
@@ -210,6 +352,13 @@ class ARIMAModel(AbstractProbabilisticStatsForecastModel):
     max_ts_length : int, default = 2500
         If not None, only the last ``max_ts_length`` time steps of each time series will be used to train the model.
         This significantly speeds up fitting and usually leads to no change in accuracy.
+    use_state_cache : bool, default = False
+        If True, the fitted model for each time series is cached in the model directory. If the time series passed
+        to predict extends a cached time series with new observations, the cached model is applied to the new
+        observations without re-estimating its parameters.
+    state_drift_threshold : float, default = 3.0
+        A cached model is refit if its one-step-ahead RMSE on the new observations exceeds state_drift_threshold
+        times its in-sample RMSE.
     """
 
     ag_priority = 10
@@ -267,6 +416,13 @@ class AutoETSModel(AbstractProbabilisticStatsForecastModel):
     max_ts_length : int, default = 2500
         If not None, only the last ``max_ts_length`` time steps of each time series will be used to train the model.
         This significantly speeds up fitting and usually leads to no change in accuracy.
+    use_state_cache : bool, default = False
+        If True, the fitted model for each time series is cached in the model directory. If the time series passed
+        to predict extends a cached time series with new observations, the cached model is applied to the new
+        observations without re-estimating its parameters.
+    state_drift_threshold : float, default = 3.0
+        A cached model is refit if its one-step-ahead RMSE on the new observations exceeds state_drift_threshold
+        times its in-sample RMSE.
     """
 
     ag_priority = 60
@@ -288,18 +444,14 @@ class AutoETSModel(AbstractProbabilisticStatsForecastModel):
         local_model_args.setdefault("damped", False)
         return local_model_args
 
-    def _predict_with_local_model(
-        self,
-        time_series: pd.Series,
-        local_model_args: dict,
-    ) -> pd.DataFrame:
+    def _get_series_local_model_args(self, time_series: pd.Series, local_model_args: dict) -> dict:
         # Disable seasonality if time series too short for chosen season_length, season_length is too high, or
         # season_length == 1. Otherwise model will crash
         season_length = local_model_args["season_length"]
         if len(time_series) < 2 * season_length or season_length == 1:
             # changing last character to "N" disables seasonality, e.g., model="AAA" -> model="AAN"
             local_model_args["model"] = local_model_args["model"][:-1] + "N"
-        return super()._predict_with_local_model(time_series=time_series, local_model_args=local_model_args)
+        return local_model_args
 
 
 class ETSModel(AutoETSModel):
@@ -331,6 +483,13 @@ class ETSModel(AutoETSModel):
     max_ts_length : int, default = 2500
         If not None, only the last ``max_ts_length`` time steps of each time series will be used to train the model.
         This significantly speeds up fitting and usually leads to no change in accuracy.
+    use_state_cache : bool, default = False
+        If True, the fitted model for each time series is cached in the model directory. If the time series passed
+        to predict extends a cached time series with new observations, the cached model is applied to the new
+        observations without re-estimating its parameters.
+    state_drift_threshold : float, default = 3.0
+        A cached model is refit if its one-step-ahead RMSE on the new observations exceeds state_drift_threshold
+        times its in-sample RMSE.
     """
 
     ag_priority = 80
@@ -372,6 +531,13 @@ class DynamicOptimizedThetaModel(AbstractProbabilisticStatsForecastModel):
     max_ts_length : int, default = 2500
         If not None, only the last ``max_ts_length`` time steps of each time series will be used to train the model.
         This significantly speeds up fitting and usually leads to no change in accuracy.
+    use_state_cache : bool, default = False
+        If True, the fitted model for each time series is cached in the model directory. If the time series passed
+        to predict extends a cached time series with new observations, the cached model is applied to the new
+        observations without re-estimating its parameters.
+    state_drift_threshold : float, default = 3.0
+        A cached model is refit if its one-step-ahead RMSE on the new observations exceeds state_drift_threshold
+        times its in-sample RMSE.
     """
 
     ag_priority = 75
@@ -417,6 +583,13 @@ class ThetaModel(AbstractProbabilisticStatsForecastModel):
     max_ts_length : int, default = 2500
         If not None, only the last ``max_ts_length`` time steps of each time series will be used to train the model.
         This significantly speeds up fitting and usually leads to no change in accuracy.
+    use_state_cache : bool, default = False
+        If True, the fitted model for each time series is cached in the model directory. If the time series passed
+        to predict extends a cached time series with new observations, the cached model is applied to the new
+        observations without re-estimating its parameters.
+    state_drift_threshold : float, default = 3.0
+        A cached model is refit if its one-step-ahead RMSE on the new observations exceeds state_drift_threshold
+        times its in-sample RMSE.
     """
 
     ag_priority = 75
@@ -538,6 +711,13 @@ class AutoCESModel(AbstractProbabilisticStatsForecastModel):
     max_ts_length : int, default = 2500
         If not None, only the last ``max_ts_length`` time steps of each time series will be used to train the model.
         This significantly speeds up fitting and usually leads to no change in accuracy.
+    use_state_cache : bool, default = False
+        If True, the fitted model for each time series is cached in the model directory. If the time series passed
+        to predict extends a cached time series with new observations, the cached model is applied to the new
+        observations without re-estimating its parameters.
+    state_drift_threshold : float, default = 3.0
+        A cached model is refit if its one-step-ahead RMSE on the new observations exceeds state_drift_threshold
+        times its in-sample RMSE.
     """
 
     ag_priority = 10
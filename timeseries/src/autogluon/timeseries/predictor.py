@@ -1598,6 +1598,23 @@ class TimeSeriesPredictor:
         """
         return self._learner.unpersist_trainer()
 
+    def prediction_cache_stats(self) -> dict[str, int | float]:
+        """Return statistics of the prediction cache used by :meth:`~autogluon.timeseries.TimeSeriesPredictor.predict`,
+        :meth:`~autogluon.timeseries.TimeSeriesPredictor.leaderboard` and
+        :meth:`~autogluon.timeseries.TimeSeriesPredictor.evaluate`.
+
+        Hits and misses are counted per model since the predictor was created or loaded. If ``cache_predictions=True``,
+        the number of cached entries and their total size on disk are reported as well.
+
+        Returns
+        -------
+        stats : dict[str, int | float]
+            Dictionary with keys ``"num_hits"``, ``"num_misses"`` and ``"hit_rate"``, and, if caching is enabled,
+            ``"num_entries"`` and ``"disk_bytes"``.
+        """
+        self._assert_is_fit("prediction_cache_stats")
+        return self._trainer.prediction_cache.get_stats()
+
     def leaderboard(
         self,
         data: TimeSeriesDataFrame | pd.DataFrame | Path | str | None = None,
@@ -10,7 +10,7 @@ import numpy as np
 from typing_extensions import Self
 
 from autogluon.timeseries import TimeSeriesDataFrame
-from autogluon.timeseries.metrics import TimeSeriesScorer
+from autogluon.timeseries.metrics import ScoringContext, TimeSeriesScorer
 from autogluon.timeseries.models.ensemble import (
     AbstractTimeSeriesEnsembleModel,
     PerformanceWeightedEnsemble,
@@ -210,6 +210,12 @@ class EnsembleComposer:
             window_end = window_start + self.num_windows_per_layer[layer_idx - 1]
             return data_per_window[window_start:window_end]
 
+        # validation scores of all ensembles are computed on the last layer's windows
+        last_layer_scoring_contexts = [
+            ScoringContext(data, prediction_length=self.eval_metric.prediction_length, target=self.target)
+            for data in get_ground_truth_for_layer(self.num_layers)
+        ]
+
         main_loop_timer = SplitTimer(time_limit, rounds=num_ensembles).start()
 
         # main loop over layers of ensembles
@@ -259,10 +265,9 @@ class EnsembleComposer:
 
                     # compute validation score using the last layer's validation windows
                     last_layer_oof_predictions = ensemble.get_oof_predictions()[-self.num_windows_per_layer[-1] :]
-                    last_layer_ground_truth = get_ground_truth_for_layer(self.num_layers)
                     score_per_fold = [
-                        self.eval_metric(data, prediction, target=self.target)
-                        for prediction, data in zip(last_layer_oof_predictions, last_layer_ground_truth)
+                        self.eval_metric.score_batch(scoring_context, [prediction], target=self.target)[0]
+                        for prediction, scoring_context in zip(last_layer_oof_predictions, last_layer_scoring_contexts)
                     ]
                     ensemble.val_score = float(np.mean(score_per_fold, dtype=np.float64))
 
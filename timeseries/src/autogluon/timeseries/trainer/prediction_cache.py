@@ -1,7 +1,11 @@
 import logging
+import os
+import shutil
+import time
 from abc import ABC, abstractmethod
+from hashlib import md5
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
 from autogluon.common.utils.utils import hash_pandas_df
 from autogluon.core.utils.loaders import load_pkl
@@ -19,11 +23,21 @@ class PredictionCache(ABC):
 
     def __init__(self, root_path: str):
         self.root_path = Path(root_path)
+        self.num_hits = 0
+        self.num_misses = 0
 
     @abstractmethod
     def get(
-        self, data: TimeSeriesDataFrame, known_covariates: TimeSeriesDataFrame | None
+        self,
+        data: TimeSeriesDataFrame,
+        known_covariates: TimeSeriesDataFrame | None,
+        model_names: Iterable[str] | None = None,
     ) -> tuple[dict[str, TimeSeriesDataFrame | None], dict[str, float]]:
+        """Return the cached (model_pred_dict, pred_time_dict) for the given data.
+
+        If ``model_names`` is provided, only predictions of these models are returned. Otherwise, predictions of all
+        cached models are returned.
+        """
         pass
 
     @abstractmethod
@@ -40,10 +54,19 @@ class PredictionCache(ABC):
     def clear(self) -> None:
         pass
 
+    def get_stats(self) -> dict[str, int | float]:
+        """Return the number of cache hits and misses, counted per model, since the cache was created."""
+        num_requests = self.num_hits + self.num_misses
+        return {
+            "num_hits": self.num_hits,
+            "num_misses": self.num_misses,
+            "hit_rate": self.num_hits / num_requests if num_requests > 0 else 0.0,
+        }
+
 
-def get_prediction_cache(use_cache: bool, root_path: str) -> PredictionCache:
+def get_prediction_cache(use_cache: bool, root_path: str, max_disk_bytes: int | None = None) -> PredictionCache:
     if use_cache:
-        return FileBasedPredictionCache(root_path=root_path)
+        return FileBasedPredictionCache(root_path=root_path, max_disk_bytes=max_disk_bytes)
     else:
         return NoOpPredictionCache(root_path=root_path)
 
@@ -58,7 +81,10 @@ class NoOpPredictionCache(PredictionCache):
     """A dummy (no-op) prediction cache."""
 
     def get(
-        self, data: TimeSeriesDataFrame, known_covariates: TimeSeriesDataFrame | None
+        self,
+        data: TimeSeriesDataFrame,
+        known_covariates: TimeSeriesDataFrame | None,
+        model_names: Iterable[str] | None = None,
     ) -> tuple[dict[str, TimeSeriesDataFrame | None], dict[str, float]]:
         return {}, {}
 
@@ -76,19 +102,63 @@ class NoOpPredictionCache(PredictionCache):
 
 
 class FileBasedPredictionCache(PredictionCache):
-    """A file-backed cache of model predictions."""
+    """A file-backed cache of model predictions.
+
+    The predictions of each (dataset, model) pair are stored in a separate file, so that ``get`` only loads the
+    requested models and ``put`` only writes the new predictions. An index file keeps track of the size, prediction
+    time and last access time of every entry. When the total size of the cached predictions exceeds
+    ``max_disk_bytes``, the least recently used entries are evicted.
+
+    Parameters
+    ----------
+    root_path
+        Directory where the ``cached_predictions`` directory is created.
+    max_disk_bytes
+        Maximum total size of the cached prediction files. If None, defaults to 2 GB.
+    """
 
-    _cached_predictions_filename = "cached_predictions.pkl"
+    _cached_predictions_dirname = "cached_predictions"
+    _index_filename = "index.pkl"
+    # single-file cache used by previous versions, removed by ``clear``
+    _legacy_cached_predictions_filename = "cached_predictions.pkl"
+    default_max_disk_bytes = 2 * 1024**3
+
+    def __init__(self, root_path: str, max_disk_bytes: int | None = None):
+        super().__init__(root_path=root_path)
+        self.max_disk_bytes = max_disk_bytes if max_disk_bytes is not None else self.default_max_disk_bytes
+        self._index: dict[str, dict[str, dict[str, Any]]] | None = None
+        self._index_stat: tuple[int, int] | None = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # The index is reloaded from disk on first use, hit/miss statistics are tracked per session
+        state["_index"] = None
+        state["_index_stat"] = None
+        state["num_hits"] = 0
+        state["num_misses"] = 0
+        return state
+
+    @property
+    def cache_dir(self) -> Path:
+        return Path(self.root_path) / self._cached_predictions_dirname
 
     @property
     def path(self) -> Path:
-        return Path(self.root_path) / self._cached_predictions_filename
+        """Path to the index file."""
+        return self.cache_dir / self._index_filename
+
+    @property
+    def disk_bytes(self) -> int:
+        return sum(entry["size"] for entries in self._load_index().values() for entry in entries.values())
 
     def get(
-        self, data: TimeSeriesDataFrame, known_covariates: TimeSeriesDataFrame | None
+        self,
+        data: TimeSeriesDataFrame,
+        known_covariates: TimeSeriesDataFrame | None,
+        model_names: Iterable[str] | None = None,
     ) -> tuple[dict[str, TimeSeriesDataFrame | None], dict[str, float]]:
         dataset_hash = compute_dataset_hash(data, known_covariates)
-        return self._get_cached_pred_dicts(dataset_hash)
+        return self._get_cached_pred_dicts(dataset_hash, model_names=model_names)
 
     def put(
         self,
@@ -101,37 +171,108 @@ class FileBasedPredictionCache(PredictionCache):
         self._save_cached_pred_dicts(dataset_hash, model_pred_dict, pred_time_dict)
 
     def clear(self) -> None:
-        if self.path.exists():
-            logger.debug(f"Removing existing cached predictions file {self.path}")
-            self.path.unlink()
-
-    def _load_cached_predictions(self) -> dict[str, dict[str, dict[str, Any]]]:
-        if self.path.exists():
-            try:
-                cached_predictions = load_pkl.load(str(self.path))
-            except Exception:
-                cached_predictions = {}
-        else:
-            cached_predictions = {}
-        return cached_predictions
+        if self.cache_dir.exists():
+            logger.debug(f"Removing existing cached predictions directory {self.cache_dir}")
+            shutil.rmtree(self.cache_dir, ignore_errors=True)
+        legacy_path = Path(self.root_path) / self._legacy_cached_predictions_filename
+        if legacy_path.exists():
+            logger.debug(f"Removing existing cached predictions file {legacy_path}")
+            legacy_path.unlink(missing_ok=True)
+        self._index = {}
+        self._index_stat = None
+
+    def get_stats(self) -> dict[str, int | float]:
+        index = self._load_index()
+        stats = super().get_stats()
+        stats["num_entries"] = sum(len(entries) for entries in index.values())
+        stats["disk_bytes"] = self.disk_bytes
+        return stats
+
+    def _get_entry_path(self, dataset_hash: str, model_name: str) -> Path:
+        # Model names are hashed since they may contain characters that are not allowed in file names
+        model_hash = md5(model_name.encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{dataset_hash}_{model_hash}.pkl"
+
+    def _get_index_stat(self) -> tuple[int, int] | None:
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _load_index(self) -> dict[str, dict[str, dict[str, Any]]]:
+        # The index is kept in memory and only reloaded if the index file was modified by another process
+        index_stat = self._get_index_stat()
+        if self._index is None or index_stat != self._index_stat:
+            index = {}
+            if index_stat is not None:
+                try:
+                    index = load_pkl.load(str(self.path))
+                    assert isinstance(index, dict)
+                except Exception:
+                    logger.warning("Cached predictions index is corrupted. Predictions will be made from scratch.")
+                    index = {}
+            self._index = index
+            self._index_stat = index_stat
+        return self._index
+
+    def _save_index(self, index: dict[str, dict[str, dict[str, Any]]]) -> None:
+        self._atomic_save(self.path, index)
+        self._index = index
+        self._index_stat = self._get_index_stat()
+
+    @staticmethod
+    def _atomic_save(path: Path, obj: Any) -> None:
+        """Write to a temporary file first, so that an interrupted write never leaves a truncated file at ``path``."""
+        path_tmp = path.with_name(path.name + ".tmp")
+        save_pkl.save(str(path_tmp), object=obj, verbose=False)
+        os.replace(path_tmp, path)
+
+    def _remove_entry(self, index: dict[str, dict[str, dict[str, Any]]], dataset_hash: str, model_name: str) -> None:
+        entries = index.get(dataset_hash, {})
+        entries.pop(model_name, None)
+        if not entries:
+            index.pop(dataset_hash, None)
+        self._get_entry_path(dataset_hash, model_name).unlink(missing_ok=True)
 
     def _get_cached_pred_dicts(
-        self, dataset_hash: str
+        self, dataset_hash: str, model_names: Iterable[str] | None = None
     ) -> tuple[dict[str, TimeSeriesDataFrame | None], dict[str, float]]:
         """Load cached predictions for given dataset_hash from disk, if possible.
 
-        If loading fails for any reason, empty dicts are returned.
+        If ``model_names`` is provided, only the predictions of these models are loaded. Entries that cannot be loaded
+        are removed from the cache and treated as cache misses.
         """
-        cached_predictions = self._load_cached_predictions()
-        if dataset_hash in cached_predictions:
-            try:
-                model_pred_dict = cached_predictions[dataset_hash]["model_pred_dict"]
-                pred_time_dict = cached_predictions[dataset_hash]["pred_time_dict"]
-                assert model_pred_dict.keys() == pred_time_dict.keys()
-                return model_pred_dict, pred_time_dict
-            except Exception:
-                logger.warning("Cached predictions are corrupted. Predictions will be made from scratch.")
-        return {}, {}
+        index = self._load_index()
+        entries = index.get(dataset_hash, {})
+        if model_names is None:
+            model_names = list(entries.keys())
+
+        model_pred_dict = {}
+        pred_time_dict = {}
+        time_now = time.time()
+        index_updated = False
+        for model_name in model_names:
+            entry = entries.get(model_name)
+            if entry is not None:
+                try:
+                    model_pred_dict[model_name] = load_pkl.load(str(self._get_entry_path(dataset_hash, model_name)))
+                    pred_time_dict[model_name] = entry["pred_time"]
+                    entry["last_access"] = time_now
+                    self.num_hits += 1
+                    continue
+                except Exception:
+                    logger.warning(
+                        f"Cached predictions for model {model_name} are corrupted. Predictions will be made from scratch."
+                    )
+                    self._remove_entry(index, dataset_hash=dataset_hash, model_name=model_name)
+                    index_updated = True
+            self.num_misses += 1
+
+        # Persist the access times so that the LRU order is preserved across sessions
+        if len(model_pred_dict) > 0 or index_updated:
+            self._save_index(index)
+        return model_pred_dict, pred_time_dict
 
     def _save_cached_pred_dicts(
         self,
@@ -139,11 +280,41 @@ class FileBasedPredictionCache(PredictionCache):
         model_pred_dict: dict[str, TimeSeriesDataFrame | None],
         pred_time_dict: dict[str, float],
     ) -> None:
-        cached_predictions = self._load_cached_predictions()
-        # Do not save results for models that failed
-        cached_predictions[dataset_hash] = {
-            "model_pred_dict": {k: v for k, v in model_pred_dict.items() if v is not None},
-            "pred_time_dict": {k: v for k, v in pred_time_dict.items() if v is not None},
-        }
-        save_pkl.save(str(self.path), object=cached_predictions)
-        logger.debug(f"Cached predictions saved to {self.path}")
+        index = self._load_index()
+        entries = index.setdefault(dataset_hash, {})
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        time_now = time.time()
+        num_saved = 0
+        for model_name, predictions in model_pred_dict.items():
+            # Do not save results for models that failed, and do not rewrite predictions that are already cached
+            if predictions is None or pred_time_dict.get(model_name) is None or model_name in entries:
+                continue
+            entry_path = self._get_entry_path(dataset_hash, model_name)
+            self._atomic_save(entry_path, predictions)
+            entries[model_name] = {
+                "pred_time": pred_time_dict[model_name],
+                "size": entry_path.stat().st_size,
+                "last_access": time_now,
+            }
+            num_saved += 1
+        if not entries:
+            index.pop(dataset_hash)
+        if num_saved > 0:
+            self._evict(index)
+            self._save_index(index)
+            logger.debug(f"Cached predictions for {num_saved} models saved to {self.cache_dir}")
+
+    def _evict(self, index: dict[str, dict[str, dict[str, Any]]]) -> None:
+        """Remove the least recently used entries until the cache fits in ``max_disk_bytes``."""
+        all_entries = [
+            (entry["last_access"], dataset_hash, model_name, entry["size"])
+            for dataset_hash, entries in index.items()
+            for model_name, entry in entries.items()
+        ]
+        total_bytes = sum(size for *_, size in all_entries)
+        for _, dataset_hash, model_name, size in sorted(all_entries):
+            if total_bytes <= self.max_disk_bytes:
+                break
+            logger.debug(f"Evicting cached predictions for model {model_name}")
+            self._remove_entry(index, dataset_hash=dataset_hash, model_name=model_name)
+            total_bytes -= size
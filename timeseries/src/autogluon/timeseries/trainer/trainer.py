@@ -18,7 +18,7 @@ from autogluon.core.utils.exceptions import TimeLimitExceeded
 from autogluon.core.utils.loaders import load_pkl
 from autogluon.core.utils.savers import save_pkl
 from autogluon.timeseries import TimeSeriesDataFrame
-from autogluon.timeseries.metrics import TimeSeriesScorer, check_get_evaluation_metric
+from autogluon.timeseries.metrics import ScoringContext, TimeSeriesScorer, check_get_evaluation_metric
 from autogluon.timeseries.models.abstract import AbstractTimeSeriesModel, TimeSeriesModelBase
 from autogluon.timeseries.models.ensemble import AbstractTimeSeriesEnsembleModel
 from autogluon.timeseries.models.multi_window import MultiWindowBacktestingModel
@@ -660,22 +660,22 @@ class TimeSeriesTrainer(AbstractTrainer[TimeSeriesModelBase]):
             )
 
             for model_name in model_names:
-                model_preds = model_predictions[model_name]
-                if model_preds is None:
+                if model_predictions[model_name] is None:
                     # Model failed at prediction time
-                    model_info[model_name]["score_test"] = float("nan")
                     model_info[model_name]["pred_time_test"] = float("nan")
                 else:
-                    model_info[model_name]["score_test"] = self._score_with_predictions(data, model_preds)
                     model_info[model_name]["pred_time_test"] = pred_time_dict[model_name]
 
-                for metric in extra_metrics:
-                    if model_preds is None:
-                        model_info[model_name][str(metric)] = float("nan")
-                    else:
-                        model_info[model_name][str(metric)] = self._score_with_predictions(
-                            data, model_preds, metric=metric
-                        )
+            # Score the predictions of all models at once to split the data and compute past metrics only once
+            scoring_context = ScoringContext(data, prediction_length=self.prediction_length, target=self.target)
+            scores = {"score_test": self._score_multiple_with_predictions(scoring_context, model_predictions)}
+            for metric in extra_metrics:
+                scores[str(metric)] = self._score_multiple_with_predictions(
+                    scoring_context, model_predictions, metric=metric
+                )
+            for column, scores_per_model in scores.items():
+                for model_name, score in scores_per_model.items():
+                    model_info[model_name][column] = score
 
         explicit_column_order = [
             "model",
@@ -798,16 +798,36 @@ class TimeSeriesTrainer(AbstractTrainer[TimeSeriesModelBase]):
 
     def _score_with_predictions(
         self,
-        data: TimeSeriesDataFrame,
+        data: TimeSeriesDataFrame | ScoringContext,
         predictions: TimeSeriesDataFrame,
         metric: str | TimeSeriesScorer | None = None,
     ) -> float:
         """Compute the score measuring how well the predictions align with the data."""
-        return self._get_eval_metric(metric).score(
+        return self._get_eval_metric(metric).score_batch(
             data=data,
-            predictions=predictions,
+            predictions=[predictions],
+            target=self.target,
+        )[0]
+
+    def _score_multiple_with_predictions(
+        self,
+        data: TimeSeriesDataFrame | ScoringContext,
+        predictions: dict[str, TimeSeriesDataFrame | None],
+        metric: str | TimeSeriesScorer | None = None,
+    ) -> dict[str, float]:
+        """Compute the score of the predictions of multiple models on the same data.
+
+        Models with predictions equal to None (i.e., models that failed at prediction time) receive a score of NaN.
+        """
+        model_names = [model_name for model_name, model_preds in predictions.items() if model_preds is not None]
+        scores = self._get_eval_metric(metric).score_batch(
+            data=data,
+            predictions=[predictions[model_name] for model_name in model_names],
             target=self.target,
         )
+        scores_dict = {model_name: float("nan") for model_name in predictions}
+        scores_dict.update(zip(model_names, scores))
+        return scores_dict
 
     def score(
         self,
@@ -833,11 +853,12 @@ class TimeSeriesTrainer(AbstractTrainer[TimeSeriesModelBase]):
         predictions = self.predict(data=past_data, known_covariates=known_covariates, model=model, use_cache=use_cache)
 
         metrics_ = [metrics] if not isinstance(metrics, list) else metrics
+        scoring_context = ScoringContext(data, prediction_length=self.prediction_length, target=self.target)
         scores_dict = {}
         for metric in metrics_:
             eval_metric = self._get_eval_metric(metric)
             scores_dict[eval_metric.name] = self._score_with_predictions(
-                data=data, predictions=predictions, metric=eval_metric
+                data=scoring_context, predictions=predictions, metric=eval_metric
             )
         return scores_dict
 
@@ -1116,14 +1137,6 @@ class TimeSeriesTrainer(AbstractTrainer[TimeSeriesModelBase]):
         use_cache
             If False, will ignore the cache even if it's available.
         """
-        if use_cache:
-            model_pred_dict, pred_time_dict_marginal = self.prediction_cache.get(
-                data=data, known_covariates=known_covariates
-            )
-        else:
-            model_pred_dict = {}
-            pred_time_dict_marginal: dict[str, Any] = {}
-
         model_set = set()
         for model_name in model_names:
             model_set.update(self.get_minimum_model_set(model_name))
@@ -1132,6 +1145,14 @@ class TimeSeriesTrainer(AbstractTrainer[TimeSeriesModelBase]):
             model_set = sorted(model_set, key=model_to_layer.get)  # type: ignore
         logger.debug(f"Prediction order: {model_set}")
 
+        if use_cache:
+            model_pred_dict, pred_time_dict_marginal = self.prediction_cache.get(
+                data=data, known_covariates=known_covariates, model_names=model_set
+            )
+        else:
+            model_pred_dict = {}
+            pred_time_dict_marginal: dict[str, Any] = {}
+
         failed_models = []
         for model_name in model_set:
             if model_name not in model_pred_dict:
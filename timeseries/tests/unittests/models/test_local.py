@@ -9,11 +9,15 @@ from statsforecast.models import CrostonClassic, CrostonOptimized, CrostonSBA
 
 from autogluon.timeseries import TimeSeriesDataFrame
 from autogluon.timeseries.models.local import (
+    AutoARIMAModel,
+    AutoETSModel,
     AverageModel,
     CrostonModel,
+    NaiveModel,
     NPTSModel,
     SeasonalAverageModel,
     SeasonalNaiveModel,
+    ThetaModel,
 )
 from autogluon.timeseries.models.local.statsforecast import AbstractConformalizedStatsForecastModel
 
@@ -136,7 +140,7 @@ def test_when_invalid_model_arguments_provided_then_model_ignores_them(model_cla
     ],
 )
 def test_when_n_jobs_hyperparameter_provided_then_joblib_receives_it(input_n_jobs, joblib_n_jobs, temp_model_path):
-    model = AverageModel(path=temp_model_path, hyperparameters={"n_jobs": input_n_jobs})
+    model = AverageModel(path=temp_model_path, hyperparameters={"n_jobs": input_n_jobs, "use_batch_predict": False})
     with mock.patch("joblib.parallel.Parallel.__init__") as mock_parallel:
         try:
             model.fit(train_data=DUMMY_TS_DATAFRAME)
@@ -152,7 +156,9 @@ def failing_predict(*args, **kwargs):
 
 def test_when_fallback_model_disabled_and_model_fails_then_exception_is_raised(temp_model_path, local_model_class):
     model = local_model_class(
-        path=temp_model_path, hyperparameters={"use_fallback_model": False, "n_jobs": 1}, freq=DUMMY_TS_DATAFRAME.freq
+        path=temp_model_path,
+        hyperparameters={"use_fallback_model": False, "n_jobs": 1, "use_batch_predict": False},
+        freq=DUMMY_TS_DATAFRAME.freq,
     )
     model.fit(train_data=DUMMY_TS_DATAFRAME)
     model._predict_with_local_model = failing_predict
@@ -162,7 +168,9 @@ def test_when_fallback_model_disabled_and_model_fails_then_exception_is_raised(t
 
 def test_when_fallback_model_enabled_and_model_fails_then_no_exception_is_raised(temp_model_path, local_model_class):
     model = local_model_class(
-        path=temp_model_path, hyperparameters={"use_fallback_model": True, "n_jobs": 1}, freq=DUMMY_TS_DATAFRAME.freq
+        path=temp_model_path,
+        hyperparameters={"use_fallback_model": True, "n_jobs": 1, "use_batch_predict": False},
+        freq=DUMMY_TS_DATAFRAME.freq,
     )
     model.fit(train_data=DUMMY_TS_DATAFRAME)
     model._predict_with_local_model = failing_predict
@@ -385,6 +393,151 @@ def test_when_leading_nans_are_present_then_seasonal_naive_can_forecast(temp_mod
     assert not pd.isna(predictions).any(axis=None)
 
 
+@pytest.mark.parametrize("model_class", [NaiveModel, SeasonalNaiveModel, AverageModel, SeasonalAverageModel])
+@pytest.mark.parametrize("seasonal_period", [1, 3, 12])
+def test_when_batch_predict_used_then_predictions_match_per_item_predictions(model_class, seasonal_period):
+    data = DUMMY_VARIABLE_LENGTH_TS_DATAFRAME.copy()
+    indptr = data.get_indptr()
+    target = data["target"].to_numpy(copy=True)
+    target[indptr[0] : indptr[1]] = np.nan
+    target[indptr[1] : indptr[1] + 5] = np.nan
+    target[indptr[3] - 2 : indptr[3]] = np.nan
+    target[indptr[3] : indptr[4] : 2] = np.nan
+    data["target"] = target
+
+    predictions = {}
+    for use_batch_predict in [True, False]:
+        model = model_class(
+            freq=data.freq,
+            prediction_length=5,
+            hyperparameters={
+                **DEFAULT_HYPERPARAMETERS,
+                "seasonal_period": seasonal_period,
+                "use_batch_predict": use_batch_predict,
+            },
+        )
+        model.fit(train_data=data)
+        predictions[use_batch_predict] = model.predict(data)
+
+    assert predictions[True].index.equals(predictions[False].index)
+    assert list(predictions[True].columns) == list(predictions[False].columns)
+    assert np.allclose(predictions[True].values, predictions[False].values)
+
+
+@pytest.mark.parametrize("model_class", [NaiveModel, AverageModel, ThetaModel, NPTSModel])
+def test_when_model_does_not_implement_batch_predict_then_batch_predict_is_skipped(model_class):
+    model = model_class(freq=DUMMY_TS_DATAFRAME.freq, prediction_length=3, hyperparameters=DEFAULT_HYPERPARAMETERS)
+    model.fit(train_data=DUMMY_TS_DATAFRAME)
+    supports_batch_predict = model_class in [NaiveModel, AverageModel]
+
+    assert model._supports_batch_predict() == supports_batch_predict
+    with mock.patch.object(model, "_predict_batch_with_fallback", wraps=model._predict_batch_with_fallback) as spy:
+        model.predict(DUMMY_TS_DATAFRAME)
+    assert spy.called == supports_batch_predict
+
+
+@pytest.mark.parametrize("model_class", [SeasonalNaiveModel, AutoETSModel, NPTSModel])
+@pytest.mark.parametrize("n_jobs, predict_chunk_size", [(1, None), (2, 1), (2, 3)])
+def test_when_chunked_predict_used_then_predictions_match_per_item_predictions(
+    model_class, n_jobs, predict_chunk_size
+):
+    data = DUMMY_VARIABLE_LENGTH_TS_DATAFRAME.copy()
+    predictions = {}
+    for use_chunked_predict in [True, False]:
+        model = model_class(
+            freq=data.freq,
+            prediction_length=5,
+            hyperparameters={
+                **DEFAULT_HYPERPARAMETERS,
+                "n_jobs": n_jobs,
+                "use_batch_predict": False,
+                "use_chunked_predict": use_chunked_predict,
+                "predict_chunk_size": predict_chunk_size,
+            },
+        )
+        model.fit(train_data=data)
+        predictions[use_chunked_predict] = model.predict(data)
+
+    assert predictions[True].index.equals(predictions[False].index)
+    assert list(predictions[True].columns) == list(predictions[False].columns)
+    assert np.allclose(predictions[True].values, predictions[False].values)
+
+
+@pytest.mark.parametrize("model_class", [AutoARIMAModel, AutoETSModel, ThetaModel])
+def test_when_state_cache_used_and_series_extended_then_local_models_are_not_refit(model_class, temp_model_path):
+    data = DUMMY_TS_DATAFRAME.copy()
+    past_data = data.slice_by_timestep(None, -1)
+    model = model_class(
+        path=temp_model_path,
+        freq=data.freq,
+        hyperparameters={**DEFAULT_HYPERPARAMETERS, "use_state_cache": True, "state_drift_threshold": float("inf")},
+    )
+    model.fit(train_data=past_data)
+    model.predict(past_data)
+
+    with mock.patch.object(model, "_get_local_model", wraps=model._get_local_model) as mock_get_local_model:
+        predictions = model.predict(data)
+    assert mock_get_local_model.call_count == 0
+    assert not predictions.isna().any(axis=None)
+
+
+def test_when_state_cache_used_and_new_observations_drift_then_local_models_are_refit(temp_model_path):
+    data = DUMMY_TS_DATAFRAME.copy()
+    past_data = data.slice_by_timestep(None, -1)
+    model = AutoETSModel(
+        path=temp_model_path,
+        freq=data.freq,
+        hyperparameters={**DEFAULT_HYPERPARAMETERS, "use_state_cache": True, "state_drift_threshold": 3.0},
+    )
+    model.fit(train_data=past_data)
+    model.predict(past_data)
+
+    data.iloc[-1, data.columns.get_loc("target")] = 1000.0
+    with mock.patch.object(model, "_get_local_model", wraps=model._get_local_model) as mock_get_local_model:
+        model.predict(data)
+    assert mock_get_local_model.call_count == 1
+
+
+@pytest.mark.parametrize("use_chunked_predict", [True, False])
+def test_when_state_cache_used_then_cache_only_contains_items_of_last_prediction(temp_model_path, use_chunked_predict):
+    # Use data without all-NaN items, since no state is cached for series without observed values
+    data = get_data_frame_with_item_index(["10", "A", "2", "1"])
+    model = AutoETSModel(
+        path=temp_model_path,
+        freq=data.freq,
+        hyperparameters={
+            **DEFAULT_HYPERPARAMETERS,
+            "use_state_cache": True,
+            "use_chunked_predict": use_chunked_predict,
+        },
+    )
+    model.fit(train_data=data)
+    model.predict(data)
+    assert model._load_item_states(data.item_ids) is not None
+    assert all(state is not None for state in model._load_item_states(data.item_ids))
+
+    subset = data.loc[data.item_ids[:2]]
+    model.predict(subset)
+    item_states = model._load_item_states(data.item_ids)
+    assert [state is not None for state in item_states] == [True, True, False, False]
+
+
+def test_when_state_cache_used_and_series_history_changed_then_local_models_are_refit(temp_model_path):
+    data = DUMMY_TS_DATAFRAME.copy()
+    model = AutoETSModel(
+        path=temp_model_path,
+        freq=data.freq,
+        hyperparameters={**DEFAULT_HYPERPARAMETERS, "use_state_cache": True},
+    )
+    model.fit(train_data=data)
+    model.predict(data)
+
+    data.iloc[-3, data.columns.get_loc("target")] += 1.0
+    with mock.patch.object(model, "_get_local_model", wraps=model._get_local_model) as mock_get_local_model:
+        model.predict(data)
+    assert mock_get_local_model.call_count == 1
+
+
 @pytest.mark.parametrize(
     "hyperparameters, expected_cls",
     [
@@ -22,6 +22,7 @@ from autogluon.timeseries.metrics import (
     AVAILABLE_METRICS,
     DEFAULT_METRIC_NAME,
     METRIC_ALIASES,
+    ScoringContext,
     TimeSeriesScorer,
     check_get_evaluation_metric,
 )
@@ -193,6 +194,68 @@ def test_given_predictions_contain_nan_when_metric_evaluated_then_exception_is_r
         metric_cls(prediction_length=prediction_length)(data=test, predictions=predictions)
 
 
+@pytest.mark.parametrize("metric_cls", AVAILABLE_METRICS.values())
+def test_when_score_batch_called_then_scores_equal_to_individual_scores(metric_cls):
+    prediction_length = 5
+    train, test = DUMMY_TS_DATAFRAME.train_test_split(prediction_length)
+    predictions = [get_prediction_for_df(train, prediction_length).abs() for _ in range(3)]
+    metric = metric_cls(prediction_length=prediction_length)
+    test = test.abs()
+    expected_scores = [metric.score(test, preds) for preds in predictions]
+
+    assert metric.score_batch(test, predictions) == expected_scores
+    scoring_context = ScoringContext(test, prediction_length=prediction_length)
+    assert metric.score_batch(scoring_context, predictions[:1]) == expected_scores[:1]
+    assert metric.score_batch(scoring_context, predictions[1:]) == expected_scores[1:]
+
+
+@pytest.mark.parametrize("method_name", ["score", "__call__"])
+def test_when_subclass_overrides_score_then_score_batch_uses_it(method_name):
+    prediction_length = 5
+    train, test = DUMMY_TS_DATAFRAME.train_test_split(prediction_length)
+    predictions = [get_prediction_for_df(train, prediction_length) for _ in range(2)]
+
+    def score(self, data, predictions, target="target", **kwargs):
+        return 42.0
+
+    CustomMAE = type("CustomMAE", (AVAILABLE_METRICS["MAE"],), {method_name: score})
+    metric = CustomMAE(prediction_length=prediction_length)
+
+    assert metric.score_batch(test, predictions) == [42.0, 42.0]
+    scoring_context = ScoringContext(test, prediction_length=prediction_length)
+    assert metric.score_batch(scoring_context, predictions) == [42.0, 42.0]
+
+
+def test_when_scoring_context_reused_then_past_metrics_are_computed_once_per_metric(monkeypatch):
+    prediction_length = 5
+    train, test = DUMMY_TS_DATAFRAME.train_test_split(prediction_length)
+    predictions = [get_prediction_for_df(train, prediction_length) for _ in range(3)]
+    scoring_context = ScoringContext(test, prediction_length=prediction_length)
+    metrics = [check_get_evaluation_metric(name, prediction_length=prediction_length) for name in ["MASE", "SQL"]]
+
+    calls = []
+    for metric in metrics:
+        original_save_past_metrics = type(metric).save_past_metrics
+
+        def save_past_metrics(self, *args, _original=original_save_past_metrics, **kwargs):
+            calls.append(self.name)
+            return _original(self, *args, **kwargs)
+
+        monkeypatch.setattr(type(metric), "save_past_metrics", save_past_metrics)
+
+    for metric in metrics:
+        for preds in predictions:
+            metric.score_batch(scoring_context, [preds])
+    assert calls == ["MASE", "SQL"]
+
+
+def test_when_scoring_context_has_different_prediction_length_then_exception_is_raised():
+    scoring_context = ScoringContext(DUMMY_TS_DATAFRAME, prediction_length=3)
+    predictions = get_prediction_for_df(DUMMY_TS_DATAFRAME.slice_by_timestep(None, -5), 5)
+    with pytest.raises(ValueError, match="cannot be used to score"):
+        check_get_evaluation_metric("MASE", prediction_length=5).score_batch(scoring_context, [predictions])
+
+
 def test_available_metrics_have_coefficients():
     for metric_cls in AVAILABLE_METRICS.values():
         metric = metric_cls()
@@ -475,6 +475,24 @@ def test_when_predictor_is_loaded_then_info_works(temp_model_path):
     assert len(info["model_info"]) == len(DUMMY_HYPERPARAMETERS) + 1  # + 1 for ensemble
 
 
+@pytest.mark.parametrize("cache_predictions", [True, False])
+def test_when_predicting_repeatedly_then_prediction_cache_stats_are_updated(temp_model_path, cache_predictions):
+    predictor = TimeSeriesPredictor(path=temp_model_path, prediction_length=2, cache_predictions=cache_predictions)
+    predictor.fit(train_data=DUMMY_TS_DATAFRAME, hyperparameters={"Naive": {}})
+    predictor.predict(DUMMY_TS_DATAFRAME)
+    predictor.predict(DUMMY_TS_DATAFRAME)
+
+    stats = predictor.prediction_cache_stats()
+    if cache_predictions:
+        assert stats["num_hits"] == 1
+        assert stats["num_misses"] == 1
+        assert stats["num_entries"] == 1
+        assert stats["disk_bytes"] > 0
+    else:
+        assert stats["num_hits"] == 0
+        assert stats["num_misses"] == 0
+
+
 def test_when_train_data_contains_nans_then_predictor_can_fit(temp_model_path):
     predictor = TimeSeriesPredictor(path=temp_model_path)
     df = DATAFRAME_WITH_COVARIATES.copy()
@@ -1,5 +1,6 @@
 import copy
 import datetime
+import pickle
 import tempfile
 import traceback
 from pathlib import Path
@@ -481,6 +482,61 @@ def test_when_slice_by_timestep_used_with_different_inputs_then_output_selects_c
     result = df.slice_by_timestep(start_index, end_index)
     expected = df.groupby(ITEMID).nth(slice(start_index, end_index))
     pd.testing.assert_frame_equal(result, expected)
+    assert np.array_equal(result.get_indptr(), TimeSeriesDataFrame(pd.DataFrame(result)).get_indptr())
+
+
+@pytest.mark.parametrize("start_index, end_index", [(None, -2), (-3, None), (1, 3), (5, None)])
+def test_when_index_is_sorted_then_fast_path_matches_unsorted_path(start_index, end_index):
+    df = get_data_frame_with_variable_lengths({"B": 5, "A": 3, "C": 4, "D": 1})
+    # Items are stored contiguously, but not in sorted order
+    unsorted_df = df
+    sorted_df = df.sort_index()
+    assert not unsorted_df.index.is_monotonic_increasing
+
+    def assert_equal_after_sorting(result, expected):
+        pd.testing.assert_frame_equal(result, expected.sort_index())
+        assert np.array_equal(result.get_indptr(), TimeSeriesDataFrame(pd.DataFrame(result)).get_indptr())
+
+    pd.testing.assert_series_equal(
+        sorted_df.num_timesteps_per_item(), unsorted_df.num_timesteps_per_item().sort_index()
+    )
+    pd.testing.assert_index_equal(sorted_df.item_ids, unsorted_df.item_ids.sort_values())
+    assert_equal_after_sorting(
+        sorted_df.slice_by_timestep(start_index, end_index), unsorted_df.slice_by_timestep(start_index, end_index)
+    )
+
+
+def test_when_index_is_sorted_then_split_by_time_matches_timestamp_mask():
+    df = get_data_frame_with_variable_lengths({"A": 5, "B": 1, "C": 4, "D": 3})
+    timestamps = df.index.get_level_values(TIMESTAMP)
+    start_time, end_time = pd.Timestamp("2022-01-02"), pd.Timestamp("2022-01-04")
+
+    def assert_equal_to_mask(result, mask):
+        expected = TimeSeriesDataFrame(pd.DataFrame(df)[mask])
+        pd.testing.assert_frame_equal(result, expected)
+        assert np.array_equal(result.get_indptr(), expected.get_indptr())
+
+    before, after = df.split_by_time(end_time)
+    assert_equal_to_mask(before, timestamps < end_time)
+    assert_equal_to_mask(after, timestamps >= end_time)
+    assert_equal_to_mask(df.slice_by_time(start_time, end_time), (timestamps >= start_time) & (timestamps < end_time))
+
+
+def test_when_index_of_dataframe_is_replaced_then_cached_indptr_is_updated():
+    df = get_data_frame_with_variable_lengths({"A": 5, "B": 3})
+    assert df.freq == "D"
+    assert np.array_equal(df.get_indptr(), [0, 5, 8])
+    df.get_indptr()[:] = 0
+    assert np.array_equal(df.get_indptr(), [0, 5, 8])
+
+    df.drop(("A", pd.Timestamp("2022-01-01")), inplace=True)
+    assert np.array_equal(df.get_indptr(), [0, 4, 7])
+    df.index = pd.MultiIndex.from_arrays(
+        [["A"] * 2 + ["B"] * 5, pd.date_range("2022-01-01", periods=7, freq="h")], names=[ITEMID, TIMESTAMP]
+    )
+    assert np.array_equal(df.get_indptr(), [0, 2, 7])
+    assert df.freq == "h"
+    assert np.array_equal(pickle.loads(pickle.dumps(df)).get_indptr(), [0, 2, 7])
 
 
 @pytest.mark.parametrize("input_df", [SAMPLE_TS_DATAFRAME, SAMPLE_TS_DATAFRAME_EMPTY])
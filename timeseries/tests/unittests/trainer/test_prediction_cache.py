@@ -1,3 +1,8 @@
+import pickle
+import time
+from unittest import mock
+
+from autogluon.core.utils.loaders import load_pkl
 from autogluon.timeseries.dataset import TimeSeriesDataFrame
 from autogluon.timeseries.trainer.prediction_cache import FileBasedPredictionCache, compute_dataset_hash
 from autogluon.timeseries.utils.forecast import make_future_data_frame
@@ -96,15 +101,103 @@ class TestFileBasedPredictionCache:
         assert not cached_preds
         assert not cached_times
 
-    def test_when_cache_cleared_then_file_is_removed(self, tmp_path):
+    def test_when_cache_cleared_then_files_are_removed(self, tmp_path):
         df = DATAFRAME_WITH_COVARIATES
         preds = get_prediction_for_df(df)
 
         cache = FileBasedPredictionCache(str(tmp_path))
         cache.put(df, None, {"MyModel": preds}, {"MyModel": 0.5})
+        assert cache.path.exists()
 
         cache.clear()
 
-        expected_path = tmp_path / cache._cached_predictions_filename
-        assert expected_path == cache.path
-        assert not expected_path.exists()
+        expected_dir = tmp_path / cache._cached_predictions_dirname
+        assert expected_dir == cache.cache_dir
+        assert not expected_dir.exists()
+        assert cache.get(df, None) == ({}, {})
+
+    def test_when_cache_cleared_then_legacy_cache_file_is_removed(self, tmp_path):
+        legacy_path = tmp_path / FileBasedPredictionCache._legacy_cached_predictions_filename
+        legacy_path.write_bytes(b"legacy")
+
+        FileBasedPredictionCache(str(tmp_path)).clear()
+
+        assert not legacy_path.exists()
+
+    def test_when_predictions_are_put_then_each_model_is_stored_in_separate_file(self, tmp_path):
+        df = DATAFRAME_WITH_COVARIATES
+        preds = get_prediction_for_df(df)
+
+        cache = FileBasedPredictionCache(str(tmp_path))
+        cache.put(df, None, {"ModelA": preds, "ModelB": preds, "FailedModel": None}, {"ModelA": 0.5, "ModelB": 0.1})
+
+        dataset_hash = compute_dataset_hash(df)
+        for model_name in ["ModelA", "ModelB"]:
+            assert cache._get_entry_path(dataset_hash, model_name).exists()
+        assert not cache._get_entry_path(dataset_hash, "FailedModel").exists()
+        assert len(list(cache.cache_dir.glob("*.tmp"))) == 0
+
+    def test_when_model_names_are_given_then_only_requested_models_are_loaded(self, tmp_path):
+        df = DATAFRAME_WITH_COVARIATES
+        preds = get_prediction_for_df(df)
+
+        cache = FileBasedPredictionCache(str(tmp_path))
+        cache.put(df, None, {"ModelA": preds, "ModelB": preds}, {"ModelA": 0.5, "ModelB": 0.1})
+
+        with mock.patch(
+            "autogluon.timeseries.trainer.prediction_cache.load_pkl.load", wraps=load_pkl.load
+        ) as mock_load:
+            cached_preds, cached_times = cache.get(df, None, model_names=["ModelB", "ModelC"])
+            assert mock_load.call_count == 1
+
+        assert list(cached_preds.keys()) == list(cached_times.keys()) == ["ModelB"]
+        assert cache.get_stats()["num_hits"] == 1
+        assert cache.get_stats()["num_misses"] == 1
+
+    def test_when_cache_exceeds_max_disk_bytes_then_least_recently_used_entries_are_evicted(self, tmp_path):
+        df = DATAFRAME_WITH_COVARIATES
+        preds = get_prediction_for_df(df)
+
+        cache = FileBasedPredictionCache(str(tmp_path))
+        cache.put(df, None, {"ModelA": preds}, {"ModelA": 0.5})
+        entry_size = cache.disk_bytes
+        cache.max_disk_bytes = 2 * entry_size
+
+        cache.put(df, None, {"ModelB": preds}, {"ModelB": 0.5})
+        # Access ModelA so that ModelB becomes the least recently used entry
+        with mock.patch("time.time", return_value=time.time() + 10):
+            cache.get(df, None, model_names=["ModelA"])
+        with mock.patch("time.time", return_value=time.time() + 20):
+            cache.put(df, None, {"ModelC": preds}, {"ModelC": 0.5})
+
+        cached_preds, _ = cache.get(df, None)
+        assert sorted(cached_preds.keys()) == ["ModelA", "ModelC"]
+        assert cache.disk_bytes <= cache.max_disk_bytes
+        assert not cache._get_entry_path(compute_dataset_hash(df), "ModelB").exists()
+
+    def test_when_cache_is_reloaded_then_cached_predictions_are_available(self, tmp_path):
+        df = DATAFRAME_WITH_COVARIATES
+        preds = get_prediction_for_df(df)
+
+        cache = FileBasedPredictionCache(str(tmp_path))
+        cache.put(df, None, {"MyModel": preds}, {"MyModel": 0.5})
+        cache.get(df, None, model_names=["MyModel"])
+
+        cache_loaded = pickle.loads(pickle.dumps(cache))
+        cached_preds, cached_times = cache_loaded.get(df, None, model_names=["MyModel"])
+        assert cached_preds["MyModel"].equals(preds)
+        assert cached_times["MyModel"] == 0.5
+        assert cache_loaded.get_stats()["num_hits"] == 1
+
+    def test_when_cached_prediction_file_is_corrupted_then_entry_is_treated_as_miss(self, tmp_path):
+        df = DATAFRAME_WITH_COVARIATES
+        preds = get_prediction_for_df(df)
+
+        cache = FileBasedPredictionCache(str(tmp_path))
+        cache.put(df, None, {"ModelA": preds, "ModelB": preds}, {"ModelA": 0.5, "ModelB": 0.5})
+        cache._get_entry_path(compute_dataset_hash(df), "ModelA").write_text("foo")
+
+        cached_preds, _ = cache.get(df, None)
+        assert list(cached_preds.keys()) == ["ModelB"]
+        assert cache.get_stats()["num_misses"] == 1
+        assert "ModelA" not in cache._load_index()[compute_dataset_hash(df)]
@@ -582,7 +582,7 @@ def test_given_cache_predictions_is_false_when_calling_get_model_pred_dict_then_
     trainer.fit(DUMMY_TS_DATAFRAME, hyperparameters=DUMMY_TRAINER_HYPERPARAMETERS)
     trainer.get_model_pred_dict(trainer.get_model_names(), data=DUMMY_TS_DATAFRAME)
 
-    assert not Path.exists(Path(temp_model_path) / FileBasedPredictionCache._cached_predictions_filename)
+    assert not Path.exists(Path(temp_model_path) / FileBasedPredictionCache._cached_predictions_dirname)
 
 
 @pytest.mark.parametrize("method_name", ["leaderboard", "predict", "evaluate"])